@@ -0,0 +1,15 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class AuditTrailsConfig(AppConfig):
+    name = "openzaak.audittrails"
+    # the audit trails of vng-api-common already use the ``audittrails`` label
+    label = "openzaak_audittrails"
+    verbose_name = _("Audit trails")
+
+    def ready(self):
+        # load the signal receivers
+        from . import signals  # noqa
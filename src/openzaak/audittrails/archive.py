@@ -0,0 +1,224 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Archival of old audit trail records.
+
+The records of a period are written as zstd compressed JSON lines to the private
+media and removed from the database. The records of every main object are
+compressed as a separate zstd frame, of which the position in the file is indexed
+(see :class:`ArchivedHoofdObject`). The audit trail of a main object includes its
+archived records by reading only these frames (see
+:func:`get_archived_audittrails`), so the cost doesn't depend on the size of the
+archives.
+"""
+import io
+import json
+import logging
+import tempfile
+from datetime import datetime
+from itertools import islice
+from typing import Iterator, List, Optional, Union
+from uuid import UUID
+
+from django.core.files import File
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.utils.dateparse import parse_datetime
+
+import zstandard
+from vng_api_common.audittrails.models import AuditTrail
+
+from .deltas import materialize, resolve_snapshots
+from .models import (
+    ArchivedHoofdObject,
+    AuditTrailArchive,
+    AuditTrailDelta,
+    HoofdObjectReference,
+)
+from .partitioning import TABLE, add_months, drop_partition, is_partitioned, month_start
+from .utils import parse_hoofd_object
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_LEVEL = 10
+
+
+FIELDS = [field.attname for field in AuditTrail._meta.concrete_fields]
+
+CHUNK_SIZE = 2000
+
+
+def _encode(audittrail: AuditTrail) -> bytes:
+    record = {field: getattr(audittrail, field) for field in FIELDS}
+    # keep the microseconds, which are dropped by the DjangoJSONEncoder
+    record["aanmaakdatum"] = record["aanmaakdatum"].isoformat()
+    return json.dumps(record, cls=DjangoJSONEncoder).encode("utf-8") + b"\n"
+
+
+def _decode(line: Union[str, bytes]) -> AuditTrail:
+    data = json.loads(line)
+    data["uuid"] = UUID(data["uuid"])
+    data["aanmaakdatum"] = parse_datetime(data["aanmaakdatum"])
+    return AuditTrail(**data)
+
+
+def _write_segment(
+    tmp, compressor: zstandard.ZstdCompressor, url: str, lines: List[bytes]
+) -> Optional[ArchivedHoofdObject]:
+    """
+    Write the records of a main object as a separate frame.
+    """
+    offset = tmp.tell()
+    tmp.write(compressor.compress(b"".join(lines)))
+    parsed = parse_hoofd_object(url)
+    if parsed is None:
+        return None
+
+    resource, uuid = parsed
+    return ArchivedHoofdObject(
+        resource=resource, uuid=uuid, offset=offset, length=tmp.tell() - offset
+    )
+
+
+def archive_period(start: datetime, end: datetime) -> Optional[AuditTrailArchive]:
+    """
+    Move the audit trail records created between ``start`` and ``end`` to an archive.
+
+    If the period is a month with its own partition, the partition is dropped.
+    Otherwise the records are deleted.
+    """
+    queryset = AuditTrail.objects.filter(aanmaakdatum__gte=start, aanmaakdatum__lt=end)
+
+    segments = []
+    count = 0
+    with tempfile.TemporaryFile() as tmp:
+        compressor = zstandard.ZstdCompressor(level=COMPRESSION_LEVEL)
+        # the records are grouped per main object
+        audittrails = queryset.order_by("hoofd_object", "pk").iterator(
+            chunk_size=CHUNK_SIZE
+        )
+        url, lines = None, []
+        while batch := list(islice(audittrails, CHUNK_SIZE)):
+            # the archive is self-contained, so it keeps the full snapshots
+            resolve_snapshots(batch)
+            for audittrail in batch:
+                if audittrail.hoofd_object != url and lines:
+                    segments.append(_write_segment(tmp, compressor, url, lines))
+                    lines = []
+                url = audittrail.hoofd_object
+                lines.append(_encode(audittrail))
+            count += len(batch)
+
+        if not count:
+            return None
+        segments.append(_write_segment(tmp, compressor, url, lines))
+
+        tmp.seek(0)
+        archive = AuditTrailArchive(start=start, end=end, count=count)
+        # the file is written before the records are deleted, so the records are
+        # never lost if writing the file fails
+        archive.file.save(
+            f"audittrails-{start:%Y%m%d}-{end:%Y%m%d}.jsonl.zst", File(tmp), save=False
+        )
+
+    try:
+        _finish_archive(archive, [segment for segment in segments if segment])
+    except BaseException:
+        # don't leave an archive file behind for the rolled back transaction
+        archive.file.delete(save=False)
+        raise
+
+    logger.info("Archived %d audit trail records to %s", count, archive.file.name)
+    return archive
+
+
+def _finish_archive(
+    archive: AuditTrailArchive, segments: List[ArchivedHoofdObject]
+) -> None:
+    """
+    Save the archive and remove the archived records from the database.
+    """
+    start, end = archive.start, archive.end
+    # the outermost transaction, so the file is removed for every rollback
+    with transaction.atomic(durable=True):
+        archive.save()
+        for segment in segments:
+            segment.archive = archive
+        ArchivedHoofdObject.objects.bulk_create(segments, batch_size=1000)
+        HoofdObjectReference.objects.filter(
+            audittrail__aanmaakdatum__gte=start, audittrail__aanmaakdatum__lt=end
+        ).delete()
+        # the later records can't be reconstructed from archived checkpoints
+        materialize(
+            AuditTrailDelta.objects.filter(
+                checkpoint__aanmaakdatum__gte=start,
+                checkpoint__aanmaakdatum__lt=end,
+                audittrail__aanmaakdatum__gte=end,
+            )
+        )
+        AuditTrailDelta.objects.filter(
+            audittrail__aanmaakdatum__gte=start, audittrail__aanmaakdatum__lt=end
+        ).delete()
+
+        is_month = start == month_start(start) and end == add_months(start, 1)
+        if not (is_month and is_partitioned() and drop_partition(start)):
+            # ⚡️ skip the collection of the related objects, which are deleted
+            # above
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"DELETE FROM {TABLE} "
+                    "WHERE aanmaakdatum >= %s AND aanmaakdatum < %s",
+                    [start, end],
+                )
+
+
+def read_archive(archive: AuditTrailArchive) -> Iterator[AuditTrail]:
+    """
+    Read the (unsaved) audit trail records from an archive.
+    """
+    with archive.file.open("rb") as fh:
+        reader = zstandard.ZstdDecompressor().stream_reader(fh, read_across_frames=True)
+        for line in io.TextIOWrapper(reader, encoding="utf-8"):
+            yield _decode(line)
+
+
+def read_segment(segment: ArchivedHoofdObject) -> List[AuditTrail]:
+    """
+    Read the (unsaved) audit trail records of a main object from its archive.
+    """
+    with segment.archive.file.open("rb") as fh:
+        fh.seek(segment.offset)
+        data = zstandard.ZstdDecompressor().decompress(fh.read(segment.length))
+    return [_decode(line) for line in data.splitlines()]
+
+
+def get_archived_audittrails(
+    uuid: UUID, resource: Optional[str] = None
+) -> List[AuditTrail]:
+    """
+    Return the archived audit trail records of a main object.
+    """
+    uuid = UUID(str(uuid))
+    filters = {"uuid": uuid}
+    if resource is not None:
+        filters["resource"] = resource
+    segments = ArchivedHoofdObject.objects.filter(**filters).select_related("archive")
+
+    audittrails = []
+    read_archives = set()
+    for segment in segments:
+        if segment.offset is not None:
+            records = read_segment(segment)
+        elif segment.archive_id not in read_archives:
+            # archives written before the records were compressed per main object
+            read_archives.add(segment.archive_id)
+            records = read_archive(segment.archive)
+        else:
+            continue
+
+        for audittrail in records:
+            parsed = parse_hoofd_object(audittrail.hoofd_object)
+            if parsed and parsed[1] == uuid and resource in (None, parsed[0]):
+                audittrails.append(audittrail)
+    # the primary key increases along with the aanmaakdatum
+    return sorted(audittrails, key=lambda audittrail: audittrail.pk)
@@ -0,0 +1,176 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Diff-only storage of the snapshots of audit trail records.
+
+Every audit trail record stores the full ``oud`` and ``nieuw`` snapshots of its
+resource, which are nearly identical for the records of a resource that is updated
+often. With ``AUDITTRAIL_DIFF_STORAGE`` enabled, only the first record of a resource
+(a checkpoint) keeps its full snapshots. The next records store the diff of their
+snapshots against the checkpoint (see :class:`AuditTrailDelta`), until a new
+checkpoint is stored after ``AUDITTRAIL_CHECKPOINT_INTERVAL`` records.
+
+The snapshots are reconstructed when they are read (see :func:`resolve_snapshots`),
+by applying a single diff to the snapshot of the checkpoint.
+"""
+import json
+from itertools import chain
+from typing import Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count
+
+from dictdiffer import diff, patch
+from vng_api_common.audittrails.models import AuditTrail
+
+from .models import AuditTrailDelta
+from .utils import parse_hoofd_object
+
+
+def _get_base(oud: Optional[dict], nieuw: Optional[dict]) -> Optional[dict]:
+    return nieuw if nieuw is not None else oud
+
+
+def make_diff(base: dict, snapshot: Optional[dict]) -> Optional[list]:
+    if snapshot is None:
+        return None
+    # compare the snapshot as it is stored in the database
+    snapshot = json.loads(json.dumps(snapshot, cls=DjangoJSONEncoder))
+    changes = list(diff(base, snapshot, dot_notation=False))
+    return json.loads(json.dumps(changes))
+
+
+def apply_diff(base: dict, changes: Optional[list]) -> Optional[dict]:
+    if changes is None:
+        return None
+    return patch(changes, base)
+
+
+def get_changed_keys(delta: AuditTrailDelta) -> Optional[Set[str]]:
+    """
+    Return the top-level keys in which the snapshots of the delta can differ.
+
+    The other keys are equal to the checkpoint in both snapshots. ``None`` is
+    returned if one of the snapshots is empty.
+    """
+    if delta.oud is None or delta.nieuw is None:
+        return None
+
+    keys = set()
+    for _action, path, values in chain(delta.oud, delta.nieuw):
+        if path:
+            keys.add(path[0])
+        else:
+            # keys added to or removed from the snapshot itself
+            keys.update(key for key, _value in values)
+    return keys
+
+
+def diff_snapshots(audittrail: AuditTrail) -> list:
+    """
+    Return the changes between the ``oud`` and ``nieuw`` snapshots of the record.
+
+    ⚡️ For the records resolved from a delta, only the keys changed by the diffs of
+    the delta are compared instead of the full snapshots.
+    """
+    oud = audittrail.oud or {}
+    nieuw = audittrail.nieuw or {}
+
+    keys = getattr(audittrail, "changed_keys", None)
+    if keys is not None:
+        oud = {key: value for key, value in oud.items() if key in keys}
+        nieuw = {key: value for key, value in nieuw.items() if key in keys}
+    return list(diff(oud, nieuw))
+
+
+def prepare_delta(audittrail: AuditTrail) -> Optional[AuditTrailDelta]:
+    """
+    Return the (unsaved) delta of a new audit trail record.
+
+    ``None`` is returned if the record must keep its full snapshots.
+    """
+    parsed = parse_hoofd_object(audittrail.hoofd_object)
+    if parsed is None:
+        return None
+
+    resource, uuid = parsed
+    checkpoint = (
+        AuditTrail.objects.filter(
+            hoofd_object_reference__uuid=uuid,
+            hoofd_object_reference__resource=resource,
+            resource_url=audittrail.resource_url,
+            delta__isnull=True,
+        )
+        .annotate(deltas=Count("checkpoint_deltas"))
+        .order_by("-pk")
+        .values("pk", "oud", "nieuw", "deltas")
+        .first()
+    )
+    if checkpoint is None:
+        return None
+    if checkpoint["deltas"] + 1 >= settings.AUDITTRAIL_CHECKPOINT_INTERVAL:
+        return None
+
+    base = _get_base(checkpoint["oud"], checkpoint["nieuw"])
+    if base is None:
+        return None
+
+    return AuditTrailDelta(
+        checkpoint_id=checkpoint["pk"],
+        oud=make_diff(base, audittrail.oud),
+        nieuw=make_diff(base, audittrail.nieuw),
+    )
+
+
+def resolve_snapshots(audittrails: Iterable[AuditTrail]) -> None:
+    """
+    Reconstruct the snapshots of the audit trail records that are stored as a diff.
+
+    The snapshots are set on the records in place, together with the keys in which
+    they can differ as ``changed_keys`` (see :func:`diff_snapshots`).
+    """
+    # the snapshots of a record are only both empty if it has a delta
+    candidates = {
+        audittrail.pk: audittrail
+        for audittrail in audittrails
+        if audittrail.oud is None and audittrail.nieuw is None and audittrail.pk
+    }
+    if not candidates:
+        return
+
+    deltas = list(AuditTrailDelta.objects.filter(audittrail_id__in=candidates))
+    if not deltas:
+        return
+
+    bases = {
+        pk: _get_base(oud, nieuw)
+        for pk, oud, nieuw in AuditTrail.objects.filter(
+            pk__in={delta.checkpoint_id for delta in deltas}
+        ).values_list("pk", "oud", "nieuw")
+    }
+    for delta in deltas:
+        base = bases.get(delta.checkpoint_id)
+        if base is None:
+            continue
+        audittrail = candidates[delta.audittrail_id]
+        audittrail.oud = apply_diff(base, delta.oud)
+        audittrail.nieuw = apply_diff(base, delta.nieuw)
+        audittrail.changed_keys = get_changed_keys(delta)
+
+
+def materialize(deltas: Iterable[AuditTrailDelta]) -> List[AuditTrail]:
+    """
+    Store the full snapshots of the audit trail records of the deltas again.
+    """
+    audittrails = list(
+        AuditTrail.objects.filter(
+            pk__in=[delta.audittrail_id for delta in deltas]
+        ).order_by("pk")
+    )
+    resolve_snapshots(audittrails)
+    AuditTrail.objects.bulk_update(audittrails, ["oud", "nieuw"], batch_size=500)
+    AuditTrailDelta.objects.filter(
+        audittrail_id__in=[audittrail.pk for audittrail in audittrails]
+    ).delete()
+    return audittrails
@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.core.management.base import BaseCommand
+
+from vng_api_common.audittrails.models import AuditTrail
+
+from ...models import HoofdObjectReference
+from ...utils import build_references
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the indexed references to the main objects of the audit trail "
+        "records that were created before they were introduced"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10_000,
+            help="The number of audit trail records processed per batch.",
+        )
+
+    def handle(self, **options):
+        batch_size = options["batch_size"]
+        verbosity = options["verbosity"]
+
+        # walk over the primary key rather than using offsets, so that every batch
+        # is an index range scan
+        last_pk = 0
+        total = 0
+        while True:
+            batch = list(
+                AuditTrail.objects.filter(
+                    pk__gt=last_pk, hoofd_object_reference__isnull=True
+                )
+                .order_by("pk")
+                .values_list("pk", "hoofd_object")[:batch_size]
+            )
+            if not batch:
+                break
+
+            last_pk = batch[-1][0]
+            created = HoofdObjectReference.objects.bulk_create(
+                build_references(batch), ignore_conflicts=True
+            )
+            total += len(created)
+            if verbosity > 1:
+                self.stdout.write(f"Processed audit trail records up to pk {last_pk}")
+
+        if verbosity > 0:
+            self.stdout.write(
+                self.style.SUCCESS(f"Created {total} main object references")
+            )
@@ -0,0 +1,54 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from ...partitioning import convert_to_partitioned, create_partitions, is_partitioned
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the monthly partitions of the audit trail table for the coming "
+        "months, or convert the audit trail table into a partitioned table"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months",
+            type=int,
+            default=settings.AUDITTRAIL_PARTITIONS_AHEAD,
+            help="The number of months to create partitions for.",
+        )
+        parser.add_argument(
+            "--convert",
+            action="store_true",
+            help=(
+                "Convert the audit trail table into a partitioned table. The table is "
+                "locked during the conversion."
+            ),
+        )
+
+    def handle(self, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("Partitioning requires a PostgreSQL database")
+
+        months = options["months"]
+        if options["convert"]:
+            if is_partitioned():
+                raise CommandError("The audit trail table is already partitioned")
+            convert_to_partitioned(timezone.now(), months)
+            self.stdout.write(self.style.SUCCESS("Converted the audit trail table"))
+            return
+
+        if not is_partitioned():
+            raise CommandError(
+                "The audit trail table is not partitioned, use --convert to "
+                "partition it"
+            )
+
+        created = create_partitions(timezone.now(), months)
+        for name in created:
+            self.stdout.write(f"Created partition {name}")
+        self.stdout.write(self.style.SUCCESS(f"Created {len(created)} partitions"))
@@ -0,0 +1,54 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+# Generated by Django 4.2.15 on 2024-09-02 10:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("audittrails", "0018_auto_20221212_0745"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="HoofdObjectReference",
+            fields=[
+                (
+                    "audittrail",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="hoofd_object_reference",
+                        serialize=False,
+                        to="audittrails.audittrail",
+                        verbose_name="audit trail",
+                    ),
+                ),
+                (
+                    "resource",
+                    models.CharField(
+                        help_text="The type of the main object, as it appears in its URL (e.g. `zaken`).",
+                        max_length=100,
+                        verbose_name="resource",
+                    ),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(
+                        db_index=True,
+                        help_text="The UUID of the main object.",
+                        verbose_name="UUID",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "main object reference",
+                "verbose_name_plural": "main object references",
+            },
+        ),
+    ]
@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+# Generated by Django 4.2.15 on 2024-09-09 09:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import privates.fields
+import privates.storages
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audittrails", "0018_auto_20221212_0745"),
+        ("openzaak_audittrails", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="hoofdobjectreference",
+            name="audittrail",
+            field=models.OneToOneField(
+                db_constraint=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                primary_key=True,
+                related_name="hoofd_object_reference",
+                serialize=False,
+                to="audittrails.audittrail",
+                verbose_name="audit trail",
+            ),
+        ),
+        migrations.CreateModel(
+            name="AuditTrailArchive",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "start",
+                    models.DateTimeField(
+                        help_text="The start of the archived period.",
+                        verbose_name="start",
+                    ),
+                ),
+                (
+                    "end",
+                    models.DateTimeField(
+                        help_text="The (exclusive) end of the archived period.",
+                        verbose_name="end",
+                    ),
+                ),
+                (
+                    "file",
+                    privates.fields.PrivateMediaFileField(
+                        help_text="The zstd compressed JSON lines of the audit trail records.",
+                        storage=privates.storages.PrivateMediaFileSystemStorage(),
+                        upload_to="audittrails/archive/",
+                        verbose_name="file",
+                    ),
+                ),
+                (
+                    "count",
+                    models.PositiveIntegerField(
+                        help_text="The number of archived audit trail records.",
+                        verbose_name="count",
+                    ),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created"),
+                ),
+            ],
+            options={
+                "verbose_name": "audit trail archive",
+                "verbose_name_plural": "audit trail archives",
+                "ordering": ("start",),
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedHoofdObject",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "resource",
+                    models.CharField(
+                        help_text="The type of the main object, as it appears in its URL (e.g. `zaken`).",
+                        max_length=100,
+                        verbose_name="resource",
+                    ),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(
+                        db_index=True,
+                        help_text="The UUID of the main object.",
+                        verbose_name="UUID",
+                    ),
+                ),
+                (
+                    "archive",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="hoofd_objecten",
+                        to="openzaak_audittrails.audittrailarchive",
+                        verbose_name="archive",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "archived main object",
+                "verbose_name_plural": "archived main objects",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="archivedhoofdobject",
+            constraint=models.UniqueConstraint(
+                fields=("archive", "resource", "uuid"),
+                name="unique_archived_hoofd_object",
+            ),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+# Generated by Django 4.2.15 on 2024-09-16 14:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audittrails", "0018_auto_20221212_0745"),
+        ("openzaak_audittrails", "0002_archive"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuditTrailDelta",
+            fields=[
+                (
+                    "audittrail",
+                    models.OneToOneField(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="delta",
+                        serialize=False,
+                        to="audittrails.audittrail",
+                        verbose_name="audit trail",
+                    ),
+                ),
+                (
+                    "oud",
+                    models.JSONField(
+                        help_text="The diff of the snapshot before the action.",
+                        null=True,
+                        verbose_name="oud",
+                    ),
+                ),
+                (
+                    "nieuw",
+                    models.JSONField(
+                        help_text="The diff of the snapshot after the action.",
+                        null=True,
+                        verbose_name="nieuw",
+                    ),
+                ),
+                (
+                    "checkpoint",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        help_text="The earlier audit trail record of the same resource with the full snapshots, from which the snapshots are reconstructed.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="checkpoint_deltas",
+                        to="audittrails.audittrail",
+                        verbose_name="checkpoint",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "audit trail delta",
+                "verbose_name_plural": "audit trail deltas",
+            },
+        ),
+    ]
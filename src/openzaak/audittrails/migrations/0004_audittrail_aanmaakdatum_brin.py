@@ -0,0 +1,25 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # the index is built concurrently, so writes to the (large) audit trail table
+    # are not blocked while it is built
+    atomic = False
+
+    dependencies = [
+        ("audittrails", "0018_auto_20221212_0745"),
+        ("openzaak_audittrails", "0003_audittraildelta"),
+    ]
+
+    operations = [
+        # the records of a period are selected when they are archived
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS audittrail_aanmaakdatum_brin "
+                "ON audittrails_audittrail USING brin (aanmaakdatum)"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS audittrail_aanmaakdatum_brin",
+        ),
+    ]
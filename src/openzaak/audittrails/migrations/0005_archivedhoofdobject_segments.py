@@ -0,0 +1,37 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+# Generated by Django 4.2.15 on 2024-09-23 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("openzaak_audittrails", "0004_audittrail_aanmaakdatum_brin"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="archivedhoofdobject",
+            name="unique_archived_hoofd_object",
+        ),
+        migrations.AddField(
+            model_name="archivedhoofdobject",
+            name="offset",
+            field=models.PositiveBigIntegerField(
+                help_text="The position in the archive file of the compressed records of the main object. Empty for archives in which the records are not compressed per main object.",
+                null=True,
+                verbose_name="offset",
+            ),
+        ),
+        migrations.AddField(
+            model_name="archivedhoofdobject",
+            name="length",
+            field=models.PositiveBigIntegerField(
+                help_text="The size in bytes of the compressed records of the main object.",
+                null=True,
+                verbose_name="length",
+            ),
+        ),
+    ]
@@ -0,0 +1,171 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from privates.fields import PrivateMediaFileField
+from vng_api_common.audittrails.models import AuditTrail
+
+
+class HoofdObjectReference(models.Model):
+    """
+    Indexed reference of an audit trail record to its main object.
+
+    The audit trail of vng-api-common only stores the URL of the main object, which
+    can't be used to look up the audit trail of an object without scanning the
+    (large) audit trail table.
+    """
+
+    audittrail = models.OneToOneField(
+        AuditTrail,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        # a partitioned audit trail table can't be referenced by a foreign key
+        # constraint, see :mod:`openzaak.audittrails.partitioning`
+        db_constraint=False,
+        related_name="hoofd_object_reference",
+        verbose_name=_("audit trail"),
+    )
+    resource = models.CharField(
+        _("resource"),
+        max_length=100,
+        help_text=_(
+            "The type of the main object, as it appears in its URL (e.g. `zaken`)."
+        ),
+    )
+    uuid = models.UUIDField(
+        _("UUID"),
+        db_index=True,
+        help_text=_("The UUID of the main object."),
+    )
+
+    class Meta:
+        verbose_name = _("main object reference")
+        verbose_name_plural = _("main object references")
+
+    def __str__(self):
+        return f"{self.resource}/{self.uuid}"
+
+
+class AuditTrailArchive(models.Model):
+    """
+    The audit trail records of a period, moved out of the database.
+
+    The records are stored as zstd compressed JSON lines in the private media.
+    """
+
+    start = models.DateTimeField(
+        _("start"), help_text=_("The start of the archived period.")
+    )
+    end = models.DateTimeField(
+        _("end"), help_text=_("The (exclusive) end of the archived period.")
+    )
+    file = PrivateMediaFileField(
+        _("file"),
+        upload_to="audittrails/archive/",
+        help_text=_("The zstd compressed JSON lines of the audit trail records."),
+    )
+    count = models.PositiveIntegerField(
+        _("count"), help_text=_("The number of archived audit trail records.")
+    )
+    created = models.DateTimeField(_("created"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("audit trail archive")
+        verbose_name_plural = _("audit trail archives")
+        ordering = ("start",)
+
+    def __str__(self):
+        return f"{self.start:%Y-%m-%d} - {self.end:%Y-%m-%d}"
+
+
+class ArchivedHoofdObject(models.Model):
+    """
+    The archived audit trail records of a main object.
+
+    The records of a main object are compressed separately in the archive file, so
+    that only these records are read to retrieve its audit trail.
+    """
+
+    archive = models.ForeignKey(
+        AuditTrailArchive,
+        on_delete=models.CASCADE,
+        related_name="hoofd_objecten",
+        verbose_name=_("archive"),
+    )
+    resource = models.CharField(
+        _("resource"),
+        max_length=100,
+        help_text=_(
+            "The type of the main object, as it appears in its URL (e.g. `zaken`)."
+        ),
+    )
+    uuid = models.UUIDField(
+        _("UUID"),
+        db_index=True,
+        help_text=_("The UUID of the main object."),
+    )
+    offset = models.PositiveBigIntegerField(
+        _("offset"),
+        null=True,
+        help_text=_(
+            "The position in the archive file of the compressed records of the main "
+            "object. Empty for archives in which the records are not compressed per "
+            "main object."
+        ),
+    )
+    length = models.PositiveBigIntegerField(
+        _("length"),
+        null=True,
+        help_text=_("The size in bytes of the compressed records of the main object."),
+    )
+
+    class Meta:
+        verbose_name = _("archived main object")
+        verbose_name_plural = _("archived main objects")
+
+    def __str__(self):
+        return f"{self.resource}/{self.uuid}"
+
+
+class AuditTrailDelta(models.Model):
+    """
+    The snapshots of an audit trail record, stored as a diff against a checkpoint.
+
+    The ``oud`` and ``nieuw`` snapshots of the audit trail record itself are empty,
+    see :mod:`openzaak.audittrails.deltas`.
+    """
+
+    audittrail = models.OneToOneField(
+        AuditTrail,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        db_constraint=False,
+        related_name="delta",
+        verbose_name=_("audit trail"),
+    )
+    checkpoint = models.ForeignKey(
+        AuditTrail,
+        on_delete=models.CASCADE,
+        db_constraint=False,
+        related_name="checkpoint_deltas",
+        verbose_name=_("checkpoint"),
+        help_text=_(
+            "The earlier audit trail record of the same resource with the full "
+            "snapshots, from which the snapshots are reconstructed."
+        ),
+    )
+    oud = models.JSONField(
+        _("oud"),
+        null=True,
+        help_text=_("The diff of the snapshot before the action."),
+    )
+    nieuw = models.JSONField(
+        _("nieuw"),
+        null=True,
+        help_text=_("The diff of the snapshot after the action."),
+    )
+
+    class Meta:
+        verbose_name = _("audit trail delta")
+        verbose_name_plural = _("audit trail deltas")
@@ -0,0 +1,223 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Partitioning of the audit trail table by ``aanmaakdatum``.
+
+The audit trail table is converted once (see :func:`convert_to_partitioned`) into a
+table that is partitioned by month. The existing records end up in a single legacy
+partition, new records in the monthly partitions, which must be created ahead of
+time (see :func:`create_partitions`). A default partition catches the records for
+which no partition exists, so that writes never fail.
+
+Old partitions are moved out of the database by
+:func:`openzaak.audittrails.archive.archive_period`, which drops the partition of
+the archived month rather than deleting its records.
+
+Postgres requires the primary key and the unique constraints of a partitioned table
+to include the partition key, so the primary key becomes ``(id, aanmaakdatum)`` and
+the UUID is unique per ``aanmaakdatum``. Foreign keys to the table are not possible
+anymore.
+"""
+import logging
+import re
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from django.db import connection, transaction
+from django.utils.dateparse import parse_datetime
+
+from vng_api_common.audittrails.models import AuditTrail
+
+logger = logging.getLogger(__name__)
+
+TABLE = AuditTrail._meta.db_table
+LEGACY_PARTITION = f"{TABLE}_legacy"
+DEFAULT_PARTITION = f"{TABLE}_default"
+SEQUENCE = f"{TABLE}_partitioned_id_seq"
+# the maximum length of identifiers in Postgres
+MAX_NAME_LENGTH = 63
+
+PARTITION_BOUND_END = re.compile(r"TO \('(?P<end>[^']+)'\)")
+
+
+def month_start(value: datetime) -> datetime:
+    value = value.astimezone(timezone.utc)
+    return datetime(value.year, value.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    year, month = divmod(value.month - 1 + months, 12)
+    return value.replace(year=value.year + year, month=month + 1)
+
+
+def partition_name(start: datetime) -> str:
+    return f"{TABLE}_y{start:%Y}m{start:%m}"
+
+
+def _table_exists(cursor, name: str) -> bool:
+    cursor.execute("SELECT to_regclass(%s) IS NOT NULL", [name])
+    return cursor.fetchone()[0]
+
+
+def is_partitioned() -> bool:
+    if connection.vendor != "postgresql":
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass(%s))",
+            [TABLE],
+        )
+        return cursor.fetchone()[0]
+
+
+def _get_legacy_end(cursor) -> Optional[datetime]:
+    cursor.execute(
+        "SELECT pg_get_expr(relpartbound, oid) FROM pg_class "
+        "WHERE oid = to_regclass(%s)",
+        [LEGACY_PARTITION],
+    )
+    row = cursor.fetchone()
+    if row is None or not row[0]:
+        return None
+    match = PARTITION_BOUND_END.search(row[0])
+    return parse_datetime(match.group("end")) if match else None
+
+
+def _get_indexes(cursor) -> List[Tuple[str, str]]:
+    """
+    Return the names and definitions of the indexes of the table.
+
+    The indexes of the primary key and the unique constraints are left out, since
+    they are replaced by constraints that include the partition key. Other unique
+    indexes can't be created on a partitioned table.
+    """
+    cursor.execute(
+        "SELECT index_class.relname, pg_get_indexdef(i.indexrelid), i.indisunique "
+        "FROM pg_index i JOIN pg_class index_class ON index_class.oid = i.indexrelid "
+        "WHERE i.indrelid = to_regclass(%s) AND NOT EXISTS "
+        "(SELECT 1 FROM pg_constraint WHERE conindid = i.indexrelid)",
+        [TABLE],
+    )
+    indexes = []
+    for name, definition, is_unique in cursor.fetchall():
+        if is_unique:
+            logger.warning(
+                "The unique index %s is not created on the partitioned table", name
+            )
+            continue
+        indexes.append((name, definition))
+    return indexes
+
+
+def _legacy_index_name(name: str) -> str:
+    suffix = "_legacy"
+    return name[: MAX_NAME_LENGTH - len(suffix)] + suffix
+
+
+def create_partitions(start: datetime, months: int) -> List[str]:
+    """
+    Create the monthly partitions for ``months`` months from ``start`` onwards.
+
+    Partitions that already exist, or which would overlap with the legacy
+    partition, are skipped. The names of the created partitions are returned.
+    """
+    created = []
+    with connection.cursor() as cursor:
+        legacy_end = _get_legacy_end(cursor)
+        for month in range(months):
+            lower = add_months(month_start(start), month)
+            upper = add_months(lower, 1)
+            name = partition_name(lower)
+            if (legacy_end and lower < legacy_end) or _table_exists(cursor, name):
+                continue
+
+            cursor.execute(
+                f"CREATE TABLE {name} PARTITION OF {TABLE} "
+                "FOR VALUES FROM (%s) TO (%s)",
+                [lower, upper],
+            )
+            logger.info("Created audit trail partition %s", name)
+            created.append(name)
+    return created
+
+
+def drop_partition(start: datetime) -> bool:
+    """
+    Drop the partition of the month starting at ``start``, if it exists.
+    """
+    name = partition_name(start)
+    with connection.cursor() as cursor:
+        if not _table_exists(cursor, name):
+            return False
+        cursor.execute(f"ALTER TABLE {TABLE} DETACH PARTITION {name}")
+        cursor.execute(f"DROP TABLE {name}")
+    logger.info("Dropped audit trail partition %s", name)
+    return True
+
+
+@transaction.atomic
+def convert_to_partitioned(now: datetime, months: int) -> None:
+    """
+    Convert the audit trail table into a table partitioned by month.
+
+    The existing records are kept in the legacy partition, which covers everything
+    up to the next month. The table is locked during the conversion, which scans
+    the existing records once to attach them to the new table.
+    """
+    legacy_end = add_months(month_start(now), 1)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {TABLE} IN ACCESS EXCLUSIVE MODE")
+        cursor.execute(
+            "SELECT conname FROM pg_constraint "
+            "WHERE conrelid = to_regclass(%s) AND contype IN ('p', 'u')",
+            [TABLE],
+        )
+        constraints = [row[0] for row in cursor.fetchall()]
+        indexes = _get_indexes(cursor)
+        cursor.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {TABLE}")
+        next_id = cursor.fetchone()[0]
+
+        # strip the legacy table of everything that a partition can't have, and of
+        # the default of the primary key, which is not copied to the new table
+        cursor.execute(f"ALTER TABLE {TABLE} RENAME TO {LEGACY_PARTITION}")
+        for name in constraints:
+            cursor.execute(f"ALTER TABLE {LEGACY_PARTITION} DROP CONSTRAINT {name}")
+        cursor.execute(
+            f"ALTER TABLE {LEGACY_PARTITION} ALTER COLUMN id DROP IDENTITY IF EXISTS"
+        )
+        cursor.execute(f"ALTER TABLE {LEGACY_PARTITION} ALTER COLUMN id DROP DEFAULT")
+        # the names are taken by the indexes of the partitioned table
+        for name, _definition in indexes:
+            cursor.execute(f"ALTER INDEX {name} RENAME TO {_legacy_index_name(name)}")
+
+        cursor.execute(
+            f"CREATE TABLE {TABLE} (LIKE {LEGACY_PARTITION} "
+            "INCLUDING DEFAULTS INCLUDING STORAGE) PARTITION BY RANGE (aanmaakdatum)"
+        )
+        cursor.execute(f"CREATE SEQUENCE {SEQUENCE} START WITH %s", [next_id])
+        cursor.execute(f"ALTER SEQUENCE {SEQUENCE} OWNED BY {TABLE}.id")
+        cursor.execute(
+            f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{SEQUENCE}')"
+        )
+        cursor.execute(f"ALTER TABLE {TABLE} ADD PRIMARY KEY (id, aanmaakdatum)")
+        cursor.execute(
+            f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_uuid_aanmaakdatum_uniq "
+            "UNIQUE (uuid, aanmaakdatum)"
+        )
+        # the indexes of the partitioned table are created on every partition, and
+        # the equivalent indexes of the legacy partition are attached to them
+        for _name, definition in indexes:
+            cursor.execute(definition)
+
+        cursor.execute(
+            f"ALTER TABLE {TABLE} ATTACH PARTITION {LEGACY_PARTITION} "
+            "FOR VALUES FROM (MINVALUE) TO (%s)",
+            [legacy_end],
+        )
+        cursor.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT")
+
+    create_partitions(legacy_end, months)
+    logger.info("Converted the audit trail table into a partitioned table")
@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.conf import settings
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from vng_api_common.audittrails.models import AuditTrail
+
+from .deltas import prepare_delta
+from .models import HoofdObjectReference
+from .utils import build_references
+
+
+@receiver(pre_save, sender=AuditTrail, dispatch_uid="audittrails.prepare_delta")
+def store_snapshots_as_diff(sender, instance: AuditTrail, raw: bool, **kwargs):
+    if raw or instance.pk or not settings.AUDITTRAIL_DIFF_STORAGE:
+        return
+
+    delta = prepare_delta(instance)
+    if delta is None:
+        return
+
+    # the snapshots are restored once the delta is saved
+    instance._audittrail_delta = (delta, instance.oud, instance.nieuw)
+    instance.oud = instance.nieuw = None
+
+
+@receiver(post_save, sender=AuditTrail, dispatch_uid="audittrails.create_reference")
+def create_reference(sender, instance: AuditTrail, created: bool, **kwargs):
+    if not created:
+        return
+
+    HoofdObjectReference.objects.bulk_create(
+        build_references([(instance.pk, instance.hoofd_object)]),
+        ignore_conflicts=True,
+    )
+
+
+@receiver(post_save, sender=AuditTrail, dispatch_uid="audittrails.save_delta")
+def save_delta(sender, instance: AuditTrail, created: bool, **kwargs):
+    delta_info = getattr(instance, "_audittrail_delta", None)
+    if not created or delta_info is None:
+        return
+
+    delta, instance.oud, instance.nieuw = delta_info
+    delta.audittrail = instance
+    delta.save()
+    del instance._audittrail_delta
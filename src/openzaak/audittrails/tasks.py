@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.conf import settings
+from django.utils import timezone
+
+from vng_api_common.audittrails.models import AuditTrail
+
+from openzaak import celery_app
+
+from .archive import archive_period
+from .models import AuditTrailArchive
+from .partitioning import add_months, create_partitions, is_partitioned, month_start
+
+
+@celery_app.task()
+def create_audittrail_partitions():
+    if not is_partitioned():
+        return
+
+    create_partitions(timezone.now(), settings.AUDITTRAIL_PARTITIONS_AHEAD)
+
+
+@celery_app.task()
+def archive_audittrails():
+    """
+    Archive the audit trail records of the months older than the retention period.
+
+    The months are archived one at a time, starting after the last archived month.
+    """
+    if not settings.AUDITTRAIL_ARCHIVE_AFTER_MONTHS:
+        return
+
+    end = add_months(
+        month_start(timezone.now()), -settings.AUDITTRAIL_ARCHIVE_AFTER_MONTHS
+    )
+    last_archive = AuditTrailArchive.objects.order_by("end").last()
+    if last_archive:
+        start = last_archive.end
+    else:
+        # the primary key is indexed and increases along with the aanmaakdatum
+        oldest = AuditTrail.objects.order_by("pk").first()
+        if oldest is None:
+            return
+        start = month_start(oldest.aanmaakdatum)
+
+    while start < end:
+        month_end = add_months(start, 1)
+        archive_period(start, month_end)
+        start = month_end
@@ -0,0 +1,171 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import os
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+
+from freezegun import freeze_time
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.tests import reverse
+
+from openzaak.components.zaken.tests.factories import ZaakFactory
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..archive import archive_period, get_archived_audittrails
+from ..models import ArchivedHoofdObject, AuditTrailArchive, HoofdObjectReference
+from ..tasks import archive_audittrails
+from ..utils import delete_audittrails
+
+
+def create_audittrail(url: str, **kwargs) -> AuditTrail:
+    return AuditTrail.objects.create(
+        hoofd_object=url, resource="zaak", resultaat=200, bron="ZRC", **kwargs
+    )
+
+
+@temp_private_root()
+@override_settings(AUDITTRAIL_ARCHIVE_AFTER_MONTHS=2)
+class ArchiveAuditTrailsTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.zaak = ZaakFactory.create()
+        self.zaak_url = f"http://testserver{reverse(self.zaak)}"
+        for timestamp in ["2024-01-15T10:00:00.123456Z", "2024-02-03T10:00:00Z"]:
+            with freeze_time(timestamp):
+                create_audittrail(self.zaak_url, oud={"a": 1}, nieuw={"a": 2})
+        with freeze_time("2024-05-01T10:00:00Z"):
+            self.recent = create_audittrail(self.zaak_url)
+
+    @freeze_time("2024-05-20")
+    def test_archive_audittrails(self):
+        archive_audittrails()
+
+        self.assertEqual(AuditTrailArchive.objects.count(), 2)
+        self.assertEqual(list(AuditTrail.objects.all()), [self.recent])
+        self.assertEqual(HoofdObjectReference.objects.count(), 1)
+        self.assertEqual(
+            ArchivedHoofdObject.objects.filter(uuid=self.zaak.uuid).count(), 2
+        )
+
+        archived = get_archived_audittrails(self.zaak.uuid)
+
+        self.assertEqual(len(archived), 2)
+        self.assertEqual(
+            archived[0].aanmaakdatum.isoformat(), "2024-01-15T10:00:00.123456+00:00"
+        )
+        self.assertEqual(archived[0].oud, {"a": 1})
+        self.assertEqual(archived[0].hoofd_object, self.zaak_url)
+
+    @freeze_time("2024-05-20")
+    def test_read_records_of_main_object_only(self):
+        other_zaak = ZaakFactory.create()
+        with freeze_time("2024-01-20T10:00:00Z"):
+            create_audittrail(f"http://testserver{reverse(other_zaak)}")
+        archive_audittrails()
+
+        segments = ArchivedHoofdObject.objects.filter(archive__start__month=1).order_by(
+            "offset"
+        )
+        self.assertEqual(
+            {segment.uuid for segment in segments}, {self.zaak.uuid, other_zaak.uuid}
+        )
+        self.assertEqual(segments[1].offset, segments[0].offset + segments[0].length)
+
+        with patch(
+            "openzaak.audittrails.archive.read_archive",
+            side_effect=AssertionError("the whole archive is read"),
+        ):
+            archived = get_archived_audittrails(other_zaak.uuid)
+
+        self.assertEqual(len(archived), 1)
+        self.assertEqual(
+            archived[0].hoofd_object, f"http://testserver{reverse(other_zaak)}"
+        )
+
+    def test_archive_audittrails_continues_after_last_archive(self):
+        with freeze_time("2024-04-20"):
+            archive_audittrails()
+        with freeze_time("2024-05-20"):
+            archive_audittrails()
+
+        self.assertEqual(AuditTrailArchive.objects.count(), 2)
+        self.assertEqual(len(get_archived_audittrails(self.zaak.uuid)), 2)
+
+    def test_archive_file_removed_on_rollback(self):
+        with patch(
+            "openzaak.audittrails.archive.materialize", side_effect=DatabaseError
+        ):
+            with self.assertRaises(DatabaseError):
+                archive_period(
+                    datetime(2024, 1, 1, tzinfo=timezone.utc),
+                    datetime(2024, 2, 1, tzinfo=timezone.utc),
+                )
+
+        self.assertFalse(AuditTrailArchive.objects.exists())
+        self.assertEqual(AuditTrail.objects.count(), 3)
+        archive_dir = os.path.join(settings.PRIVATE_MEDIA_ROOT, "audittrails/archive")
+        self.assertEqual(os.listdir(archive_dir), [])
+
+    @override_settings(AUDITTRAIL_ARCHIVE_AFTER_MONTHS=0)
+    def test_archival_disabled(self):
+        archive_audittrails()
+
+        self.assertFalse(AuditTrailArchive.objects.exists())
+        self.assertEqual(AuditTrail.objects.count(), 3)
+
+    @freeze_time("2024-05-20")
+    def test_delete_audittrails(self):
+        archive_audittrails()
+
+        delete_audittrails(self.zaak_url)
+
+        self.assertFalse(AuditTrail.objects.exists())
+        self.assertEqual(get_archived_audittrails(self.zaak.uuid), [])
+
+
+@temp_private_root()
+@override_settings(AUDITTRAIL_ARCHIVE_AFTER_MONTHS=2)
+class ArchivedAuditTrailEndpointTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        self.zaak = ZaakFactory.create()
+        zaak_url = f"http://testserver{reverse(self.zaak)}"
+        with freeze_time("2024-01-15T10:00:00Z"):
+            self.archived = create_audittrail(zaak_url)
+        with freeze_time("2024-05-01T10:00:00Z"):
+            self.recent = create_audittrail(zaak_url)
+        with freeze_time("2024-05-20"):
+            archive_audittrails()
+
+    def test_list(self):
+        response = self.client.get(
+            reverse("audittrail-list", kwargs={"zaak_uuid": self.zaak.uuid})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [audittrail["uuid"] for audittrail in response.data],
+            [str(self.archived.uuid), str(self.recent.uuid)],
+        )
+
+    def test_retrieve_archived(self):
+        response = self.client.get(
+            reverse(
+                "audittrail-detail",
+                kwargs={"zaak_uuid": self.zaak.uuid, "uuid": self.archived.uuid},
+            )
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["uuid"], str(self.archived.uuid))
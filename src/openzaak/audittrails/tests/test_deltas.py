@@ -0,0 +1,180 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.test import TestCase, override_settings
+
+from dictdiffer import diff
+from freezegun import freeze_time
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.tests import reverse
+
+from openzaak.components.zaken.tests.factories import ZaakFactory
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..archive import get_archived_audittrails
+from ..deltas import diff_snapshots, resolve_snapshots
+from ..models import AuditTrailDelta
+from ..tasks import archive_audittrails
+
+
+def get_states(url: str, count: int) -> list:
+    return [
+        {"url": url, "omschrijving": f"versie {index}", "kenmerken": list(range(index))}
+        for index in range(count)
+    ]
+
+
+def create_audittrails(url: str, states: list, timestamps=None) -> list:
+    timestamps = timestamps or [
+        f"2024-01-{index + 1:02}T10:00:00Z" for index in range(len(states))
+    ]
+    audittrails = []
+    for index, (oud, nieuw) in enumerate(zip([None] + states, states)):
+        with freeze_time(timestamps[index]):
+            audittrail = AuditTrail.objects.create(
+                hoofd_object=url,
+                resource="zaak",
+                resource_url=url,
+                resultaat=200,
+                bron="ZRC",
+                oud=oud,
+                nieuw=nieuw,
+            )
+        audittrails.append(audittrail)
+    return audittrails
+
+
+@override_settings(AUDITTRAIL_DIFF_STORAGE=True, AUDITTRAIL_CHECKPOINT_INTERVAL=3)
+class DiffStorageTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.zaak = ZaakFactory.create()
+        self.zaak_url = f"http://testserver{reverse(self.zaak)}"
+        self.states = get_states(self.zaak_url, 5)
+
+    def test_snapshots_stored_as_diff(self):
+        audittrails = create_audittrails(self.zaak_url, self.states)
+
+        # the instances keep their snapshots
+        self.assertEqual(audittrails[1].nieuw, self.states[1])
+
+        stored = AuditTrail.objects.order_by("pk").values_list("oud", "nieuw")
+        self.assertEqual(
+            [(oud is not None, nieuw is not None) for oud, nieuw in stored],
+            [
+                (False, True),
+                (False, False),
+                (False, False),
+                (True, True),
+                (False, False),
+            ],
+        )
+        self.assertEqual(
+            list(
+                AuditTrailDelta.objects.order_by("pk").values_list(
+                    "audittrail", "checkpoint"
+                )
+            ),
+            [
+                (audittrails[1].pk, audittrails[0].pk),
+                (audittrails[2].pk, audittrails[0].pk),
+                (audittrails[4].pk, audittrails[3].pk),
+            ],
+        )
+
+    def test_resolve_snapshots(self):
+        create_audittrails(self.zaak_url, self.states)
+        audittrails = list(AuditTrail.objects.order_by("pk"))
+
+        with self.assertNumQueries(2):
+            resolve_snapshots(audittrails)
+
+        self.assertEqual(
+            [audittrail.oud for audittrail in audittrails], [None] + self.states[:-1]
+        )
+        self.assertEqual([audittrail.nieuw for audittrail in audittrails], self.states)
+
+    def test_diff_snapshots(self):
+        create_audittrails(self.zaak_url, self.states)
+        audittrails = list(AuditTrail.objects.order_by("pk"))
+        resolve_snapshots(audittrails)
+
+        changed_keys = {"omschrijving", "kenmerken"}
+        # only the keys changed by the diffs of the deltas are compared
+        self.assertEqual(
+            [getattr(audittrail, "changed_keys", None) for audittrail in audittrails],
+            [None, changed_keys, changed_keys, None, changed_keys],
+        )
+        for audittrail in audittrails:
+            with self.subTest(audittrail=audittrail.pk):
+                self.assertEqual(
+                    diff_snapshots(audittrail),
+                    list(diff(audittrail.oud or {}, audittrail.nieuw or {})),
+                )
+
+    @override_settings(AUDITTRAIL_DIFF_STORAGE=False)
+    def test_diff_storage_disabled(self):
+        create_audittrails(self.zaak_url, self.states)
+
+        self.assertFalse(AuditTrailDelta.objects.exists())
+        self.assertFalse(AuditTrail.objects.filter(nieuw__isnull=True).exists())
+
+    def test_admin_history(self):
+        create_audittrails(self.zaak_url, self.states)
+
+        history = self.zaak.audittrail
+
+        self.assertEqual([audit.nieuw for audit, changes in history], self.states[::-1])
+        self.assertEqual(
+            history[0][1], [("change", {"omschrijving": ("versie 3", "versie 4")})]
+        )
+
+    @temp_private_root()
+    @override_settings(AUDITTRAIL_ARCHIVE_AFTER_MONTHS=2)
+    def test_archive_checkpoint(self):
+        create_audittrails(
+            self.zaak_url,
+            self.states,
+            timestamps=[
+                "2024-01-10T10:00:00Z",
+                "2024-01-11T10:00:00Z",
+                "2024-02-10T10:00:00Z",
+                "2024-02-11T10:00:00Z",
+                "2024-02-12T10:00:00Z",
+            ],
+        )
+
+        with freeze_time("2024-04-20"):
+            archive_audittrails()
+
+        archived = get_archived_audittrails(self.zaak.uuid)
+        self.assertEqual([audit.nieuw for audit in archived], self.states[:2])
+        # the checkpoint of the third record is archived, so its snapshots are
+        # stored in full again
+        remaining = AuditTrail.objects.order_by("pk").first()
+        self.assertEqual(remaining.nieuw, self.states[2])
+        self.assertEqual(AuditTrailDelta.objects.count(), 1)
+
+
+@override_settings(AUDITTRAIL_DIFF_STORAGE=True, AUDITTRAIL_CHECKPOINT_INTERVAL=3)
+class DiffStorageEndpointTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_list(self):
+        zaak = ZaakFactory.create()
+        zaak_url = f"http://testserver{reverse(zaak)}"
+        states = get_states(zaak_url, 3)
+        create_audittrails(zaak_url, states)
+
+        response = self.client.get(
+            reverse("audittrail-list", kwargs={"zaak_uuid": zaak.uuid})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([audit["nieuw"] for audit in response.data], states)
+        self.assertEqual(
+            [audit["oud"] for audit in response.data], [None] + states[:-1]
+        )
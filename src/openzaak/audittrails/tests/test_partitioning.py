@@ -0,0 +1,39 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from datetime import datetime, timezone
+
+from django.db import connection
+from django.test import TestCase
+
+from ..partitioning import TABLE, convert_to_partitioned, partition_name
+
+
+def get_indexed_columns(table: str) -> set:
+    """
+    Return the index methods and columns of the indexes of the table.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_get_indexdef(indexrelid) FROM pg_index "
+            "WHERE indrelid = to_regclass(%s)",
+            [table],
+        )
+        # e.g. "brin (aanmaakdatum)", the names differ per partition
+        return {row[0].split(" USING ", 1)[1] for row in cursor.fetchall()}
+
+
+class ConvertToPartitionedTests(TestCase):
+    def test_indexes_created_on_partitions(self):
+        indexes = get_indexed_columns(TABLE)
+
+        convert_to_partitioned(datetime(2024, 1, 15, tzinfo=timezone.utc), months=1)
+
+        partition = partition_name(datetime(2024, 2, 1, tzinfo=timezone.utc))
+        partition_indexes = get_indexed_columns(partition)
+        self.assertIn("brin (aanmaakdatum)", partition_indexes)
+        # the primary key and the unique UUID now include the partition key
+        self.assertEqual(
+            partition_indexes
+            - {"btree (id, aanmaakdatum)", "btree (uuid, aanmaakdatum)"},
+            indexes - {"btree (id)", "btree (uuid)"},
+        )
@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import uuid
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.tests import reverse
+
+from openzaak.components.zaken.tests.factories import ZaakFactory
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..models import HoofdObjectReference
+from ..utils import get_audittrails, parse_hoofd_object
+
+
+class ParseHoofdObjectTests(TestCase):
+    def test_parse_url(self):
+        zaak_uuid = uuid.uuid4()
+
+        parsed = parse_hoofd_object(f"http://testserver/zaken/api/v1/zaken/{zaak_uuid}")
+
+        self.assertEqual(parsed, ("zaken", zaak_uuid))
+
+    def test_parse_path(self):
+        eio_uuid = uuid.uuid4()
+
+        parsed = parse_hoofd_object(
+            f"/documenten/api/v1/enkelvoudiginformatieobjecten/{eio_uuid}/"
+        )
+
+        self.assertEqual(parsed, ("enkelvoudiginformatieobjecten", eio_uuid))
+
+    def test_parse_invalid_url(self):
+        self.assertIsNone(parse_hoofd_object("http://testserver/zaken/api/v1/zaken"))
+
+
+class HoofdObjectReferenceTests(TestCase):
+    def test_reference_created_with_audittrail(self):
+        zaak_uuid = uuid.uuid4()
+
+        audittrail = AuditTrail.objects.create(
+            hoofd_object=f"http://testserver/zaken/api/v1/zaken/{zaak_uuid}",
+            resource="zaak",
+            resultaat=201,
+        )
+
+        reference = HoofdObjectReference.objects.get()
+        self.assertEqual(reference.audittrail, audittrail)
+        self.assertEqual(reference.resource, "zaken")
+        self.assertEqual(reference.uuid, zaak_uuid)
+
+    def test_get_audittrails(self):
+        zaak_url = f"http://testserver/zaken/api/v1/zaken/{uuid.uuid4()}"
+        audittrail = AuditTrail.objects.create(
+            hoofd_object=zaak_url, resource="zaak", resultaat=201
+        )
+        AuditTrail.objects.create(
+            hoofd_object=f"http://testserver/zaken/api/v1/zaken/{uuid.uuid4()}",
+            resource="zaak",
+            resultaat=201,
+        )
+
+        with self.assertNumQueries(1):
+            audittrails = list(get_audittrails(zaak_url))
+
+        self.assertEqual(audittrails, [audittrail])
+
+    def test_get_audittrails_without_reference(self):
+        zaak_url = f"http://testserver/zaken/api/v1/zaken/{uuid.uuid4()}"
+        audittrail = AuditTrail.objects.create(
+            hoofd_object=zaak_url, resource="zaak", resultaat=201
+        )
+        # created before the references were introduced
+        HoofdObjectReference.objects.all().delete()
+
+        with self.subTest("fallback"):
+            self.assertEqual(list(get_audittrails(zaak_url)), [audittrail])
+
+        with self.subTest("no fallback"), override_settings(
+            AUDITTRAIL_HOOFD_OBJECT_FALLBACK=False
+        ):
+            self.assertEqual(list(get_audittrails(zaak_url)), [])
+
+    def test_backfill(self):
+        zaak_uuid = uuid.uuid4()
+        for _ in range(3):
+            AuditTrail.objects.create(
+                hoofd_object=f"http://testserver/zaken/api/v1/zaken/{zaak_uuid}",
+                resource="zaak",
+                resultaat=200,
+            )
+        AuditTrail.objects.create(
+            hoofd_object="http://testserver/invalid", resource="zaak", resultaat=200
+        )
+        # audit trail records created before the references were introduced
+        HoofdObjectReference.objects.all().delete()
+
+        call_command("backfill_audittrail_references", batch_size=2, stdout=StringIO())
+
+        self.assertEqual(HoofdObjectReference.objects.filter(uuid=zaak_uuid).count(), 3)
+        self.assertEqual(HoofdObjectReference.objects.count(), 3)
+
+
+class AuditTrailEndpointTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_list_audittrails_of_zaak(self):
+        zaak, other_zaak = ZaakFactory.create_batch(2)
+        audittrail = AuditTrail.objects.create(
+            hoofd_object=f"http://testserver{reverse(zaak)}",
+            resource="zaak",
+            resultaat=201,
+        )
+        AuditTrail.objects.create(
+            hoofd_object=f"http://testserver{reverse(other_zaak)}",
+            resource="zaak",
+            resultaat=201,
+        )
+
+        response = self.client.get(
+            reverse("audittrail-list", kwargs={"zaak_uuid": zaak.uuid})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["uuid"], str(audittrail.uuid))
+
+    def test_list_audittrails_of_zaak_without_reference(self):
+        zaak = ZaakFactory.create()
+        audittrail = AuditTrail.objects.create(
+            hoofd_object=f"http://testserver{reverse(zaak)}",
+            resource="zaak",
+            resultaat=201,
+        )
+        HoofdObjectReference.objects.all().delete()
+
+        response = self.client.get(
+            reverse("audittrail-list", kwargs={"zaak_uuid": zaak.uuid})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["uuid"], str(audittrail.uuid))
+
+    def test_list_audittrails_of_zaak_without_audittrails(self):
+        zaak = ZaakFactory.create()
+
+        response = self.client.get(
+            reverse("audittrail-list", kwargs={"zaak_uuid": zaak.uuid})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
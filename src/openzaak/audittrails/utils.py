@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import re
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+from uuid import UUID
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+
+from vng_api_common.audittrails.models import AuditTrail
+
+from .models import ArchivedHoofdObject, HoofdObjectReference
+
+HOOFD_OBJECT_PATH = re.compile(
+    r"/(?P<resource>[\w-]+)/(?P<uuid>[0-9a-fA-F]{8}-?(?:[0-9a-fA-F]{4}-?){3}[0-9a-fA-F]{12})/?$"
+)
+
+
+def parse_hoofd_object(url: str) -> Optional[Tuple[str, UUID]]:
+    """
+    Extract the resource type and UUID from the URL of a main object.
+    """
+    match = HOOFD_OBJECT_PATH.search(urlparse(url).path)
+    if match is None:
+        return None
+    return match.group("resource"), UUID(match.group("uuid"))
+
+
+def build_references(
+    audittrails: Iterable[Tuple[int, str]]
+) -> List[HoofdObjectReference]:
+    """
+    Build the references of ``(pk, hoofd_object)`` pairs of audit trail records.
+
+    Records of which the main object URL can't be parsed are skipped.
+    """
+    references = []
+    for pk, hoofd_object in audittrails:
+        parsed = parse_hoofd_object(hoofd_object)
+        if parsed is None:
+            continue
+        resource, uuid = parsed
+        references.append(
+            HoofdObjectReference(audittrail_id=pk, resource=resource, uuid=uuid)
+        )
+    return references
+
+
+def filter_hoofd_object(queryset: QuerySet, url: str) -> QuerySet:
+    """
+    Filter the audit trail records of the main object with the given URL.
+
+    ⚡️ The records are looked up through the indexed UUID of the main object,
+    rather than by searching the URL in the ``hoofd_object`` column.
+    """
+    parsed = parse_hoofd_object(url)
+    if parsed is None:
+        return queryset.filter(hoofd_object=url)
+    resource, uuid = parsed
+    if not settings.AUDITTRAIL_HOOFD_OBJECT_FALLBACK:
+        return queryset.filter(
+            hoofd_object_reference__uuid=uuid,
+            hoofd_object_reference__resource=resource,
+        )
+
+    # records without a reference (yet) are found by their URL
+    references = HoofdObjectReference.objects.filter(resource=resource, uuid=uuid)
+    return queryset.filter(
+        Q(pk__in=references.values("audittrail_id")) | Q(hoofd_object=url)
+    )
+
+
+def get_audittrails(url: str) -> QuerySet:
+    return filter_hoofd_object(AuditTrail.objects.all(), url)
+
+
+def delete_audittrails(url: str) -> None:
+    """
+    Delete the audit trail of the main object with the given URL.
+
+    Its archived records are no longer retrieved.
+    """
+    AuditTrail.objects.filter(hoofd_object=url).delete()
+    if parsed := parse_hoofd_object(url):
+        resource, uuid = parsed
+        ArchivedHoofdObject.objects.filter(resource=resource, uuid=uuid).delete()
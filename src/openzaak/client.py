@@ -5,16 +5,39 @@ Provide utilities to interact with other APIs as a client.
 """
 import logging
 
-from vng_api_common.client import Client, get_client, to_internal_data
+from vng_api_common.client import (
+    Client,
+    NoServiceConfigured,
+    get_client,
+    to_internal_data,
+)
+
+from openzaak.utils.cache import OutgoingRequestsSession
+
+__all__ = ["CachedClient", "fetch_object", "get_client"]
 
 logger = logging.getLogger(__name__)
 
 
+class CachedClient(Client, OutgoingRequestsSession):
+    """
+    Client caching the responses of GET requests.
+    """
+
+
 def fetch_object(url: str) -> dict | list | None:
     """
     Fetch a remote object by URL.
     """
-    client: Client = get_client(url, raise_exceptions=True)
+    from zgw_consumers.client import build_client
+    from zgw_consumers.models import Service
+
+    service = Service.get_service(url)
+    if not service:
+        logger.warning("No service configured for %s", url)
+        raise NoServiceConfigured(f"{url} API should be added to Service model")
+
+    client: CachedClient = build_client(service, client_factory=CachedClient)
 
     with client:
         return to_internal_data(client.get(url=url))
@@ -26,7 +26,7 @@ from .forms import (
     get_scope_choices,
 )
 from .models import CatalogusAutorisatie
-from .utils import get_related_object
+from .utils import get_related_objects
 
 
 def get_form_data(form: forms.Form) -> Dict[str, Dict]:
@@ -64,7 +64,6 @@ def get_initial_for_component(
     component: str,
     autorisaties: List[Autorisatie],
 ) -> List[Dict[str, Any]]:
-    _related_objs = {}
     _related_objs_external = {}
 
     internal_autorisaties = []
@@ -72,15 +71,16 @@ def get_initial_for_component(
 
     for autorisatie in autorisaties:
         if is_local_url(autorisatie):
-            obj = get_related_object(autorisatie)
-            _related_objs[autorisatie.pk] = obj
             internal_autorisaties.append(autorisatie)
         else:
             type_field = COMPONENT_TO_FIELDS_MAP[component]["_autorisatie_type_field"]
             _related_objs_external[autorisatie.pk] = getattr(autorisatie, type_field)
             external_autorisaties.append(autorisatie)
 
-    related_objs = {pk: obj.id for pk, obj in _related_objs.items() if obj is not None}
+    # ⚡️ resolve all the internal types at once instead of one query per autorisatie
+    related_objs = {
+        pk: obj.id for pk, obj in get_related_objects(internal_autorisaties).items()
+    }
 
     initial = []
 
@@ -176,7 +176,7 @@ def get_initial_for_component_for_catalogus_autorisaties(
             for va, _autorisaties in grouped_by_va.items():
                 _initial = {"vertrouwelijkheidaanduiding": va}
                 catalogus_autorisaties_for_va = [
-                    catalogus_autorisatie.catalogus.pk
+                    catalogus_autorisatie.catalogus_id
                     for catalogus_autorisatie in _autorisaties or []
                 ]
                 _initial.update(
@@ -191,7 +191,7 @@ def get_initial_for_component_for_catalogus_autorisaties(
                 {
                     "related_type_selection": RelatedTypeSelectionMethods.select_catalogus,
                     "catalogi": [
-                        catalogus_autorisatie.catalogus.pk
+                        catalogus_autorisatie.catalogus_id
                         for catalogus_autorisatie in catalogus_autorisaties or []
                     ],
                 }
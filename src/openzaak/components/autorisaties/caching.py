@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Shared caching of data derived from the configured autorisaties.
+
+All cache keys embed a global version number, which is bumped whenever an
+Applicatie, (Catalogus)Autorisatie or one of the catalogi types changes (see
+:mod:`openzaak.components.autorisaties.signals`). Outdated entries are never read
+again and simply expire.
+"""
+import hashlib
+import time
+from typing import Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_KEY = "autorisaties:version"
+
+
+def get_version() -> int:
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # start from a timestamp rather than 1, so that entries of a previous
+        # (evicted) version counter can never be read again
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def _bump_version() -> None:
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def invalidate_autorisaties_cache() -> None:
+    """
+    Invalidate everything that was cached based on the autorisaties.
+
+    The version is bumped again when the transaction is committed, to discard
+    entries that were built by concurrent requests from the uncommitted state.
+    """
+    _bump_version()
+    transaction.on_commit(_bump_version)
+
+
+def get_cache_key(prefix: str, *parts: Iterable) -> str:
+    """
+    Build a versioned cache key from the (string representation of) ``parts``.
+    """
+    raw = ":".join(str(part) for part in parts)
+    digest = hashlib.md5(raw.encode("utf-8")).hexdigest()
+    return f"autorisaties:{get_version()}:{prefix}:{digest}"
@@ -31,7 +31,9 @@ from openzaak.utils.auth import get_auth
 from openzaak.utils.middleware import override_request_host
 from openzaak.utils.validators import ResourceValidator
 
+from .caching import invalidate_autorisaties_cache
 from .constants import RelatedTypeSelectionMethods
+from .signals import disconnect_invalidate_cache_on_delete
 from .utils import (
     get_applicatie_serializer,
     send_applicatie_changed_notification,
@@ -366,13 +368,9 @@ class AutorisatieForm(forms.Form):
             # only pick a queryset of the explicitly selected objects
             if related_type_selection == RelatedTypeSelectionMethods.select_catalogus:
                 catalogi = self.cleaned_data["catalogi"]
-                types = []
-                for catalogus in catalogi:
-                    types += list(
-                        getattr(
-                            catalogus, f"{_field_info['_autorisatie_type_field']}_set"
-                        ).all()
-                    )
+                # ⚡️ fetch the types of all the selected catalogi in one query
+                types_queryset = self.fields[_field_info["types_field"]].queryset
+                types = list(types_queryset.filter(catalogus__in=catalogi))
             elif related_type_selection == RelatedTypeSelectionMethods.manual_select:
                 types = self.cleaned_data.get(_field_info["types_field"])
 
@@ -402,24 +400,27 @@ class AutorisatieForm(forms.Form):
             "vertrouwelijkheidaanduiding", ""
         )
 
-        types = self.get_types(component)
         # install a handler for future objects
         related_type_selection = self.cleaned_data.get("related_type_selection")
         if related_type_selection == RelatedTypeSelectionMethods.select_catalogus:
-            instance_pks = []
-            for catalogus in self.cleaned_data.get("catalogi", []):
-                instance = CatalogusAutorisatie.objects.create(
-                    applicatie=applicatie,
-                    component=component,
-                    catalogus=catalogus,
-                    scopes=scopes,
-                    max_vertrouwelijkheidaanduiding=vertrouwelijkheidaanduiding,
-                )
-                instance_pks.append(instance.pk)
+            CatalogusAutorisatie.objects.bulk_create(
+                [
+                    CatalogusAutorisatie(
+                        applicatie=applicatie,
+                        component=component,
+                        catalogus=catalogus,
+                        scopes=scopes,
+                        max_vertrouwelijkheidaanduiding=vertrouwelijkheidaanduiding,
+                    )
+                    for catalogus in self.cleaned_data.get("catalogi", [])
+                ]
+            )
 
             # In case a CatalogusAutorisatie in created, we don't want to create Autorisaties
             return
 
+        types = self.get_types(component)
+
         autorisatie_kwargs = {
             "applicatie": applicatie,
             "component": component,
@@ -475,13 +476,15 @@ class AutorisatieBaseFormSet(forms.BaseFormSet):
             self.applicatie, request=self.request
         ).data
 
-        self.applicatie.autorisaties.all().delete()
         # In case a component was changed for an existing CatalogusAutorisatie, we don't
         # want to have to figure out which row was changed and delete that row. Instead
-        # we delete all existing CatalogusAutorisaties and save all the forms in the
+        # we delete all existing (Catalogus)Autorisaties and save all the forms in the
         # formset, because the end result should always be the same as the submitted form
-        # data
-        self.applicatie.catalogusautorisatie_set.all().delete()
+        # data.
+        # The cache is invalidated once below, instead of for every deleted row.
+        with disconnect_invalidate_cache_on_delete(Autorisatie, CatalogusAutorisatie):
+            self.applicatie.autorisaties.all().delete()
+            self.applicatie.catalogusautorisatie_set.all().delete()
         for form in self.forms:
             form.save(applicatie=self.applicatie, request=self.request, commit=commit)
 
@@ -489,6 +492,9 @@ class AutorisatieBaseFormSet(forms.BaseFormSet):
             self.applicatie, request=self.request
         ).data
 
+        # autorisaties are bulk created and deleted without invalidating the cache
+        invalidate_autorisaties_cache()
+
         if not versions_equivalent(old_version, new_version):
             send_applicatie_changed_notification(self.applicatie, new_version)
 
@@ -582,7 +588,7 @@ class AutorisatieBaseFormSet(forms.BaseFormSet):
 
                     for _type in data.get(_field_info["types_field"], []):
                         catalogus_and_component = (
-                            _type.catalogus.pk,
+                            _type.catalogus_id,
                             data["component"],
                         )
                         if (
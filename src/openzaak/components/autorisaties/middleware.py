@@ -1,26 +1,170 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
-from typing import List, Union
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Union
 from urllib.parse import urlparse
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 import jwt
 from django_loose_fk.loaders import get_loader_class
-from django_loose_fk.utils import get_resource_for_path
 from rest_framework.exceptions import PermissionDenied
 from vng_api_common.authorizations.middleware import (
     AuthMiddleware as _AuthMiddleware,
     JWTAuth as _JWTAuth,
 )
-from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
 
 from openzaak.components.autorisaties.models import CatalogusAutorisatie
+from openzaak.components.catalogi.models import (
+    BesluitType,
+    InformatieObjectType,
+    ZaakType,
+)
 from openzaak.utils.constants import COMPONENT_MAPPING
 
+from .caching import get_cache_key
+
 loader = get_loader_class()()
 
+CATALOGUS_TYPE_MODELS = {
+    ComponentTypes.zrc: ZaakType,
+    ComponentTypes.drc: InformatieObjectType,
+    ComponentTypes.brc: BesluitType,
+}
+
+TYPE_FIELDS = ("zaaktype", "informatieobjecttype", "besluittype")
+
+
+def _get_va_order(value: str) -> Optional[int]:
+    if not value:
+        return None
+    return VertrouwelijkheidsAanduiding.get_choice_order(value)
+
+
+def _allows_va(max_va_order: Optional[int], value: str) -> bool:
+    order_provided = VertrouwelijkheidsAanduiding.get_choice_order(value)
+    if max_va_order is None or order_provided is None:
+        return False
+    return max_va_order >= order_provided
+
+
+@dataclass(frozen=True)
+class CachedAutorisatie:
+    scopes: FrozenSet[str]
+    max_va_order: Optional[int]
+    types: Dict[str, str]
+
+    def matches(self, **fields) -> bool:
+        for name, value in fields.items():
+            if value is None:
+                continue
+            if name == "vertrouwelijkheidaanduiding":
+                if not _allows_va(self.max_va_order, value):
+                    return False
+            elif self.types.get(name) != value:
+                return False
+        return True
+
+
+@dataclass(frozen=True)
+class CachedCatalogusAutorisatie:
+    scopes: FrozenSet[str]
+    max_va_order: Optional[int]
+    type_uuids: FrozenSet[str]
+
+    def matches(self, **fields) -> bool:
+        for name, value in fields.items():
+            if value is None:
+                continue
+            if name == "vertrouwelijkheidaanduiding":
+                if not _allows_va(self.max_va_order, value):
+                    return False
+            # only local types can be part of the catalogus
+            elif loader.is_local_url(value):
+                uuid = urlparse(value).path.rstrip("/").rsplit("/", 1)[-1]
+                if uuid not in self.type_uuids:
+                    return False
+        return True
+
+
+@dataclass
+class ClientAuthorizations:
+    """
+    Everything needed for the permission checks of a single client ID.
+
+    Instances are stored in the Django cache (see
+    :mod:`openzaak.components.autorisaties.caching`) so permission checks don't need
+    to query the database on every request.
+    """
+
+    applicaties: List[Applicatie] = field(default_factory=list)
+    autorisaties: Dict[str, List[CachedAutorisatie]] = field(default_factory=dict)
+    catalogus_autorisaties: Dict[str, List[CachedCatalogusAutorisatie]] = field(
+        default_factory=dict
+    )
+
+    @classmethod
+    def from_db(cls, client_id: str) -> "ClientAuthorizations":
+        applicaties = list(Applicatie.objects.filter(client_ids__contains=[client_id]))
+        app_ids = [app.id for app in applicaties]
+
+        autorisaties = defaultdict(list)
+        for autorisatie in Autorisatie.objects.filter(applicatie_id__in=app_ids):
+            autorisaties[autorisatie.component].append(
+                CachedAutorisatie(
+                    scopes=frozenset(autorisatie.scopes),
+                    max_va_order=_get_va_order(
+                        autorisatie.max_vertrouwelijkheidaanduiding
+                    ),
+                    types={name: getattr(autorisatie, name) for name in TYPE_FIELDS},
+                )
+            )
+
+        catalogus_autorisaties = list(
+            CatalogusAutorisatie.objects.filter(applicatie_id__in=app_ids)
+        )
+        # fetch the UUIDs of the types of all relevant catalogi in one go per component
+        type_uuids = defaultdict(set)
+        for component, model in CATALOGUS_TYPE_MODELS.items():
+            catalogus_ids = {
+                catalogus_autorisatie.catalogus_id
+                for catalogus_autorisatie in catalogus_autorisaties
+                if catalogus_autorisatie.component == component
+            }
+            if not catalogus_ids:
+                continue
+            for catalogus_id, uuid in model.objects.filter(
+                catalogus_id__in=catalogus_ids
+            ).values_list("catalogus_id", "uuid"):
+                type_uuids[(component, catalogus_id)].add(str(uuid))
+
+        cached_catalogus_autorisaties = defaultdict(list)
+        for catalogus_autorisatie in catalogus_autorisaties:
+            component = catalogus_autorisatie.component
+            cached_catalogus_autorisaties[component].append(
+                CachedCatalogusAutorisatie(
+                    scopes=frozenset(catalogus_autorisatie.scopes),
+                    max_va_order=_get_va_order(
+                        catalogus_autorisatie.max_vertrouwelijkheidaanduiding
+                    ),
+                    type_uuids=frozenset(
+                        type_uuids[(component, catalogus_autorisatie.catalogus_id)]
+                    ),
+                )
+            )
+
+        return cls(
+            applicaties=applicaties,
+            autorisaties=dict(autorisaties),
+            catalogus_autorisaties=dict(cached_catalogus_autorisaties),
+        )
+
 
 class JWTAuth(_JWTAuth):
     component = None
@@ -35,12 +179,33 @@ class JWTAuth(_JWTAuth):
                 code="jwt-{err}".format(err=type(exc).__name__.lower()),
             )
 
+    @property
+    def client_authorizations(self) -> ClientAuthorizations:
+        """
+        Retrieve the (cached) applicaties and autorisaties for the client ID.
+        """
+        if not hasattr(self, "_client_authorizations"):
+            if self.client_id is None:
+                self._client_authorizations = ClientAuthorizations()
+                return self._client_authorizations
+
+            cache_key = get_cache_key("client", self.client_id)
+            client_authorizations = cache.get(cache_key)
+            if client_authorizations is None:
+                client_authorizations = ClientAuthorizations.from_db(self.client_id)
+                cache.set(
+                    cache_key,
+                    client_authorizations,
+                    timeout=settings.AUTORISATIES_CACHE_TIMEOUT,
+                )
+            self._client_authorizations = client_authorizations
+        return self._client_authorizations
+
     @property
     def applicaties(self) -> Union[models.QuerySet, List, None]:
-        # Add caching, compared to base class since we do a lot of self.applicaties calls
-        if not hasattr(self, "_applicaties_qs"):
-            self._applicaties_qs = super().applicaties
-        return self._applicaties_qs
+        # Open Zaak is its own authorization component, there is nothing to request
+        # (see ``_request_auth``) so the applicaties can be taken from the cache
+        return self.client_authorizations.applicaties
 
     def _request_auth(self) -> list:
         return []
@@ -98,36 +263,20 @@ class JWTAuth(_JWTAuth):
         if not init_component:
             return False
 
-        autorisaties = self.get_autorisaties(init_component)
-        catalogus_autorisaties = self.get_catalogus_autorisaties(init_component)
-        has_catalogus_autorisaties = catalogus_autorisaties.exists()
+        component = COMPONENT_MAPPING.get(init_component, init_component)
+        client_authorizations = self.client_authorizations
         scopes_provided = set()
 
-        # filter on all additional components
-        for field_name, field_value in fields.items():
-            if hasattr(self, f"filter_{field_name}"):
-                autorisaties = getattr(self, f"filter_{field_name}")(
-                    autorisaties, field_value
-                )
-                if has_catalogus_autorisaties:
-                    catalogus_autorisaties = getattr(self, f"filter_{field_name}")(
-                        catalogus_autorisaties, field_value
-                    )
-            else:
-                autorisaties = self.filter_default(
-                    autorisaties, field_name, field_value
-                )
-                if has_catalogus_autorisaties and loader.is_local_url(field_value):
-                    resolved = get_resource_for_path(urlparse(field_value).path)
-                    catalogus_autorisaties = self.filter_default(
-                        catalogus_autorisaties, "catalogus", resolved.catalogus
-                    )
+        # filter on all additional fields
+        for autorisatie in client_authorizations.autorisaties.get(component, []):
+            if autorisatie.matches(**fields):
+                scopes_provided.update(autorisatie.scopes)
 
-        for autorisatie in autorisaties:
-            scopes_provided.update(autorisatie.scopes)
-
-        for catalogus_autorisatie in catalogus_autorisaties:
-            scopes_provided.update(catalogus_autorisatie.scopes)
+        for catalogus_autorisatie in client_authorizations.catalogus_autorisaties.get(
+            component, []
+        ):
+            if catalogus_autorisatie.matches(**fields):
+                scopes_provided.update(catalogus_autorisatie.scopes)
 
         return scopes.is_contained_in(list(scopes_provided))
 
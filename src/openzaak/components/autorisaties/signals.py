@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import logging
+from contextlib import contextmanager
+
+from django.db.models.base import ModelBase
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+
+from openzaak.components.catalogi.models import (
+    BesluitType,
+    Catalogus,
+    InformatieObjectType,
+    ZaakType,
+)
+
+from .caching import invalidate_autorisaties_cache
+from .models import CatalogusAutorisatie
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Applicatie,
+    dispatch_uid="autorisaties.invalidate_cache_applicatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Autorisatie,
+    dispatch_uid="autorisaties.invalidate_cache_autorisatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=CatalogusAutorisatie,
+    dispatch_uid="autorisaties.invalidate_cache_catalogusautorisatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Catalogus,
+    dispatch_uid="autorisaties.invalidate_cache_catalogus",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=ZaakType,
+    dispatch_uid="autorisaties.invalidate_cache_zaaktype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=InformatieObjectType,
+    dispatch_uid="autorisaties.invalidate_cache_informatieobjecttype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=BesluitType,
+    dispatch_uid="autorisaties.invalidate_cache_besluittype",
+)
+def invalidate_cache(sender: ModelBase, **kwargs) -> None:
+    logger.debug("Invalidating the autorisaties cache, triggered by %r", sender)
+    invalidate_autorisaties_cache()
+
+
+@contextmanager
+def disconnect_invalidate_cache_on_delete(*senders: ModelBase):
+    """
+    Don't invalidate the cache when instances of the senders are deleted.
+
+    ⚡️ Deleting a queryset sends the ``post_delete`` signal for every row, so the
+    cache must be invalidated once afterwards instead.
+    """
+    dispatch_uids = {
+        sender: f"autorisaties.invalidate_cache_{sender._meta.model_name}"
+        for sender in senders
+    }
+    for sender, dispatch_uid in dispatch_uids.items():
+        post_delete.disconnect(sender=sender, dispatch_uid=dispatch_uid)
+    try:
+        yield
+    finally:
+        for sender, dispatch_uid in dispatch_uids.items():
+            post_delete.connect(
+                invalidate_cache, sender=sender, dispatch_uid=dispatch_uid
+            )
@@ -49,6 +49,7 @@ from openzaak.notifications.tests.mixins import NotificationsConfigMixin
 from openzaak.tests.utils import mock_ztc_oas_get
 from openzaak.utils import build_absolute_url
 
+from ...admin_views import get_initial
 from ...constants import RelatedTypeSelectionMethods
 from ...models import CatalogusAutorisatie
 from ..factories import (
@@ -1564,3 +1565,96 @@ class ManageAutorisatiesAdmin(NotificationsConfigMixin, TestCase):
 
         self.assertEqual(response.status_code, 302)
         self.assertEqual(self.applicatie.autorisaties.count(), 2)
+
+    def test_load_initial_data_resolves_types_in_bulk(self):
+        zaaktypen = ZaakTypeFactory.create_batch(5, catalogus=self.catalogus)
+        iotypen = InformatieObjectTypeFactory.create_batch(5, catalogus=self.catalogus)
+        for zaaktype in zaaktypen:
+            AutorisatieFactory.create(
+                applicatie=self.applicatie,
+                component=ComponentTypes.zrc,
+                zaaktype=f"http://testserver{zaaktype.get_absolute_api_url()}",
+                scopes=[str(SCOPE_ZAKEN_ALLES_LEZEN)],
+                max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+            )
+        for iotype in iotypen:
+            AutorisatieFactory.create(
+                applicatie=self.applicatie,
+                component=ComponentTypes.drc,
+                informatieobjecttype=f"http://testserver{iotype.get_absolute_api_url()}",
+                scopes=[str(SCOPE_DOCUMENTEN_ALLES_LEZEN)],
+                max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+            )
+        CatalogusAutorisatieFactory.create(
+            applicatie=self.applicatie,
+            component=ComponentTypes.zrc,
+            catalogus=self.catalogus,
+            scopes=[str(SCOPE_ZAKEN_CREATE)],
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+        # catalogus autorisaties, autorisaties, zaaktypen and informatieobjecttypen
+        with self.assertNumQueries(4):
+            initial = get_initial(self.applicatie)
+
+        self.assertEqual(
+            initial,
+            [
+                {
+                    "component": ComponentTypes.zrc,
+                    "scopes": [str(SCOPE_ZAKEN_CREATE)],
+                    "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+                    "related_type_selection": RelatedTypeSelectionMethods.select_catalogus,
+                    "catalogi": [self.catalogus.pk],
+                },
+                {
+                    "component": ComponentTypes.zrc,
+                    "scopes": [str(SCOPE_ZAKEN_ALLES_LEZEN)],
+                    "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.geheim,
+                    "related_type_selection": RelatedTypeSelectionMethods.manual_select,
+                    "zaaktypen": {zaaktype.pk for zaaktype in zaaktypen},
+                    "externe_typen": [],
+                },
+                {
+                    "component": ComponentTypes.drc,
+                    "scopes": [str(SCOPE_DOCUMENTEN_ALLES_LEZEN)],
+                    "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.geheim,
+                    "related_type_selection": RelatedTypeSelectionMethods.manual_select,
+                    "informatieobjecttypen": {iotype.pk for iotype in iotypen},
+                    "externe_typen": [],
+                },
+            ],
+        )
+
+    def test_save_catalogus_autorisaties_in_bulk(self):
+        catalogi = CatalogusFactory.create_batch(3)
+        data = {
+            # management form
+            "form-TOTAL_FORMS": 1,
+            "form-INITIAL_FORMS": 0,
+            "form-MIN_NUM_FORMS": 0,
+            "form-MAX_NUM_FORMS": 1000,
+            "form-0-component": ComponentTypes.zrc,
+            "form-0-scopes": [str(SCOPE_ZAKEN_ALLES_LEZEN)],
+            "form-0-related_type_selection": RelatedTypeSelectionMethods.select_catalogus,
+            "form-0-catalogi": [catalogus.pk for catalogus in catalogi],
+            "form-0-vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+        }
+
+        response = self.client.post(self.url, data)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            set(
+                self.applicatie.catalogusautorisatie_set.values_list(
+                    "catalogus", flat=True
+                )
+            ),
+            {catalogus.pk for catalogus in catalogi},
+        )
+
+        # resubmitting replaces the existing catalogus autorisaties
+        response = self.client.post(self.url, data)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.applicatie.catalogusautorisatie_set.count(), 3)
@@ -0,0 +1,246 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from uuid import uuid4
+
+from django.test import TestCase
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.authorizations.utils import generate_jwt
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.components.zaken.api.scopes import SCOPE_ZAKEN_ALLES_LEZEN
+from openzaak.components.zaken.models import Zaak
+from openzaak.components.zaken.tests.factories import ZaakFactory
+from openzaak.components.zaken.tests.utils import ZAAK_READ_KWARGS
+from openzaak.tests.utils import ClearCachesMixin, JWTAuthMixin
+
+from ..caching import get_cache_key, get_version
+from ..middleware import JWTAuth
+from ..models import CatalogusAutorisatie
+from ..signals import disconnect_invalidate_cache_on_delete
+from .factories import (
+    ApplicatieFactory,
+    AutorisatieFactory,
+    CatalogusAutorisatieFactory,
+)
+
+
+class CacheVersionTests(ClearCachesMixin, TestCase):
+    def test_changes_bump_version(self):
+        version = get_version()
+        key = get_cache_key("test", [1, 2], "zrc")
+
+        AutorisatieFactory.create()
+
+        self.assertGreater(get_version(), version)
+        self.assertNotEqual(get_cache_key("test", [1, 2], "zrc"), key)
+
+    def test_disconnect_invalidate_cache_on_delete(self):
+        AutorisatieFactory.create_batch(2)
+        CatalogusAutorisatieFactory.create()
+        version = get_version()
+
+        with disconnect_invalidate_cache_on_delete(Autorisatie, CatalogusAutorisatie):
+            Autorisatie.objects.all().delete()
+            CatalogusAutorisatie.objects.all().delete()
+
+        self.assertEqual(get_version(), version)
+        self.assertFalse(Autorisatie.objects.exists())
+
+        # the receivers are connected again
+        AutorisatieFactory.create().delete()
+
+        self.assertGreater(get_version(), version)
+
+
+class FilterPlanTests(ClearCachesMixin, TestCase):
+    def test_plan_groups_types_by_max_vertrouwelijkheidaanduiding(self):
+        zaaktype1, zaaktype2, zaaktype3 = ZaakTypeFactory.create_batch(3)
+        applicatie = ApplicatieFactory.create()
+        for zaaktype, va in [
+            (zaaktype1, VertrouwelijkheidsAanduiding.openbaar),
+            (zaaktype2, VertrouwelijkheidsAanduiding.openbaar),
+            # the most permissive authorization wins
+            (zaaktype2, VertrouwelijkheidsAanduiding.geheim),
+            (zaaktype3, VertrouwelijkheidsAanduiding.geheim),
+        ]:
+            AutorisatieFactory.create(
+                applicatie=applicatie,
+                component=ComponentTypes.zrc,
+                scopes=[SCOPE_ZAKEN_ALLES_LEZEN.label],
+                zaaktype=f"http://testserver{reverse(zaaktype)}",
+                max_vertrouwelijkheidaanduiding=va,
+            )
+
+        plan = Zaak.objects.compile_filter_plan(
+            SCOPE_ZAKEN_ALLES_LEZEN, applicatie.autorisaties.all()
+        )
+
+        openbaar = VertrouwelijkheidsAanduiding.get_choice_order("openbaar")
+        geheim = VertrouwelijkheidsAanduiding.get_choice_order("geheim")
+        self.assertEqual(
+            plan.local,
+            {openbaar: {zaaktype1.pk}, geheim: {zaaktype2.pk, zaaktype3.pk}},
+        )
+        self.assertEqual(plan.external, {})
+
+    def test_unknown_local_type_matches_nothing(self):
+        zaaktype = ZaakTypeFactory.create()
+        applicatie = ApplicatieFactory.create()
+        for zaaktype_url in [
+            f"http://testserver{reverse(zaaktype)}",
+            # e.g. a zaaktype that was deleted
+            f"http://testserver{reverse('zaaktype-detail', kwargs={'uuid': uuid4()})}",
+        ]:
+            AutorisatieFactory.create(
+                applicatie=applicatie,
+                component=ComponentTypes.zrc,
+                scopes=[SCOPE_ZAKEN_ALLES_LEZEN.label],
+                zaaktype=zaaktype_url,
+                max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+            )
+
+        plan = Zaak.objects.compile_filter_plan(
+            SCOPE_ZAKEN_ALLES_LEZEN, applicatie.autorisaties.all()
+        )
+
+        openbaar = VertrouwelijkheidsAanduiding.get_choice_order("openbaar")
+        self.assertEqual(plan.local, {openbaar: {zaaktype.pk}})
+        self.assertEqual(plan.external, {})
+
+
+class CachedFilterPlanInvalidationTests(ClearCachesMixin, JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    component = ComponentTypes.zrc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+    def test_autorisatie_change_is_reflected(self):
+        ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+        url = reverse("zaak-list")
+
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 0)
+
+        self.autorisatie.max_vertrouwelijkheidaanduiding = (
+            VertrouwelijkheidsAanduiding.geheim
+        )
+        self.autorisatie.save()
+
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+
+    def test_new_zaaktype_in_catalogus_is_reflected(self):
+        CatalogusAutorisatieFactory.create(
+            catalogus=self.zaaktype.catalogus,
+            applicatie=self.applicatie,
+            component=self.component,
+            scopes=self.scopes,
+            max_vertrouwelijkheidaanduiding=self.max_vertrouwelijkheidaanduiding,
+        )
+        url = reverse("zaak-list")
+
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 0)
+
+        zaaktype = ZaakTypeFactory.create(catalogus=self.zaaktype.catalogus)
+        ZaakFactory.create(
+            zaaktype=zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+
+
+class JWTAuthCacheTests(ClearCachesMixin, JWTAuthMixin, TestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    component = ComponentTypes.zrc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+    def _get_jwt_auth(self) -> JWTAuth:
+        token = generate_jwt(
+            self.client_id, self.secret, self.user_id, self.user_representation
+        )
+        jwt_auth = JWTAuth(token.split(" ")[1])
+        # decoding the JWT looks up the secret, which is not part of the cache
+        jwt_auth.payload
+        return jwt_auth
+
+    def test_has_auth_is_answered_from_cache(self):
+        zaaktype_url = f"http://testserver{reverse(self.zaaktype)}"
+        self.assertTrue(
+            self._get_jwt_auth().has_auth(
+                SCOPE_ZAKEN_ALLES_LEZEN,
+                "zaken",
+                zaaktype=zaaktype_url,
+                vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+            )
+        )
+
+        jwt_auth = self._get_jwt_auth()
+
+        with self.assertNumQueries(0):
+            self.assertTrue(
+                jwt_auth.has_auth(
+                    SCOPE_ZAKEN_ALLES_LEZEN,
+                    "zaken",
+                    zaaktype=zaaktype_url,
+                    vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+                )
+            )
+            self.assertFalse(
+                jwt_auth.has_auth(
+                    SCOPE_ZAKEN_ALLES_LEZEN,
+                    "zaken",
+                    zaaktype=zaaktype_url,
+                    vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+                )
+            )
+
+    def test_catalogus_autorisatie_is_taken_into_account(self):
+        zaaktype = ZaakTypeFactory.create()
+        zaaktype_url = f"http://testserver{reverse(zaaktype)}"
+        self.assertFalse(
+            self._get_jwt_auth().has_auth(
+                SCOPE_ZAKEN_ALLES_LEZEN, "zaken", zaaktype=zaaktype_url
+            )
+        )
+
+        CatalogusAutorisatieFactory.create(
+            catalogus=zaaktype.catalogus,
+            applicatie=self.applicatie,
+            component=ComponentTypes.zrc,
+            scopes=[SCOPE_ZAKEN_ALLES_LEZEN.label],
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+        self.assertTrue(
+            self._get_jwt_auth().has_auth(
+                SCOPE_ZAKEN_ALLES_LEZEN, "zaken", zaaktype=zaaktype_url
+            )
+        )
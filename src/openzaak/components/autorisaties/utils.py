@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
-from typing import Any, Dict, Optional, Union
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Optional, Union
+from uuid import UUID
 
 from django.conf import settings
 from django.db.models.base import ModelBase
@@ -22,6 +24,7 @@ from openzaak.components.catalogi.models import (
 from openzaak.utils import build_absolute_url
 
 from .api.viewsets import ApplicatieViewSet
+from .caching import invalidate_autorisaties_cache
 
 RelatedTypeObject = Union[ZaakType, InformatieObjectType, BesluitType]
 
@@ -52,6 +55,45 @@ def get_related_object(autorisatie: Autorisatie) -> Optional[RelatedTypeObject]:
     return None
 
 
+COMPONENT_TO_TYPE = {
+    ComponentTypes.zrc: (ZaakType, "zaaktype"),
+    ComponentTypes.drc: (InformatieObjectType, "informatieobjecttype"),
+    ComponentTypes.brc: (BesluitType, "besluittype"),
+}
+
+
+def get_related_objects(
+    autorisaties: Iterable[Autorisatie],
+) -> Dict[int, RelatedTypeObject]:
+    """
+    Resolve the related types of the autorisaties, keyed by autorisatie pk.
+
+    ⚡️ Bulk variant of :func:`get_related_object` - the UUIDs are parsed from the
+    type URLs and every type model is queried only once.
+    """
+    uuids = defaultdict(dict)
+    for autorisatie in autorisaties:
+        if autorisatie.component not in COMPONENT_TO_TYPE:
+            continue
+        model, field = COMPONENT_TO_TYPE[autorisatie.component]
+        url = getattr(autorisatie, field)
+        if url == "":
+            continue
+        try:
+            uuid = UUID(url.rstrip("/").rsplit("/")[-1])
+        except ValueError:
+            continue
+        uuids[model][autorisatie.pk] = uuid
+
+    related_objects = {}
+    for model, uuids_by_pk in uuids.items():
+        objects = model.objects.in_bulk(set(uuids_by_pk.values()), field_name="uuid")
+        related_objects.update(
+            {pk: objects[uuid] for pk, uuid in uuids_by_pk.items() if uuid in objects}
+        )
+    return related_objects
+
+
 def sort_key(item: Any):
     if not isinstance(item, dict):
         return item
@@ -101,6 +143,9 @@ def send_applicatie_changed_notification(
 ):
     from openzaak.utils import build_fake_request
 
+    # the applicatie changed, so anything derived from it can no longer be used
+    invalidate_autorisaties_cache()
+
     viewset = ApplicatieViewSet()
     viewset.action = "update"
     if new_version is None:
@@ -20,7 +20,7 @@ from openzaak.components.zaken.api.utils import (
     delete_remote_zaakbesluit,
 )
 from openzaak.utils.api import create_remote_oio
-from openzaak.utils.serializers import ConvertNoneMixin
+from openzaak.utils.serializers import ConvertNoneMixin, HyperlinkedModelSerializer
 from openzaak.utils.validators import (
     LooseFkIsImmutableValidator,
     LooseFkResourceValidator,
@@ -34,7 +34,7 @@ from ..models import Besluit, BesluitInformatieObject
 from .validators import BesluittypeZaaktypeValidator, UniekeIdentificatieValidator
 
 
-class BesluitSerializer(ConvertNoneMixin, serializers.HyperlinkedModelSerializer):
+class BesluitSerializer(ConvertNoneMixin, HyperlinkedModelSerializer):
     vervalreden_weergave = serializers.CharField(
         source="get_vervalreden_display", read_only=True
     )
@@ -168,7 +168,7 @@ class BesluitSerializer(ConvertNoneMixin, serializers.HyperlinkedModelSerializer
         return besluit
 
 
-class BesluitInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
+class BesluitInformatieObjectSerializer(HyperlinkedModelSerializer):
     informatieobject = EnkelvoudigInformatieObjectField(
         validators=[
             LooseFkIsImmutableValidator(instance_path="canonical"),
@@ -20,7 +20,6 @@ from rest_framework.exceptions import ValidationError
 from vng_api_common.audittrails.viewsets import (
     AuditTrailCreateMixin,
     AuditTrailDestroyMixin,
-    AuditTrailViewsetMixin,
 )
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
@@ -31,7 +30,7 @@ from openzaak.utils.api import delete_remote_oio
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
 from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
-from openzaak.utils.views import AuditTrailViewSet
+from openzaak.utils.views import AuditTrailViewSet, AuditTrailViewsetMixin
 
 from ..models import Besluit, BesluitInformatieObject
 from .audits import AUDIT_BRC
@@ -11,15 +11,14 @@ from django.utils.translation import gettext_lazy as _
 from django_loose_fk.virtual_models import ProxyMixin
 from vng_api_common.caching import ETagMixin
 from vng_api_common.fields import RSINField
-from vng_api_common.models import APIMixin
-from vng_api_common.utils import generate_unique_identification
 from vng_api_common.validators import UntilTodayValidator
 from zgw_consumers.models import ServiceUrlField
 
 from openzaak.components.documenten.loaders import EIOLoader
+from openzaak.identification.generators import generate_identification
 from openzaak.loaders import AuthorizedRequestsLoader
 from openzaak.utils.fields import FkOrServiceUrlField, RelativeURLField, ServiceFkField
-from openzaak.utils.mixins import AuditTrailMixin
+from openzaak.utils.mixins import APIMixin, AuditTrailMixin
 
 from .constants import VervalRedenen
 from .query import BesluitInformatieObjectQuerySet, BesluitQuerySet
@@ -189,6 +188,8 @@ class Besluit(ETagMixin, AuditTrailMixin, APIMixin, models.Model):
 
     objects = BesluitQuerySet.as_manager()
 
+    IDENTIFICATIE_ORGANISATIE_FIELD = "verantwoordelijke_organisatie"
+
     class Meta:
         verbose_name = "besluit"
         verbose_name_plural = "besluiten"
@@ -210,7 +211,9 @@ class Besluit(ETagMixin, AuditTrailMixin, APIMixin, models.Model):
 
     def save(self, *args, **kwargs):
         if not self.identificatie:
-            self.identificatie = generate_unique_identification(self, "datum")
+            self.identificatie = generate_identification(
+                type(self), self.datum.year, self.verantwoordelijke_organisatie
+            )
 
         super().save(*args, **kwargs)
 
@@ -5,6 +5,9 @@ from django.utils.text import gettext_lazy as _
 from rest_framework import serializers
 from vng_api_common.utils import get_help_text
 
+from openzaak.utils.serializer_fields import HyperlinkedRelatedField
+from openzaak.utils.serializers import HyperlinkedModelSerializer
+
 from ...models import BesluitType, InformatieObjectType
 from ..validators import (
     ConceptUpdateValidator,
@@ -16,8 +19,8 @@ from ..validators import (
 )
 
 
-class BesluitTypeSerializer(serializers.HyperlinkedModelSerializer):
-    informatieobjecttypen = serializers.HyperlinkedRelatedField(
+class BesluitTypeSerializer(HyperlinkedModelSerializer):
+    informatieobjecttypen = HyperlinkedRelatedField(
         view_name="informatieobjecttype-detail",
         many=True,
         lookup_field="uuid",
@@ -25,7 +28,7 @@ class BesluitTypeSerializer(serializers.HyperlinkedModelSerializer):
         help_text=get_help_text("catalogi.BesluitType", "informatieobjecttypen"),
     )
 
-    zaaktypen = serializers.HyperlinkedRelatedField(
+    zaaktypen = HyperlinkedRelatedField(
         many=True,
         view_name="zaaktype-detail",
         lookup_field="uuid",
@@ -33,7 +36,7 @@ class BesluitTypeSerializer(serializers.HyperlinkedModelSerializer):
         help_text=get_help_text("catalogi.BesluitType", "zaaktypen"),
     )
 
-    resultaattypen = serializers.HyperlinkedRelatedField(
+    resultaattypen = HyperlinkedRelatedField(
         many=True,
         source="resultaattype_set",
         view_name="resultaattype-detail",
@@ -110,7 +113,7 @@ class BesluitTypeSerializer(serializers.HyperlinkedModelSerializer):
         ]
 
 
-class BesluitTypePublishSerializer(serializers.HyperlinkedModelSerializer):
+class BesluitTypePublishSerializer(HyperlinkedModelSerializer):
     class Meta:
         model = BesluitType
         fields = ("concept",)
@@ -2,13 +2,14 @@
 # Copyright (C) 2019 - 2020 Dimpact
 from django.utils.translation import gettext_lazy as _
 
-from rest_framework import serializers
+from openzaak.utils.serializer_fields import HyperlinkedRelatedField
+from openzaak.utils.serializers import HyperlinkedModelSerializer
 
 from ...models import Catalogus
 
 
-class CatalogusSerializer(serializers.HyperlinkedModelSerializer):
-    zaaktypen = serializers.HyperlinkedRelatedField(
+class CatalogusSerializer(HyperlinkedModelSerializer):
+    zaaktypen = HyperlinkedRelatedField(
         many=True,
         read_only=True,
         source="zaaktype_set",
@@ -19,7 +20,7 @@ class CatalogusSerializer(serializers.HyperlinkedModelSerializer):
         ),
     )
 
-    besluittypen = serializers.HyperlinkedRelatedField(
+    besluittypen = HyperlinkedRelatedField(
         many=True,
         read_only=True,
         source="besluittype_set",
@@ -30,7 +31,7 @@ class CatalogusSerializer(serializers.HyperlinkedModelSerializer):
         ),
     )
 
-    informatieobjecttypen = serializers.HyperlinkedRelatedField(
+    informatieobjecttypen = HyperlinkedRelatedField(
         many=True,
         read_only=True,
         source="informatieobjecttype_set",
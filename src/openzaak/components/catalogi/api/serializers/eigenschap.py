@@ -7,6 +7,8 @@ from rest_framework import serializers
 from vng_api_common.serializers import add_choice_values_help_text
 from vng_api_common.utils import get_help_text
 
+from openzaak.utils.serializer_fields import HyperlinkedRelatedField
+from openzaak.utils.serializers import HyperlinkedModelSerializer
 from openzaak.utils.validators import UniqueTogetherValidator
 
 from ...constants import FormaatChoices
@@ -38,12 +40,12 @@ class EigenschapSpecificatieSerializer(serializers.ModelSerializer):
 
 
 class EigenschapSerializer(
-    NestedCreateMixin, NestedUpdateMixin, serializers.HyperlinkedModelSerializer
+    NestedCreateMixin, NestedUpdateMixin, HyperlinkedModelSerializer
 ):
     specificatie = EigenschapSpecificatieSerializer(
         source="specificatie_van_eigenschap"
     )
-    catalogus = serializers.HyperlinkedRelatedField(
+    catalogus = HyperlinkedRelatedField(
         view_name="catalogus-detail",
         source="zaaktype.catalogus",
         read_only=True,
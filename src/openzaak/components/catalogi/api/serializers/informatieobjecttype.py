@@ -7,6 +7,8 @@ from rest_framework import serializers
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.serializers import add_choice_values_help_text
 
+from openzaak.utils.serializers import HyperlinkedModelSerializer
+
 from ...models import InformatieObjectType
 from ..validators import (
     ConceptUpdateValidator,
@@ -50,7 +52,7 @@ class OmschrijvingGeneriekSerializer(serializers.ModelSerializer):
         }
 
 
-class InformatieObjectTypeSerializer(serializers.HyperlinkedModelSerializer):
+class InformatieObjectTypeSerializer(HyperlinkedModelSerializer):
     omschrijving_generiek = OmschrijvingGeneriekSerializer(
         source="*",
         required=False,
@@ -141,7 +143,7 @@ class InformatieObjectTypeSerializer(serializers.HyperlinkedModelSerializer):
         return iotype
 
 
-class InformatieObjectTypePublishSerializer(serializers.HyperlinkedModelSerializer):
+class InformatieObjectTypePublishSerializer(HyperlinkedModelSerializer):
     class Meta:
         model = InformatieObjectType
         fields = ("concept",)
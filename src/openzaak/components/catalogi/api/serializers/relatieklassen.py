@@ -6,6 +6,8 @@ from rest_framework import serializers
 from vng_api_common.serializers import add_choice_values_help_text
 from vng_api_common.utils import get_help_text
 
+from openzaak.utils.serializer_fields import HyperlinkedRelatedField
+from openzaak.utils.serializers import HyperlinkedModelSerializer
 from openzaak.utils.validators import UniqueTogetherValidator
 
 from ...constants import RichtingChoices
@@ -13,14 +15,14 @@ from ...models import ZaakTypeInformatieObjectType
 from ..validators import ZaakTypeInformatieObjectTypeCatalogusValidator, is_force_write
 
 
-class ZaakTypeInformatieObjectTypeSerializer(serializers.HyperlinkedModelSerializer):
+class ZaakTypeInformatieObjectTypeSerializer(HyperlinkedModelSerializer):
     """
     Represent a ZaakTypeInformatieObjectType.
 
     Relatie met informatieobjecttype dat relevant is voor zaaktype.
     """
 
-    catalogus = serializers.HyperlinkedRelatedField(
+    catalogus = HyperlinkedRelatedField(
         view_name="catalogus-detail",
         source="zaaktype.catalogus",
         read_only=True,
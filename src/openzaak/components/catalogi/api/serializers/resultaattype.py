@@ -16,6 +16,8 @@ from vng_api_common.serializers import (
 )
 from vng_api_common.utils import get_help_text
 
+from openzaak.utils.serializer_fields import HyperlinkedRelatedField
+from openzaak.utils.serializers import HyperlinkedModelSerializer
 from openzaak.utils.validators import ResourceValidator, UniqueTogetherValidator
 
 from ...models import ResultaatType
@@ -50,9 +52,7 @@ class BrondatumArchiefprocedureSerializer(GegevensGroepSerializer):
         return fields
 
 
-class ResultaatTypeSerializer(
-    NestedGegevensGroepMixin, serializers.HyperlinkedModelSerializer
-):
+class ResultaatTypeSerializer(NestedGegevensGroepMixin, HyperlinkedModelSerializer):
 
     brondatum_archiefprocedure = BrondatumArchiefprocedureSerializer(
         label=_("Brondatum archiefprocedure"),
@@ -63,7 +63,7 @@ class ResultaatTypeSerializer(
             "start van de Archiefactietermijn (=brondatum) van het zaakdossier."
         ),
     )
-    catalogus = serializers.HyperlinkedRelatedField(
+    catalogus = HyperlinkedRelatedField(
         view_name="catalogus-detail",
         source="zaaktype.catalogus",
         read_only=True,
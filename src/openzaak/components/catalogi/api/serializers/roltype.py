@@ -8,12 +8,15 @@ from vng_api_common.constants import RolOmschrijving
 from vng_api_common.serializers import add_choice_values_help_text
 from vng_api_common.utils import get_help_text
 
+from openzaak.utils.serializer_fields import HyperlinkedRelatedField
+from openzaak.utils.serializers import HyperlinkedModelSerializer
+
 from ...models import RolType
 from ..validators import StartBeforeEndValidator, ZaakTypeConceptValidator
 
 
-class RolTypeSerializer(NestedCreateMixin, serializers.HyperlinkedModelSerializer):
-    catalogus = serializers.HyperlinkedRelatedField(
+class RolTypeSerializer(NestedCreateMixin, HyperlinkedModelSerializer):
+    catalogus = HyperlinkedRelatedField(
         view_name="catalogus-detail",
         source="zaaktype.catalogus",
         read_only=True,
@@ -6,6 +6,9 @@ from drf_writable_nested import NestedCreateMixin, NestedUpdateMixin
 from rest_framework import serializers
 from vng_api_common.utils import get_help_text
 
+from openzaak.utils.serializer_fields import HyperlinkedRelatedField
+from openzaak.utils.serializers import HyperlinkedModelSerializer
+
 from ...models import CheckListItem, StatusType
 from ..validators import StartBeforeEndValidator, ZaakTypeConceptValidator
 
@@ -22,7 +25,7 @@ class CheckListItemSerializer(serializers.ModelSerializer):
 
 
 class StatusTypeSerializer(
-    NestedCreateMixin, NestedUpdateMixin, serializers.HyperlinkedModelSerializer
+    NestedCreateMixin, NestedUpdateMixin, HyperlinkedModelSerializer
 ):
     is_eindstatus = serializers.BooleanField(
         read_only=True,
@@ -32,7 +35,7 @@ class StatusTypeSerializer(
             "met het hoogste volgnummer."
         ),
     )
-    catalogus = serializers.HyperlinkedRelatedField(
+    catalogus = HyperlinkedRelatedField(
         view_name="catalogus-detail",
         source="zaaktype.catalogus",
         read_only=True,
@@ -47,7 +50,7 @@ class StatusTypeSerializer(
             "Unieke identificatie van het ZAAKTYPE binnen de CATALOGUS waarin het ZAAKTYPE voorkomt."
         ),
     )
-    eigenschappen = serializers.HyperlinkedRelatedField(
+    eigenschappen = HyperlinkedRelatedField(
         view_name="eigenschap-detail",
         many=True,
         read_only=True,
@@ -57,7 +60,7 @@ class StatusTypeSerializer(
             "voordat een STATUS van dit STATUSTYPE kan worden gezet."
         ),
     )
-    zaakobjecttypen = serializers.HyperlinkedRelatedField(
+    zaakobjecttypen = HyperlinkedRelatedField(
         view_name="zaakobjecttype-detail",
         many=True,
         read_only=True,
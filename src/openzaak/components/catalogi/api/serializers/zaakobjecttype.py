@@ -3,9 +3,11 @@
 from django.utils.translation import gettext as _
 
 from rest_framework import serializers
-from rest_framework.serializers import HyperlinkedModelSerializer
 from vng_api_common.utils import get_help_text
 
+from openzaak.utils.serializer_fields import HyperlinkedRelatedField
+from openzaak.utils.serializers import HyperlinkedModelSerializer
+
 from ...models import ZaakObjectType
 from ..validators import (
     RelationZaaktypeValidator,
@@ -23,7 +25,7 @@ class ZaakObjectTypeSerializer(HyperlinkedModelSerializer):
             "Unieke identificatie van het ZAAKTYPE binnen de CATALOGUS waarin het ZAAKTYPE voorkomt."
         ),
     )
-    catalogus = serializers.HyperlinkedRelatedField(
+    catalogus = HyperlinkedRelatedField(
         view_name="catalogus-detail",
         source="zaaktype.catalogus",
         read_only=True,
@@ -5,12 +5,7 @@ from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 
 from drf_writable_nested import NestedCreateMixin, NestedUpdateMixin
-from rest_framework.serializers import (
-    DateField,
-    HyperlinkedModelSerializer,
-    HyperlinkedRelatedField,
-    ModelSerializer,
-)
+from rest_framework.serializers import DateField, ModelSerializer
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.serializers import (
     GegevensGroepSerializer,
@@ -18,6 +13,8 @@ from vng_api_common.serializers import (
     add_choice_values_help_text,
 )
 
+from openzaak.utils.serializer_fields import HyperlinkedRelatedField
+from openzaak.utils.serializers import HyperlinkedModelSerializer
 from openzaak.utils.validators import ResourceValidator
 
 from ...constants import AardRelatieChoices, RichtingChoices
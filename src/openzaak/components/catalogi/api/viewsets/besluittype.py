@@ -11,6 +11,7 @@ from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
 from openzaak.utils.schema import COMMON_ERROR_RESPONSES, VALIDATION_ERROR_RESPONSES
 
+from ...caching import cache_response
 from ...models import BesluitType
 from ..filters import BesluitTypeFilter
 from ..kanalen import KANAAL_BESLUITTYPEN
@@ -53,6 +54,7 @@ from .mixins import ConceptMixin, M2MConceptDestroyMixin
     ),
 )
 @conditional_retrieve()
+@cache_response()
 class BesluitTypeViewSet(
     CheckQueryParamsMixin,
     ConceptMixin,
@@ -8,6 +8,7 @@ from vng_api_common.viewsets import CheckQueryParamsMixin
 from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
 
+from ...caching import cache_response
 from ...models import Catalogus
 from ..filters import CatalogusFilter
 from ..scopes import SCOPE_CATALOGI_READ, SCOPE_CATALOGI_WRITE
@@ -28,6 +29,7 @@ from ..serializers import CatalogusSerializer
     ),
 )
 @conditional_retrieve()
+@cache_response()
 class CatalogusViewSet(
     CheckQueryParamsMixin, mixins.CreateModelMixin, viewsets.ReadOnlyModelViewSet
 ):
@@ -9,6 +9,7 @@ from openzaak.components.catalogi.models import Eigenschap
 from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
 
+from ...caching import cache_response
 from ..filters import EigenschapFilter
 from ..scopes import (
     SCOPE_CATALOGI_FORCED_DELETE,
@@ -59,6 +60,7 @@ from .mixins import ZaakTypeConceptMixin
     ),
 )
 @conditional_retrieve()
+@cache_response()
 class EigenschapViewSet(
     CheckQueryParamsMixin, ZaakTypeConceptMixin, viewsets.ModelViewSet
 ):
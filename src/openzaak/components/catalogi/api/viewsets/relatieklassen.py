@@ -12,6 +12,7 @@ from vng_api_common.viewsets import CheckQueryParamsMixin
 from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
 
+from ...caching import cache_response
 from ...models import ZaakTypeInformatieObjectType
 from ..filters import ZaakTypeInformatieObjectTypeFilter
 from ..scopes import (
@@ -75,6 +76,7 @@ from .mixins import ConceptDestroyMixin, ConceptFilterMixin
     ),
 )
 @conditional_retrieve()
+@cache_response()
 class ZaakTypeInformatieObjectTypeViewSet(
     CheckQueryParamsMixin,
     ConceptFilterMixin,
@@ -8,6 +8,7 @@ from vng_api_common.viewsets import CheckQueryParamsMixin
 from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
 
+from ...caching import cache_response
 from ...models import RolType
 from ..filters import RolTypeFilter
 from ..scopes import (
@@ -59,6 +60,7 @@ from .mixins import ZaakTypeConceptMixin
     ),
 )
 @conditional_retrieve()
+@cache_response()
 class RolTypeViewSet(
     CheckQueryParamsMixin, ZaakTypeConceptMixin, viewsets.ModelViewSet
 ):
@@ -8,6 +8,7 @@ from vng_api_common.viewsets import CheckQueryParamsMixin
 from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
 
+from ...caching import cache_response
 from ...models import ZaakObjectType
 from ..filters import ZaakObjectTypeFilter
 from ..scopes import (
@@ -47,6 +48,7 @@ from .mixins import ZaakTypeConceptMixin
     ),
 )
 @conditional_retrieve()
+@cache_response()
 class ZaakObjectTypeViewSet(
     CheckQueryParamsMixin, ZaakTypeConceptMixin, viewsets.ModelViewSet
 ):
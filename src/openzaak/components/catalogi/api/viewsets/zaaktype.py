@@ -12,6 +12,7 @@ from openzaak.utils.pagination import OptimizedPagination
 from openzaak.utils.permissions import AuthRequired
 from openzaak.utils.schema import COMMON_ERROR_RESPONSES, VALIDATION_ERROR_RESPONSES
 
+from ...caching import cache_response
 from ...models import ZaakType
 from ..filters import ZaakTypeFilter
 from ..kanalen import KANAAL_ZAAKTYPEN
@@ -77,6 +78,7 @@ from .mixins import (
     ),
 )
 @conditional_retrieve()
+@cache_response()
 class ZaakTypeViewSet(
     CheckQueryParamsMixin,
     ConceptPublishMixin,
@@ -0,0 +1,258 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Caching of published catalogi objects and of the responses of the Catalogi API.
+
+Published (non-concept) types are looked up on nearly every request to the Zaken,
+Documenten and Besluiten APIs, while they hardly ever change. They are kept in a
+small LRU cache per process, backed by the shared cache, keyed by their UUID.
+
+All entries are tagged with a global version number in the shared cache, which is
+bumped whenever one of the catalogi objects changes (see
+:mod:`openzaak.components.catalogi.signals`). Other processes notice the new
+version and no longer use their outdated entries. The version is read once per
+request.
+
+The rendered responses of the read endpoints of the Catalogi API are cached with
+the same version (see :func:`cache_response`), as clients poll these endpoints
+while their content only changes when the catalogi are edited.
+"""
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Iterable, Optional, Tuple, Type
+from urllib.parse import urlencode
+from uuid import UUID
+
+from django.conf import settings
+from django.core import signals
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.http import HttpResponse
+from django.urls import Resolver404, get_resolver, get_script_prefix
+
+from django_loose_fk.utils import get_resource_for_path as _get_resource_for_path
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+VERSION_KEY = "catalogi:version"
+
+# the maximum number of objects kept in the cache of a process
+MAX_SIZE = 1024
+
+# the cached models, with the relations that are loaded along with them
+CACHED_MODELS = {
+    "catalogi.ZaakType": ("catalogus",),
+    "catalogi.InformatieObjectType": ("catalogus",),
+    "catalogi.BesluitType": ("catalogus",),
+    "catalogi.StatusType": ("zaaktype", "zaaktype__catalogus"),
+    "catalogi.ResultaatType": ("zaaktype", "zaaktype__catalogus"),
+    "catalogi.RolType": ("zaaktype", "zaaktype__catalogus"),
+    "catalogi.Eigenschap": ("zaaktype", "zaaktype__catalogus"),
+}
+
+_objects: "OrderedDict[str, Tuple[int, bytes]]" = OrderedDict()
+_objects_lock = threading.Lock()
+
+_state = threading.local()
+
+
+def _start_request(**kwargs):
+    _state.in_request = True
+    _state.version = None
+
+
+def _finish_request(**kwargs):
+    _state.in_request = False
+    _state.version = None
+
+
+signals.request_started.connect(_start_request)
+signals.request_finished.connect(_finish_request)
+
+
+def get_version() -> int:
+    """
+    Return the current version, which is read once per request.
+    """
+    version = getattr(_state, "version", None)
+    if version is None:
+        version = cache.get(VERSION_KEY)
+        if version is None:
+            # start from a timestamp rather than 1, so that entries of a previous
+            # (evicted) version counter can never be read again
+            cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+            version = cache.get(VERSION_KEY)
+        if getattr(_state, "in_request", False):
+            _state.version = version
+    return version
+
+
+def _bump_version() -> None:
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+    _state.version = None
+
+
+def invalidate_catalogi_cache() -> None:
+    """
+    Invalidate the cached catalogi objects in all processes.
+
+    The version is bumped again when the transaction is committed, to discard
+    entries that were cached by concurrent requests from the uncommitted state.
+    """
+    _bump_version()
+    transaction.on_commit(_bump_version)
+
+
+def _is_published(obj: models.Model) -> bool:
+    if hasattr(obj, "concept"):
+        return not obj.concept
+    return not obj.zaaktype.concept
+
+
+def get_published_object(
+    model: Type[models.Model], uuid: UUID
+) -> Optional[models.Model]:
+    """
+    Return the published catalogi object with the given UUID.
+
+    ``None`` is returned if the model is not cached, or if the object does not
+    exist or is still a concept - callers fall back to a regular lookup.
+    """
+    label = model._meta.label
+    if label not in CACHED_MODELS:
+        return None
+
+    version = get_version()
+    key = f"{label}:{uuid}"
+
+    with _objects_lock:
+        entry = _objects.get(key)
+        if entry is not None and entry[0] == version:
+            _objects.move_to_end(key)
+            return pickle.loads(entry[1])
+
+    shared_key = f"catalogi:{version}:{key}"
+    obj = cache.get(shared_key)
+    if obj is None:
+        queryset = model._default_manager.select_related(*CACHED_MODELS[label])
+        try:
+            obj = queryset.filter(uuid=uuid).first()
+        except ValidationError:  # not a valid UUID
+            return None
+        if obj is None or not _is_published(obj):
+            return None
+        cache.set(shared_key, obj, timeout=settings.CATALOGI_CACHE_TIMEOUT)
+
+    with _objects_lock:
+        _objects[key] = (version, pickle.dumps(obj))
+        _objects.move_to_end(key)
+        while len(_objects) > MAX_SIZE:
+            _objects.popitem(last=False)
+    return obj
+
+
+def _resolve_path(path: str) -> Tuple[Optional[Type[models.Model]], Optional[str]]:
+    if settings.FORCE_SCRIPT_NAME and path.startswith(settings.FORCE_SCRIPT_NAME):
+        path = path[len(settings.FORCE_SCRIPT_NAME) :]
+    path = path.replace(get_script_prefix(), "/", 1)
+
+    try:
+        match = get_resolver().resolve(path)
+    except Resolver404:
+        return None, None
+
+    viewset = getattr(match.func, "cls", None)
+    queryset = getattr(viewset, "queryset", None)
+    if queryset is None or "uuid" not in match.kwargs:
+        return None, None
+    return queryset.model, match.kwargs["uuid"]
+
+
+def get_resource_for_path(path: str) -> models.Model:
+    """
+    Retrieve the API instance belonging to a (detail) path.
+
+    Published catalogi objects are taken from the cache, other resources are
+    retrieved with :func:`django_loose_fk.utils.get_resource_for_path`.
+    """
+    if settings.CATALOGI_CACHE_ENABLED:
+        model, uuid = _resolve_path(path)
+        if model is not None and (obj := get_published_object(model, uuid)):
+            return obj
+    return _get_resource_for_path(path)
+
+
+def get_response_cache_key(request: Request) -> str:
+    """
+    Build the cache key of the response to a request.
+
+    The key consists of the URL with the normalized query string, the negotiated
+    media type and the applicaties of the client.
+    """
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    applicaties = sorted(str(app.uuid) for app in request.jwt_auth.applicaties)
+    raw = ":".join(
+        [
+            request.build_absolute_uri(request.path),
+            query,
+            request.accepted_media_type,
+            ",".join(applicaties),
+        ]
+    )
+    digest = hashlib.md5(raw.encode("utf-8")).hexdigest()
+    return f"catalogi:{get_version()}:response:{digest}"
+
+
+def _cache_handler(handler):
+    @wraps(handler)
+    def cached_handler(viewset, request, *args, **kwargs):
+        if not settings.CATALOGI_RESPONSE_CACHE_ENABLED:
+            return handler(viewset, request, *args, **kwargs)
+
+        cache_key = get_response_cache_key(request)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            # ⚡️ skip the database and the serializer altogether
+            content, content_type = cached
+            return HttpResponse(content, content_type=content_type)
+
+        response = handler(viewset, request, *args, **kwargs)
+        if isinstance(response, Response) and response.status_code == 200:
+
+            def store(rendered: Response) -> None:
+                cache.set(
+                    cache_key,
+                    (rendered.content, rendered["Content-Type"]),
+                    timeout=settings.CATALOGI_CACHE_TIMEOUT,
+                )
+
+            response.add_post_render_callback(store)
+        return response
+
+    return cached_handler
+
+
+def cache_response(actions: Iterable[str] = ("list", "retrieve")):
+    """
+    Decorate a viewset to cache the rendered responses of the read actions.
+
+    Apply it below :func:`vng_api_common.caching.conditional_retrieve`, so that
+    conditional requests are still answered based on the ETag of the resource.
+    The permissions are checked before the handler is called, so only clients with
+    access get a cached response.
+    """
+
+    def decorator(viewset: type):
+        for action in actions:
+            setattr(viewset, action, _cache_handler(getattr(viewset, action)))
+        return viewset
+
+    return decorator
@@ -4,11 +4,19 @@ from functools import partial
 
 from django.db import models, transaction
 
+from openzaak.components.autorisaties.caching import invalidate_autorisaties_cache
 from openzaak.components.autorisaties.models import CatalogusAutorisatie
 
+from .caching import invalidate_catalogi_cache
+
 
 class SyncAutorisatieManager(models.Manager):
     @transaction.atomic
     def bulk_create(self, objs, *args, **kwargs):
         transaction.on_commit(partial(CatalogusAutorisatie.sync, objs))
+        # bulk_create does not send signals, but the types may be part of a catalogus
+        # that is used in CatalogusAutorisaties
+        invalidate_autorisaties_cache()
+        # nor does it invalidate the cached responses of the Catalogi API
+        invalidate_catalogi_cache()
         return super().bulk_create(objs, *args, **kwargs)
@@ -4,14 +4,29 @@ import logging
 from typing import Union
 
 from django.db.models.base import ModelBase
-from django.db.models.signals import ModelSignal, post_delete
+from django.db.models.signals import ModelSignal, m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
 from vng_api_common.authorizations.models import Applicatie, Autorisatie
 
 from openzaak.utils import build_absolute_url
 
-from .models import BesluitType, InformatieObjectType, ZaakType
+from .caching import invalidate_catalogi_cache
+from .models import (
+    BesluitType,
+    Catalogus,
+    CheckListItem,
+    Eigenschap,
+    EigenschapSpecificatie,
+    InformatieObjectType,
+    ResultaatType,
+    RolType,
+    StatusType,
+    ZaakObjectType,
+    ZaakType,
+    ZaakTypeInformatieObjectType,
+    ZaakTypenRelatie,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -73,3 +88,102 @@ def sync_autorisaties(
     )
     logger.info("Deleting applications: %s", apps_to_delete)
     apps_to_delete.delete()
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Catalogus,
+    dispatch_uid="catalogi.invalidate_cache_catalogus",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=ZaakType,
+    dispatch_uid="catalogi.invalidate_cache_zaaktype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=StatusType,
+    dispatch_uid="catalogi.invalidate_cache_statustype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=ResultaatType,
+    dispatch_uid="catalogi.invalidate_cache_resultaattype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=RolType,
+    dispatch_uid="catalogi.invalidate_cache_roltype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Eigenschap,
+    dispatch_uid="catalogi.invalidate_cache_eigenschap",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=InformatieObjectType,
+    dispatch_uid="catalogi.invalidate_cache_informatieobjecttype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=BesluitType,
+    dispatch_uid="catalogi.invalidate_cache_besluittype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=EigenschapSpecificatie,
+    dispatch_uid="catalogi.invalidate_cache_eigenschapspecificatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=CheckListItem,
+    dispatch_uid="catalogi.invalidate_cache_checklistitem",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=ZaakObjectType,
+    dispatch_uid="catalogi.invalidate_cache_zaakobjecttype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=ZaakTypeInformatieObjectType,
+    dispatch_uid="catalogi.invalidate_cache_zaaktypeinformatieobjecttype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=ZaakTypenRelatie,
+    dispatch_uid="catalogi.invalidate_cache_zaaktypenrelatie",
+)
+@receiver(
+    m2m_changed,
+    sender=BesluitType.informatieobjecttypen.through,
+    dispatch_uid="catalogi.invalidate_cache_besluittype_informatieobjecttypen",
+)
+@receiver(
+    m2m_changed,
+    sender=BesluitType.zaaktypen.through,
+    dispatch_uid="catalogi.invalidate_cache_besluittype_zaaktypen",
+)
+@receiver(
+    m2m_changed,
+    sender=ResultaatType.informatieobjecttypen.through,
+    dispatch_uid="catalogi.invalidate_cache_resultaattype_informatieobjecttypen",
+)
+@receiver(
+    m2m_changed,
+    sender=ResultaatType.besluittypen.through,
+    dispatch_uid="catalogi.invalidate_cache_resultaattype_besluittypen",
+)
+@receiver(
+    m2m_changed,
+    sender=ResultaatType.zaakobjecttypen.through,
+    dispatch_uid="catalogi.invalidate_cache_resultaattype_zaakobjecttypen",
+)
+@receiver(
+    m2m_changed,
+    sender=ZaakType.deelzaaktypen.through,
+    dispatch_uid="catalogi.invalidate_cache_zaaktype_deelzaaktypen",
+)
+def invalidate_cache(sender: ModelBase, **kwargs) -> None:
+    invalidate_catalogi_cache()
@@ -3,11 +3,15 @@
 """
 Test that the caching mechanisms are in place.
 """
+from django.test import TestCase, override_settings
+
 from rest_framework import status
 from rest_framework.test import APITestCase, APITransactionTestCase
 from vng_api_common.caching import calculate_etag
 from vng_api_common.tests import CacheMixin, JWTAuthMixin, reverse
 
+from openzaak.components.catalogi.caching import get_resource_for_path
+from openzaak.components.catalogi.models import RolType, ZaakType
 from openzaak.components.catalogi.tests.factories import (
     BesluitTypeFactory,
     CatalogusFactory,
@@ -880,3 +884,114 @@ class M2MRelationCachingTests(JWTAuthMixin, APITransactionTestCase):
             reverse(zaaktype), headers={"if-none-match": f'"{zaaktype_etag}"'}
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+@override_settings(CATALOGI_CACHE_ENABLED=True)
+class PublishedObjectCacheTests(TestCase):
+    def test_published_object_is_cached(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        path = reverse(zaaktype)
+        get_resource_for_path(path)
+
+        with self.assertNumQueries(0):
+            cached = get_resource_for_path(path)
+
+        self.assertEqual(cached, zaaktype)
+        self.assertEqual(cached.catalogus, zaaktype.catalogus)
+
+    def test_types_of_published_zaaktype_are_cached(self):
+        statustype = StatusTypeFactory.create(zaaktype__concept=False)
+        path = reverse(statustype)
+        get_resource_for_path(path)
+
+        with self.assertNumQueries(0):
+            cached = get_resource_for_path(path)
+
+        self.assertEqual(cached, statustype)
+        self.assertFalse(cached.zaaktype.concept)
+
+    def test_concept_is_not_cached(self):
+        roltype = RolTypeFactory.create(zaaktype__concept=True, omschrijving="old")
+        path = reverse(roltype)
+        get_resource_for_path(path)
+
+        # updates of querysets do not send signals
+        RolType.objects.filter(pk=roltype.pk).update(omschrijving="new")
+
+        self.assertEqual(get_resource_for_path(path).omschrijving, "new")
+
+    def test_cache_is_invalidated_on_change(self):
+        besluittype = BesluitTypeFactory.create(concept=False, omschrijving="old")
+        path = reverse(besluittype)
+        get_resource_for_path(path)
+
+        besluittype.omschrijving = "new"
+        besluittype.save()
+
+        self.assertEqual(get_resource_for_path(path).omschrijving, "new")
+
+    def test_disabled(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        path = reverse(zaaktype)
+        get_resource_for_path(path)
+
+        with override_settings(CATALOGI_CACHE_ENABLED=False):
+            with self.assertNumQueries(1):
+                get_resource_for_path(path)
+
+
+@override_settings(CATALOGI_RESPONSE_CACHE_ENABLED=True)
+class ResponseCacheTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_response_is_cached(self):
+        zaaktype = ZaakTypeFactory.create(concept=False, omschrijving="old")
+        url = reverse(zaaktype)
+        self.client.get(url)
+
+        # updates of querysets do not send signals
+        ZaakType.objects.filter(pk=zaaktype.pk).update(omschrijving="new")
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["omschrijving"], "old")
+
+    def test_query_string_is_normalized(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        url = reverse("zaaktype-list")
+        catalogus = f"http://testserver{reverse(zaaktype.catalogus)}"
+        self.client.get(url, {"catalogus": catalogus, "status": "alles"})
+
+        ZaakType.objects.filter(pk=zaaktype.pk).update(omschrijving="new")
+        response = self.client.get(url, {"status": "alles", "catalogus": catalogus})
+
+        self.assertNotEqual(response.json()["results"][0]["omschrijving"], "new")
+
+    def test_cache_is_invalidated_on_change(self):
+        zaaktype = ZaakTypeFactory.create(concept=False, omschrijving="old")
+        url = reverse(zaaktype)
+        self.client.get(url)
+
+        zaaktype.omschrijving = "new"
+        zaaktype.save()
+        response = self.client.get(url)
+
+        self.assertEqual(response.json()["omschrijving"], "new")
+
+    def test_conditional_get_304(self):
+        besluittype = BesluitTypeFactory.create(with_etag=True)
+        self.client.get(reverse(besluittype))
+
+        response = self.client.get(
+            reverse(besluittype), headers={"if-none-match": f'"{besluittype._etag}"'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_cached_response_has_etag(self):
+        besluittype = BesluitTypeFactory.create(with_etag=True)
+        self.client.get(reverse(besluittype))
+
+        response = self.client.get(reverse(besluittype))
+
+        self.assertEqual(response["ETag"], f'"{besluittype._etag}"')
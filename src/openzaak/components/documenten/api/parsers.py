@@ -0,0 +1,303 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Parse JSON request bodies without keeping large base64 encoded files in memory.
+
+The content of a document is sent base64 encoded in the ``inhoud`` attribute of
+the request body. The default JSON parser loads the complete body, after which the
+serializer field decodes the complete string again. Instead, the body is scanned
+while it is read, and the value of ``inhoud`` is decoded on the fly into a spooled
+temporary file. The remainder of the body is parsed as usual.
+"""
+import binascii
+import codecs
+import json
+import re
+import uuid
+from tempfile import SpooledTemporaryFile
+from typing import Dict, Optional, Sequence
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+
+from djangorestframework_camel_case.parser import CamelCaseJSONParser
+from djangorestframework_camel_case.util import underscoreize
+from rest_framework.exceptions import ParseError
+
+# number of bytes read from the request at a time
+READ_CHUNK_SIZE = 64 * 1024
+
+# the maximum length of a data URI header, e.g. ``data:application/pdf;base64,``
+MAX_HEADER_LENGTH = 256
+
+_NON_BASE64 = re.compile(r"[^A-Za-z0-9+/=]")
+_SIGNIFICANT = re.compile(r'["{}\[\],:]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/"}
+
+
+class StreamedBase64File(UploadedFile):
+    """
+    A file decoded from a base64 string in the request body.
+
+    Errors while decoding are not raised by the parser, but kept in ``error``, so
+    they can be reported as validation errors of the field.
+    """
+
+    def __init__(self, file, size: int, error: Optional[binascii.Error] = None):
+        super().__init__(file, name=f"{uuid.uuid4()}.bin", size=size)
+        self.error = error
+
+
+class Base64Decoder:
+    """
+    Decode a base64 string which is received in pieces.
+    """
+
+    def __init__(self):
+        self.file = SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE)
+        self.size = 0
+
+        self.is_empty = True
+
+        self._header = ""
+        self._remainder = ""
+        self._has_invalid_characters = False
+
+    def write(self, text: str) -> None:
+        self.is_empty = self.is_empty and not text
+
+        if self._header is not None:
+            # strip the data URI header, if any
+            self._header += text
+            if ";base64," in self._header:
+                text = self._header.split(";base64,", 1)[1]
+            elif (
+                "data:".startswith(self._header[:5])
+                and len(self._header) < MAX_HEADER_LENGTH
+            ):
+                return
+            else:
+                text = self._header
+            self._header = None
+
+        data = _NON_BASE64.sub("", text)
+        if len(data) != len(text):
+            self._has_invalid_characters = True
+
+        data = self._remainder + data
+        end = len(data) - len(data) % 4
+        self._remainder = data[end:]
+
+        if end:
+            self._write_decoded(binascii.a2b_base64(data[:end]))
+
+    def _write_decoded(self, decoded: bytes) -> None:
+        self.file.write(decoded)
+        self.size += len(decoded)
+
+    def close(self) -> StreamedBase64File:
+        if self._header:
+            header, self._header = self._header, None
+            self.write(header)
+
+        error = None
+        if self._remainder:
+            try:
+                self._write_decoded(binascii.a2b_base64(self._remainder))
+            except binascii.Error as exc:
+                error = exc
+                # mimic the error of a strict decode of the string
+                if self._has_invalid_characters:
+                    error = binascii.Error("Only base64 data is allowed")
+
+        self.file.seek(0)
+        return StreamedBase64File(self.file, self.size, error=error)
+
+
+class Base64Extractor:
+    """
+    Scan a JSON document and decode the string values of the given top level
+    attributes into files.
+
+    The JSON document without these values (they are replaced by ``null``) is
+    collected in ``output``.
+    """
+
+    def __init__(self, fields: Sequence[str]):
+        self.fields = fields
+        self.output = []
+        self.files: Dict[str, StreamedBase64File] = {}
+
+        # the containers the scanner is in, either ``{`` or ``[``
+        self._stack = []
+        self._expect_key = False
+        self._key = None
+
+        # state within a string
+        self._in_string = False
+        self._is_key = False
+        self._raw_key = []
+        self._escape = None
+        self._decoder: Optional[Base64Decoder] = None
+        self._placeholder = None
+
+    def feed(self, text: str) -> None:
+        position = 0
+        while position < len(text):
+            if self._in_string:
+                position = self._feed_string(text, position)
+            else:
+                position = self._feed_structure(text, position)
+
+    def close(self) -> None:
+        for file in self.files.values():
+            file.close()
+        if self._decoder is not None:
+            self._decoder.file.close()
+
+    def _feed_structure(self, text: str, position: int) -> int:
+        match = _SIGNIFICANT.search(text, position)
+        if match is None:
+            self.output.append(text[position:])
+            return len(text)
+
+        char = match.group()
+        end = match.end()
+
+        if char == '"':
+            self._in_string = True
+            self._is_key = bool(self._stack) and self._stack[-1] == "{"
+            self._is_key = self._is_key and self._expect_key
+            self._raw_key = []
+
+            if self._is_base64_value():
+                self.output.append(text[position : match.start()])
+                self.output.append("null")
+                self._placeholder = len(self.output) - 1
+                self._decoder = Base64Decoder()
+                return end
+        elif char in "{[":
+            self._stack.append(char)
+            self._expect_key = char == "{"
+        elif char in "}]":
+            if self._stack:
+                self._stack.pop()
+            self._expect_key = False
+        elif char == ",":
+            self._expect_key = bool(self._stack) and self._stack[-1] == "{"
+        elif char == ":":
+            self._expect_key = False
+
+        self.output.append(text[position:end])
+        return end
+
+    def _is_base64_value(self) -> bool:
+        return (
+            len(self._stack) == 1
+            and self._stack[0] == "{"
+            and not self._is_key
+            and self._key in self.fields
+        )
+
+    def _feed_string(self, text: str, position: int) -> int:
+        if self._escape is not None:
+            return self._feed_escape(text, position)
+
+        match = _STRING_SPECIAL.search(text, position)
+        end = match.start() if match else len(text)
+        self._write_string(text[position:end])
+
+        if match is None:
+            return end
+
+        if match.group() == "\\":
+            self._escape = ""
+            if self._decoder is None:
+                self.output.append("\\")
+            if self._is_key:
+                self._raw_key.append("\\")
+            return match.end()
+
+        # the end of the string
+        self._in_string = False
+        if self._decoder is not None:
+            decoder, self._decoder = self._decoder, None
+            if decoder.is_empty:
+                # an empty string is not a file
+                self.output[self._placeholder] = '""'
+                self.files.pop(self._key, None)
+                decoder.file.close()
+            else:
+                self.files[self._key] = decoder.close()
+            return match.end()
+
+        self.output.append('"')
+        if self._is_key:
+            self._key = json.loads(f'"{"".join(self._raw_key)}"')
+            self._is_key = False
+        return match.end()
+
+    def _feed_escape(self, text: str, position: int) -> int:
+        # an escape sequence may be split over multiple pieces of text
+        length = 5 if (self._escape or text[position])[0] == "u" else 1
+        end = position + length - len(self._escape)
+        sequence = self._escape + text[position:end]
+
+        if len(sequence) < length:
+            self._escape = sequence
+            return len(text)
+
+        self._escape = None
+        if self._decoder is None:
+            self.output.append(sequence)
+            if self._is_key:
+                self._raw_key.append(sequence)
+        elif sequence[0] == "u":
+            self._decoder.write(chr(int(sequence[1:], 16)))
+        else:
+            # other escaped characters are whitespace, which is ignored
+            self._decoder.write(_ESCAPES.get(sequence, ""))
+        return end
+
+    def _write_string(self, text: str) -> None:
+        if not text:
+            return
+        if self._decoder is not None:
+            self._decoder.write(text)
+            return
+        self.output.append(text)
+        if self._is_key:
+            self._raw_key.append(text)
+
+
+class Base64StreamingJSONParser(CamelCaseJSONParser):
+    """
+    Parse JSON, decoding the base64 encoded file attributes while reading.
+    """
+
+    base64_fields = ("inhoud",)
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        extractor = Base64Extractor(self.base64_fields)
+        try:
+            decoder = codecs.getincrementaldecoder(encoding)()
+            while chunk := stream.read(READ_CHUNK_SIZE):
+                extractor.feed(decoder.decode(chunk))
+            extractor.feed(decoder.decode(b"", final=True))
+
+            data = json.loads("".join(extractor.output))
+        except (ValueError, binascii.Error) as exc:
+            extractor.close()
+            raise ParseError("JSON parse error - %s" % str(exc))
+
+        data = underscoreize(data, **self.json_underscoreize)
+        if isinstance(data, dict):
+            for field, file in extractor.files.items():
+                if field in data:
+                    data[field] = file
+        return data
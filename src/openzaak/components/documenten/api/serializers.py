@@ -4,6 +4,7 @@
 Serializers of the Document Registratie Component REST API
 """
 import binascii
+import logging
 import math
 import uuid
 from base64 import b64decode
@@ -18,7 +19,7 @@ from django.utils.http import urlencode
 from django.utils.translation import gettext_lazy as _
 
 from drc_cmis.utils.convert import make_absolute_uri
-from drf_extra_fields.fields import Base64FileField
+from drf_extra_fields.fields import Base64FieldMixin, Base64FileField
 from humanize import naturalsize
 from privates.storages import PrivateMediaFileSystemStorage
 from rest_framework import serializers
@@ -34,9 +35,13 @@ from vng_api_common.utils import get_help_text
 from openzaak.contrib.verzoeken.validators import verzoek_validator
 from openzaak.utils.serializer_fields import (
     FKOrServiceUrlField,
+    HyperlinkedIdentityField,
     LengthHyperlinkedRelatedField,
 )
-from openzaak.utils.serializers import get_from_serializer_data_or_instance
+from openzaak.utils.serializers import (
+    HyperlinkedModelSerializer,
+    get_from_serializer_data_or_instance,
+)
 from openzaak.utils.validators import (
     IsImmutableValidator,
     LooseFkResourceValidator,
@@ -60,7 +65,14 @@ from ..models import (
 from ..query.cmis import flatten_gegevens_groep
 from ..utils import PrivateMediaStorageWithCMIS
 from .fields import OnlyRemoteOrFKOrURLField
-from .utils import create_filename, merge_files
+from .parsers import StreamedBase64File
+from .utils import (
+    HASHLIB_ALGORITHMS,
+    create_filename,
+    merge_files,
+    merge_files_in_storage,
+    supports_direct_merge,
+)
 from .validators import (
     InformatieObjectUniqueValidator,
     StatusValidator,
@@ -68,6 +80,8 @@ from .validators import (
     VerzendingAddressValidator,
 )
 
+logger = logging.getLogger(__name__)
+
 oz = "openzaak.components"
 
 
@@ -87,6 +101,12 @@ class AnyBase64File(Base64FileField):
         return "bin"
 
     def to_internal_value(self, base64_data):
+        # ⚡️ already decoded while parsing the request body
+        if isinstance(base64_data, StreamedBase64File):
+            if base64_data.error:
+                self._raise_base64_error(base64_data.error)
+            return super(Base64FieldMixin, self).to_internal_value(base64_data)
+
         try:
             return super().to_internal_value(base64_data)
         except Exception:
@@ -94,15 +114,18 @@ class AnyBase64File(Base64FileField):
                 # If validate is False, no check is done to see if the data contains non base-64 alphabet characters
                 b64decode(base64_data, validate=True)
             except binascii.Error as e:
-                if str(e) == "Incorrect padding":
-                    raise ValidationError(
-                        _("The provided base64 data has incorrect padding"),
-                        code="incorrect-base64-padding",
-                    )
-                raise ValidationError(str(e), code="invalid-base64")
+                self._raise_base64_error(e)
             except TypeError as exc:
                 raise ValidationError(str(exc))
 
+    def _raise_base64_error(self, error: binascii.Error):
+        if str(error) == "Incorrect padding":
+            raise ValidationError(
+                _("The provided base64 data has incorrect padding"),
+                code="incorrect-base64-padding",
+            )
+        raise ValidationError(str(error), code="invalid-base64")
+
     def to_representation(self, file):
         is_private_storage = isinstance(file.storage, PrivateMediaFileSystemStorage)
         is_cmis_storage = isinstance(file.storage, PrivateMediaStorageWithCMIS)
@@ -204,7 +227,7 @@ class LockField(serializers.CharField):
         return instance.get_current_lock_value()
 
 
-class BestandsDeelSerializer(serializers.HyperlinkedModelSerializer):
+class BestandsDeelSerializer(HyperlinkedModelSerializer):
     lock = LockField(
         required=True,
         help_text="Hash string, which represents id of the lock of related informatieobject",
@@ -259,12 +282,12 @@ class BestandsDeelSerializer(serializers.HyperlinkedModelSerializer):
         return valid_attrs
 
 
-class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
+class EnkelvoudigInformatieObjectSerializer(HyperlinkedModelSerializer):
     """
     Serializer for the EnkelvoudigInformatieObject model
     """
 
-    url = serializers.HyperlinkedIdentityField(
+    url = HyperlinkedIdentityField(
         view_name="enkelvoudiginformatieobject-detail", lookup_field="uuid"
     )
     inhoud = AnyBase64File(
@@ -843,22 +866,29 @@ class UnlockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
             return self.instance
 
         if complete_upload:
-            part_files = [p.inhoud.file for p in bestandsdelen]
             # create the name of target file using the storage backend to the serializer
             name = create_filename(self.instance.bestandsnaam)
             file_field = self.instance._meta.get_field("inhoud")
             rel_path = file_field.generate_filename(self.instance, name)
-            file_name = Path(rel_path).name
-            # merge files
-            file_dir = Path(settings.PRIVATE_MEDIA_ROOT)
-            target_file = merge_files(part_files, file_dir, file_name)
-            # save full file to the instance FileField
-            with open(target_file, "rb") as file_obj:
-                self.instance.inhoud = File(file_obj, name=file_name)
-                self.instance.save()
-
-            # Remove the merged file
-            target_file.unlink()
+
+            if not settings.CMIS_ENABLED and supports_direct_merge(file_field.storage):
+                # ⚡️ assemble the file once, at its final location
+                self._merge_in_storage(
+                    [p.inhoud.path for p in bestandsdelen], file_field.storage, rel_path
+                )
+            else:
+                part_files = [p.inhoud.file for p in bestandsdelen]
+                file_name = Path(rel_path).name
+                # merge files
+                file_dir = Path(settings.PRIVATE_MEDIA_ROOT)
+                target_file = merge_files(part_files, file_dir, file_name)
+                # save full file to the instance FileField
+                with open(target_file, "rb") as file_obj:
+                    self.instance.inhoud = File(file_obj, name=file_name)
+                    self.instance.save()
+
+                # Remove the merged file
+                target_file.unlink()
         else:
             self.instance.bestandsomvang = None
             self.instance.save()
@@ -868,6 +898,24 @@ class UnlockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
 
         return self.instance
 
+    def _merge_in_storage(self, part_paths: list, storage, name: str) -> None:
+        algorithm = HASHLIB_ALGORITHMS.get(self.instance.integriteit_algoritme)
+        # the checksum is only used to verify the given integriteit
+        if not self.instance.integriteit_waarde:
+            algorithm = None
+
+        self.instance.inhoud, checksum = merge_files_in_storage(
+            part_paths, storage, name, checksum_algorithm=algorithm
+        )
+        self.instance.save()
+
+        if checksum and checksum != self.instance.integriteit_waarde.lower():
+            logger.warning(
+                "The checksum of the uploaded content of document %s does not match "
+                "its integriteit.waarde",
+                self.instance.uuid,
+            )
+
 
 class EIOZoekSerializer(serializers.Serializer):
     uuid__in = serializers.ListField(
@@ -876,7 +924,7 @@ class EIOZoekSerializer(serializers.Serializer):
     )
 
 
-class GebruiksrechtenSerializer(serializers.HyperlinkedModelSerializer):
+class GebruiksrechtenSerializer(HyperlinkedModelSerializer):
     informatieobject = EnkelvoudigInformatieObjectHyperlinkedRelatedField(
         view_name="enkelvoudiginformatieobject-detail",
         lookup_field="uuid",
@@ -925,7 +973,7 @@ class GebruiksrechtenSerializer(serializers.HyperlinkedModelSerializer):
         return ret
 
 
-class ObjectInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
+class ObjectInformatieObjectSerializer(HyperlinkedModelSerializer):
     informatieobject = EnkelvoudigInformatieObjectHyperlinkedRelatedField(
         view_name="enkelvoudiginformatieobject-detail",
         lookup_field="uuid",
@@ -1036,7 +1084,7 @@ class CorrespondentiePostadresVerzendingSerializer(GegevensGroepSerializer):
 
 class VerzendingSerializer(
     NestedGegevensGroepMixin,
-    serializers.HyperlinkedModelSerializer,
+    HyperlinkedModelSerializer,
 ):
     informatieobject = EnkelvoudigInformatieObjectHyperlinkedRelatedField(
         view_name="enkelvoudiginformatieobject-detail",
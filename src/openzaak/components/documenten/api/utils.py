@@ -1,12 +1,32 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
+import errno
+import hashlib
+import os
 import re
 import shutil
+import tempfile
 import uuid
 from pathlib import Path, PurePath
+from typing import Iterable, Optional, Tuple
 from urllib.parse import urlparse
 
 from django.conf import settings
+from django.core.files.storage import Storage
+
+from ..constants import ChecksumAlgoritmes
+
+# the checksum algorithms which can be computed while merging the upload parts
+HASHLIB_ALGORITHMS = {
+    ChecksumAlgoritmes.md5: "md5",
+    ChecksumAlgoritmes.sha_1: "sha1",
+    ChecksumAlgoritmes.sha_256: "sha256",
+    ChecksumAlgoritmes.sha_512: "sha512",
+    ChecksumAlgoritmes.sha_3: "sha3_256",
+}
+
+# errors indicating that a kernel side copy is not possible between the files
+_KERNEL_COPY_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.ENOTSUP}
 
 
 def merge_files(part_files, file_dir, file_name) -> str:
@@ -22,6 +42,125 @@ def merge_files(part_files, file_dir, file_name) -> str:
     return file_path
 
 
+def supports_direct_merge(storage: Storage) -> bool:
+    """
+    Check if the upload parts can be merged in place in the storage.
+    """
+    try:
+        storage.path("")
+    except NotImplementedError:
+        return False
+    return True
+
+
+def _kernel_copy(source: int, target: int, size: int) -> int:
+    """
+    Copy the data between file descriptors without passing it through userspace.
+
+    Returns the number of bytes copied, which is less than ``size`` if a kernel
+    side copy is not possible.
+    """
+    copied = 0
+    for copy in (
+        getattr(os, "copy_file_range", None),
+        lambda source, target, count: os.sendfile(target, source, None, count),
+    ):
+        if copy is None:
+            continue
+
+        try:
+            while copied < size:
+                sent = copy(source, target, size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+        except OSError as exc:
+            if exc.errno not in _KERNEL_COPY_ERRNOS:
+                raise
+            # nothing is copied when the call fails, so the next method can
+            # continue at the current offsets
+            continue
+        break
+
+    return copied
+
+
+def _copy_part(source, target, checksum) -> None:
+    if checksum is None:
+        size = os.fstat(source.fileno()).st_size
+        # the file offsets are shared with the file objects, so a userspace copy
+        # continues where the kernel copy stopped
+        if _kernel_copy(source.fileno(), target.fileno(), size) == size:
+            return
+
+    # computing the checksum requires reading the data, so it is copied in the
+    # same pass
+    while chunk := source.read(settings.DOCUMENTEN_UPLOAD_READ_CHUNK):
+        target.write(chunk)
+        if checksum is not None:
+            checksum.update(chunk)
+
+
+def merge_files_in_storage(
+    part_paths: Iterable[str],
+    storage: Storage,
+    name: str,
+    checksum_algorithm: Optional[str] = None,
+) -> Tuple[str, Optional[str]]:
+    """
+    Merge the upload parts directly into their final location in the storage.
+
+    The parts are copied by the kernel where possible, into a temporary file next
+    to the target, which is moved into place atomically once complete. This
+    avoids writing the file to disk multiple times, as :func:`merge_files` and
+    saving the result to the storage does.
+
+    Returns the name of the stored file and, if an algorithm is given, the hex
+    digest of its content.
+    """
+    checksum = hashlib.new(checksum_algorithm) if checksum_algorithm else None
+
+    target_dir = Path(storage.path(name)).parent
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.NamedTemporaryFile(
+        dir=target_dir, prefix=".merge-", suffix=".part", delete=False
+    ) as target:
+        try:
+            # the copy functions bypass the buffer of the file object
+            target.flush()
+            for part_path in part_paths:
+                with open(part_path, "rb") as source:
+                    _copy_part(source, target, checksum)
+                target.flush()
+            os.fsync(target.fileno())
+        except BaseException:
+            os.unlink(target.name)
+            raise
+
+    try:
+        permissions_mode = getattr(storage, "file_permissions_mode", None)
+        if permissions_mode is not None:
+            os.chmod(target.name, permissions_mode)
+
+        # a hard link fails if the name is taken in the meantime, unlike a rename
+        while True:
+            name = storage.get_available_name(name)
+            try:
+                os.link(target.name, storage.path(name))
+            except FileExistsError:
+                continue
+            except OSError:
+                # hard links are not supported by the file system
+                os.replace(target.name, storage.path(name))
+            break
+    finally:
+        if os.path.exists(target.name):
+            os.unlink(target.name)
+
+    return name.replace("\\", "/"), checksum.hexdigest() if checksum else None
+
+
 def create_filename(name):
     path = PurePath(name)
     main_part, ext = path.stem, path.suffix
@@ -19,15 +19,12 @@ from drf_spectacular.utils import (
 from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.serializers import ErrorDetail, ValidationError
 from rest_framework.settings import api_settings
-from vng_api_common.audittrails.viewsets import AuditTrailViewsetMixin
 from vng_api_common.filters import Backend
 from vng_api_common.search import SearchMixin
-from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from openzaak.components.documenten.import_utils import DocumentRow
 from openzaak.components.documenten.tasks import import_documents
@@ -47,14 +44,22 @@ from openzaak.utils.mixins import (
     ConvertCMISAdapterExceptions,
     ExpandMixin,
 )
-from openzaak.utils.pagination import OptimizedPagination
+from openzaak.utils.pagination import (
+    CMISPagination,
+    CursorPagination,
+    OptimizedPagination,
+)
 from openzaak.utils.permissions import AuthRequired
 from openzaak.utils.schema import (
     COMMON_ERROR_RESPONSES,
     FILE_ERROR_RESPONSES,
     VALIDATION_ERROR_RESPONSES,
 )
-from openzaak.utils.views import AuditTrailViewSet
+from openzaak.utils.views import (
+    AuditTrailViewSet,
+    AuditTrailViewsetMixin,
+    CheckQueryParamsMixin,
+)
 
 from ..caching import cmis_conditional_retrieve
 from ..models import (
@@ -76,6 +81,7 @@ from .filters import (
 )
 from .kanalen import KANAAL_DOCUMENTEN
 from .mixins import UpdateWithoutPartialMixin
+from .parsers import Base64StreamingJSONParser
 from .permissions import InformationObjectAuthRequired
 from .renderers import BinaryFileRenderer
 from .scopes import (
@@ -250,6 +256,8 @@ class EnkelvoudigInformatieObjectViewSet(
     }
     notifications_kanaal = KANAAL_DOCUMENTEN
     audit = AUDIT_DRC
+    # ⚡️ decode the base64 encoded ``inhoud`` while reading the request body
+    parser_classes = (Base64StreamingJSONParser,)
 
     def get_renderers(self):
         if self.action == "download":
@@ -303,8 +311,8 @@ class EnkelvoudigInformatieObjectViewSet(
     @property
     def pagination_class(self):
         if settings.CMIS_ENABLED:
-            return PageNumberPagination
-        return OptimizedPagination
+            return CMISPagination
+        return CursorPagination
 
     @extend_schema(
         "enkelvoudiginformatieobject_download",
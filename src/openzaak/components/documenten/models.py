@@ -18,9 +18,9 @@ from privates.fields import PrivateMediaFileField
 from rest_framework.reverse import reverse
 from vng_api_common.descriptors import GegevensGroepType
 from vng_api_common.fields import RSINField, VertrouwelijkheidsAanduidingField
-from vng_api_common.utils import generate_unique_identification
 from zgw_consumers.models import ServiceUrlField
 
+from openzaak.identification.generators import generate_identification
 from openzaak.utils.fields import (
     AliasServiceUrlField,
     FkOrServiceUrlField,
@@ -236,7 +236,9 @@ class InformatieObject(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.identificatie:
-            self.identificatie = generate_unique_identification(self, "creatiedatum")
+            self.identificatie = generate_identification(
+                type(self), self.creatiedatum.year, self.bronorganisatie
+            )
         super().save(*args, **kwargs)
 
     def clean(self):
@@ -4,9 +4,9 @@ import copy
 import datetime
 import logging
 import uuid
-from itertools import groupby
-from operator import attrgetter, itemgetter
-from typing import List, Optional, Tuple
+from itertools import islice
+from operator import attrgetter
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from django.db import IntegrityError
 from django.db.models import fields
@@ -15,8 +15,10 @@ from django.utils import timezone
 from django.utils.text import slugify
 
 from django_loose_fk.virtual_models import ProxyMixin
+from drc_cmis.browser.client import CMISDRCClient
 from drc_cmis.utils.convert import make_absolute_uri
 from drc_cmis.utils.mapper import mapper
+from drc_cmis.utils.query import CMISQuery
 from rest_framework.request import Request
 from vng_api_common.client import to_internal_data
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
@@ -38,10 +40,14 @@ from .django import (
     InformatieobjectRelatedQuerySet,
     ObjectInformatieObjectQuerySet,
 )
+from .versions import get_version_histories
 
 logger = logging.getLogger(__name__)
 
 
+# number of documents for which the version histories are loaded at once
+VERSION_HISTORY_BATCH_SIZE = 100
+
 # map query names from django models to properties on the CMIS models
 EIO_PROPERTY_MAP = {
     "canonical": "uuid",  # UUID is the same for different versions
@@ -62,6 +68,67 @@ def sort_results(documents: List, order_by: List[str]) -> List:
     return documents
 
 
+def get_cmis_ordering(order_by: List[str]) -> Optional[List[str]]:
+    """
+    Translate the Django ordering into CMIS ``ORDER BY`` clauses.
+
+    ``None`` is returned if (part of) the ordering can't be expressed in CMIS.
+    """
+    clauses = []
+    for order_key in order_by:
+        descending = order_key.startswith("-")
+        _order_key = order_key if not descending else order_key[1:]
+        # canonical is ordered on the UUID, which the documents are made distinct on
+        # as well, so all versions of a document are adjacent in the results
+        column = mapper(EIO_PROPERTY_MAP.get(_order_key, ""), type="document")
+        if column is None:
+            return None
+        clauses.append(f"{column} {'DESC' if descending else 'ASC'}")
+    return clauses
+
+
+def supports_query_paging(cmis_client) -> bool:
+    # the webservice binding of drc-cmis doesn't expose ``maxItems``/``skipCount``
+    return isinstance(cmis_client, CMISDRCClient)
+
+
+def query_documents(
+    cmis_client: CMISDRCClient,
+    lhs: List[str],
+    rhs: List[str],
+    columns: Optional[List[str]] = None,
+    order_by: Optional[List[str]] = None,
+    max_items: Optional[int] = None,
+    skip_count: int = 0,
+) -> Tuple[list, Optional[int]]:
+    """
+    Query the documents with the ordering and paging done by the DMS.
+
+    If specific columns are selected, the raw results are returned instead of
+    documents. The total number of results is returned as well, if the DMS
+    reports it.
+    """
+    return_type = cmis_client.get_return_type("Document")
+    select = ", ".join(columns) if columns else "*"
+    where = (" WHERE " + " AND ".join(lhs)) if lhs else ""
+    order = (" ORDER BY " + ", ".join(order_by)) if order_by else ""
+    query = CMISQuery(f"SELECT {select} FROM {return_type.table}{where}{order}")
+
+    body = {"cmisaction": "query", "statement": query(*rhs) if rhs else query()}
+    if max_items is not None:
+        body["maxItems"] = max_items
+    if skip_count:
+        body["skipCount"] = skip_count
+
+    logger.debug("CMIS query: request data: %s", body)
+    response = cmis_client.post_request(cmis_client.base_url, body)
+
+    results = response.get("results", [])
+    if not columns:
+        results = cmis_client.get_all_results(response, return_type)
+    return results, response.get("numItems")
+
+
 # ---------------------- Model iterables -----------
 
 
@@ -73,69 +140,99 @@ class CMISDocumentIterable(BaseIterable, CMISClientMixin):
 
     def __iter__(self):
         queryset = self.queryset
+        django_query = queryset.query
+        self._check_query(django_query)
 
         filters = self._check_for_pk_filter(queryset._cmis_query)
 
         lhs, rhs = self._normalize_filters(filters)
 
-        documents = queryset.cmis_client.query(self.return_type, lhs, rhs)
-        documents = self._process_intermediate(queryset.query, documents)
-
         version = dict(filters).get("versie")
         begin_registratie = dict(filters).get("begin_registratie")
 
-        if self._needs_vertrowelijkaanduiding_filter(filters):
-            documents = self._filter_by_va(filters, documents)
-
-        # a collection of (uuid, versie) which is considered unique together. Once such
-        # a tuple is seen, no extra results with the same version can be seen. This is
-        # required because alfresco tracks cmis:versionLabel for all updates, while they
-        # keep the same Documenten API versie (i.e.: there are multiple alfresco versions
-        # with the (uuid, versie) combo).
-        uuid_version_tuples_seen = set()
+        # distinct on canonical -> we want the latest version of each document, if
+        # a PWC exists, grab that. This means -> don't fetch additional versions
+        if "canonical" in django_query.distinct_fields:
+            assert (
+                "-versie" in django_query.order_by
+            ), "Undefined behaviour w/r to version sorting"
+
+            low_mark, high_mark = django_query.low_mark, django_query.high_mark
+            skip_count = queryset._cmis_skip_count
+            if (
+                skip_count is not None
+                and skip_count >= low_mark
+                and self._pages_in_dms(django_query)
+            ):
+                # ⚡️ the offset of the first result in the CMIS results is known, so
+                # the preceding results don't have to be walked through
+                if high_mark is not None:
+                    high_mark -= low_mark
+                low_mark = 0
+            else:
+                skip_count = 0
 
-        for document in documents:
-            # distinct on canonical -> we want the latest version of each document, if
-            # a PWC exists, grab that. This means -> don't fetch additional versions
-            if "canonical" in queryset.query.distinct_fields:
-                assert (
-                    "-versie" in queryset.query.order_by
-                ), "Undefined behaviour w/r to version sorting"
-                eio = cmis_doc_to_django_model(
+            # every document is exactly one result, so the slice can be applied
+            # before the (expensive) conversion to Django model instances
+            documents = self._iter_documents(
+                django_query, lhs, rhs, low_mark, high_mark, skip_count=skip_count
+            )
+            for _, document in islice(documents, low_mark, high_mark):
+                yield cmis_doc_to_django_model(
                     document,
                     skip_pwc=False,
                     version=version,
                     begin_registratie=begin_registratie,
                 )
-                yield eio
 
-            # general query, we want multiple versions of the same document -> get the entire
-            # version history
-            else:
-                versions = self.cmis_client.get_all_versions(document)
-                versions = sort_results(versions, queryset.query.order_by)
+            # remember the offset of the next result, to continue from there
+            if high_mark is not None:
+                following = next(documents, None)
+                queryset._cmis_next_skip_count = following[0] if following else None
+
+        # general query, we want multiple versions of the same document -> get the entire
+        # version history
+        else:
+            documents = self._iter_documents(
+                django_query, lhs, rhs, django_query.low_mark, django_query.high_mark
+            )
+            results = self._iter_versions(
+                django_query, (document for _, document in documents)
+            )
+            yield from islice(results, django_query.low_mark, django_query.high_mark)
 
-                seen = set()
-                for version in versions:
-                    if version.versie in seen:
-                        continue
+    def count(self) -> int:
+        """
+        Count the number of results without converting the documents.
+        """
+        queryset = self.queryset
+        django_query = queryset.query
+        self._check_query(django_query)
 
-                    uuid_version_combination = (version.uuid, version.versie)
-                    if uuid_version_combination in uuid_version_tuples_seen:
-                        continue
+        if "canonical" not in django_query.distinct_fields:
+            # the version history of every document needs to be fetched to count
+            # the results
+            return sum(1 for _ in self)
 
-                    # mark version as seen in both scopes
-                    seen.add(version.versie)
-                    uuid_version_tuples_seen.add(uuid_version_combination)
+        filters = self._check_for_pk_filter(queryset._cmis_query)
+        lhs, rhs = self._normalize_filters(filters)
 
-                    yield cmis_doc_to_django_model(version, skip_pwc=True)
+        if supports_query_paging(queryset.cmis_client):
+            uuid_column = mapper("uuid", type="document")
+            rows, _ = query_documents(
+                queryset.cmis_client, lhs, rhs, columns=[uuid_column]
+            )
+            uuids = {row["properties"][uuid_column]["value"] for row in rows}
+        else:
+            documents = queryset.cmis_client.query(self.return_type, lhs, rhs)
+            uuids = {document.uuid for document in documents}
 
-    def _process_intermediate(
-        self, django_query, documents: List[Cmisdoc]
-    ) -> List[Cmisdoc]:
-        """
-        Order the results of the CMIS query and throw out non-distinct results.
-        """
+        count = max(len(uuids) - django_query.low_mark, 0)
+        if django_query.high_mark is not None:
+            count = min(count, django_query.high_mark - django_query.low_mark)
+        return count
+
+    def _check_query(self, django_query) -> None:
         _order_keys = [
             key if not key.startswith("-") else key[1:] for key in django_query.order_by
         ]
@@ -144,11 +241,130 @@ class CMISDocumentIterable(BaseIterable, CMISClientMixin):
                 f"Not all order keys in {_order_keys} are implemented yet."
             )
 
-        documents = sort_results(documents, django_query.order_by)
-
         if django_query.distinct and not django_query.distinct_fields:
             raise NotImplementedError("Blank distinct not implemented.")
 
+    def _pages_in_dms(self, django_query) -> bool:
+        return get_cmis_ordering(
+            django_query.order_by
+        ) is not None and supports_query_paging(self.queryset.cmis_client)
+
+    def _iter_documents(
+        self,
+        django_query,
+        lhs: List[str],
+        rhs: List[str],
+        low_mark: int,
+        high_mark: Optional[int],
+        skip_count: int = 0,
+    ) -> Iterator[Tuple[Optional[int], Cmisdoc]]:
+        """
+        Yield the ordered and distinct documents matching the query, with their offset
+        in the CMIS results.
+
+        If the DMS supports it, the ordering is part of the CMIS query and the
+        documents are fetched in batches starting at ``skip_count``, which stops as
+        soon as the consumer has seen enough results. Otherwise, everything is
+        fetched and processed in Python and the offsets are ``None``.
+        """
+        cmis_client = self.queryset.cmis_client
+        if not self._pages_in_dms(django_query):
+            documents = cmis_client.query(self.return_type, lhs, rhs)
+            for document in self._process_intermediate(django_query, documents):
+                yield None, document
+            return
+
+        order_by = get_cmis_ordering(django_query.order_by)
+        # the distinct fields are the only reason for the CMIS results and the
+        # documents to differ, in which case some extra documents are needed
+        batch_size = None
+        if high_mark is not None:
+            batch_size = high_mark
+            if django_query.distinct_fields:
+                batch_size += high_mark - low_mark
+
+        seen = {field: set() for field in django_query.distinct_fields}
+        while True:
+            documents, num_items = query_documents(
+                cmis_client,
+                lhs,
+                rhs,
+                order_by=order_by,
+                max_items=batch_size,
+                skip_count=skip_count,
+            )
+
+            for offset, document in enumerate(documents, start=skip_count):
+                values = {
+                    field: getattr(document, EIO_PROPERTY_MAP[field]) for field in seen
+                }
+                # value already seen -> skip subsequent ones
+                if any(value in seen[field] for field, value in values.items()):
+                    continue
+                for field, value in values.items():
+                    seen[field].add(value)
+
+                yield offset, document
+
+            skip_count += len(documents)
+            if (
+                batch_size is None
+                or len(documents) < batch_size
+                or (num_items is not None and skip_count >= num_items)
+            ):
+                return
+            batch_size = high_mark - low_mark or 1
+
+    def _iter_versions(self, django_query, documents: Iterable[Cmisdoc]) -> Iterator:
+        # a collection of (uuid, versie) which is considered unique together. Once such
+        # a tuple is seen, no extra results with the same version can be seen. This is
+        # required because alfresco tracks cmis:versionLabel for all updates, while they
+        # keep the same Documenten API versie (i.e.: there are multiple alfresco versions
+        # with the (uuid, versie) combo).
+        uuid_version_tuples_seen = set()
+
+        # ⚡️ load the version histories for batches of documents at once
+        for document, versions in self._iter_version_histories(django_query, documents):
+            versions = sort_results(versions, django_query.order_by)
+
+            seen = set()
+            for version in versions:
+                if version.versie in seen:
+                    continue
+
+                uuid_version_combination = (version.uuid, version.versie)
+                if uuid_version_combination in uuid_version_tuples_seen:
+                    continue
+
+                # mark version as seen in both scopes
+                seen.add(version.versie)
+                uuid_version_tuples_seen.add(uuid_version_combination)
+
+                yield cmis_doc_to_django_model(version, skip_pwc=True)
+
+    def _iter_version_histories(
+        self, django_query, documents: Iterable[Cmisdoc]
+    ) -> Iterator[Tuple[Cmisdoc, List[Cmisdoc]]]:
+        # every document has at least one version, so there is no point in loading
+        # more histories than the number of requested results
+        batch_size = VERSION_HISTORY_BATCH_SIZE
+        if django_query.high_mark is not None:
+            batch_size = min(batch_size, django_query.high_mark)
+
+        documents = iter(documents)
+        while batch := list(islice(documents, batch_size)):
+            histories = get_version_histories(self.cmis_client, batch)
+            for document in batch:
+                yield document, histories[document.objectId]
+
+    def _process_intermediate(
+        self, django_query, documents: List[Cmisdoc]
+    ) -> List[Cmisdoc]:
+        """
+        Order the results of the CMIS query and throw out non-distinct results.
+        """
+        documents = sort_results(documents, django_query.order_by)
+
         # now that the ordering is okay, implement the distinct fields
         for field in django_query.distinct_fields:
             attr_name = EIO_PROPERTY_MAP[field]
@@ -170,21 +386,6 @@ class CMISDocumentIterable(BaseIterable, CMISClientMixin):
             # for remaining distinct fields
             documents = to_keep
 
-        # do a final sort, because UUID sorting (canonical) does not mimic reality
-        if _order_keys and _order_keys[0] == "canonical":
-            grouped = []
-            # maintain any groups that may have been bundled by UUID! and then sort the
-            # groups
-            for canonical, group in groupby(documents, key=attrgetter("uuid")):
-                group = list(group)
-                min_creation = min([x.creationDate for x in group])
-                grouped.append((min_creation, group))
-
-            # now the groups are sorted by their logical canonical creation date
-            grouped = sorted(grouped, key=itemgetter(0))
-            # merge the documents together again (flattening the tuples of [int, list])
-            documents = sum([group for _, group in grouped], [])
-
         return documents
 
     def _normalize_filters(self, filters: List[Tuple]) -> Tuple[List[str], List[str]]:
@@ -212,6 +413,17 @@ class CMISDocumentIterable(BaseIterable, CMISClientMixin):
                 _rhs.append(value.isoformat().replace("+00:00", "Z"))
                 continue
             elif key == "_va_order":
+                # only the vertrouwelijkheidaanduidingen up to the maximum are allowed
+                column = mapper("vertrouwelijkheidaanduiding", type="document")
+                max_va_order = get_max_va_order(value)
+                allowed = [
+                    va
+                    for va in VertrouwelijkheidsAanduiding.values
+                    if VertrouwelijkheidsAanduiding.get_choice_order(va) <= max_va_order
+                ]
+                lhs, rhs = self._build_authorisation_filter(column, allowed)
+                _lhs.append(lhs)
+                _rhs += rhs
                 continue
             elif key == "informatieobjecttype":
                 if isinstance(value, list) and len(value) == 0:
@@ -247,42 +459,6 @@ class CMISDocumentIterable(BaseIterable, CMISClientMixin):
 
         return new_filters or filters
 
-    def _needs_vertrowelijkaanduiding_filter(self, filters: List[Tuple]) -> bool:
-        return "_va_order" in dict(filters)
-
-    def _filter_by_va(self, filters: List[Tuple], documents: List) -> List:
-        if len(documents) == 0:
-            return documents
-
-        # get the vertrowelijkaanduiding filter
-        for filter_name, filter_value in filters:
-            if filter_name == "_va_order":
-                # In case there are multiple different vertrouwelijk aanduiding,
-                # it chooses the lowest one
-                all_vertrouwelijkaanduiding = []
-                if isinstance(filter_value, list):
-                    for order in filter_value:
-                        for case in order.cases:
-                            all_vertrouwelijkaanduiding.append(
-                                case.result.identity[1][1]
-                            )
-
-                else:
-                    for case in filter_value.cases:
-                        all_vertrouwelijkaanduiding.append(case.result.identity[1][1])
-                va_order = min(all_vertrouwelijkaanduiding)
-                break
-
-        filtered_docs = []
-        for cmis_doc in documents:
-            # Check that the vertrouwelijkaanduiding autorisation is as required
-            django_doc = cmis_doc_to_django_model(cmis_doc)
-            doc_va_order = get_doc_va_order(django_doc)
-            if doc_va_order <= va_order:
-                filtered_docs.append(cmis_doc)
-
-        return filtered_docs
-
     def _build_authorisation_filter(
         self, key: str, value: List
     ) -> Tuple[str, List[str]]:
@@ -460,10 +636,26 @@ class CMISQuerySet(InformatieobjectQuerySet, CMISClientMixin):
         self._iterable_class = CMISDocumentIterable
 
         self._cmis_query = []
+        self._cmis_skip_count = None
+        self._cmis_next_skip_count = None
 
     def _clone(self):
         clone = super()._clone()
         clone._cmis_query = copy.copy(self._cmis_query)
+        clone._cmis_skip_count = self._cmis_skip_count
+        return clone
+
+    def skip_to(self, skip_count: int) -> "CMISQuerySet":
+        """
+        Start the slice of the results at offset ``skip_count`` of the CMIS results.
+
+        Private working copies share the UUID of their document, so the offset of a
+        slice in the CMIS results can't be derived from the slice itself. After a
+        slice is evaluated, the offset of the result following it is available as
+        ``_cmis_next_skip_count``.
+        """
+        clone = self._chain()
+        clone._cmis_skip_count = skip_count
         return clone
 
     def iterator(self):
@@ -473,14 +665,19 @@ class CMISQuerySet(InformatieobjectQuerySet, CMISClientMixin):
 
     def exists(self):
         if self._result_cache is None:
-            return bool(len(self))
+            # ⚡️ only fetch a single document
+            return bool(len(self[:1]) if not self.query.is_sliced else len(self))
         return bool(self._result_cache)
 
     def count(self):
         if self._result_cache is not None:
             return len(self._result_cache)
 
-        return len(self)
+        if not issubclass(self._iterable_class, CMISDocumentIterable):
+            return len(self)
+
+        # ⚡️ count the results without converting the documents
+        return self._iterable_class(self).count()
 
     def union(self, *args, **kwargs):
         unified_queryset = super().union(*args, **kwargs)
@@ -1065,10 +1262,16 @@ def get_object_url(
         return make_absolute_uri(path, request=request)
 
 
-def get_doc_va_order(django_doc):
-    return VertrouwelijkheidsAanduiding.get_choice_order(
-        django_doc.vertrouwelijkheidaanduiding
-    )
+def get_max_va_order(filter_value) -> int:
+    """
+    Extract the maximum vertrouwelijkheidaanduiding order from the ``_va_order``
+    filter expression(s).
+
+    In case there are multiple different vertrouwelijkheidaanduidingen, the lowest
+    one is used.
+    """
+    orders = filter_value if isinstance(filter_value, list) else [filter_value]
+    return min(case.result.identity[1][1] for order in orders for case in order.cases)
 
 
 def build_filter(filter_name, filter_value):
@@ -51,15 +51,7 @@ class InformatieobjectAuthorizationsFilterMixin(LooseFkAuthorizationsFilterMixin
     def prefix(self):
         return ""
 
-    def build_queryset(self, local_filters, external_filters) -> models.QuerySet:
-        _local_filters = models.Q()
-        for k, v in local_filters.items():
-            _local_filters &= models.Q(**{k: v})
-
-        _external_filters = models.Q()
-        for k, v in external_filters.items():
-            _external_filters &= models.Q(**{k: v})
-
+    def build_queryset(self, filters: models.Q) -> models.QuerySet:
         order_case = VertrouwelijkheidsAanduiding.get_order_expression(
             "vertrouwelijkheidaanduiding"
         )
@@ -72,21 +64,17 @@ class InformatieobjectAuthorizationsFilterMixin(LooseFkAuthorizationsFilterMixin
             # related to those EnkelvoudigInformatieObjectCanonicals
             model = apps.get_model("documenten", "EnkelvoudigInformatieObject")
             if settings.CMIS_ENABLED:
-                filtered = model.objects.annotate(**annotations).filter(
-                    _local_filters | _external_filters
-                )
+                filtered = model.objects.annotate(**annotations).filter(filters)
             else:
                 filtered = (
                     model.objects.annotate(**annotations)
-                    .filter(_local_filters | _external_filters)
+                    .filter(filters)
                     .values("canonical")
                 )
             queryset = self.filter(informatieobject__in=filtered)
             # bring it all together now to build the resulting queryset
         else:
-            queryset = self.annotate(**annotations).filter(
-                _local_filters | _external_filters
-            )
+            queryset = self.annotate(**annotations).filter(filters)
 
         return queryset
 
@@ -134,10 +122,11 @@ class InformatieobjectAuthorizationsFilterMixin(LooseFkAuthorizationsFilterMixin
         scope: Scope,
         authorizations: models.QuerySet,
         catalogus_authorizations: models.QuerySet,
+        cache_key: str = "",
     ) -> models.QuerySet:
         if not settings.CMIS_ENABLED:
             return super().filter_for_authorizations(
-                scope, authorizations, catalogus_authorizations
+                scope, authorizations, catalogus_authorizations, cache_key=cache_key
             )
 
         # todo implement error if no loose-fk field
@@ -0,0 +1,151 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Load the version histories of CMIS documents in bulk.
+
+Fetching the history of every document separately results in a round trip to the
+DMS per document. Where the DMS supports searching all versions, the histories of
+a batch of documents are fetched with a single query, otherwise they are fetched
+concurrently. Within a request, the histories are memoized.
+"""
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from threading import local
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from django.core import signals
+
+from drc_cmis.browser.client import CMISDRCClient
+from drc_cmis.connections import use_cmis_connection_pool
+from drc_cmis.utils.query import CMISQuery
+
+from ..utils import Cmisdoc
+
+logger = logging.getLogger(__name__)
+
+# upper bound on the number of concurrent requests to the DMS
+MAX_WORKERS = 8
+
+# keep the ``IN (...)`` clause of the version query at a reasonable size
+QUERY_CHUNK_SIZE = 50
+
+_state = local()
+
+
+def _start_request(**kwargs):
+    _state.histories = {}
+
+
+def _finish_request(**kwargs):
+    _state.histories = None
+
+
+signals.request_started.connect(_start_request)
+signals.request_finished.connect(_finish_request)
+
+
+def _get_memo() -> Optional[Dict[str, List[Cmisdoc]]]:
+    """
+    Return the histories memoized during the current request, if any.
+
+    The memo is keyed by ``cmis:objectId``, which changes whenever a new version
+    or a private working copy is created, so stale histories are never returned.
+    """
+    return getattr(_state, "histories", None)
+
+
+def _version_label_key(document: Cmisdoc) -> Tuple[int, ...]:
+    try:
+        return tuple(int(bit) for bit in document.versionLabel.split("."))
+    except (AttributeError, ValueError):
+        return ()
+
+
+def _supports_version_query(cmis_client) -> bool:
+    if not isinstance(cmis_client, CMISDRCClient):
+        return False
+    capabilities = cmis_client.repository_info.get("capabilities", {})
+    return bool(capabilities.get("capabilityAllVersionsSearchable"))
+
+
+def _query_versions(
+    cmis_client: CMISDRCClient, version_series_ids: Sequence[str]
+) -> Dict[str, List[Cmisdoc]]:
+    return_type = cmis_client.get_return_type("Document")
+    placeholders = ", ".join("'%s'" for _ in version_series_ids)
+    query = CMISQuery(
+        f"SELECT * FROM {return_type.table} "
+        f"WHERE cmis:versionSeriesId IN ({placeholders})"
+    )
+
+    versions = defaultdict(list)
+    skip_count = 0
+    while True:
+        body = {
+            "cmisaction": "query",
+            "statement": query(*version_series_ids),
+            "searchAllVersions": "true",
+            "skipCount": skip_count,
+        }
+        logger.debug("CMIS version query: request data: %s", body)
+        response = cmis_client.post_request(cmis_client.base_url, body)
+
+        documents = cmis_client.get_all_results(response, return_type)
+        for document in documents:
+            versions[document.versionSeriesId].append(document)
+
+        skip_count += len(documents)
+        if not documents or not response.get("hasMoreItems"):
+            break
+
+    # mimic the ordering of ``getAllVersions``: most recent first
+    return {
+        version_series_id: sorted(documents, key=_version_label_key, reverse=True)
+        for version_series_id, documents in versions.items()
+    }
+
+
+def _get_all_versions(cmis_client, document: Cmisdoc) -> List[Cmisdoc]:
+    # the worker threads need their own connection pool
+    with use_cmis_connection_pool():
+        return cmis_client.get_all_versions(document)
+
+
+def get_version_histories(
+    cmis_client, documents: Sequence[Cmisdoc]
+) -> Dict[str, List[Cmisdoc]]:
+    """
+    Retrieve all versions of the given documents, keyed by ``cmis:objectId``.
+    """
+    memo = _get_memo()
+    if memo is None:
+        memo = {}
+
+    to_fetch = [doc for doc in documents if doc.objectId not in memo]
+
+    # a private working copy is not found by querying the versions, so the
+    # histories of checked out documents are always retrieved individually
+    if to_fetch and _supports_version_query(cmis_client):
+        checked_in = [doc for doc in to_fetch if not doc.isVersionSeriesCheckedOut]
+        for start in range(0, len(checked_in), QUERY_CHUNK_SIZE):
+            chunk = checked_in[start : start + QUERY_CHUNK_SIZE]
+            versions = _query_versions(
+                cmis_client, sorted({doc.versionSeriesId for doc in chunk})
+            )
+            for doc in chunk:
+                memo[doc.objectId] = versions.get(doc.versionSeriesId, [doc])
+
+        to_fetch = [doc for doc in to_fetch if doc.objectId not in memo]
+
+    if len(to_fetch) == 1:
+        memo[to_fetch[0].objectId] = cmis_client.get_all_versions(to_fetch[0])
+    elif to_fetch:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(to_fetch))) as pool:
+            results = pool.map(
+                lambda doc: _get_all_versions(cmis_client, doc), to_fetch
+            )
+            for doc, versions in zip(to_fetch, results):
+                memo[doc.objectId] = versions
+
+    return {doc.objectId: memo[doc.objectId] for doc in documents}
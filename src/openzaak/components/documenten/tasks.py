@@ -1,18 +1,23 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2024 Dimpact
 import logging
+import multiprocessing
 import shutil
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from math import ceil
 from pathlib import Path
+from typing import Callable, Iterator, Optional
 from uuid import UUID, uuid4
 
 from django.conf import settings
 from django.core.exceptions import DisallowedHost, ValidationError
-from django.db import Error as DatabaseError, IntegrityError, transaction
+from django.db import Error as DatabaseError, IntegrityError, connections, transaction
 from django.http import HttpRequest
 from django.utils import timezone
 
 from vng_api_common.constants import RelatieAarden
-from vng_api_common.utils import generate_unique_identification
 
 from openzaak import celery_app
 from openzaak.components.documenten.api.serializers import (
@@ -24,10 +29,14 @@ from openzaak.components.documenten.models import (
     EnkelvoudigInformatieObjectCanonical,
 )
 from openzaak.components.zaken.models.zaken import Zaak, ZaakInformatieObject
+from openzaak.identification.generators import generate_identifications
 from openzaak.import_data.models import Import, ImportStatusChoices
 from openzaak.import_data.utils import (
+    ReportWriter,
+    add_batch_statistics,
     finish_batch,
     finish_import,
+    get_batch_statistics,
     get_csv_generator,
     get_total_count,
     task_locker,
@@ -36,34 +45,37 @@ from openzaak.utils.fields import get_default_path
 
 logger = logging.getLogger(__name__)
 
+# the maximum number of UUIDs looked up with a single query
+LOOKUP_CHUNK_SIZE = 1000
 
-def _import_document_row(
-    row: list[str],
-    row_index: int,
-    identifier: str,
-    existing_uuids: list[str],
-    zaak_uuids: dict[str, int],
-    request: HttpRequest,
+
+def _fail_document_row(document_row: DocumentRow, error_message: str) -> DocumentRow:
+    logger.warning(error_message)
+    document_row.comment = error_message
+    document_row.processed = True
+    document_row.instance = None
+    return document_row
+
+
+def _validate_document_row(
+    row_index: int, row: list[str], request: HttpRequest
 ) -> DocumentRow:
+    """
+    Parse and validate a row, which doesn't depend on any of the other rows.
+    """
     expected_column_count = len(DocumentRow.import_headers)
 
     if len(row) < expected_column_count:
-        error_message = (
-            f"Validation failed for line {row_index}: insufficient row count"
-        )
-
-        logger.warning(error_message)
-
         length = len(row)
         missing_count = expected_column_count - length
 
         missing_dummy_data = ["" for _i in range(missing_count)]
         data = [*row[:length], *missing_dummy_data, row_index]
 
-        document_row = DocumentRow(*data)
-        document_row.comment = error_message
-        document_row.processed = True
-        return document_row
+        return _fail_document_row(
+            DocumentRow(*data),
+            f"Validation failed for line {row_index}: insufficient row count",
+        )
 
     data = [*row[:expected_column_count], row_index]
     document_row = DocumentRow(*data)
@@ -71,13 +83,9 @@ def _import_document_row(
     try:
         import_data = document_row.as_serializer_data()
     except Exception as e:
-        error_message = f"Unable to import line {row_index}: {e}"
-
-        logger.warning(error_message)
-        document_row.comment = error_message
-        document_row.processed = True
-
-        return document_row
+        return _fail_document_row(
+            document_row, f"Unable to import line {row_index}: {e}"
+        )
 
     eio_serializer = EnkelvoudigInformatieObjectSerializer(
         data=import_data, context={"request": request}
@@ -85,25 +93,16 @@ def _import_document_row(
 
     try:
         if not eio_serializer.is_valid():
-            error_message = (
+            return _fail_document_row(
+                document_row,
                 "A validation error occurred while deserializing a "
                 f"EnkelvoudigInformatieObject on line {row_index}: \n"
-                f"{eio_serializer.errors}"
+                f"{eio_serializer.errors}",
             )
-
-            logger.warning(error_message)
-            document_row.comment = error_message
-            document_row.processed = True
-
-            return document_row
     except DisallowedHost as e:
-        error_message = f"Unable to import line {row_index}: {e}"
-
-        logger.warning(error_message)
-        document_row.comment = error_message
-        document_row.processed = True
-
-        return document_row
+        return _fail_document_row(
+            document_row, f"Unable to import line {row_index}: {e}"
+        )
 
     data: dict = eio_serializer.validated_data
 
@@ -111,28 +110,11 @@ def _import_document_row(
         try:
             uuid = UUID(document_row.uuid, version=4)
         except ValueError:
-            error_message = (
-                f"Given UUID for row {row_index} is not a valid UUID (version 4)"
-            )
-
-            logger.warning(error_message)
-            document_row.comment = error_message
-            document_row.processed = True
-
-            return document_row
-
-        if document_row.uuid in existing_uuids:
-            error_message = (
-                f"UUID given on row {row_index} was already found! Not overwriting "
-                "existing EIO."
+            return _fail_document_row(
+                document_row,
+                f"Given UUID for row {row_index} is not a valid UUID (version 4)",
             )
 
-            logger.warning(error_message)
-            document_row.comment = error_message
-            document_row.processed = True
-
-            return document_row
-
         data["uuid"] = str(uuid)
     else:
         data["uuid"] = str(uuid4())
@@ -151,78 +133,293 @@ def _import_document_row(
     instance = EnkelvoudigInformatieObject(**data)
     instance.canonical = EnkelvoudigInformatieObjectCanonical()
 
+    try:
+        instance.clean()
+    except ValidationError as e:
+        return _fail_document_row(
+            document_row,
+            "A validation error occurred while validating a "
+            f"EnkelvoudigInformatieObject on line {row_index}: \n"
+            f"{str(e)}",
+        )
+
+    document_row.instance = instance
+    return document_row
+
+
+def _validate_document_row_with_headers(
+    row_index: int, row: list[str], request_headers: dict
+) -> DocumentRow:
+    # the request can't be passed to the worker processes
+    return _validate_document_row(row_index, row, _reconstruct_request(request_headers))
+
+
+def _check_document_row(
+    document_row: DocumentRow,
+    identifier: str,
+    existing_uuids: set[str],
+    zaak_uuids: dict[str, int],
+) -> None:
+    """
+    Perform the checks which depend on the rows before this one, in order.
+    """
+    if document_row.processed:
+        return
+
+    row_index = document_row.row_index
+    instance = document_row.instance
+
+    if document_row._uuid and str(instance.uuid) in existing_uuids:
+        _fail_document_row(
+            document_row,
+            f"UUID given on row {row_index} was already found! Not overwriting "
+            "existing EIO.",
+        )
+        return
+
     if not instance.identificatie:
         instance.identificatie = identifier
 
     zaak_uuid = document_row.zaak_uuid
 
     if zaak_uuid and zaak_uuid not in zaak_uuids:
-        error_message = f"Zaak ID specified for row {row_index} is unknown."
+        _fail_document_row(
+            document_row, f"Zaak ID specified for row {row_index} is unknown."
+        )
 
-        logger.warning(error_message)
-        document_row.comment = error_message
-        document_row.processed = True
 
-        return document_row
+def _get_staging_dir(import_instance: Import) -> Path:
+    """
+    Return the directory the files of the import are copied to before being inserted.
+
+    The directory is on the same storage as the documents, so the files can be moved
+    into place without copying them again.
+    """
+    field = EnkelvoudigInformatieObject.inhoud.field
+    return Path(field.storage.base_location) / ".import" / str(import_instance.pk)
 
-    try:
-        instance.clean()
-    except ValidationError as e:
-        error_message = (
-            "A validation error occurred while validating a "
-            f"EnkelvoudigInformatieObject on line {row_index}: \n"
-            f"{str(e)}"
-        )
 
-        logger.warning(error_message)
-        document_row.comment = error_message
-        document_row.processed = True
+def _copy_document_file(
+    document_row: DocumentRow, staging_dir: Optional[Path] = None
+) -> DocumentRow:
+    """
+    Copy the file of the row to the documents, or to the staging directory.
 
+    The file name of the document is set in both cases.
+    """
+    if document_row.processed:
         return document_row
 
+    row_index = document_row.row_index
     file_path = document_row.bestandspad
     path = Path(settings.IMPORT_DOCUMENTEN_BASE_DIR) / Path(file_path)
 
     if not path.exists() or not path.is_file():
-        error_message = (
+        return _fail_document_row(
+            document_row,
             f"The given filepath {path} does not exist or is not a file for "
-            f"row {row_index}"
+            f"row {row_index}",
         )
 
-        logger.warning(error_message)
-        document_row.comment = error_message
-        document_row.processed = True
-
-        return document_row
-
     default_dir = get_default_path(EnkelvoudigInformatieObject.inhoud.field)
     import_path = default_dir / path.name
 
-    if not default_dir.exists():
-        default_dir.mkdir(parents=True)
+    copy_dir = staging_dir or default_dir
+    copy_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        shutil.copy2(path, import_path)
+        shutil.copy2(path, copy_dir / path.name)
     except Exception as e:
-        error_message = f"Unable to copy file for row {row_index}: \n {str(e)}"
+        return _fail_document_row(
+            document_row, f"Unable to copy file for row {row_index}: \n {str(e)}"
+        )
 
-        logger.warning(error_message)
-        document_row.comment = error_message
-        document_row.processed = True
+    document_row.instance.inhoud.name = str(import_path)
+    return document_row
 
-        return document_row
 
-    instance.inhoud.name = str(import_path)
+def _import_document_row(
+    row: list[str],
+    row_index: int,
+    identifier: str,
+    existing_uuids: set[str],
+    zaak_uuids: dict[str, int],
+    request: HttpRequest,
+) -> DocumentRow:
+    document_row = _validate_document_row(row_index, row, request)
+    _check_document_row(document_row, identifier, existing_uuids, zaak_uuids)
+    return _copy_document_file(document_row)
 
-    document_row.instance = instance
-    return document_row
+
+def _process_rows(func: Callable, items: list) -> list:
+    try:
+        return [func(*item) for item in items]
+    finally:
+        # workers use their own database connections
+        connections.close_all()
+
+
+def _get_validation_executor(workers: int) -> Optional[ProcessPoolExecutor]:
+    """
+    Return the pool of processes the rows are validated on, which is CPU-bound.
+
+    The processes are forked when the first rows are submitted, so they share the
+    loaded code and configuration.
+    """
+    if workers <= 1:
+        return None
+
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("fork")
+    )
+
+
+def _submit(
+    executor: Optional[Executor], func: Callable, items: list
+) -> Callable[[], list]:
+    """
+    Apply ``func`` to the items on the workers, and return a callable to wait for
+    the results, in the original order.
+
+    The items are split in a chunk per worker, so every worker only needs a single
+    database connection per chunk.
+    """
+    if executor is None:
+        results = [func(*item) for item in items]
+        return lambda: results
+
+    if isinstance(executor, ProcessPoolExecutor):
+        # forked workers must open their own database connections
+        connections.close_all()
+
+    chunk_size = ceil(len(items) / executor._max_workers) or 1
+    futures = [
+        executor.submit(_process_rows, func, items[index : index + chunk_size])
+        for index in range(0, len(items), chunk_size)
+    ]
+    return lambda: [result for future in futures for result in future.result()]
+
+
+def _get_existing_uuids(batch: list[DocumentRow]) -> set[str]:
+    uuids = [
+        str(row.instance.uuid)
+        for row in batch
+        if row.instance is not None and row._uuid
+    ]
+
+    existing_uuids = set()
+    for index in range(0, len(uuids), LOOKUP_CHUNK_SIZE):
+        existing_uuids.update(
+            str(uuid)
+            for uuid in EnkelvoudigInformatieObject.objects.filter(
+                uuid__in=uuids[index : index + LOOKUP_CHUNK_SIZE]
+            ).values_list("uuid", flat=True)
+        )
+
+    return existing_uuids
+
+
+def _get_zaak_ids(batch: list[DocumentRow]) -> dict[str, int]:
+    uuids = []
+    for row in batch:
+        if row.instance is None or not row.zaak_uuid:
+            continue
+
+        try:
+            UUID(row.zaak_uuid)
+        except ValueError:
+            continue
+
+        uuids.append(row.zaak_uuid)
+
+    zaak_ids = {}
+    for index in range(0, len(uuids), LOOKUP_CHUNK_SIZE):
+        zaak_ids.update(
+            (str(uuid), id)
+            for uuid, id in Zaak.objects.filter(
+                uuid__in=uuids[index : index + LOOKUP_CHUNK_SIZE]
+            ).values_list("uuid", "id")
+        )
+
+    return zaak_ids
+
+
+def _get_row_batches(
+    file_path: str, batch_size: int, start_row: int
+) -> Iterator[list[tuple[int, list[str]]]]:
+    batch = []
+
+    for row_index, row in get_csv_generator(file_path):
+        # skip the header row and the rows of already committed batches
+        if row_index == 1 or row_index <= start_row:
+            continue
+
+        batch.append((row_index, row))
+
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def _commit_batch(
+    import_instance: Import,
+    batch: list[DocumentRow],
+    zaak_uuids: dict[str, int],
+    staging_dir: Path,
+) -> None:
+    """
+    Insert the batch, and save the statistics and the last committed row with it.
+
+    The files of the inserted rows are moved from the staging directory into place
+    as the last step of the transaction. If the transaction fails, the moved files
+    are removed again, so no files remain for rows which weren't committed.
+    """
+    # the instances are replaced by the created ones, so the paths are taken first
+    paths = [row.imported_path for row in batch if row.instance is not None]
+    moved = []
+
+    try:
+        with transaction.atomic():
+            _batch_create_eios(batch, zaak_uuids)
+
+            for path in paths:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                (staging_dir / path.name).replace(path)
+                moved.append(path)
+
+            _processed, _fail_count, _success_count = get_batch_statistics(batch)
+            Import.objects.filter(pk=import_instance.pk).update(
+                processed=import_instance.processed + _processed,
+                processed_successfully=(
+                    import_instance.processed_successfully + _success_count
+                ),
+                processed_invalid=import_instance.processed_invalid + _fail_count,
+                last_committed_row=batch[-1].row_index,
+            )
+    except Exception:
+        for path in moved:
+            path.unlink(missing_ok=True)
+
+        # the rows inserted before the error are rolled back as well
+        for row in batch:
+            row.processed = True
+            row.succeeded = False
+        raise
+
+    add_batch_statistics(import_instance, batch)
+    import_instance.last_committed_row = batch[-1].row_index
 
 
 @transaction.atomic()
 def _batch_create_eios(batch: list[DocumentRow], zaak_uuids: dict[str, int]) -> None:
+    rows = [row for row in batch if row.instance is not None]
+
     try:
         EnkelvoudigInformatieObjectCanonical.objects.bulk_create(
-            [row.instance.canonical for row in batch if row.instance is not None]
+            [row.instance.canonical for row in rows]
         )
     except DatabaseError as e:
         for row in batch:
@@ -233,7 +430,7 @@ def _batch_create_eios(batch: list[DocumentRow], zaak_uuids: dict[str, int]) ->
 
     try:
         eios = EnkelvoudigInformatieObject.objects.bulk_create(
-            [row.instance for row in batch if row.instance is not None]
+            [row.instance for row in rows]
         )
     except DatabaseError as e:
         for row in batch:
@@ -242,20 +439,8 @@ def _batch_create_eios(batch: list[DocumentRow], zaak_uuids: dict[str, int]) ->
 
         raise e
 
-    # reuse created instances
-    for row in batch:
-        if row.failed:
-            continue
-
-        instance = next(
-            (
-                eio
-                for eio in eios
-                if row.instance and str(eio.uuid) == str(row.instance.uuid)
-            ),
-            None,
-        )
-
+    # reuse created instances, which are returned in the same order
+    for row, instance in zip(rows, eios):
         row.instance = instance
 
         if not row.zaak_uuid:
@@ -295,23 +480,26 @@ def _batch_create_eios(batch: list[DocumentRow], zaak_uuids: dict[str, int]) ->
         row.succeeded = True
 
 
-def _get_identifiers(size: int) -> list[str]:
-    now = timezone.now()
-    dummy_instance = EnkelvoudigInformatieObject(creatiedatum=now.date())
-    first_identifier = generate_unique_identification(dummy_instance, "creatiedatum")
-
-    _range = size - 1 if size else 0  # don't count the first identifier
-
-    model_name, year, number = first_identifier.split("-")
-    number = int(number)
-    identifiers = []
-
-    for i in range(_range):
-        number += 1
-
-        identifiers.append(f"{model_name}-{year}-{str(number).zfill(10)}")
-
-    return [first_identifier, *identifiers]
+def _get_identifiers(batch: list[DocumentRow]) -> dict[int, str]:
+    """
+    Generate the identifications of the rows without one, by row index.
+    """
+    rows = defaultdict(list)
+    for document_row in batch:
+        if document_row.processed or document_row.instance.identificatie:
+            continue
+        instance = document_row.instance
+        key = (instance.creatiedatum.year, instance.bronorganisatie)
+        rows[key].append(document_row.row_index)
+
+    identifiers = {}
+    # ⚡️ reserve the identifications of an organisation at once
+    for (year, organisation), row_indices in rows.items():
+        generated = generate_identifications(
+            EnkelvoudigInformatieObject, year, organisation, count=len(row_indices)
+        )
+        identifiers.update(zip(row_indices, generated))
+    return identifiers
 
 
 def _reconstruct_request(headers: dict) -> HttpRequest:
@@ -331,95 +519,159 @@ def _reconstruct_request(headers: dict) -> HttpRequest:
 @celery_app.task(bind=True)
 @task_locker
 def import_documents(self, import_pk: int, request_headers: dict) -> None:
-    import_instance = Import.objects.get(pk=import_pk)
+    """
+    Import the documents in a staged pipeline.
 
-    request = _reconstruct_request(request_headers)
+    1. The rows are parsed and validated on a pool of worker processes.
+    2. The checks which depend on earlier rows (duplicate UUIDs, identifiers and
+       the zaak references) are done in order.
+    3. The files are copied on a pool of worker threads.
+    4. The batch is inserted in the database, in order.
 
-    file_path = import_instance.import_file.path
+    While a batch is being copied and inserted, the next batch is validated. No
+    more batches are read from the import file, which bounds the memory usage.
 
-    import_instance.total = get_total_count(file_path)
-    import_instance.started_on = timezone.now()
-    import_instance.status = ImportStatusChoices.active
-    import_instance.save(update_fields=["total", "started_on", "status"])
+    The files are copied to a staging directory, and only moved into place when the
+    batch is inserted. The last row of every committed batch is stored on the import
+    in the same transaction as the statistics, so a restarted import continues after
+    the last committed batch.
+    """
+    import_instance = Import.objects.get(pk=import_pk)
 
-    batch: list[DocumentRow] = []
-    batch_size = settings.IMPORT_DOCUMENTEN_BATCH_SIZE
+    file_path = import_instance.import_file.path
+    start_row = import_instance.last_committed_row
 
-    zaak_uuids = {str(uuid): id for uuid, id in Zaak.objects.values_list("uuid", "id")}
-    eio_uuids = [
-        str(uuid) for uuid in EnkelvoudigInformatieObject.objects.values_list("uuid")
-    ]
+    if start_row:
+        logger.info(f"Resuming import after row {start_row}")
+    else:
+        import_instance.total = get_total_count(file_path)
+        import_instance.started_on = timezone.now()
 
-    identifiers = []
+    import_instance.status = ImportStatusChoices.active
+    import_instance.save(update_fields=["total", "started_on", "status"])
 
-    for row_index, row in get_csv_generator(file_path):
-        if row_index == 1:  # skip the header row
-            continue
+    # the files of a batch which wasn't committed before the import stopped
+    staging_dir = _get_staging_dir(import_instance)
+    shutil.rmtree(staging_dir, ignore_errors=True)
 
-        if len(batch) % batch_size == 0:
-            logger.info(
-                f"Starting batch {import_instance.get_batch_number(batch_size)}"
+    batch_size = settings.IMPORT_DOCUMENTEN_BATCH_SIZE
+    workers = settings.IMPORT_DOCUMENTEN_WORKERS
+
+    row_batches = _get_row_batches(file_path, batch_size, start_row)
+
+    validation_executor = _get_validation_executor(workers)
+
+    with ReportWriter(import_instance, DocumentRow.export_headers) as report, (
+        validation_executor or nullcontext()
+    ), (
+        ThreadPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()
+    ) as executor:
+        row_batch = next(row_batches, None)
+        validating = (
+            _submit(
+                validation_executor,
+                _validate_document_row_with_headers,
+                [(*row, request_headers) for row in row_batch],
             )
-
-            identifiers = _get_identifiers(batch_size)
-
-        document_row = _import_document_row(
-            row, row_index, identifiers.pop(), eio_uuids, zaak_uuids, request
+            if row_batch
+            else None
         )
 
-        if document_row.instance and document_row.instance.uuid:
-            eio_uuids.append(str(document_row.instance.uuid))
-
-        batch.append(document_row)
-
-        processed = import_instance.processed + len(batch)
-        is_finished = bool(import_instance.total == processed)
-
-        if not len(batch) % batch_size == 0 and not is_finished:
-            continue
-
-        try:
-            logger.debug(
-                "Creating EIO's and ZEIO's for batch "
-                f"{import_instance.get_batch_number(batch_size)}"
-            )
-            _batch_create_eios(batch, zaak_uuids)
-        except IntegrityError as e:
-            error_message = (
-                "An Integrity error occured during batch "
-                f"{import_instance.get_batch_number(batch_size)}: \n {str(e)}"
+        while validating is not None:
+            batch: list[DocumentRow] = validating()
+            batch_number = import_instance.get_batch_number(batch_size)
+            logger.info(f"Starting batch {batch_number}")
+
+            # validate the next batch while this one is being finished
+            row_batch = next(row_batches, None)
+            validating = (
+                _submit(
+                    validation_executor,
+                    _validate_document_row_with_headers,
+                    [(*row, request_headers) for row in row_batch],
+                )
+                if row_batch
+                else None
             )
 
-            import_instance.comment += f"\n\n {error_message}"
-            import_instance.save(update_fields=["comment"])
+            # only look up the UUIDs referenced in this batch, which keeps the
+            # memory usage independent of the size of the database
+            eio_uuids = _get_existing_uuids(batch)
+            zaak_uuids = _get_zaak_ids(batch)
+
+            identifiers = _get_identifiers(batch)
+            for document_row in batch:
+                _check_document_row(
+                    document_row,
+                    identifiers.get(document_row.row_index, ""),
+                    eio_uuids,
+                    zaak_uuids,
+                )
 
-            logger.warning(
-                f"{error_message} \n Trying to continue with batch "
-                f"{import_instance.get_batch_number(batch_size) + 1}"
-            )
+                if document_row.instance and document_row.instance.uuid:
+                    eio_uuids.add(str(document_row.instance.uuid))
+
+            batch = _submit(
+                executor,
+                _copy_document_file,
+                [(row, staging_dir) for row in batch],
+            )()
+
+            try:
+                logger.debug(f"Creating EIO's and ZEIO's for batch {batch_number}")
+                _commit_batch(import_instance, batch, zaak_uuids, staging_dir)
+            except IntegrityError as e:
+                error_message = (
+                    "An Integrity error occured during batch "
+                    f"{batch_number}: \n {str(e)}"
+                )
 
-        except DatabaseError as e:
-            logger.critical(
-                "A critical error occured during batch "
-                f"{import_instance.get_batch_number(batch_size)}. "
-                f"Finishing import due to database error: \n{str(e)}"
-            )
-            logger.info("Trying to stop the import process gracefully")
+                # the batch is reported as failed, so it's saved as processed to
+                # prevent reporting its rows again when the import is resumed
+                add_batch_statistics(import_instance, batch)
+                import_instance.last_committed_row = batch[-1].row_index
+                import_instance.comment += f"\n\n {error_message}"
+                import_instance.save(
+                    update_fields=[
+                        "processed",
+                        "processed_successfully",
+                        "processed_invalid",
+                        "last_committed_row",
+                        "comment",
+                    ]
+                )
 
-            finish_batch(import_instance, batch, DocumentRow.export_headers)
-            finish_import(
-                import_instance,
-                status=ImportStatusChoices.error,
-                comment=str(e),
-            )
+                logger.warning(
+                    f"{error_message} \n Trying to continue with batch "
+                    f"{batch_number + 1}"
+                )
 
-            return
+            except DatabaseError as e:
+                logger.critical(
+                    f"A critical error occured during batch {batch_number}. "
+                    f"Finishing import due to database error: \n{str(e)}"
+                )
+                logger.info("Trying to stop the import process gracefully")
+
+                add_batch_statistics(import_instance, batch)
+                finish_batch(batch_number, batch, report)
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                finish_import(
+                    import_instance,
+                    status=ImportStatusChoices.error,
+                    comment=str(e),
+                )
 
-        finish_batch(import_instance, batch, DocumentRow.export_headers)
+                for _executor in (validation_executor, executor):
+                    if _executor is not None:
+                        _executor.shutdown(cancel_futures=True)
+                return
 
-        remaining_batches = import_instance.get_remaining_batches(batch_size)
-        logger.info(f"{remaining_batches} batches remaining")
+            finish_batch(batch_number, batch, report)
+            # the files of the rows which weren't inserted
+            shutil.rmtree(staging_dir, ignore_errors=True)
 
-        batch.clear()
+            remaining_batches = import_instance.get_remaining_batches(batch_size)
+            logger.info(f"{remaining_batches} batches remaining")
 
     finish_import(import_instance, ImportStatusChoices.finished)
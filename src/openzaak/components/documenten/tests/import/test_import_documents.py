@@ -1,11 +1,12 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2024 Dimpact
 import csv
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
 from django.db import IntegrityError, OperationalError
-from django.test import TestCase, override_settings
+from django.test import TestCase, TransactionTestCase, override_settings
 
 import requests_mock
 from zgw_consumers.constants import APITypes
@@ -21,6 +22,7 @@ from openzaak.components.documenten.tests.utils import (
     get_catalogus_response,
     get_informatieobjecttype_response,
 )
+from openzaak.components.zaken.models import ZaakInformatieObject
 from openzaak.components.zaken.tests.factories import ZaakFactory
 from openzaak.import_data.models import (
     ImportRowResultChoices,
@@ -141,6 +143,41 @@ class ImportDocumentTestCase(ImportTestMixin, MockSchemasMixin, TestCase):
         # no comments on all the rows
         self.assertTrue(all((row[-2] == "") for row in rows[1:]))
 
+    def test_resume_import(self):
+        ZaakFactory(uuid="43f1d8f4-c689-46eb-ae6e-c64d892d5341")
+        ZaakFactory(uuid="b02ee3eb-8e94-4cd9-93e7-f8d1b16a1952")
+
+        import_file_path = self.test_data_path / "import.csv"
+
+        # the first batch (the rows 2 and 3) was committed before the import stopped
+        with open(import_file_path) as import_file:
+            import_instance = self.create_import(
+                import_type=ImportTypeChoices.documents,
+                status=ImportStatusChoices.active,
+                import_file__data=import_file.read(),
+                total=4,
+                processed=2,
+                processed_successfully=2,
+                last_committed_row=3,
+                report_file=None,
+            )
+
+        import_documents(import_instance.pk, self.request_headers)
+
+        import_instance.refresh_from_db()
+
+        self.assertEqual(EnkelvoudigInformatieObject.objects.count(), 2)
+
+        self.assertEqual(import_instance.total, 4)
+        self.assertEqual(import_instance.processed, 4)
+        self.assertEqual(import_instance.processed_invalid, 0)
+        self.assertEqual(import_instance.processed_successfully, 4)
+        self.assertEqual(import_instance.last_committed_row, 5)
+        self.assertEqual(import_instance.status, ImportStatusChoices.finished)
+
+        report_path = Path(import_instance.report_file.path)
+        self.addCleanup(report_path.unlink)
+
     def test_total_smaller_than_batch_size(self):
         ZaakFactory(uuid="43f1d8f4-c689-46eb-ae6e-c64d892d5341")
 
@@ -439,6 +476,74 @@ class ImportDocumentTestCase(ImportTestMixin, MockSchemasMixin, TestCase):
             with self.subTest(filename=filename):
                 self.assertFalse(expected_path.exists())
 
+    @patch("openzaak.components.documenten.tasks.uuid4")
+    @patch(
+        "openzaak.components.documenten.tasks.EnkelvoudigInformatieObject.objects.bulk_create",
+        autospec=True,
+    )
+    def test_integrity_error_in_last_batch(self, mocked_bulk_create, mocked_uuid):
+        ZaakFactory(uuid="43f1d8f4-c689-46eb-ae6e-c64d892d5341")
+        ZaakFactory(uuid="b02ee3eb-8e94-4cd9-93e7-f8d1b16a1952")
+
+        import_file_path = self.test_data_path / "import-database-connection-loss.csv"
+
+        with open(import_file_path) as import_file:
+            import_instance = self.create_import(
+                import_type=ImportTypeChoices.documents,
+                status=ImportStatusChoices.pending,
+                import_file__data=import_file.read(),
+                total=0,
+                report_file=None,
+            )
+
+        random_eios = EnkelvoudigInformatieObjectFactory.create_batch(
+            size=2, informatieobjecttype=self.informatieobjecttype
+        )
+
+        mocked_bulk_create.side_effect = (random_eios, IntegrityError)
+
+        mocked_uuid.side_effect = tuple(eio.uuid for eio in random_eios)
+
+        import_documents(import_instance.pk, self.request_headers)
+
+        import_instance.refresh_from_db()
+
+        self.assertEqual(import_instance.processed, 4)
+        self.assertEqual(import_instance.processed_invalid, 2)
+        self.assertEqual(import_instance.processed_successfully, 2)
+        self.assertEqual(import_instance.status, ImportStatusChoices.finished)
+        # the rows of the rolled back batch are reported as not imported, and
+        # aren't processed again when resuming
+        self.assertEqual(import_instance.last_committed_row, 5)
+
+        report_path = Path(import_instance.report_file.path)
+        self.addCleanup(report_path.unlink)
+
+        import_documents(import_instance.pk, self.request_headers)
+
+        import_instance.refresh_from_db()
+
+        self.assertEqual(import_instance.processed, 4)
+
+        with open(report_path) as report_file:
+            rows = list(csv.reader(report_file, delimiter=",", quotechar='"'))
+
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(
+            [row[-1] for row in rows[3:]],
+            [ImportRowResultChoices.not_imported.label] * 2,
+        )
+
+        default_path = get_default_path(EnkelvoudigInformatieObject.inhoud.field)
+
+        for filename in ("test-file-1.odt", "test-file-2.odt"):
+            with self.subTest(filename=filename):
+                self.assertTrue((default_path / filename).exists())
+
+        for filename in ("test-file-3.odt", "test-file-4.odt"):
+            with self.subTest(filename=filename):
+                self.assertFalse((default_path / filename).exists())
+
     @patch("openzaak.components.documenten.tasks.uuid4")
     @patch(
         "openzaak.components.documenten.tasks.EnkelvoudigInformatieObject.objects.bulk_create",
@@ -706,3 +811,112 @@ class ImportDocumentTestCase(ImportTestMixin, MockSchemasMixin, TestCase):
                     )
                 else:
                     self.assertIn("Unable to load row due to database error", row[-2])
+
+
+@override_settings(
+    ALLOWED_HOSTS=["testserver"],
+    IMPORT_DOCUMENTEN_BATCH_SIZE=2,
+    IMPORT_DOCUMENTEN_WORKERS=2,
+)
+class ImportDocumentWorkersTests(
+    ImportTestMixin, MockSchemasMixin, TransactionTestCase
+):
+    """
+    The rows are validated on worker processes and the files are copied on worker
+    threads, which use their own database connections and only see committed data.
+    """
+
+    mocker_attr = "requests_mock"
+
+    clean_import_files = False
+    clean_documenten_files = True
+
+    catalogus = "https://externe.catalogus.nl/api/v1/catalogussen/1c8e36be-338c-4c07-ac5e-1adf55bec04a"
+    informatieobjecttype = (
+        "https://externe.catalogus.nl/api/v1/informatieobjecttypen/"
+        "b71f72ef-198d-44d8-af64-ae1932df830a"
+    )
+
+    def setUp(self):
+        self.requests_mock = requests_mock.Mocker()
+        self.requests_mock.start()
+
+        self.requests_mock.get(
+            self.informatieobjecttype,
+            json=get_informatieobjecttype_response(
+                self.catalogus, self.informatieobjecttype
+            ),
+        )
+        self.requests_mock.get(
+            self.catalogus,
+            json=get_catalogus_response(self.catalogus, self.informatieobjecttype),
+        )
+
+        self.addCleanup(self.requests_mock.stop)
+
+        super().setUp()
+
+        override = override_settings(IMPORT_DOCUMENTEN_BASE_DIR=_get_test_dir())
+        override.enable()
+        self.addCleanup(override.disable)
+
+        ServiceFactory.create(
+            api_root="https://externe.catalogus.nl/api/v1/", api_type=APITypes.ztc
+        )
+
+    def test_import_with_workers(self):
+        ZaakFactory(uuid="43f1d8f4-c689-46eb-ae6e-c64d892d5341")
+        ZaakFactory(uuid="b02ee3eb-8e94-4cd9-93e7-f8d1b16a1952")
+
+        import_file_path = _get_test_dir() / "import.csv"
+
+        with open(import_file_path) as import_file:
+            import_instance = self.create_import(
+                import_type=ImportTypeChoices.documents,
+                status=ImportStatusChoices.pending,
+                import_file__data=import_file.read(),
+                total=0,
+                report_file=None,
+            )
+
+        with patch(
+            "openzaak.components.documenten.tasks.ProcessPoolExecutor",
+            wraps=ProcessPoolExecutor,
+        ) as mock_pool:
+            import_documents(
+                import_instance.pk, {"SERVER_NAME": "testserver", "SERVER_PORT": 80}
+            )
+
+        self.assertEqual(mock_pool.call_args.kwargs["max_workers"], 2)
+
+        import_instance.refresh_from_db()
+
+        self.assertEqual(EnkelvoudigInformatieObject.objects.count(), 4)
+        self.assertEqual(ZaakInformatieObject.objects.count(), 2)
+
+        self.assertEqual(import_instance.total, 4)
+        self.assertEqual(import_instance.processed, 4)
+        self.assertEqual(import_instance.processed_successfully, 4)
+        self.assertEqual(import_instance.last_committed_row, 5)
+        self.assertEqual(import_instance.status, ImportStatusChoices.finished)
+
+        report_path = Path(import_instance.report_file.path)
+        self.addCleanup(report_path.unlink)
+
+        with open(report_path) as report_file:
+            rows = list(csv.reader(report_file, delimiter=",", quotechar='"'))
+
+        # the rows are reported in the order of the import file
+        self.assertEqual(
+            [row[4] for row in rows[1:]],
+            ["Document 1", "Document 2", "Document 3", "Document 4"],
+        )
+        self.assertTrue(
+            all(row[-1] == ImportRowResultChoices.imported.label for row in rows[1:])
+        )
+
+        default_path = get_default_path(EnkelvoudigInformatieObject.inhoud.field)
+        for eio in EnkelvoudigInformatieObject.objects.all():
+            with self.subTest(eio=eio):
+                self.assertEqual(Path(eio.inhoud.path).parent, default_path)
+                self.assertTrue(Path(eio.inhoud.path).exists())
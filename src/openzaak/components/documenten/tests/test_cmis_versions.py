@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from django.core import signals
+from django.test import SimpleTestCase
+
+from ..query.versions import get_version_histories
+
+
+def _document(object_id: str, checked_out=False) -> SimpleNamespace:
+    return SimpleNamespace(
+        objectId=object_id,
+        versionSeriesId=object_id.split(";")[0],
+        isVersionSeriesCheckedOut=checked_out,
+    )
+
+
+class VersionHistoryTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cmis_client = Mock()
+        self.cmis_client.get_all_versions.side_effect = lambda doc: [doc]
+
+    def test_histories_are_fetched_for_all_documents(self):
+        documents = [_document(f"doc-{i};1.0") for i in range(5)]
+
+        histories = get_version_histories(self.cmis_client, documents)
+
+        self.assertEqual(
+            histories, {document.objectId: [document] for document in documents}
+        )
+        self.assertEqual(self.cmis_client.get_all_versions.call_count, 5)
+
+    def test_histories_are_memoized_during_request(self):
+        documents = [_document("doc-1;1.0"), _document("doc-2;1.0")]
+        signals.request_started.send(sender=self.__class__)
+        self.addCleanup(signals.request_finished.send, sender=self.__class__)
+
+        get_version_histories(self.cmis_client, documents)
+        get_version_histories(self.cmis_client, documents)
+
+        self.assertEqual(self.cmis_client.get_all_versions.call_count, 2)
+
+        # a new version results in a different object ID
+        get_version_histories(self.cmis_client, [_document("doc-1;1.1")])
+
+        self.assertEqual(self.cmis_client.get_all_versions.call_count, 3)
+
+    def test_histories_are_not_memoized_outside_request(self):
+        documents = [_document("doc-1;1.0")]
+
+        get_version_histories(self.cmis_client, documents)
+        get_version_histories(self.cmis_client, documents)
+
+        self.assertEqual(self.cmis_client.get_all_versions.call_count, 2)
@@ -859,6 +859,84 @@ class EnkelvoudigInformatieObjectPaginationAPITests(JWTAuthMixin, APICMISTestCas
         self.assertIsNone(response_data["previous"])
         self.assertIsNone(response_data["next"])
 
+    def test_pagination_page_size_param(self):
+        # the documents are ordered on their UUID
+        eio1, eio2, eio3 = sorted(
+            EnkelvoudigInformatieObjectFactory.create_batch(3),
+            key=lambda eio: str(eio.uuid),
+        )
+
+        response = self.client.get(self.list_url, {"pageSize": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_data = response.json()
+        self.assertEqual(response_data["count"], 3)
+        self.assertIsNone(response_data["previous"])
+        self.assertIn("skipCount=2", response_data["next"])
+        self.assertEqual(
+            [eio["identificatie"] for eio in response_data["results"]],
+            [eio1.identificatie, eio2.identificatie],
+        )
+
+        response = self.client.get(response_data["next"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_data = response.json()
+        self.assertEqual(response_data["count"], 3)
+        self.assertIsNone(response_data["next"])
+        self.assertEqual(
+            [eio["identificatie"] for eio in response_data["results"]],
+            [eio3.identificatie],
+        )
+
+    def test_pagination_skip_count_param(self):
+        eio3 = max(
+            EnkelvoudigInformatieObjectFactory.create_batch(3),
+            key=lambda eio: str(eio.uuid),
+        )
+
+        response = self.client.get(
+            self.list_url, {"pageSize": 2, "page": 2, "skipCount": 2}
+        )
+
+        # the skip count of the next link is not an unknown parameter
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertEqual(response_data["count"], 3)
+        self.assertNotIn("skipCount", response_data["previous"])
+        self.assertEqual(
+            [eio["identificatie"] for eio in response_data["results"]],
+            [eio3.identificatie],
+        )
+
+    def test_pagination_skip_count_with_private_working_copy(self):
+        eios = sorted(
+            EnkelvoudigInformatieObjectFactory.create_batch(3),
+            key=lambda eio: str(eio.uuid),
+        )
+        # the private working copy shares the UUID of the first document
+        eio_url = reverse(
+            "enkelvoudiginformatieobject-detail", kwargs={"uuid": eios[0].uuid}
+        )
+        self.client.post(f"{eio_url}/lock")
+
+        response = self.client.get(self.list_url, {"pageSize": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertEqual(response_data["count"], 3)
+        identificaties = [eio["identificatie"] for eio in response_data["results"]]
+
+        response = self.client.get(response_data["next"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertIsNone(response_data["next"])
+        identificaties += [eio["identificatie"] for eio in response_data["results"]]
+        self.assertEqual(identificaties, [eio.identificatie for eio in eios])
+
 
 @tag("external-urls")
 @require_cmis
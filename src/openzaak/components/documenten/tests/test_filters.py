@@ -1,7 +1,9 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 from django.contrib.sites.models import Site
+from django.db import connection
 from django.test import override_settings, tag
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -296,6 +298,33 @@ class EnkelvoudigInformatieObjectFilterTests(JWTAuthMixin, APITestCase):
                     getattr(first_information_object, order_option),
                 )
 
+    def test_ordering_filter_latest_versions(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(auteur="a")
+        EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio1.canonical, versie=2, auteur="c"
+        )
+        EnkelvoudigInformatieObjectFactory.create(auteur="b")
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                reverse(EnkelvoudigInformatieObject), {"ordering": "-auteur"}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["count"], 2)
+        self.assertEqual([eio["auteur"] for eio in data["results"]], ["c", "b"])
+        list_queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if 'ORDER BY "documenten_enkelvoudiginformatieobject"."auteur" DESC'
+            in query["sql"]
+        ]
+        self.assertEqual(len(list_queries), 1)
+        # the latest versions are selected in a subquery, the outer query is ordered
+        self.assertIn("IN (SELECT DISTINCT ON", list_queries[0])
+        self.assertFalse(list_queries[0].startswith("SELECT DISTINCT"))
+
     def test_trefwoorden(self):
         EnkelvoudigInformatieObjectFactory.create(trefwoorden=["foo"])
         EnkelvoudigInformatieObjectFactory.create(trefwoorden=["foo", "bar"])
@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.test import SimpleTestCase, override_settings
+
+from ..api.utils import merge_files_in_storage, supports_direct_merge
+
+
+@override_settings(DOCUMENTEN_UPLOAD_READ_CHUNK=10)
+class MergeFilesInStorageTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+        self.storage = FileSystemStorage(location=self.temp_dir)
+
+        self.part_paths = []
+        for index, content in enumerate([b"some ", b"file ", b"content"]):
+            path = Path(self.temp_dir) / f"part-{index}"
+            path.write_bytes(content)
+            self.part_paths.append(str(path))
+
+    def test_merge(self):
+        name, checksum = merge_files_in_storage(
+            self.part_paths, self.storage, "uploads/2024/01/file.bin"
+        )
+
+        self.assertEqual(name, "uploads/2024/01/file.bin")
+        self.assertIsNone(checksum)
+        with self.storage.open(name) as merged:
+            self.assertEqual(merged.read(), b"some file content")
+        # no temporary files are left behind
+        self.assertEqual(
+            os.listdir(Path(self.temp_dir) / "uploads/2024/01"), ["file.bin"]
+        )
+
+    def test_merge_with_checksum(self):
+        name, checksum = merge_files_in_storage(
+            self.part_paths,
+            self.storage,
+            "uploads/2024/01/file.bin",
+            checksum_algorithm="sha256",
+        )
+
+        self.assertEqual(checksum, hashlib.sha256(b"some file content").hexdigest())
+        with self.storage.open(name) as merged:
+            self.assertEqual(merged.read(), b"some file content")
+
+    def test_merge_existing_name(self):
+        self.storage.save("uploads/file.bin", ContentFile(b"some "))
+
+        name, _checksum = merge_files_in_storage(
+            self.part_paths, self.storage, "uploads/file.bin"
+        )
+
+        self.assertNotEqual(name, "uploads/file.bin")
+        with self.storage.open("uploads/file.bin") as existing:
+            self.assertEqual(existing.read(), b"some ")
+        with self.storage.open(name) as merged:
+            self.assertEqual(merged.read(), b"some file content")
+
+    def test_merge_without_kernel_copy(self):
+        with patch("os.copy_file_range", side_effect=OSError(18, "EXDEV"), create=True):
+            with patch("os.sendfile", side_effect=OSError(38, "ENOSYS")):
+                name, _checksum = merge_files_in_storage(
+                    self.part_paths, self.storage, "uploads/file.bin"
+                )
+
+        with self.storage.open(name) as merged:
+            self.assertEqual(merged.read(), b"some file content")
+
+    def test_supports_direct_merge(self):
+        self.assertTrue(supports_direct_merge(self.storage))
@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import json
+from base64 import b64encode
+from io import BytesIO
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from rest_framework.exceptions import ParseError
+
+from ..api.parsers import Base64StreamingJSONParser, StreamedBase64File
+
+
+class Base64StreamingJSONParserTests(SimpleTestCase):
+    content = b"some file content" * 100
+
+    def _parse(self, body: str, chunk_size: int = 7):
+        # small chunks to split the tokens over multiple reads
+        with patch(
+            "openzaak.components.documenten.api.parsers.READ_CHUNK_SIZE", chunk_size
+        ):
+            return Base64StreamingJSONParser().parse(BytesIO(body.encode("utf-8")))
+
+    def test_inhoud_is_decoded_into_file(self):
+        body = json.dumps(
+            {
+                "titel": 'a "quoted" title',
+                "inhoud": b64encode(self.content).decode("ascii"),
+                "indicatieGebruiksrecht": False,
+            }
+        )
+
+        data = self._parse(body)
+
+        self.assertEqual(data["titel"], 'a "quoted" title')
+        self.assertIs(data["indicatie_gebruiksrecht"], False)
+        self.assertIsInstance(data["inhoud"], StreamedBase64File)
+        self.assertIsNone(data["inhoud"].error)
+        self.assertEqual(data["inhoud"].size, len(self.content))
+        self.assertEqual(data["inhoud"].read(), self.content)
+
+    def test_escaped_and_data_uri_inhoud(self):
+        encoded = b64encode(self.content).decode("ascii")
+        body = json.dumps({"inhoud": f"data:text/plain;base64,{encoded}"})
+        # JSON allows escaping the forward slash
+        body = body.replace("/", "\\/")
+
+        data = self._parse(body)
+
+        self.assertEqual(data["inhoud"].read(), self.content)
+
+    def test_nested_inhoud_is_not_decoded(self):
+        body = json.dumps({"ondertekening": {"inhoud": "c29tZQ=="}, "inhoud": None})
+
+        data = self._parse(body)
+
+        self.assertEqual(data["ondertekening"], {"inhoud": "c29tZQ=="})
+        self.assertIsNone(data["inhoud"])
+
+    def test_empty_inhoud(self):
+        data = self._parse(json.dumps({"inhoud": ""}))
+
+        self.assertEqual(data["inhoud"], "")
+
+    def test_incorrect_padding(self):
+        data = self._parse(json.dumps({"inhoud": "c29tZQ"}))
+
+        self.assertEqual(str(data["inhoud"].error), "Incorrect padding")
+
+    def test_invalid_json(self):
+        with self.assertRaises(ParseError):
+            self._parse('{"inhoud": "c29tZQ==", ')
@@ -8,10 +8,11 @@ from django.utils.translation import gettext_lazy as _
 
 from django_filters import filters
 from django_loose_fk.filters import FkOrUrlFieldFilter
-from django_loose_fk.utils import get_resource_for_path, is_local
+from django_loose_fk.utils import is_local
 from drf_spectacular.plumbing import build_choice_description_list
 from vng_api_common.utils import get_field_attribute, get_help_text
 
+from openzaak.components.catalogi.caching import get_resource_for_path
 from openzaak.components.zaken.api.serializers.zaken import ZaakSerializer
 from openzaak.utils.filters import (
     ExpandFilter,
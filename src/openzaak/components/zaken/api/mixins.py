@@ -10,13 +10,13 @@ from openzaak.components.zaken.api.scopes import SCOPE_ZAKEN_GEFORCEERD_BIJWERKE
 from openzaak.components.zaken.models import Zaak
 
 from .exceptions import ZaakClosed
-from .serializers import ZaakSerializer
+from .permissions import ZaakAuthRequired
 
 
 class ClosedZaakMixin:
     def _has_override(self, zaak: Zaak) -> bool:
         jwt_auth = self.request.jwt_auth
-        zaak_data = ZaakSerializer(zaak, context={"request": self.request}).data
+        zaak_data = ZaakAuthRequired().format_data(zaak, self.request)
         return jwt_auth.has_auth(
             scopes=SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
             zaaktype=zaak_data["zaaktype"],
@@ -0,0 +1,176 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Cache the object types referenced by the ``objectTypeOverigeDefinitie`` of zaakobjecten.
+
+Validating such a zaakobject compiles the jq expressions of the definition and
+checks the JSON schema of the object type, before the object data is validated
+against it. The compiled expressions and the checked schemas are kept in memory. The
+schemas are cached by object type URL, schema path and ETag (or a digest of the
+content, if the object type has no ETag).
+
+An object type is used for ``OBJECTTYPES_CACHE_TIMEOUT`` seconds after it was
+fetched. After that it is revalidated with its ETag, so an unchanged object type is
+not transferred and its schemas don't have to be checked again.
+"""
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from django.utils.translation import gettext_lazy as _
+
+import jq
+import jsonschema
+from jsonschema.protocols import Validator
+from rest_framework import serializers
+from vng_api_common.validators import URLValidator
+
+# upper bound on the number of object types, compiled expressions and schemas that
+# are kept
+MAX_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class ObjectType:
+    data: dict
+    # the ETag, or a digest of the content if there is no ETag
+    version: str
+    etag: Optional[str]
+    expires_at: float
+
+    @property
+    def is_expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+_lock = threading.Lock()
+_object_types: Dict[str, ObjectType] = {}
+# the JSON schemas (and the validator class for their draft) by object type URL,
+# schema path and object type version, ``None`` if there is no schema at the path
+_schemas: Dict[Tuple[str, str, str], Optional[Tuple[type, dict]]] = {}
+
+
+def _add(cache: dict, key, value) -> None:
+    with _lock:
+        if key not in cache and len(cache) >= MAX_CACHE_SIZE:
+            # evict the oldest entry
+            del cache[next(iter(cache))]
+        cache[key] = value
+
+
+def clear_caches() -> None:
+    with _lock:
+        _object_types.clear()
+        _schemas.clear()
+    compile_jq.cache_clear()
+
+
+@lru_cache(maxsize=MAX_CACHE_SIZE)
+def compile_jq(expression: str):
+    """
+    Compile the jq expression, raising a :class:`ValueError` if it's invalid.
+    """
+    return jq.compile(expression)
+
+
+def get_cached_object_type(url: str) -> Optional[ObjectType]:
+    with _lock:
+        return _object_types.get(url)
+
+
+def fetch_object_type(
+    url: str, headers: dict, cached: Optional[ObjectType] = None
+) -> ObjectType:
+    """
+    Fetch the object type, or revalidate the cached object type with its ETag.
+
+    Raises the same validation errors as :class:`URLValidator` if the object type
+    can't be fetched.
+    """
+    if cached is not None and cached.etag:
+        headers = {**headers, "If-None-Match": cached.etag}
+
+    link_fetcher = import_string(settings.LINK_FETCHER)
+    try:
+        response = link_fetcher(url, headers=headers)
+    except Exception as exc:
+        raise serializers.ValidationError(
+            _("The URL {url} could not be fetched. Exception: {exc}").format(
+                url=url, exc=exc
+            ),
+            code=URLValidator.code,
+        )
+
+    expires_at = time.monotonic() + settings.OBJECTTYPES_CACHE_TIMEOUT
+    if cached is not None and cached.etag and response.status_code == 304:
+        object_type = replace(cached, expires_at=expires_at)
+        _add(_object_types, url, object_type)
+        return object_type
+
+    if response.status_code != 200:
+        raise serializers.ValidationError(
+            URLValidator.message.format(status_code=response.status_code, url=url),
+            code=URLValidator.code,
+        )
+
+    try:
+        data = response.json()
+    except json.JSONDecodeError:
+        raise serializers.ValidationError(
+            {
+                "objectTypeOverigeDefinitie.url": _(
+                    "The endpoint did not return valid JSON."
+                )
+            },
+            code="invalid",
+        )
+
+    etag = response.headers.get("ETag")
+    object_type = ObjectType(
+        data=data,
+        version=etag or hashlib.sha256(response.content).hexdigest(),
+        etag=etag,
+        expires_at=expires_at,
+    )
+    _add(_object_types, url, object_type)
+    return object_type
+
+
+def get_schema_validator(
+    url: str, schema_path: str, object_type: ObjectType
+) -> Optional[Validator]:
+    """
+    Return a validator for the JSON schema at the path in the object type.
+
+    The schema is checked against the meta schema of its draft once per version of
+    the object type. A new validator is returned for every call, since validators
+    resolving references can't be shared between threads.
+    """
+    key = (url, schema_path, object_type.version)
+    with _lock:
+        cached = key in _schemas
+        entry = _schemas.get(key)
+
+    if not cached:
+        try:
+            schema = compile_jq(schema_path).input(object_type.data).first()
+        except ValueError:
+            schema = None
+
+        entry = None
+        if schema:
+            validator_class = jsonschema.validators.validator_for(schema)
+            validator_class.check_schema(schema)
+            entry = (validator_class, schema)
+        _add(_schemas, key, entry)
+
+    if entry is None:
+        return None
+    validator_class, schema = entry
+    return validator_class(schema)
@@ -11,6 +11,7 @@ from vng_api_common.serializers import add_choice_values_help_text
 from vng_api_common.validators import IsImmutableValidator, URLValidator
 
 from openzaak.utils.auth import get_auth
+from openzaak.utils.serializers import TemplatedURLsMixin
 from openzaak.utils.validators import (
     LooseFkIsImmutableValidator,
     LooseFkResourceValidator,
@@ -91,7 +92,7 @@ class ObjectTypeOverigeDefinitieSerializer(serializers.Serializer):
     )
 
 
-class ZaakObjectSerializer(PolymorphicSerializer):
+class ZaakObjectSerializer(TemplatedURLsMixin, PolymorphicSerializer):
     discriminator = Discriminator(
         discriminator_field="object_type",
         mapping={
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2022 Dimpact
 import logging
+from functools import partial
 from typing import Optional
 
 from django.conf import settings
@@ -9,12 +10,11 @@ from django.utils.dateparse import parse_datetime
 from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
 
+from django_loose_fk.loaders import FetchError, FetchJsonError
 from django_loose_fk.virtual_models import ProxyMixin
 from drf_writable_nested import NestedCreateMixin, NestedUpdateMixin
 from rest_framework import serializers
 from rest_framework_gis.fields import GeometryField
-from rest_framework_nested.relations import NestedHyperlinkedRelatedField
-from rest_framework_nested.serializers import NestedHyperlinkedModelSerializer
 from vng_api_common.caching.etags import track_object_serializer
 from vng_api_common.constants import (
     Archiefnominatie,
@@ -42,7 +42,16 @@ from openzaak.utils.api import (
 from openzaak.utils.auth import get_auth
 from openzaak.utils.exceptions import DetermineProcessEndDateException
 from openzaak.utils.help_text import mark_experimental
-from openzaak.utils.serializer_fields import FKOrServiceUrlField
+from openzaak.utils.serializer_fields import (
+    FKOrServiceUrlField,
+    HyperlinkedRelatedField,
+    NestedHyperlinkedRelatedField,
+)
+from openzaak.utils.serializers import (
+    HyperlinkedModelSerializer,
+    NestedHyperlinkedModelSerializer,
+    TemplatedURLsMixin,
+)
 from openzaak.utils.validators import (
     LooseFkIsImmutableValidator,
     LooseFkResourceValidator,
@@ -69,6 +78,7 @@ from ...models import (
     ZaakKenmerk,
     ZaakVerzoek,
 )
+from ...tasks import calculate_archiefactiedatum
 from ..validators import (
     CorrectZaaktypeValidator,
     DateNotInFutureValidator,
@@ -97,7 +107,7 @@ logger = logging.getLogger(__name__)
 
 
 # Zaak API
-class ZaakKenmerkSerializer(serializers.HyperlinkedModelSerializer):
+class ZaakKenmerkSerializer(HyperlinkedModelSerializer):
     class Meta:
         model = ZaakKenmerk
         fields = ("kenmerk", "bron")
@@ -126,7 +136,7 @@ class OpschortingSerializer(GegevensGroepSerializer):
         }
 
 
-class RelevanteZaakSerializer(serializers.HyperlinkedModelSerializer):
+class RelevanteZaakSerializer(HyperlinkedModelSerializer):
     class Meta:
         model = RelevanteZaakRelatie
         fields = ("url", "aard_relatie")
@@ -177,7 +187,7 @@ class ZaakSerializer(
     NestedGegevensGroepMixin,
     NestedCreateMixin,
     NestedUpdateMixin,
-    serializers.HyperlinkedModelSerializer,
+    HyperlinkedModelSerializer,
 ):
     eigenschappen = NestedHyperlinkedRelatedField(
         many=True,
@@ -196,7 +206,7 @@ class ZaakSerializer(
         source="rol_set",
         help_text=_("URL-referenties naar ROLLen."),
     )
-    status = serializers.HyperlinkedRelatedField(
+    status = HyperlinkedRelatedField(
         source="current_status",
         read_only=True,
         allow_null=True,
@@ -251,7 +261,7 @@ class ZaakSerializer(
         ),
     )
 
-    deelzaken = serializers.HyperlinkedRelatedField(
+    deelzaken = HyperlinkedRelatedField(
         read_only=True,
         many=True,
         view_name="zaak-detail",
@@ -260,7 +270,7 @@ class ZaakSerializer(
         help_text=_("URL-referenties naar deel ZAAKen."),
     )
 
-    resultaat = serializers.HyperlinkedRelatedField(
+    resultaat = HyperlinkedRelatedField(
         read_only=True,
         allow_null=True,
         view_name="resultaat-detail",
@@ -559,7 +569,7 @@ class ZaakZoekSerializer(serializers.Serializer):
         model = Zaak
 
 
-class StatusSerializer(serializers.HyperlinkedModelSerializer):
+class StatusSerializer(HyperlinkedModelSerializer):
     class Meta:
         model = Status
         fields = (
@@ -641,11 +651,20 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
                 zaak, validated_attrs["datum_status_gezet"]
             )
             try:
-                brondatum_calculator.calculate()
+                if not brondatum_calculator.is_deferred:
+                    brondatum_calculator.calculate()
             except Resultaat.DoesNotExist as exc:
                 raise serializers.ValidationError(
                     exc.args[0], code="resultaat-does-not-exist"
                 ) from exc
+            except (FetchError, FetchJsonError) as exc:
+                raise serializers.ValidationError(
+                    _(
+                        "De objecten waaruit de brondatum wordt afgeleid konden niet "
+                        "opgehaald worden: {exc}"
+                    ).format(exc=exc),
+                    code="archiefactiedatum-error",
+                ) from exc
             except DetermineProcessEndDateException as exc:
                 # ideally, we'd like to do this in the validate function, but that's unfortunately too
                 # early since we don't know the end date yet
@@ -705,7 +724,7 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
                 _zaak_fields_changed.append("archiefnominatie")
 
             # Archiving: Calculate archiefactiedatum
-            if not zaak.archiefactiedatum:
+            if not zaak.archiefactiedatum and not brondatum_calculator.is_deferred:
                 zaak.archiefactiedatum = brondatum_calculator.calculate()
                 if zaak.archiefactiedatum is not None:
                     _zaak_fields_changed.append("archiefactiedatum")
@@ -720,10 +739,24 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
             # Save updated information on the ZAAK
             zaak.save(update_fields=_zaak_fields_changed)
 
+            if (
+                is_eindstatus
+                and not zaak.archiefactiedatum
+                and brondatum_calculator.is_deferred
+            ):
+                # the objects in other APIs are fetched in the background
+                transaction.on_commit(
+                    partial(
+                        calculate_archiefactiedatum.delay,
+                        zaak.pk,
+                        brondatum_calculator.datum_status_gezet.isoformat(),
+                    )
+                )
+
         return obj
 
 
-class ZaakInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
+class ZaakInformatieObjectSerializer(HyperlinkedModelSerializer):
     aard_relatie_weergave = serializers.ChoiceField(
         source="get_aard_relatie_display",
         read_only=True,
@@ -829,7 +862,7 @@ class ZaakInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
 
 class ZaakEigenschapSerializer(NestedHyperlinkedModelSerializer):
     parent_lookup_kwargs = {"zaak_uuid": "zaak__uuid"}
-    zaak = serializers.HyperlinkedRelatedField(
+    zaak = HyperlinkedRelatedField(
         queryset=Zaak.objects.all(),
         view_name="zaak-detail",
         lookup_field="uuid",
@@ -870,7 +903,7 @@ class ZaakEigenschapSerializer(NestedHyperlinkedModelSerializer):
         return attrs
 
 
-class KlantContactSerializer(serializers.HyperlinkedModelSerializer):
+class KlantContactSerializer(HyperlinkedModelSerializer):
     class Meta:
         model = KlantContact
         fields = (
@@ -898,7 +931,7 @@ class ContactPersoonRolSerializer(GegevensGroepSerializer):
         gegevensgroep = "contactpersoon_rol"
 
 
-class RolSerializer(PolymorphicSerializer):
+class RolSerializer(TemplatedURLsMixin, PolymorphicSerializer):
     discriminator = Discriminator(
         discriminator_field="betrokkene_type",
         mapping={
@@ -1022,7 +1055,7 @@ class RolSerializer(PolymorphicSerializer):
         return rol
 
 
-class ResultaatSerializer(serializers.HyperlinkedModelSerializer):
+class ResultaatSerializer(HyperlinkedModelSerializer):
     class Meta:
         model = Resultaat
         fields = ("url", "uuid", "zaak", "resultaattype", "toelichting")
@@ -1078,7 +1111,7 @@ class ZaakBesluitSerializer(NestedHyperlinkedModelSerializer):
         return super().create(validated_data)
 
 
-class ZaakContactMomentSerializer(serializers.HyperlinkedModelSerializer):
+class ZaakContactMomentSerializer(HyperlinkedModelSerializer):
     class Meta:
         model = ZaakContactMoment
         fields = ("url", "uuid", "zaak", "contactmoment")
@@ -1133,7 +1166,7 @@ class ZaakContactMomentSerializer(serializers.HyperlinkedModelSerializer):
         return zaakcontactmoment
 
 
-class ZaakVerzoekSerializer(serializers.HyperlinkedModelSerializer):
+class ZaakVerzoekSerializer(HyperlinkedModelSerializer):
     class Meta:
         model = ZaakVerzoek
         fields = ("url", "uuid", "zaak", "verzoek")
@@ -3,17 +3,17 @@
 import json
 import logging
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Optional
 
 from django.conf import settings
-from django.db import models
+from django.db import connections, models
 from django.db.models import Max, Subquery
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
-import jq
-import jsonschema
+from django_loose_fk.loaders import FetchError, FetchJsonError
 from rest_framework import serializers
 from rest_framework.exceptions import ErrorDetail
 from vng_api_common.constants import Archiefstatus
@@ -28,15 +28,37 @@ from openzaak.components.documenten.models import (
     EnkelvoudigInformatieObject,
     EnkelvoudigInformatieObjectCanonical,
 )
+from openzaak.loaders import AuthorizedRequestsLoader
 from openzaak.utils.auth import get_auth
 from openzaak.utils.serializers import get_from_serializer_data_or_instance
 
 from ..constants import IndicatieMachtiging
 from ..models import Zaak
+from .objecttypes import (
+    compile_jq,
+    fetch_object_type,
+    get_cached_object_type,
+    get_schema_validator,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def fetch_remote_informatieobjecten(zaak: Zaak) -> Iterable[dict]:
+    """
+    Fetch the external informatieobjecten related to the zaak concurrently.
+    """
+    remote_zios = zaak.zaakinformatieobject_set.filter(
+        _informatieobject_base_url__isnull=False
+    ).select_related("_informatieobject_base_url")
+    urls = [zio._informatieobject_url for zio in remote_zios]
+
+    for data in AuthorizedRequestsLoader.fetch_objects(urls).values():
+        if isinstance(data, (FetchError, FetchJsonError)):
+            raise data
+        yield data
+
+
 class RolOccurenceValidator:
     """
     Validate that max x occurences of a field occur for a related object.
@@ -235,16 +257,8 @@ class ZaakArchiveIOsArchivedValidator:
     def validate_remote_eios_archived(
         self, attrs: dict, instance: Optional[Zaak], error: serializers.ValidationError
     ):
-        remote_zios = instance.zaakinformatieobject_set.filter(
-            _informatieobject_base_url__isnull=False
-        )
-        # This is a very naive approach to load all the remote objects - it happens
-        # sequentially, while futures.concurrent _could_ be used. Let's see first
-        # how performance is in this setup. Because we're looping and exiting as
-        # soon as an error condition is found, we can reduce unnecessary network
-        # calls.
-        for zio in remote_zios:
-            if zio.informatieobject.status != Statussen.gearchiveerd:
+        for informatieobject in fetch_remote_informatieobjecten(instance):
+            if informatieobject.get("status") != Statussen.gearchiveerd:
                 raise error
 
     def validate_extra_attributes(self, attrs: dict, instance: Optional[Zaak]):
@@ -291,11 +305,8 @@ class EndStatusIOsUnlockedValidator:
         if local_zios.exclude(_informatieobject__lock="").exists():
             raise serializers.ValidationError(self.message, code=self.code)
 
-        remote_zios = zaak.zaakinformatieobject_set.filter(
-            _informatieobject_base_url__isnull=False
-        )
-        for zio in remote_zios:
-            if zio.informatieobject.locked:
+        for informatieobject in fetch_remote_informatieobjecten(zaak):
+            if informatieobject.get("locked"):
                 raise serializers.ValidationError(self.message, code=self.code)
 
 
@@ -345,11 +356,8 @@ class EndStatusIOsIndicatieGebruiksrechtValidator:
             raise serializers.ValidationError(self.message, self.code)
 
     def validate_remote_eios_indicatie_set(self, zaak: Zaak):
-        remote_zios = zaak.zaakinformatieobject_set.filter(
-            _informatieobject_base_url__isnull=False
-        )
-        for zio in remote_zios:
-            if zio.informatieobject.indicatie_gebruiksrecht is None:
+        for informatieobject in fetch_remote_informatieobjecten(zaak):
+            if informatieobject.get("indicatie_gebruiksrecht") is None:
                 raise serializers.ValidationError(self.message, self.code)
 
 
@@ -385,11 +393,34 @@ class JQExpressionValidator:
 
     def __call__(self, value: str):
         try:
-            jq.compile(value)
+            compile_jq(value)
         except ValueError:
             raise serializers.ValidationError(self.message, code=self.code)
 
 
+def _run_in_thread(func: Callable, *args):
+    try:
+        return func(*args)
+    finally:
+        # worker threads use their own database connections
+        connections.close_all()
+
+
+def _submit(executor: Optional[ThreadPoolExecutor], func: Callable, *args) -> Future:
+    """
+    Call ``func`` on the executor, or immediately if there is no executor.
+    """
+    if executor is not None:
+        return executor.submit(_run_in_thread, func, *args)
+
+    future = Future()
+    try:
+        future.set_result(func(*args))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
 class ObjectTypeOverigeDefinitieValidator:
     code = "invalid"
 
@@ -420,31 +451,31 @@ class ObjectTypeOverigeDefinitieValidator:
             )
             attrs["object_identificatie"] = None
 
-        # now validate the schema
-        url_validator = URLValidator(get_auth=get_auth)
+        object_type_url = object_type_overige_definitie["url"]
+        # the credentials are looked up in the database, so keep this out of the
+        # worker threads
+        object_validator = URLValidator(headers=get_auth(object_url))
+        object_type = get_cached_object_type(object_type_url)
 
-        response = url_validator(object_type_overige_definitie["url"])
-        try:
-            object_type = response.json()
-        except json.JSONDecodeError:
-            raise serializers.ValidationError(
-                {
-                    "objectTypeOverigeDefinitie.url": _(
-                        "The endpoint did not return valid JSON."
-                    )
-                },
-                code="invalid",
-            )
+        if object_type is not None and not object_type.is_expired:
+            object_type_future = None
+            object_future = _submit(None, object_validator, object_url)
+        else:
+            headers = get_auth(object_type_url)
+            # ⚡️ fetch the object type and the object concurrently
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                object_type_future = _submit(
+                    pool, fetch_object_type, object_type_url, headers, object_type
+                )
+                object_future = _submit(pool, object_validator, object_url)
 
-        schema_jq = jq.compile(object_type_overige_definitie["schema"])
-        record_data_jq = jq.compile(object_type_overige_definitie["object_data"])
+        if object_type_future is not None:
+            object_type = object_type_future.result()
 
-        try:
-            json_schema_definition = schema_jq.input(object_type).first()
-        except ValueError:
-            json_schema_definition = None
-
-        if not json_schema_definition:
+        schema_validator = get_schema_validator(
+            object_type_url, object_type_overige_definitie["schema"], object_type
+        )
+        if schema_validator is None:
             raise serializers.ValidationError(
                 {
                     "objectTypeOverigeDefinitie.schema": _(
@@ -455,7 +486,7 @@ class ObjectTypeOverigeDefinitieValidator:
             )
 
         # validate the object
-        object_response = url_validator(object_url)
+        object_response = object_future.result()
         try:
             object_resource = object_response.json()
         except json.JSONDecodeError:
@@ -463,6 +494,7 @@ class ObjectTypeOverigeDefinitieValidator:
                 {"object": _("The endpoint did not return valid JSON.")}, code="invalid"
             )
 
+        record_data_jq = compile_jq(object_type_overige_definitie["object_data"])
         try:
             object_data = record_data_jq.input(object_resource).first()
         except ValueError:
@@ -478,9 +510,7 @@ class ObjectTypeOverigeDefinitieValidator:
             )
 
         # validate the schema
-        try:
-            jsonschema.validate(instance=object_data, schema=json_schema_definition)
-        except jsonschema.ValidationError:
+        if not schema_validator.is_valid(object_data):
             raise serializers.ValidationError(
                 {"object": _("The object data does not match the specified schema.")},
                 code="invalid-schema",
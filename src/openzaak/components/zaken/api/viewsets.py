@@ -28,7 +28,6 @@ from rest_framework.settings import api_settings
 from vng_api_common.audittrails.viewsets import (
     AuditTrailCreateMixin,
     AuditTrailDestroyMixin,
-    AuditTrailViewsetMixin,
 )
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.client import to_internal_data
@@ -36,7 +35,7 @@ from vng_api_common.filters import Backend
 from vng_api_common.geo import GeoMixin
 from vng_api_common.search import SearchMixin
 from vng_api_common.utils import lookup_kwargs_to_filters
-from vng_api_common.viewsets import CheckQueryParamsMixin, NestedViewSetMixin
+from vng_api_common.viewsets import NestedViewSetMixin
 
 from openzaak.client import get_client
 from openzaak.utils.api import (
@@ -46,14 +45,22 @@ from openzaak.utils.api import (
 )
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
 from openzaak.utils.mixins import ExpandMixin
-from openzaak.utils.pagination import OptimizedPagination
+from openzaak.utils.pagination import (
+    CursorPagination,
+    OptimizedPagination,
+    OptionalCursorPagination,
+)
 from openzaak.utils.permissions import AuthRequired
 from openzaak.utils.schema import (
     COMMON_ERROR_RESPONSES,
     PRECONDITION_ERROR_RESPONSES,
     VALIDATION_ERROR_RESPONSES,
 )
-from openzaak.utils.views import AuditTrailViewSet
+from openzaak.utils.views import (
+    AuditTrailViewSet,
+    AuditTrailViewsetMixin,
+    CheckQueryParamsMixin,
+)
 
 from ..models import (
     KlantContact,
@@ -264,13 +271,12 @@ class ZaakViewSet(
             "zaakobject_set",
         )
         .order_by("-pk")
-        .distinct()
     )
     serializer_class = ZaakSerializer
     search_input_serializer_class = ZaakZoekSerializer
     filter_backends = (Backend,)
     lookup_field = "uuid"
-    pagination_class = OptimizedPagination
+    pagination_class = CursorPagination
 
     permission_classes = (ZaakAuthRequired,)
     required_scopes = {
@@ -381,8 +387,8 @@ class ZaakViewSet(
         insufficient permissions
 
         """
-        zaak = self.get_object()
-        zaak_data = self.get_serializer(zaak).data
+        zaak = serializer.instance
+        zaak_data = ZaakAuthRequired().format_data(zaak, self.request)
 
         if not self.request.jwt_auth.has_auth(
             scopes=SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
@@ -483,7 +489,7 @@ class StatusViewSet(
     serializer_class = StatusSerializer
     filterset_class = StatusFilter
     lookup_field = "uuid"
-    pagination_class = OptimizedPagination
+    pagination_class = CursorPagination
 
     permission_classes = (ZaakAuthRequired,)
     permission_main_object = "zaak"
@@ -512,7 +518,7 @@ class StatusViewSet(
           insufficient permissions
         """
         zaak = serializer.validated_data["zaak"]
-        zaak_data = ZaakSerializer(zaak, context={"request": self.request}).data
+        zaak_data = ZaakAuthRequired().format_data(zaak, self.request)
         component = self.queryset.model._meta.app_label
 
         if not self.request.jwt_auth.has_auth(
@@ -705,6 +711,8 @@ class ZaakInformatieObjectViewSet(
     filterset_class = ZaakInformatieObjectFilter
     serializer_class = ZaakInformatieObjectSerializer
     lookup_field = "uuid"
+    # not paginated by default, cursor pagination must be requested explicitly
+    pagination_class = OptionalCursorPagination
     notifications_kanaal = KANAAL_ZAKEN
     notifications_main_resource_key = "zaak"
     permission_classes = (ZaakAuthRequired,)
@@ -963,7 +971,7 @@ class RolViewSet(
     serializer_class = RolSerializer
     filterset_class = RolFilter
     lookup_field = "uuid"
-    pagination_class = OptimizedPagination
+    pagination_class = CursorPagination
 
     permission_classes = (ZaakAuthRequired,)
     permission_main_object = "zaak"
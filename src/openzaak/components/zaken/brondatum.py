@@ -1,16 +1,20 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 from datetime import date, datetime
-from typing import Union
+from functools import cached_property
+from typing import Dict, List, Union
 
+from django.conf import settings
 from django.db.models import Max
 from django.utils.translation import gettext_lazy as _
 
 from dateutil.relativedelta import relativedelta
+from django_loose_fk.loaders import FetchError, FetchJsonError
 from glom import Path, glom
 from relativedeltafield.utils import parse_relativedelta
 from vng_api_common.constants import BrondatumArchiefprocedureAfleidingswijze
 
+from openzaak.loaders import AuthorizedRequestsLoader
 from openzaak.utils import parse_isodatetime
 from openzaak.utils.exceptions import DetermineProcessEndDateException
 
@@ -22,7 +26,42 @@ class BrondatumCalculator:
         self.zaak = zaak
         self.datum_status_gezet = datum_status_gezet
 
+    @cached_property
+    def is_deferred(self) -> bool:
+        """
+        Whether the archiefactiedatum is calculated in the background.
+
+        This is only the case if configured, and if the brondatum is derived from
+        objects in other APIs.
+        """
+        if not settings.BRONDATUM_DEFERRED_CALCULATION:
+            return False
+
+        brondatum_archiefprocedure = (
+            self.zaak.resultaat.resultaattype.brondatum_archiefprocedure
+        )
+        afleidingswijze = brondatum_archiefprocedure["afleidingswijze"]
+        if afleidingswijze == BrondatumArchiefprocedureAfleidingswijze.zaakobject:
+            zaak_objecten = self.zaak.zaakobject_set.filter(
+                object_type=brondatum_archiefprocedure["objecttype"]
+            )
+            return zaak_objecten.exclude(object="").exists()
+        if (
+            afleidingswijze
+            == BrondatumArchiefprocedureAfleidingswijze.gerelateerde_zaak
+        ):
+            relevante_zaken = self.zaak.relevante_andere_zaken
+            return relevante_zaken.filter(_relevant_zaak__isnull=True).exists()
+        return False
+
     def calculate(self) -> Union[None, date]:
+        # the calculation is done during validation and again when the status is
+        # created, so the remote objects are only fetched once
+        if not hasattr(self, "_archiefactiedatum"):
+            self._archiefactiedatum = self._calculate()
+        return self._archiefactiedatum
+
+    def _calculate(self) -> Union[None, date]:
         if self.zaak.archiefactiedatum:
             return
 
@@ -145,9 +184,16 @@ def get_brondatum(
         # Nested `datumkenmerk` can be specified with `/`
         datum_kenmerk_path = Path(*datum_kenmerk.split("/"))
         dates = []
-        for zaak_object in zaak.zaakobject_set.filter(object_type=objecttype):
+        zaak_objecten = list(zaak.zaakobject_set.filter(object_type=objecttype))
+        # ⚡️ fetch all remote objects concurrently
+        remote_objects = fetch_remote_objects(
+            [zaak_object.object for zaak_object in zaak_objecten if zaak_object.object],
+            do_underscoreize=False,
+        )
+        for zaak_object in zaak_objecten:
             if zaak_object.object:
-                remote_object = zaak_object._get_object()
+                remote_object = remote_objects[zaak_object.object]
+                zaak_object._object = remote_object
                 value = glom(remote_object, datum_kenmerk_path, default=None)
             else:
                 local_object = getattr(zaak_object, objecttype.replace("_", ""))
@@ -215,9 +261,19 @@ def get_brondatum(
         ]
 
         # external
+        relevante_zaken_external = relevante_zaken.filter(
+            _relevant_zaak__isnull=True
+        ).select_related("_relevant_zaak_base_url")
+        # ⚡️ fetch all external zaken concurrently
+        external_zaken = fetch_remote_objects(
+            [
+                relevante_zaak._relevant_zaak_url
+                for relevante_zaak in relevante_zaken_external
+            ]
+        )
         einddatum_max_external = None
-        for relevante_zaak in relevante_zaken.filter(_relevant_zaak__isnull=True):
-            einddatum_str = relevante_zaak.url.einddatum
+        for external_zaak in external_zaken.values():
+            einddatum_str = external_zaak["einddatum"]
             einddatum = datetime.strptime(einddatum_str, "%Y-%m-%d").date()
             einddatum_max_external = max_with_none(einddatum, einddatum_max_external)
 
@@ -262,5 +318,23 @@ def get_brondatum(
     raise ValueError(f'Onbekende "Afleidingswijze": {afleidingswijze}')
 
 
+def fetch_remote_objects(urls: List[str], do_underscoreize=True) -> Dict[str, dict]:
+    """
+    Fetch the objects in other APIs concurrently, within the configured time.
+
+    :raises FetchError: if any of the objects could not be fetched.
+    :raises FetchJsonError: if the response for any of the objects isn't JSON.
+    """
+    objects = AuthorizedRequestsLoader.fetch_objects(
+        urls,
+        do_underscoreize=do_underscoreize,
+        timeout=settings.BRONDATUM_FETCH_TIMEOUT,
+    )
+    for data in objects.values():
+        if isinstance(data, (FetchError, FetchJsonError)):
+            raise data
+    return objects
+
+
 def max_with_none(*args):
     return max(filter(lambda x: x is not None, args)) if any(args) else None
@@ -2,40 +2,32 @@
 # Copyright (C) 2022 Open Zaak maintainers
 from datetime import date
 
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 
 from vng_api_common.fields import RSINField
-from vng_api_common.utils import generate_unique_identification
 
-from openzaak.utils.db import pg_advisory_lock
-
-LOCK_ID_IDENTIFICATION_GENERATION = "generate-zaak-identification"
+from openzaak.identification.generators import generate_identification
 
 
 class ZaakIdentificatieManager(models.Manager):
     def generate(self, organisation: str, date: date):
         """
-        Generate an identification based on existing data.
+        Generate an identification for the organisation.
 
-        This uses a PostgreSQL-specific advisory lock, meaning that only one
-        thread/process is able to generate a new identification at a time (other
-        threads will simply wait until they acquire the lock after the running call
-        releases it when the transaction exits).
+        The number is issued by the counter of the organisation and year (see
+        :mod:`openzaak.identification.generators`), rather than by looking up the
+        highest existing identification under a global lock. Concurrent generations
+        for different organisations or years don't wait on each other.
 
-        Note that this does NOT prevent other records from being read or even written
-        to the involved table, so IntegrityError can still be raised if unique
-        constraints will be violated. However, this does allow for concurrent read
-        and writes with explicit identifications to different rows that don't affect
-        the ID generation and should be a better option for performance than pessimistic
-        locking where the entire table is locked even for reading (as otherwise the view
-        of the data inside by generate_unique_identification could be stale due to new
-        inserts).
+        Note that this does NOT prevent other records from being written with
+        explicit identifications, so IntegrityError can still be raised if unique
+        constraints will be violated.
         """
-        with pg_advisory_lock(LOCK_ID_IDENTIFICATION_GENERATION):
-            instance = self.model()
-            instance.dummy_date = date
-            identification = generate_unique_identification(instance, "dummy_date")
+        with transaction.atomic():
+            identification = generate_identification(
+                self.model, date.year, organisation
+            )
             return self.create(
                 identificatie=identification, bronorganisatie=organisation
             )
@@ -70,8 +62,6 @@ class ZaakIdentificatie(models.Model):
     objects = ZaakIdentificatieManager()
     IDENTIFICATIE_PREFIX = "ZAAK"
 
-    dummy_date = None
-
     class Meta:
         verbose_name = _("zaak identification")
         verbose_name_plural = _("zaak identifications")
@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import logging
+
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+
+from django_loose_fk.loaders import FetchError
+
+from openzaak import celery_app
+from openzaak.utils.exceptions import DetermineProcessEndDateException
+
+from .brondatum import BrondatumCalculator
+from .models import Resultaat, Zaak
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(
+    autoretry_for=(FetchError,),
+    retry_backoff=True,
+    retry_backoff_max=60 * 60,
+    max_retries=10,
+)
+def calculate_archiefactiedatum(zaak_pk: int, datum_status_gezet: str) -> None:
+    """
+    Calculate the archiefactiedatum of a closed zaak, which depends on objects or
+    zaken in other APIs.
+
+    The task is retried with an exponential backoff if these can't be fetched.
+    """
+    zaak = Zaak.objects.filter(pk=zaak_pk).first()
+    # the zaak may be deleted or reopened in the meantime
+    if zaak is None or zaak.einddatum is None or zaak.archiefactiedatum:
+        return
+
+    calculator = BrondatumCalculator(zaak, parse_datetime(datum_status_gezet))
+    try:
+        archiefactiedatum = calculator.calculate()
+    except (DetermineProcessEndDateException, Resultaat.DoesNotExist) as exc:
+        logger.warning(
+            "Could not calculate the archiefactiedatum of zaak %s: %s", zaak.uuid, exc
+        )
+        return
+
+    if archiefactiedatum is None:
+        return
+
+    # don't keep the zaak locked while the other APIs are queried
+    with transaction.atomic():
+        zaak = Zaak.objects.select_for_update().filter(pk=zaak_pk).first()
+        if zaak is None or zaak.einddatum is None or zaak.archiefactiedatum:
+            return
+
+        zaak.archiefactiedatum = archiefactiedatum
+        zaak.save(update_fields=["archiefactiedatum"])
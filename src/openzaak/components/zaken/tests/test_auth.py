@@ -5,11 +5,12 @@ Guarantee that the proper authorization machinery is in place.
 """
 from unittest.mock import patch
 
-from django.test import override_settings, tag
+from django.test import TestCase, override_settings, tag
 
+import requests_mock
 from mozilla_django_oidc_db.models import OpenIDConnectConfig
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.test import APIRequestFactory, APITestCase
 from vng_api_common.authorizations.models import Autorisatie
 from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
 from vng_api_common.tests import AuthCheckMixin, reverse
@@ -24,6 +25,7 @@ from openzaak.components.catalogi.tests.factories import (
 )
 from openzaak.tests.utils import JWTAuthMixin
 
+from ..api.permissions import ZaakAuthRequired
 from ..api.scopes import (
     SCOPE_ZAKEN_ALLES_LEZEN,
     SCOPE_ZAKEN_ALLES_VERWIJDEREN,
@@ -1723,3 +1725,57 @@ class ExternalZaaktypeScopeTests(JWTAuthMixin, APITestCase):
 
         self.assertEqual(response1.status_code, status.HTTP_200_OK)
         self.assertEqual(response2.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ZaakPermissionDataTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.request = APIRequestFactory().get("/")
+
+    def test_local_zaaktype(self):
+        ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+        zaak = Zaak.objects.get()
+
+        data = ZaakAuthRequired().format_data(zaak, self.request)
+
+        self.assertEqual(
+            data,
+            {
+                "zaaktype": f"http://testserver{reverse(zaak.zaaktype)}",
+                "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+            },
+        )
+
+    def test_external_zaaktype(self):
+        zaaktype = "https://externe.catalogus.nl/api/v1/zaaktypen/b71f72ef-198d-44d8-af64-ae1932df830a"
+        ZaakFactory.create(
+            zaaktype=zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+        zaak = Zaak.objects.get()
+
+        # the remote zaaktype is not fetched
+        with requests_mock.Mocker():
+            data = ZaakAuthRequired().format_data(zaak, self.request)
+
+        self.assertEqual(
+            data,
+            {
+                "zaaktype": zaaktype,
+                "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.geheim,
+            },
+        )
+
+    def test_data_reused_within_request(self):
+        ZaakFactory.create()
+        zaak = Zaak.objects.get()
+
+        data = ZaakAuthRequired().format_data(zaak, self.request)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                ZaakAuthRequired().format_data(Zaak(pk=zaak.pk), self.request), data
+            )
@@ -522,8 +522,8 @@ class PerformanceTests(
          14-17: Application/CatalogusAutorisatie/Autorisatie lookup for permission checks
             18: Begin transaction (savepoint) (from NotificationsCreateMixin)
             19: Savepoint for zaakidentificatie generation
-            20: advisory lock for zaakidentificatie generation
-            21: Query highest zaakidentificatie number at the  moment
+            20: increment identification counter of the organisation
+            21: check the generated zaakidentificatie is not taken
             22: insert new zaakidentificatie
             23: release savepoint
             24: release savepoint (commit zaakidentificatie transaction)
@@ -552,8 +552,12 @@ class PerformanceTests(
             52: release savepoint (commit transaction)
         """
         # create a random zaak to get some other initial setup queries out of the way
-        # (most notable figuring out the PG/postgres version)
-        ZaakFactory.create()
+        # (most notable figuring out the PG/postgres version and starting the
+        # identification counter)
+        ZaakFactory.create(
+            bronorganisatie=VERANTWOORDELIJKE_ORGANISATIE,
+            registratiedatum=date(2018, 6, 11),
+        )
 
         EXPECTED_NUM_QUERIES = 52
 
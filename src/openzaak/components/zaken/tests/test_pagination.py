@@ -1,18 +1,23 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2024 Dimpact
+import json
+from base64 import urlsafe_b64encode
+from datetime import datetime, timezone
 from unittest.mock import patch
 
-from django.test import override_settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import F, Value
+from django.test import SimpleTestCase, override_settings
 
 from rest_framework import status
 from rest_framework.test import APITestCase
 from vng_api_common.tests import reverse, reverse_lazy
 
 from openzaak.tests.utils import JWTAuthMixin
-from openzaak.utils.pagination import FuzzyPagination
+from openzaak.utils.pagination import CursorPaginationMixin, FuzzyPagination
 
-from ..models import Zaak
-from .factories import ZaakFactory
+from ..models import Status, Zaak
+from .factories import StatusFactory, ZaakFactory
 from .utils import ZAAK_READ_KWARGS
 
 
@@ -139,3 +144,157 @@ class ZaakFuzzyPaginationTests(JWTAuthMixin, APITestCase):
             data["next"], f"http://testserver{self.list_url}?page=2&pageSize=5"
         )
         self.assertTrue(data["countExact"])
+
+
+class ZaakCursorPaginationTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    list_url = reverse_lazy("zaak-list")
+
+    def test_walk_all_pages(self):
+        zaken = ZaakFactory.create_batch(5)
+        expected = [
+            f"http://testserver{reverse(zaak)}"
+            for zaak in sorted(zaken, key=lambda zaak: zaak.pk, reverse=True)
+        ]
+
+        urls = []
+        next_url = f"{self.list_url}?cursor=&pageSize=2"
+        while next_url:
+            response = self.client.get(next_url, **ZAAK_READ_KWARGS)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertNotIn("count", data)
+            urls += [zaak["url"] for zaak in data["results"]]
+            next_url = data["next"]
+
+        self.assertEqual(urls, expected)
+
+    def test_ordering_is_respected(self):
+        zaak1 = ZaakFactory.create(startdatum="2024-01-02")
+        zaak2 = ZaakFactory.create(startdatum="2024-01-01")
+        zaak3 = ZaakFactory.create(startdatum="2024-01-02")
+
+        response = self.client.get(
+            self.list_url,
+            {"cursor": "", "pageSize": 2, "ordering": "startdatum"},
+            **ZAAK_READ_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(
+            [zaak["url"] for zaak in data["results"]],
+            [f"http://testserver{reverse(zaak)}" for zaak in [zaak2, zaak1]],
+        )
+
+        response = self.client.get(data["next"], **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(
+            [zaak["url"] for zaak in data["results"]],
+            [f"http://testserver{reverse(zaak3)}"],
+        )
+        self.assertIsNone(data["next"])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(
+            self.list_url, {"cursor": "invalid"}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_values_of_invalid_type(self):
+        ZaakFactory.create()
+
+        for position in [
+            ["invalid", 1],
+            ["2024-01-01", "invalid"],
+            ["2024-01-01", [1]],
+        ]:
+            with self.subTest(position=position):
+                cursor = urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+                response = self.client.get(
+                    self.list_url,
+                    {"cursor": cursor, "ordering": "startdatum"},
+                    **ZAAK_READ_KWARGS,
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(CURSOR_PAGINATION=True)
+    def test_cursor_pagination_by_default(self):
+        ZaakFactory.create_batch(2)
+
+        response = self.client.get(self.list_url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.json())
+
+        response = self.client.get(self.list_url, {"page": 1}, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 2)
+
+    def test_datetimes_at_full_precision(self):
+        """
+        Assert that items differing only by microseconds are returned exactly once.
+        """
+        zaak = ZaakFactory.create()
+        statussen = [
+            StatusFactory.create(
+                zaak=zaak,
+                datum_status_gezet=datetime(
+                    2024, 1, 1, 10, 0, 0, microsecond, tzinfo=timezone.utc
+                ),
+            )
+            for microsecond in [100, 200, 300, 1000]
+        ]
+        expected = [
+            f"http://testserver{reverse(status_)}" for status_ in reversed(statussen)
+        ]
+
+        urls = []
+        next_url = f"{reverse('status-list')}?cursor=&pageSize=1"
+        while next_url:
+            response = self.client.get(next_url, **ZAAK_READ_KWARGS)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            urls += [status_["url"] for status_ in data["results"]]
+            next_url = data["next"]
+
+        self.assertEqual(urls, expected)
+
+
+class KeysetTests(SimpleTestCase):
+    def test_model_ordering(self):
+        keyset = CursorPaginationMixin().get_keyset(Status.objects.all())
+
+        self.assertEqual(keyset, [("datum_status_gezet", True), ("pk", True)])
+
+    def test_field_expression_ordering(self):
+        keyset = CursorPaginationMixin().get_keyset(
+            Zaak.objects.order_by(F("startdatum").desc(), "pk")
+        )
+
+        self.assertEqual(keyset, [("startdatum", True), ("pk", False)])
+
+    def test_keyset_fields(self):
+        keyset = [("zaak__startdatum", False), ("pk", False)]
+
+        fields = CursorPaginationMixin().get_keyset_fields(Status.objects.all(), keyset)
+
+        self.assertEqual(fields, [Zaak._meta.get_field("startdatum"), Status._meta.pk])
+
+    def test_other_expression_ordering_rejected(self):
+        for queryset in [
+            Zaak.objects.order_by(Value(1).asc()),
+            Zaak.objects.order_by(F("startdatum").desc(nulls_last=True)),
+            Zaak.objects.order_by("?"),
+        ]:
+            with self.subTest(queryset=queryset.query.order_by):
+                with self.assertRaises(ImproperlyConfigured):
+                    CursorPaginationMixin().get_keyset(queryset)
@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import json
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import RolTypes
+from vng_api_common.tests import reverse_lazy
+
+from openzaak.components.catalogi.tests.factories import RolTypeFactory, ZaakTypeFactory
+from openzaak.tests.utils import JWTAuthMixin
+
+from .factories import RolFactory, ZaakFactory
+from .utils import ZAAK_READ_KWARGS
+
+
+def _get_plan_keys(plan: dict) -> list:
+    keys = plan.get("Sort Key", []) + plan.get("Group Key", [])
+    for subplan in plan.get("Plans", []):
+        keys += _get_plan_keys(subplan)
+    return keys
+
+
+class ZaakListQueryPlanTests(JWTAuthMixin, APITestCase):
+    """
+    Regression tests for the list query: the whole (wide) filtered set of zaken
+    may not be sorted or hashed to remove duplicates before the LIMIT is applied.
+    """
+
+    heeft_alle_autorisaties = True
+    url = reverse_lazy("zaak-list")
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        roltype = RolTypeFactory.create(zaaktype=zaaktype)
+        for zaak in ZaakFactory.create_batch(50, zaaktype=zaaktype):
+            RolFactory.create_batch(
+                2,
+                zaak=zaak,
+                roltype=roltype,
+                betrokkene_type=RolTypes.medewerker,
+                betrokkene="http://example.com/medewerker/1",
+            )
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE zaken_zaak, zaken_rol")
+
+    def _get_list_query_plan(self, params: dict) -> tuple:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, params, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.json()["count"], 50)
+
+        list_queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith('SELECT "zaken_zaak"."id"')
+            and "LIMIT" in query["sql"]
+        ]
+        self.assertEqual(len(list_queries), 1)
+        sql = list_queries[0]
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return sql, plan[0]["Plan"]
+
+    def assertOnlySortedOnPrimaryKey(self, plan: dict):
+        zaak_columns = {
+            key for key in _get_plan_keys(plan) if key.startswith("zaken_zaak.")
+        }
+        self.assertLessEqual(
+            {column.split(" ")[0] for column in zaak_columns}, {"zaken_zaak.id"}
+        )
+
+    def test_list_without_filters(self):
+        sql, plan = self._get_list_query_plan({})
+
+        self.assertNotIn("DISTINCT", sql)
+        self.assertOnlySortedOnPrimaryKey(plan)
+
+    def test_list_with_rol_filters(self):
+        sql, plan = self._get_list_query_plan(
+            {
+                "rol__betrokkeneType": RolTypes.medewerker,
+                "rol__betrokkene": "http://example.com/medewerker/1",
+            }
+        )
+
+        self.assertNotIn("DISTINCT", sql)
+        self.assertIn("EXISTS", sql)
+        self.assertOnlySortedOnPrimaryKey(plan)
@@ -4,6 +4,7 @@
 Ref: https://github.com/VNG-Realisatie/gemma-zaken/issues/345
 """
 from datetime import date
+from unittest.mock import patch
 
 from django.test import override_settings, tag
 
@@ -33,8 +34,10 @@ from openzaak.components.documenten.tests.factories import (
 )
 from openzaak.tests.utils import JWTAuthMixin, get_eio_response, mock_zrc_oas_get
 
+from ..tasks import calculate_archiefactiedatum
 from .factories import (
     RelevanteZaakRelatieFactory,
+    ResultaatFactory,
     WozWaardeFactory,
     ZaakEigenschapFactory,
     ZaakFactory,
@@ -1268,3 +1271,103 @@ class ExternalDocumentsAPITests(JWTAuthMixin, APITestCase):
         #
         # zaak.refresh_from_db()
         # self.assertEqual(zaak.archiefactiedatum, date(2030, 1, 1))
+
+
+@requests_mock.Mocker()
+class RemoteBrondatumTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def _setup_zaak(self, m):
+        zaak = ZaakFactory.create()
+        zaak_object1 = ZaakObjectFactory.create(
+            zaak=zaak, object="https://objects.example.com/api/objects/1"
+        )
+        ZaakObjectFactory.create(
+            zaak=zaak,
+            object="https://objects.example.com/api/objects/2",
+            object_type=zaak_object1.object_type,
+        )
+        ServiceFactory.create(
+            api_type=APITypes.orc,
+            api_root="https://objects.example.com/api/",
+            auth_type=AuthTypes.no_auth,
+        )
+        resultaattype = ResultaatTypeFactory.create(
+            archiefactietermijn="P10Y",
+            archiefnominatie=Archiefnominatie.blijvend_bewaren,
+            brondatum_archiefprocedure_afleidingswijze=BrondatumArchiefprocedureAfleidingswijze.zaakobject,
+            brondatum_archiefprocedure_datumkenmerk="einddatum",
+            brondatum_archiefprocedure_objecttype=zaak_object1.object_type,
+            zaaktype=zaak.zaaktype,
+        )
+        ResultaatFactory.create(zaak=zaak, resultaattype=resultaattype)
+        m.get(
+            "https://objects.example.com/api/objects/1",
+            json={"einddatum": isodatetime(2019, 1, 1)},
+        )
+        return zaak
+
+    def _close_zaak(self, zaak):
+        statustype = StatusTypeFactory.create(zaaktype=zaak.zaaktype)
+        data = {
+            "zaak": reverse(zaak),
+            "statustype": f"http://testserver{reverse(statustype)}",
+            "datumStatusGezet": "2018-10-18T20:00:00Z",
+        }
+        return self.client.post(get_operation_url("status_create"), data)
+
+    def test_remote_objects_are_fetched_once(self, m):
+        zaak = self._setup_zaak(m)
+        m.get(
+            "https://objects.example.com/api/objects/2",
+            json={"einddatum": isodatetime(2022, 1, 1)},
+        )
+
+        response = self._close_zaak(zaak)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.archiefactiedatum, date(2032, 1, 1))
+        object_requests = [
+            request
+            for request in m.request_history
+            if request.url.startswith("https://objects.example.com/api/objects/")
+        ]
+        self.assertEqual(len(object_requests), 2)
+
+    def test_remote_object_not_available(self, m):
+        zaak = self._setup_zaak(m)
+        m.get("https://objects.example.com/api/objects/2", status_code=503)
+
+        response = self._close_zaak(zaak)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "archiefactiedatum-error")
+
+    @override_settings(BRONDATUM_DEFERRED_CALCULATION=True)
+    def test_deferred_calculation(self, m):
+        zaak = self._setup_zaak(m)
+        m.get("https://objects.example.com/api/objects/2", status_code=503)
+
+        with patch(
+            "openzaak.components.zaken.api.serializers.zaken"
+            ".calculate_archiefactiedatum.delay"
+        ) as mock_delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self._close_zaak(zaak)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        zaak.refresh_from_db()
+        self.assertIsNone(zaak.archiefactiedatum)
+        mock_delay.assert_called_once_with(zaak.pk, "2018-10-18T20:00:00+00:00")
+
+        # the other API is available again
+        m.get(
+            "https://objects.example.com/api/objects/2",
+            json={"einddatum": isodatetime(2022, 1, 1)},
+        )
+        calculate_archiefactiedatum(*mock_delay.call_args.args)
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.archiefactiedatum, date(2032, 1, 1))
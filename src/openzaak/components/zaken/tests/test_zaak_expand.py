@@ -1,11 +1,14 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
 from django.contrib.gis.geos import Point
+from django.db import connection
 from django.test import tag
+from django.test.utils import CaptureQueriesContext
 
 import requests_mock
 from rest_framework import status
 from rest_framework.test import APITestCase
+from vng_api_common.constants import RolTypes
 from vng_api_common.tests import reverse, reverse_lazy
 
 from openzaak.components.catalogi.tests.factories import (
@@ -18,6 +21,7 @@ from openzaak.tests.utils.auth import JWTAuthMixin
 from .constants import POLYGON_AMSTERDAM_CENTRUM
 from .factories import (
     ResultaatFactory,
+    RolFactory,
     StatusFactory,
     ZaakEigenschapFactory,
     ZaakFactory,
@@ -227,6 +231,38 @@ class ZakenIncludeTests(JWTAuthMixin, APITestCase):
         }
         self.assertEqual(data, expected_results)
 
+    def test_zaak_list_include_queries_do_not_scale_with_page_size(self):
+        """
+        Test that the related resources of all zaken are loaded in bulk
+        """
+        expand = "zaaktype,status,status.statustype,rollen,eigenschappen"
+
+        def _create_zaak():
+            zaak = ZaakFactory.create(zaaktype=self.zaaktype)
+            StatusFactory.create(zaak=zaak, statustype=self.statustype)
+            RolFactory.create(
+                zaak=zaak,
+                roltype__zaaktype=self.zaaktype,
+                betrokkene_type=RolTypes.medewerker,
+            )
+            ZaakEigenschapFactory.create(zaak=zaak)
+
+        for _ in range(2):
+            _create_zaak()
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, {"expand": expand}, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 2)
+
+        for _ in range(3):
+            _create_zaak()
+
+        with self.assertNumQueries(len(context.captured_queries)):
+            response = self.client.get(self.url, {"expand": expand}, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 5)
+
 
 @tag("external-urls", "expand")
 class ZakenExternalIncludeTests(JWTAuthMixin, APITestCase):
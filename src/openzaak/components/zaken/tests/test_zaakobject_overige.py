@@ -1,14 +1,16 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2021 Dimpact
-from django.test import tag
+from django.test import override_settings, tag
 
 import requests_mock
 from rest_framework import status
 from rest_framework.test import APITestCase
 from vng_api_common.constants import ZaakobjectTypes
+from vng_api_common.tests import get_validation_errors
 
 from openzaak.tests.utils import JWTAuthMixin
 
+from ..api.objecttypes import clear_caches
 from ..models import ZaakObject
 from ..tests.factories import ZaakFactory
 from ..tests.utils import get_operation_url
@@ -48,6 +50,27 @@ class ZaakObjectObjectTypeOverigeDefinitie(JWTAuthMixin, APITestCase):
         },
     }
 
+    def setUp(self):
+        super().setUp()
+
+        clear_caches()
+        self.addCleanup(clear_caches)
+
+    def _create_zaakobject(self, object_url: str):
+        zaak = ZaakFactory.create()
+        zaak_url = get_operation_url("zaak_read", uuid=zaak.uuid)
+        data = {
+            "zaak": f"http://testserver{zaak_url}",
+            "object": object_url,
+            "objectType": ZaakobjectTypes.overige,
+            "objectTypeOverigeDefinitie": {
+                "url": "https://objecttypes.example.com/api/objecttypes/foo",
+                "schema": ".jsonSchema",
+                "objectData": ".record.data",
+            },
+        }
+        return self.client.post(get_operation_url("zaakobject_create"), data)
+
     @requests_mock.Mocker()
     def test_create_zaakobject_overig_explicit_schema(self, m):
         """
@@ -180,3 +203,60 @@ class ZaakObjectObjectTypeOverigeDefinitie(JWTAuthMixin, APITestCase):
         self.assertEqual(
             response.status_code, status.HTTP_400_BAD_REQUEST, response.json()
         )
+
+    @requests_mock.Mocker()
+    def test_object_type_cached(self, m):
+        object_type_url = "https://objecttypes.example.com/api/objecttypes/foo"
+        m.get(object_type_url, json=self.OBJECT_TYPE)
+        for index in range(2):
+            m.get(
+                f"https://objects.example.com/api/objects/{index}",
+                json={"record": {"data": {"name": f"Beleidsveld {index}"}}},
+            )
+
+        for index in range(2):
+            with self.subTest(index=index):
+                response = self._create_zaakobject(
+                    f"https://objects.example.com/api/objects/{index}"
+                )
+
+                self.assertEqual(
+                    response.status_code, status.HTTP_201_CREATED, response.json()
+                )
+
+        object_type_requests = [
+            request for request in m.request_history if request.url == object_type_url
+        ]
+        self.assertEqual(len(object_type_requests), 1)
+
+    @override_settings(OBJECTTYPES_CACHE_TIMEOUT=0)
+    @requests_mock.Mocker()
+    def test_object_type_revalidated(self, m):
+        object_type_url = "https://objecttypes.example.com/api/objecttypes/foo"
+        object_url = "https://objects.example.com/api/objects/1234"
+        m.get(
+            object_type_url,
+            [
+                {"json": self.OBJECT_TYPE, "headers": {"ETag": '"123"'}},
+                {"status_code": 304},
+            ],
+        )
+        m.get(object_url, json={"record": {"data": {"invalidKey": "invalid"}}})
+
+        for index in range(2):
+            with self.subTest(index=index):
+                response = self._create_zaakobject(object_url)
+
+                # the schema of the cached object type is still applied
+                self.assertEqual(
+                    response.status_code, status.HTTP_400_BAD_REQUEST, response.json()
+                )
+                error = get_validation_errors(response, "object")
+                self.assertEqual(error["code"], "invalid-schema")
+
+        object_type_requests = [
+            request for request in m.request_history if request.url == object_type_url
+        ]
+        self.assertEqual(len(object_type_requests), 2)
+        self.assertNotIn("If-None-Match", object_type_requests[0].headers)
+        self.assertEqual(object_type_requests[1].headers["If-None-Match"], '"123"')
@@ -27,10 +27,24 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": "import_requests",
     },
+    "outgoing_requests": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "outgoing_requests",
+    },
 }
 
 LOGGING = LOGGING_SETTINGS  # Minimally required logging is nice
 
+# the workers don't see the data of the test transactions
+IMPORT_DOCUMENTEN_WORKERS = 1
+
+# responses of external APIs are mocked per test
+OUTGOING_REQUESTS_CACHE_ENABLED = False
+
+# keep the number of queries of the tests independent of the test order
+CATALOGI_CACHE_ENABLED = False
+CATALOGI_RESPONSE_CACHE_ENABLED = False
+
 #
 # Django-axes
 #
@@ -73,6 +73,10 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": "import_requests",
     },
+    "outgoing_requests": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "outgoing_requests",
+    },
 }
 
 REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] += (
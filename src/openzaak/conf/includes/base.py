@@ -51,6 +51,15 @@ CACHES["import_requests"] = {
     "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
     "LOCATION": "import_requests",
 }
+CACHES["outgoing_requests"] = {
+    "BACKEND": "django_redis.cache.RedisCache",
+    "LOCATION": f"redis://{CACHE_DEFAULT}",
+    "KEY_PREFIX": "outgoing_requests",
+    "OPTIONS": {
+        "CLIENT_CLASS": "django_redis.client.DefaultClient",
+        "IGNORE_EXCEPTIONS": True,
+    },
+}
 
 #
 # APPLICATIONS enabled for this project
@@ -75,6 +84,8 @@ INSTALLED_APPS = (
         "openzaak.accounts",
         "openzaak.import_data",
         "openzaak.utils",
+        "openzaak.audittrails",
+        "openzaak.identification",
         "openzaak.components.autorisaties",
         "openzaak.components.zaken",
         "openzaak.components.besluiten",
@@ -332,7 +343,15 @@ CELERY_BEAT_SCHEDULE = {
     "daily-remove-imports": {
         "task": "openzaak.import_data.tasks.remove_imports",
         "schedule": crontab(hour="9"),
-    }
+    },
+    "daily-create-audittrail-partitions": {
+        "task": "openzaak.audittrails.tasks.create_audittrail_partitions",
+        "schedule": crontab(hour="2", minute="0"),
+    },
+    "daily-archive-audittrails": {
+        "task": "openzaak.audittrails.tasks.archive_audittrails",
+        "schedule": crontab(hour="3", minute="0"),
+    },
 }
 
 #
@@ -425,6 +444,167 @@ FUZZY_PAGINATION_COUNT_LIMIT = config(
     ),
 )
 
+CURSOR_PAGINATION = config(
+    "CURSOR_PAGINATION",
+    default=False,
+    help_text=(
+        "if this variable is set to ``true``, ``yes`` or ``1``, cursor pagination is "
+        "applied by default to the endpoints that support it, unless a ``page`` is "
+        "requested. Cursor pagination can always be requested explicitly with the "
+        "``cursor`` query parameter."
+    ),
+)
+AUTORISATIES_CACHE_TIMEOUT = config(
+    "AUTORISATIES_CACHE_TIMEOUT",
+    default=60 * 60,
+    help_text=(
+        "the number of seconds data derived from the configured autorisaties (such as "
+        "the resolved filters for list endpoints) is kept in the cache. Changes to the "
+        "autorisaties invalidate the cache immediately, regardless of this value."
+    ),
+)
+CATALOGI_CACHE_ENABLED = config(
+    "CATALOGI_CACHE_ENABLED",
+    default=True,
+    help_text=(
+        "if this variable is set to ``true``, ``yes`` or ``1``, published catalogi "
+        "types (zaaktypen, informatieobjecttypen, besluittypen and the types of a "
+        "zaaktype) are cached when they are looked up by URL. Changes to the catalogi "
+        "invalidate the cache immediately."
+    ),
+)
+CATALOGI_CACHE_TIMEOUT = config(
+    "CATALOGI_CACHE_TIMEOUT",
+    default=60 * 60,
+    help_text=(
+        "the number of seconds published catalogi types and the responses of the "
+        "Catalogi API are kept in the shared cache."
+    ),
+)
+CATALOGI_RESPONSE_CACHE_ENABLED = config(
+    "CATALOGI_RESPONSE_CACHE_ENABLED",
+    default=True,
+    help_text=(
+        "if this variable is set to ``true``, ``yes`` or ``1``, the responses of the "
+        "read endpoints of the Catalogi API are cached. Changes to the catalogi "
+        "invalidate the cache immediately."
+    ),
+)
+OBJECTTYPES_CACHE_TIMEOUT = config(
+    "OBJECTTYPES_CACHE_TIMEOUT",
+    default=5 * 60,
+    help_text=(
+        "the number of seconds an object type referenced by the "
+        "``objectTypeOverigeDefinitie`` of a zaakobject is used without fetching it "
+        "again. After that, the object type is revalidated with its ``ETag``."
+    ),
+)
+BRONDATUM_FETCH_TIMEOUT = config(
+    "BRONDATUM_FETCH_TIMEOUT",
+    default=10,
+    help_text=(
+        "the maximum number of seconds spent in total on fetching the objects and "
+        "zaken in other APIs from which the brondatum of the archiefactiedatum is "
+        "derived. They are fetched concurrently, objects that are not fetched in "
+        "time are treated as unavailable."
+    ),
+)
+BRONDATUM_DEFERRED_CALCULATION = config(
+    "BRONDATUM_DEFERRED_CALCULATION",
+    default=False,
+    help_text=(
+        "if this variable is set to ``true``, ``yes`` or ``1``, the archiefactiedatum "
+        "of a zaak is calculated by a background task when its brondatum is derived "
+        "from objects or zaken in other APIs, instead of while the eindstatus is set. "
+        "The task is retried if the other APIs are not available. Note that errors in "
+        "the calculation are then only logged, and not reported to the client."
+    ),
+)
+AUDITTRAIL_PARTITIONS_AHEAD = config(
+    "AUDITTRAIL_PARTITIONS_AHEAD",
+    default=3,
+    help_text=(
+        "the number of monthly partitions of the audit trail table that are created "
+        "ahead of time, once the table is partitioned with the "
+        "``create_audittrail_partitions --convert`` management command."
+    ),
+)
+AUDITTRAIL_ARCHIVE_AFTER_MONTHS = config(
+    "AUDITTRAIL_ARCHIVE_AFTER_MONTHS",
+    default=0,
+    help_text=(
+        "the number of months after which audit trail records are moved from the "
+        "database to compressed archive files in the private media. The archived "
+        "records are still returned by the audit trail endpoints. Set to ``0`` to "
+        "disable the archival."
+    ),
+)
+AUDITTRAIL_DIFF_STORAGE = config(
+    "AUDITTRAIL_DIFF_STORAGE",
+    default=False,
+    help_text=(
+        "if this variable is set to ``true``, ``yes`` or ``1``, audit trail records "
+        "store their ``oud`` and ``nieuw`` snapshots as a diff against an earlier "
+        "record of the same resource with the full snapshots (a checkpoint), instead "
+        "of storing the full snapshots. The full snapshots are reconstructed when the "
+        "audit trail is read."
+    ),
+)
+AUDITTRAIL_HOOFD_OBJECT_FALLBACK = config(
+    "AUDITTRAIL_HOOFD_OBJECT_FALLBACK",
+    default=True,
+    help_text=(
+        "if this variable is set to ``true``, ``yes`` or ``1``, audit trail records "
+        "without a reference to their main object are also looked up by the URL of "
+        "the main object. These are the records created before the references were "
+        "introduced, until the ``backfill_audittrail_references`` management command "
+        "has run. Disable it after the backfill, since the lookup by URL is slower."
+    ),
+)
+AUDITTRAIL_CHECKPOINT_INTERVAL = config(
+    "AUDITTRAIL_CHECKPOINT_INTERVAL",
+    default=20,
+    help_text=(
+        "the number of audit trail records of a resource after which the full "
+        "snapshots are stored again, when ``AUDITTRAIL_DIFF_STORAGE`` is enabled."
+    ),
+)
+IDENTIFICATION_BLOCK_SIZE = config(
+    "IDENTIFICATION_BLOCK_SIZE",
+    default=1,
+    help_text=(
+        "the number of identification numbers (of zaken, besluiten and documents) "
+        "a process reserves at once. Reserving more than one number at once reduces "
+        "the waiting of concurrent creations for the same organisation, but numbers "
+        "are not issued in order and the numbers that are left when the process "
+        "stops are never used."
+    ),
+)
+OUTGOING_REQUESTS_CACHE_ENABLED = config(
+    "OUTGOING_REQUESTS_CACHE_ENABLED",
+    default=True,
+    help_text=(
+        "if this variable is set to ``true``, ``yes`` or ``1``, the responses of GET "
+        "requests to external APIs (such as remote catalogi, the Selectielijst API and "
+        "remote documents) are cached. Responses are cached for the time configured "
+        "for the service, or as indicated by their ``Cache-Control`` header, and are "
+        "revalidated with their ``ETag`` or ``Last-Modified`` header."
+    ),
+)
+OUTGOING_REQUESTS_CACHE_LOCK_TIMEOUT = config(
+    "OUTGOING_REQUESTS_CACHE_LOCK_TIMEOUT",
+    default=10,
+    help_text=(
+        "the maximum number of seconds a request to an external API waits for the same "
+        "request made by another process to complete, instead of making the request "
+        "itself when the response is not cached."
+    ),
+)
+# Name of the cache used to store responses for requests made to external APIs
+OUTGOING_REQUESTS_CACHE_NAME = config(
+    "OUTGOING_REQUESTS_CACHE_NAME", "outgoing_requests", add_to_docs=False
+)
+
 # Import settings
 IMPORT_RETENTION_DAYS = config(
     "IMPORT_RETENTION_DAYS",
@@ -456,3 +636,15 @@ IMPORT_DOCUMENTEN_BATCH_SIZE = config(
     ),
     group="Documenten import",
 )
+
+IMPORT_DOCUMENTEN_WORKERS = config(
+    "IMPORT_DOCUMENTEN_WORKERS",
+    4,
+    help_text=(
+        "is the number of processes used to validate the rows, and the number of "
+        "threads used to copy the files, of a batch while bulk importing "
+        "``EnkelvoudigInformatieObject``'s. Use ``1`` to process the rows "
+        "sequentially."
+    ),
+    group="Documenten import",
+)
@@ -7,8 +7,10 @@ from django.utils.translation import gettext_lazy as _
 from drc_cmis.admin import CMISConfigAdmin as _CMISConfigAdmin
 from drc_cmis.models import CMISConfig
 from solo.admin import SingletonModelAdmin
+from zgw_consumers.admin import ServiceAdmin as _ServiceAdmin
+from zgw_consumers.models import Service
 
-from .models import FeatureFlags, InternalService
+from .models import FeatureFlags, InternalService, ServiceCacheConfig
 
 
 @admin.register(InternalService)
@@ -54,3 +56,16 @@ class CMISConfigAdmin(_CMISConfigAdmin):
 
     def has_change_permission(self, *args, **kwargs):
         return self.cmis_enabled()
+
+
+class ServiceCacheConfigInline(admin.StackedInline):
+    model = ServiceCacheConfig
+
+
+# Replace the ServiceAdmin with our own to configure the caching per service.
+admin.site.unregister(Service)
+
+
+@admin.register(Service)
+class ServiceAdmin(_ServiceAdmin):
+    inlines = list(_ServiceAdmin.inlines) + [ServiceCacheConfigInline]
@@ -0,0 +1,52 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+# Generated by Django 4.2.15 on 2024-09-02 10:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("zgw_consumers", "0022_set_default_service_slug"),
+        ("config", "0015_alter_internalservice_api_type"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ServiceCacheConfig",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "ttl",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of seconds the responses of GET requests to this service are cached. If 0, cached responses are only reused after checking with the service that they did not change, which requires the service to send an ETag or Last-Modified header. A Cache-Control header of the response takes precedence.",
+                        verbose_name="cache duration",
+                    ),
+                ),
+                (
+                    "service",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="cache_config",
+                        to="zgw_consumers.service",
+                        verbose_name="service",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "cache configuration",
+                "verbose_name_plural": "cache configurations",
+            },
+        ),
+    ]
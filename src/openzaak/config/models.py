@@ -60,3 +60,34 @@ class FeatureFlags(SingletonModel):
 
     def __str__(self):
         return force_str(self._meta.verbose_name)
+
+
+class ServiceCacheConfig(models.Model):
+    """
+    Configure how long responses of an external API are cached.
+    """
+
+    service = models.OneToOneField(
+        "zgw_consumers.Service",
+        on_delete=models.CASCADE,
+        related_name="cache_config",
+        verbose_name=_("service"),
+    )
+    ttl = models.PositiveIntegerField(
+        _("cache duration"),
+        default=0,
+        help_text=_(
+            "Number of seconds the responses of GET requests to this service are "
+            "cached. If 0, cached responses are only reused after checking with the "
+            "service that they did not change, which requires the service to send an "
+            "ETag or Last-Modified header. A Cache-Control header of the response "
+            "takes precedence."
+        ),
+    )
+
+    class Meta:
+        verbose_name = _("cache configuration")
+        verbose_name_plural = _("cache configurations")
+
+    def __str__(self):
+        return str(self.service)
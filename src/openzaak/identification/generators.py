@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Generate the human readable identifications of zaken, besluiten and documents.
+
+Identifications have the format ``{PREFIX}-{year}-{number}``, e.g.
+``ZAAK-2024-0000000001``. The numbers are issued by a counter per prefix, year and
+organisation (see :class:`IdentificationCounter`), which is incremented with a
+single ``UPDATE ... RETURNING`` statement. A new counter starts after the highest
+number that was issued before.
+
+The row of a counter stays locked until the transaction that incremented it is
+committed, so only the creations for the same organisation and year wait on each
+other. With ``IDENTIFICATION_BLOCK_SIZE`` set, a process reserves a block of numbers
+at once and issues the rest of the block from memory, which avoids most of the
+waiting.
+"""
+import threading
+from collections import defaultdict, deque
+from functools import partial
+from typing import Deque, Dict, List, Sequence, Tuple, Type
+
+from django.conf import settings
+from django.db import connection, models, transaction
+
+from .models import IdentificationCounter
+
+NUMBER_LENGTH = 10
+
+CounterKey = Tuple[str, int, str]
+
+_lock = threading.Lock()
+# the reserved numbers that can be issued by this process
+_reserved: Dict[CounterKey, Deque[int]] = defaultdict(deque)
+
+
+def get_prefix(model: Type[models.Model]) -> str:
+    return getattr(model, "IDENTIFICATIE_PREFIX", model._meta.model_name.upper())
+
+
+def format_identification(prefix: str, year: int, number: int) -> str:
+    return f"{prefix}-{year}-{str(number).zfill(NUMBER_LENGTH)}"
+
+
+def _get_highest_number(model: Type[models.Model], prefix: str, year: int) -> int:
+    start = f"{prefix}-{year}"
+    # ⚡ startswith is added to use the index in the DB query
+    max_id = model._default_manager.filter(
+        identificatie__startswith=start,
+        identificatie__regex=start + r"-\d{%d}" % NUMBER_LENGTH,
+    ).aggregate(models.Max("identificatie"))["identificatie__max"]
+    return int(max_id.rsplit("-", 1)[-1]) if max_id is not None else 0
+
+
+def _increment(model: Type[models.Model], key: CounterKey, count: int) -> int:
+    """
+    Increment the counter by ``count`` and return its new value.
+    """
+    prefix, year, organisation = key
+    quote = connection.ops.quote_name
+    sql = (
+        f"UPDATE {quote(IdentificationCounter._meta.db_table)} "
+        f"SET {quote('value')} = {quote('value')} + %s "
+        f"WHERE {quote('prefix')} = %s AND {quote('year')} = %s "
+        f"AND {quote('organisation')} = %s "
+        f"RETURNING {quote('value')}"
+    )
+    params = [count, prefix, year, organisation]
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        row = cursor.fetchone()
+        if row is not None:
+            return row[0]
+
+        # start a new counter after the identifications that were issued before
+        IdentificationCounter.objects.bulk_create(
+            [
+                IdentificationCounter(
+                    prefix=prefix,
+                    year=year,
+                    organisation=organisation,
+                    value=_get_highest_number(model, prefix, year),
+                )
+            ],
+            ignore_conflicts=True,
+        )
+        cursor.execute(sql, params)
+        return cursor.fetchone()[0]
+
+
+def _release(key: CounterKey, numbers: Sequence[int]) -> None:
+    with _lock:
+        _reserved[key].extend(numbers)
+
+
+def reserve_numbers(
+    model: Type[models.Model], year: int, organisation: str, count: int = 1
+) -> List[int]:
+    """
+    Reserve ``count`` numbers for the identifications of ``model``.
+    """
+    key = (get_prefix(model), year, organisation)
+    numbers = []
+    with _lock:
+        reserved = _reserved[key]
+        while reserved and len(numbers) < count:
+            numbers.append(reserved.popleft())
+
+    missing = count - len(numbers)
+    if not missing:
+        return numbers
+
+    block_size = max(missing, settings.IDENTIFICATION_BLOCK_SIZE)
+    last = _increment(model, key, block_size)
+    block = range(last - block_size + 1, last + 1)
+    numbers += block[:missing]
+    if remainder := block[missing:]:
+        # the numbers are only reserved once the counter update is committed
+        transaction.on_commit(partial(_release, key, remainder))
+    return numbers
+
+
+def generate_identifications(
+    model: Type[models.Model], year: int, organisation: str, count: int = 1
+) -> List[str]:
+    """
+    Generate ``count`` new identifications for the objects of ``model``.
+
+    Identifications that already exist for the organisation (because they were
+    given explicitly) are skipped.
+    """
+    prefix = get_prefix(model)
+    organisation_field = getattr(
+        model, "IDENTIFICATIE_ORGANISATIE_FIELD", "bronorganisatie"
+    )
+
+    identifications = []
+    while len(identifications) < count:
+        candidates = [
+            format_identification(prefix, year, number)
+            for number in reserve_numbers(
+                model, year, organisation, count - len(identifications)
+            )
+        ]
+        existing = set(
+            model._default_manager.filter(
+                **{organisation_field: organisation},
+                identificatie__in=candidates,
+            ).values_list("identificatie", flat=True)
+        )
+        identifications += [
+            identification
+            for identification in candidates
+            if identification not in existing
+        ]
+    return identifications
+
+
+def generate_identification(
+    model: Type[models.Model], year: int, organisation: str
+) -> str:
+    return generate_identifications(model, year, organisation)[0]
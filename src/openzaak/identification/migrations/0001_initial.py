@@ -0,0 +1,72 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+# Generated by Django 4.2.15 on 2024-09-16 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="IdentificationCounter",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "prefix",
+                    models.CharField(
+                        help_text="The prefix of the identifications, e.g. `ZAAK`.",
+                        max_length=20,
+                        verbose_name="prefix",
+                    ),
+                ),
+                (
+                    "year",
+                    models.PositiveSmallIntegerField(
+                        help_text="The year of the identifications.",
+                        verbose_name="year",
+                    ),
+                ),
+                (
+                    "organisation",
+                    models.CharField(
+                        blank=True,
+                        help_text="The RSIN of the organisation the identifications belong to.",
+                        max_length=9,
+                        verbose_name="organisation",
+                    ),
+                ),
+                (
+                    "value",
+                    models.PositiveBigIntegerField(
+                        default=0,
+                        help_text="The last issued number.",
+                        verbose_name="value",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "identification counter",
+                "verbose_name_plural": "identification counters",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="identificationcounter",
+            constraint=models.UniqueConstraint(
+                fields=("prefix", "year", "organisation"),
+                name="unique_identification_counter",
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class IdentificationCounter(models.Model):
+    """
+    The last issued number of the generated identifications of a kind of object.
+
+    Identifications like ``ZAAK-2024-0000000001`` are numbered per prefix, year and
+    organisation. See :mod:`openzaak.identification.generators`.
+    """
+
+    prefix = models.CharField(
+        _("prefix"),
+        max_length=20,
+        help_text=_("The prefix of the identifications, e.g. `ZAAK`."),
+    )
+    year = models.PositiveSmallIntegerField(
+        _("year"), help_text=_("The year of the identifications.")
+    )
+    organisation = models.CharField(
+        _("organisation"),
+        max_length=9,
+        blank=True,
+        help_text=_("The RSIN of the organisation the identifications belong to."),
+    )
+    value = models.PositiveBigIntegerField(
+        _("value"), default=0, help_text=_("The last issued number.")
+    )
+
+    class Meta:
+        verbose_name = _("identification counter")
+        verbose_name_plural = _("identification counters")
+        constraints = [
+            models.UniqueConstraint(
+                fields=("prefix", "year", "organisation"),
+                name="unique_identification_counter",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.prefix}-{self.year} ({self.organisation}): {self.value}"
@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from datetime import date
+
+from django.test import TestCase, override_settings
+
+from openzaak.components.besluiten.models import Besluit
+from openzaak.components.besluiten.tests.factories import BesluitFactory
+from openzaak.components.zaken.models import ZaakIdentificatie
+
+from ..generators import (
+    _reserved,
+    format_identification,
+    generate_identification,
+    generate_identifications,
+)
+from ..models import IdentificationCounter
+
+
+class GenerateIdentificationTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        _reserved.clear()
+        self.addCleanup(_reserved.clear)
+
+    def test_format_identification(self):
+        self.assertEqual(
+            format_identification("ZAAK", 2024, 12), "ZAAK-2024-0000000012"
+        )
+
+    def test_numbers_per_organisation(self):
+        generate = ZaakIdentificatie.objects.generate
+        first = generate("517439943", date(2024, 1, 1))
+        second = generate("517439943", date(2024, 1, 1))
+        other = generate("123456782", date(2024, 1, 1))
+
+        self.assertEqual(first.identificatie, "ZAAK-2024-0000000001")
+        self.assertEqual(second.identificatie, "ZAAK-2024-0000000002")
+        # a new counter starts after the identifications that were issued before
+        self.assertEqual(other.identificatie, "ZAAK-2024-0000000003")
+        self.assertEqual(IdentificationCounter.objects.count(), 2)
+
+    def test_counter_starts_after_existing_identifications(self):
+        BesluitFactory.create(
+            identificatie="BESLUIT-2024-0000000020",
+            verantwoordelijke_organisatie="517439943",
+        )
+
+        identification = generate_identification(Besluit, 2024, "517439943")
+
+        self.assertEqual(identification, "BESLUIT-2024-0000000021")
+
+    def test_existing_identifications_are_skipped(self):
+        generate_identification(Besluit, 2024, "517439943")
+        BesluitFactory.create(
+            identificatie="BESLUIT-2024-0000000002",
+            verantwoordelijke_organisatie="517439943",
+        )
+
+        identifications = generate_identifications(Besluit, 2024, "517439943", count=2)
+
+        self.assertEqual(
+            identifications, ["BESLUIT-2024-0000000003", "BESLUIT-2024-0000000004"]
+        )
+
+    @override_settings(IDENTIFICATION_BLOCK_SIZE=10)
+    def test_reserve_block(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            first = generate_identification(ZaakIdentificatie, 2024, "517439943")
+
+        with self.assertNumQueries(1):
+            second = generate_identification(ZaakIdentificatie, 2024, "517439943")
+
+        self.assertEqual(first, "ZAAK-2024-0000000001")
+        self.assertEqual(second, "ZAAK-2024-0000000002")
+        counter = IdentificationCounter.objects.get()
+        self.assertEqual(counter.value, 10)
+
+    @override_settings(IDENTIFICATION_BLOCK_SIZE=10)
+    def test_block_not_reserved_before_commit(self):
+        with self.captureOnCommitCallbacks(execute=False):
+            generate_identification(ZaakIdentificatie, 2024, "517439943")
+
+        identification = generate_identification(ZaakIdentificatie, 2024, "517439943")
+
+        self.assertEqual(identification, "ZAAK-2024-0000000011")
+
+    def test_besluit_save(self):
+        besluit = BesluitFactory.create(identificatie="", datum=date(2019, 7, 1))
+
+        self.assertEqual(besluit.identificatie, "BESLUIT-2019-0000000001")
+        self.assertTrue(
+            IdentificationCounter.objects.filter(
+                prefix="BESLUIT",
+                year=2019,
+                organisation=besluit.verantwoordelijke_organisatie,
+                value=1,
+            ).exists()
+        )
@@ -0,0 +1,24 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+# Generated by Django 4.2.15 on 2024-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("import_data", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="import",
+            name="last_committed_row",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="De laatste rij van de laatst verwerkte batch. Een herstarte import gaat verder vanaf de volgende rij.",
+                verbose_name="Laatst verwerkte rij",
+            ),
+        ),
+    ]
@@ -102,6 +102,15 @@ class Import(models.Model):
         verbose_name=_("Niet succesvol verwerkt"), default=0
     )
 
+    last_committed_row = models.PositiveIntegerField(
+        verbose_name=_("Laatst verwerkte rij"),
+        default=0,
+        help_text=_(
+            "De laatste rij van de laatst verwerkte batch. Een herstarte import gaat "
+            "verder vanaf de volgende rij."
+        ),
+    )
+
     def __str__(self):
         return str(self.uuid)
 
@@ -5,9 +5,9 @@ from django.utils.translation import gettext as _
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field
 from rest_framework.fields import SerializerMethodField
-from rest_framework.serializers import HyperlinkedModelSerializer
 
 from openzaak.import_data.models import Import, ImportStatusChoices
+from openzaak.utils.serializers import HyperlinkedModelSerializer
 
 
 class ImportSerializer(HyperlinkedModelSerializer):
@@ -3,7 +3,6 @@
 import csv
 import functools
 import logging
-import shutil
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
@@ -68,7 +67,14 @@ def finish_import(
     finished_on: Optional[datetime] = None,
     comment: Optional[str] = "",
 ):
-    updated_fields = ["finished_on", "status"]
+    updated_fields = [
+        "finished_on",
+        "status",
+        # the statistics of the batches after the last committed one
+        "processed",
+        "processed_successfully",
+        "processed_invalid",
+    ]
 
     instance.finished_on = finished_on or timezone.now()
     instance.status = status
@@ -86,98 +92,98 @@ def finish_import(
         logger.critical(f"Unable to save import state due to database error: {str(e)}")
 
 
-def finish_batch(import_instance: Import, batch: list, headers: list) -> None:
-    batch_number = import_instance.get_batch_number(len(batch))
+def add_batch_statistics(instance: Import, batch: list) -> None:
+    """
+    Add the statistics of the batch to the import, without saving them.
+    """
     _processed, _fail_count, _success_count = get_batch_statistics(batch)
 
-    import_instance.processed = import_instance.processed + _processed
-    import_instance.processed_successfully = (
-        import_instance.processed_successfully + _success_count
-    )
-    import_instance.processed_invalid = import_instance.processed_invalid + _fail_count
+    instance.processed = instance.processed + _processed
+    instance.processed_successfully = instance.processed_successfully + _success_count
+    instance.processed_invalid = instance.processed_invalid + _fail_count
 
-    try:
-        import_instance.save(
-            update_fields=["processed", "processed_successfully", "processed_invalid"]
-        )
-    except DatabaseError as e:
-        logger.critical(
-            f"Unable to save batch statistics for batch {batch_number} due to database "
-            f"error: {str(e)}"
-        )
 
+def finish_batch(batch_number: int, batch: list, report: "ReportWriter") -> None:
     logger.info(f"Writing batch number {batch_number} to report file")
-    write_to_file(import_instance, batch, headers)
+    report.write(batch)
 
-    logger.info(f"Removing files for unimported rows for batch number {batch_number}")
-    cleanup_import_files(batch)
 
+class ReportWriter:
+    """
+    Append the rows of the processed batches to the report file of an import.
 
-def cleanup_import_files(batch: list) -> None:
-    for row in batch:
-        if row.succeeded:
-            continue
+    The report file is opened once, and the header is only written when the file is
+    created (or empty), so writing a batch doesn't depend on the size of the report.
 
-        path = row.imported_path
+    Note that this relies on (PrivateMedia)FileSystemStorage
+    """
 
-        if not path or not path.exists():
-            continue
+    def __init__(self, instance: Import, headers: list):
+        self.instance = instance
+        self.headers = headers
 
-        logger.debug(f"Removing {path} for row {row.row_index}")
+        self._file = None
+        self._csv_writer = None
 
-        if path.is_dir():
-            shutil.rmtree(path, ignore_errors=True)
-        else:
-            path.unlink(missing_ok=True)
+    def __enter__(self) -> "ReportWriter":
+        return self
 
+    def __exit__(self, *args) -> None:
+        self.close()
 
-def write_to_file(instance: Import, batch: list, headers: list) -> None:
-    """
-    Note that this relies on (PrivateMedia)FileSystemStorage
-    """
-    default_dir = get_default_path(Import.report_file.field)
-    default_name = f"report-{instance.pk}.csv"
-    default_path = f"{default_dir}/{default_name}"
+    def _open(self) -> None:
+        file_path = (
+            self.instance.report_file.path if self.instance.report_file else None
+        )
 
-    if not default_dir.exists():
-        default_dir.mkdir(parents=True)
+        if not file_path:
+            default_dir = get_default_path(Import.report_file.field)
+            default_name = f"report-{self.instance.pk}.csv"
 
-    file_path = instance.report_file.file.name if instance.report_file else None
-    file_exists = Path(instance.report_file.file.name).exists() if file_path else False
-    has_data = bool(get_total_count(file_path)) if file_exists else False
+            if not default_dir.exists():
+                default_dir.mkdir(parents=True)
 
-    if file_exists and has_data:
-        mode = "a"
-    elif file_exists:
-        mode = "w"
-    else:
-        mode = "w+"
+            file_path = f"{default_dir}/{default_name}"
 
-    logger.debug(f"Using file mode {mode} for file {file_path or default_path}")
+            self.instance.report_file.name = str(
+                Path(self.instance.report_file.field.upload_to) / default_name
+            )
 
-    with open(file_path or default_path, mode) as _export_file:
-        csv_writer = csv.writer(_export_file, delimiter=",", quotechar='"')
+            try:
+                self.instance.save(update_fields=["report_file"])
+            except DatabaseError as e:
+                logger.critical(
+                    f"Unable to save new report file due to database error: {str(e)}"
+                )
 
-        if mode in ("w", "w+"):
-            csv_writer.writerow(headers)
+        path = Path(file_path)
+        has_data = path.exists() and path.stat().st_size > 0
+        mode = "a" if has_data else "w"
 
-        for row in batch:
-            data = row.as_export_data()
-            csv_writer.writerow(data.values())
+        logger.debug(f"Using file mode {mode} for file {file_path}")
 
-    if file_path:
-        return
+        self._file = open(file_path, mode)
+        self._csv_writer = csv.writer(self._file, delimiter=",", quotechar='"')
 
-    relative_path = Path(instance.report_file.field.upload_to) / default_name
+        if not has_data:
+            self._csv_writer.writerow(self.headers)
 
-    instance.report_file.name = str(relative_path)
+    def write(self, batch: list) -> None:
+        if self._file is None:
+            self._open()
 
-    try:
-        instance.save(update_fields=["report_file"])
-    except DatabaseError as e:
-        logger.critical(
-            f"Unable to save new report file due to database error: {str(e)}"
-        )
+        self._csv_writer.writerows(row.as_export_data().values() for row in batch)
+
+        # keep the report up to date with the committed batches
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+
+        self._file.close()
+        self._file = None
+        self._csv_writer = None
 
 
 LOCK_EXPIRE = 60 * (60 * 24)  # 24 hours
@@ -1,9 +1,19 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+import copy
 import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from http.cookiejar import DefaultCookiePolicy
 from inspect import getmembers
-from typing import Any, Dict
+from threading import Lock, local
+from typing import Any, Dict, Iterable, Optional, Union
+from urllib.parse import urlparse
 
+from django.conf import settings
+from django.core import signals
 from django.db import models
 from django.db.models.base import ModelBase
 
@@ -11,9 +21,75 @@ import requests
 from django_loose_fk.loaders import BaseLoader, FetchError, FetchJsonError
 from django_loose_fk.virtual_models import virtual_model_factory
 from djangorestframework_camel_case.util import underscoreize
+from requests.adapters import HTTPAdapter
 from vng_api_common.descriptors import GegevensGroepType
 
+from openzaak.components.catalogi.caching import get_resource_for_path
 from openzaak.utils.auth import get_auth
+from openzaak.utils.cache import OutgoingRequestsSession, get_service_ttl
+
+logger = logging.getLogger(__name__)
+
+# upper bound on the number of concurrent requests to external APIs
+MAX_WORKERS = 8
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = Lock()
+
+_state = local()
+
+
+def _reset_sessions():
+    # forked processes (see ``import_documents``) must not share the connections
+    global _sessions_lock
+    _sessions.clear()
+    _sessions_lock = Lock()
+
+
+os.register_at_fork(after_in_child=_reset_sessions)
+
+
+def _start_request(**kwargs):
+    _state.objects = {}
+
+
+def _finish_request(**kwargs):
+    _state.objects = None
+
+
+signals.request_started.connect(_start_request)
+signals.request_finished.connect(_finish_request)
+
+
+def _get_memo() -> Optional[Dict[str, Any]]:
+    """
+    Return the objects fetched during the current request, if any.
+    """
+    return getattr(_state, "objects", None)
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    Return the session for the host of the URL, keeping connections alive.
+
+    The responses are cached, see
+    :class:`openzaak.utils.cache.OutgoingRequestsCacheMixin`.
+
+    The sessions are shared between threads. Cookies are not stored, so no state
+    leaks between the requests made with the same session.
+    """
+    parsed = urlparse(url)
+    host = f"{parsed.scheme}://{parsed.netloc}"
+
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = OutgoingRequestsSession()
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            adapter = HTTPAdapter(pool_maxsize=MAX_WORKERS)
+            session.mount(f"{parsed.scheme}://", adapter)
+            _sessions[host] = session
+    return session
 
 
 class AuthorizedRequestsLoader(BaseLoader):
@@ -25,28 +101,112 @@ class AuthorizedRequestsLoader(BaseLoader):
     def fetch_object(url: str, do_underscoreize=True) -> dict:
         # TODO should we replace it with Service.get_client() and use it instead of requests?
         # but in this case we couldn't catch separate FetchJsonError
-        headers = get_auth(url)
-
-        try:
-            response = requests.get(url, headers=headers)
-        except requests.exceptions.RequestException as exc:
-            raise FetchError(exc.args[0]) from exc
-
-        try:
-            response.raise_for_status()
-        except requests.HTTPError as exc:
-            raise FetchError(exc.args[0]) from exc
-
-        try:
-            data = response.json()
-        except json.JSONDecodeError as exc:
-            raise FetchJsonError(exc.args[0]) from exc
+        memo = _get_memo()
+        if memo is not None and url in memo:
+            data = copy.deepcopy(memo[url])
+        else:
+            data = _get_json(url, **_get_request_kwargs(url))
+            if memo is not None:
+                memo[url] = copy.deepcopy(data)
 
         if not do_underscoreize:
             return data
 
         return underscoreize(data)
 
+    @classmethod
+    def fetch_objects(
+        cls,
+        urls: Iterable[str],
+        do_underscoreize=True,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Union[dict, FetchError, FetchJsonError]]:
+        """
+        Fetch multiple external API objects concurrently.
+
+        Every URL is fetched once during a request. The result maps each URL to
+        the object or, if it could not be fetched, the :class:`FetchError` (or
+        :class:`FetchJsonError` for responses that aren't JSON).
+
+        :param timeout: the maximum number of seconds to spend on fetching all
+          objects. Objects which are not fetched in time result in a
+          :class:`FetchError`.
+        """
+        memo = _get_memo()
+        if memo is None:
+            memo = {}
+
+        urls = list(dict.fromkeys(urls))
+        to_fetch = [url for url in urls if url not in memo]
+        # the credentials and cache configuration are looked up in the database, so
+        # keep this out of the worker threads
+        request_kwargs = [_get_request_kwargs(url) for url in to_fetch]
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        def _fetch(url: str, kwargs: dict) -> Union[dict, FetchError, FetchJsonError]:
+            try:
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise FetchError(f"Timed out before fetching {url}")
+                    kwargs = {**kwargs, "timeout": remaining}
+                return _get_json(url, **kwargs)
+            except (FetchError, FetchJsonError) as exc:
+                return exc
+
+        if len(to_fetch) == 1 and deadline is None:
+            results = [_fetch(to_fetch[0], request_kwargs[0])]
+        elif to_fetch:
+            pool = ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(to_fetch)))
+            futures = [
+                pool.submit(_fetch, url, kwargs)
+                for url, kwargs in zip(to_fetch, request_kwargs)
+            ]
+            # the request timeout only limits the time between bytes received, so
+            # the deadline is enforced on the whole batch
+            done, _ = wait(
+                futures,
+                timeout=(
+                    max(deadline - time.monotonic(), 0)
+                    if deadline is not None
+                    else None
+                ),
+            )
+            # don't wait for requests that are still running
+            pool.shutdown(wait=False, cancel_futures=True)
+            results = [
+                (
+                    future.result()
+                    if future in done
+                    else FetchError(f"Timed out while fetching {url}")
+                )
+                for url, future in zip(to_fetch, futures)
+            ]
+        else:
+            results = []
+
+        errors = {}
+        for url, result in zip(to_fetch, results):
+            if isinstance(result, (FetchError, FetchJsonError)):
+                logger.info("Could not fetch %s: %s", url, result)
+                errors[url] = result
+            else:
+                memo[url] = result
+
+        objects = {}
+        for url in urls:
+            if url in errors:
+                objects[url] = errors[url]
+                continue
+            data = copy.deepcopy(memo[url])
+            objects[url] = underscoreize(data) if do_underscoreize else data
+        return objects
+
+    def load_local_object(self, url: str, model: ModelBase) -> models.Model:
+        # ⚡️ published catalogi objects are taken from the cache
+        return get_resource_for_path(urlparse(url).path)
+
     def load(self, url: str, model: ModelBase) -> models.Model:
         if self.is_local_url(url):
             # print(url)
@@ -57,6 +217,37 @@ class AuthorizedRequestsLoader(BaseLoader):
         return get_model_instance_with_gegevensgroeps(model, data, loader=self)
 
 
+def _get_request_kwargs(url: str) -> dict:
+    kwargs = {"headers": get_auth(url)}
+    if settings.OUTGOING_REQUESTS_CACHE_ENABLED:
+        kwargs["expire_after"] = get_service_ttl(url)
+    return kwargs
+
+
+def _get_json(
+    url: str,
+    headers: dict,
+    expire_after: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> dict:
+    try:
+        response = get_session(url).get(
+            url, headers=headers, expire_after=expire_after, timeout=timeout
+        )
+    except requests.exceptions.RequestException as exc:
+        raise FetchError(exc.args[0]) from exc
+
+    try:
+        response.raise_for_status()
+    except requests.HTTPError as exc:
+        raise FetchError(exc.args[0]) from exc
+
+    try:
+        return response.json()
+    except json.JSONDecodeError as exc:
+        raise FetchJsonError(exc.args[0]) from exc
+
+
 def get_model_instance_with_gegevensgroeps(
     model: ModelBase, data: Dict[str, Any], loader
 ) -> models.Model:
@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+from django.core.management import BaseCommand
+
+from openzaak.utils.cache import CACHE_METRICS, get_outgoing_requests_cache
+
+
+class Command(BaseCommand):
+    help = "Show the hit/miss counters of the cache of requests to external APIs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the counters after showing them.",
+        )
+
+    def handle(self, **options):
+        cache = get_outgoing_requests_cache()
+        metrics = cache.get_metrics()
+
+        if not metrics:
+            self.stdout.write("No requests to external APIs were made.")
+
+        for host, counters in sorted(metrics.items()):
+            total = sum(counters.values())
+            cached = total - counters["miss"]
+            ratio = cached / total if total else 0
+            line = ", ".join(
+                f"{metric}: {counters[metric]}" for metric in CACHE_METRICS
+            )
+            self.stdout.write(f"{host} - {line} (hit ratio: {ratio:.0%})")
+
+        if options["reset"]:
+            cache.reset_metrics()
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
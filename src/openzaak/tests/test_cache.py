@@ -1,8 +1,18 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
-from django.test import TestCase
+from django.core.cache import caches
+from django.test import TestCase, override_settings
 
-from openzaak.utils.cache import DjangoCacheStorage
+import requests_mock
+from zgw_consumers.constants import APITypes
+from zgw_consumers.test.factories import ServiceFactory
+
+from openzaak.config.models import ServiceCacheConfig
+from openzaak.utils.cache import (
+    DjangoCacheStorage,
+    OutgoingRequestsSession,
+    get_outgoing_requests_cache,
+)
 
 
 class DjangoCacheStorageTestCase(TestCase):
@@ -52,3 +62,85 @@ class DjangoCacheStorageTestCase(TestCase):
 
         self.assertFalse("foo" in self.storage)
         self.assertFalse("bar" in self.storage)
+
+
+@override_settings(OUTGOING_REQUESTS_CACHE_ENABLED=True)
+@requests_mock.Mocker()
+class OutgoingRequestsSessionTests(TestCase):
+    url = "https://external.catalogus.nl/api/v1/zaaktypen/1"
+
+    def setUp(self):
+        super().setUp()
+
+        service = ServiceFactory.create(
+            api_root="https://external.catalogus.nl/api/v1/", api_type=APITypes.ztc
+        )
+        self.cache_config = ServiceCacheConfig.objects.create(service=service, ttl=60)
+
+        self.session = OutgoingRequestsSession()
+        cache = caches["outgoing_requests"]
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_response_is_cached_for_service_ttl(self, m):
+        m.get(self.url, json={"omschrijving": "some zaaktype"})
+
+        self.session.get(self.url)
+        response = self.session.get(self.url)
+
+        self.assertTrue(response.from_cache)
+        self.assertEqual(response.json(), {"omschrijving": "some zaaktype"})
+        self.assertEqual(m.call_count, 1)
+        self.assertNotIn("Cache-Control", m.last_request.headers)
+
+    def test_response_is_not_cached_without_ttl(self, m):
+        self.cache_config.delete()
+        m.get(self.url, json={"omschrijving": "some zaaktype"})
+
+        self.session.get(self.url)
+        response = self.session.get(self.url)
+
+        self.assertFalse(response.from_cache)
+        self.assertEqual(m.call_count, 2)
+
+    def test_response_is_revalidated_with_etag(self, m):
+        self.cache_config.delete()
+        m.get(
+            self.url,
+            [
+                {"json": {"omschrijving": "some zaaktype"}, "headers": {"ETag": '"1"'}},
+                {"status_code": 304, "headers": {"ETag": '"1"'}},
+            ],
+        )
+
+        self.session.get(self.url)
+        response = self.session.get(self.url)
+
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(m.last_request.headers["If-None-Match"], '"1"')
+        self.assertTrue(response.from_cache)
+        self.assertEqual(response.json(), {"omschrijving": "some zaaktype"})
+
+    def test_cache_control_takes_precedence(self, m):
+        m.get(
+            self.url,
+            json={"omschrijving": "some zaaktype"},
+            headers={"Cache-Control": "no-store"},
+        )
+
+        self.session.get(self.url)
+        self.session.get(self.url)
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_metrics(self, m):
+        m.get(self.url, json={"omschrijving": "some zaaktype"})
+
+        for _ in range(3):
+            self.session.get(self.url)
+
+        metrics = get_outgoing_requests_cache().get_metrics()
+        self.assertEqual(
+            metrics["external.catalogus.nl"],
+            {"hit": 2, "miss": 1, "revalidated": 0, "waited": 0},
+        )
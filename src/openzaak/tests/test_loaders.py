@@ -0,0 +1,102 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import threading
+import time
+
+from django.core import signals
+from django.test import TestCase
+
+import requests_mock
+from django_loose_fk.loaders import FetchError, FetchJsonError
+
+from openzaak.loaders import AuthorizedRequestsLoader
+
+
+@requests_mock.Mocker()
+class FetchObjectsTests(TestCase):
+    def test_fetch_objects(self, m):
+        for index in range(3):
+            m.get(
+                f"https://external.example.com/api/objects/{index}",
+                json={"someAttribute": index},
+            )
+        m.get("https://external.example.com/api/objects/missing", status_code=404)
+        urls = [
+            "https://external.example.com/api/objects/0",
+            "https://external.example.com/api/objects/1",
+            "https://external.example.com/api/objects/missing",
+            "https://external.example.com/api/objects/2",
+            "https://external.example.com/api/objects/0",
+        ]
+
+        objects = AuthorizedRequestsLoader.fetch_objects(urls)
+
+        self.assertEqual(list(objects), list(dict.fromkeys(urls)))
+        self.assertEqual(objects[urls[0]], {"some_attribute": 0})
+        self.assertEqual(objects[urls[3]], {"some_attribute": 2})
+        self.assertIsInstance(objects[urls[2]], FetchError)
+        # every URL is requested once
+        self.assertEqual(m.call_count, 4)
+
+    def test_invalid_json_is_returned_per_url(self, m):
+        m.get("https://external.example.com/api/objects/0", json={"someAttribute": 0})
+        m.get("https://external.example.com/api/objects/invalid", text="<html>")
+        urls = [
+            "https://external.example.com/api/objects/0",
+            "https://external.example.com/api/objects/invalid",
+        ]
+
+        objects = AuthorizedRequestsLoader.fetch_objects(urls)
+
+        self.assertEqual(objects[urls[0]], {"some_attribute": 0})
+        self.assertIsInstance(objects[urls[1]], FetchJsonError)
+
+    def test_objects_are_memoized_during_request(self, m):
+        url = "https://external.example.com/api/objects/0"
+        m.get(url, json={"someAttribute": 0})
+        signals.request_started.send(sender=self.__class__)
+        self.addCleanup(signals.request_finished.send, sender=self.__class__)
+
+        AuthorizedRequestsLoader.fetch_objects([url])
+        data = AuthorizedRequestsLoader.fetch_object(url, do_underscoreize=False)
+
+        self.assertEqual(data, {"someAttribute": 0})
+        self.assertEqual(m.call_count, 1)
+
+    def test_objects_are_not_memoized_outside_request(self, m):
+        url = "https://external.example.com/api/objects/0"
+        m.get(url, json={"someAttribute": 0})
+
+        AuthorizedRequestsLoader.fetch_objects([url])
+        AuthorizedRequestsLoader.fetch_object(url)
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_timeout_applies_to_all_objects(self, m):
+        released = threading.Event()
+        self.addCleanup(released.set)
+
+        def slow_response(request, context):
+            # a response that trickles in keeps renewing the request timeout
+            released.wait(timeout=5)
+            return {"someAttribute": "slow"}
+
+        m.get("https://external.example.com/api/objects/fast", json={"a": 1})
+        m.get("https://external.example.com/api/objects/slow", json=slow_response)
+
+        start = time.monotonic()
+        objects = AuthorizedRequestsLoader.fetch_objects(
+            [
+                "https://external.example.com/api/objects/fast",
+                "https://external.example.com/api/objects/slow",
+            ],
+            timeout=0.5,
+        )
+
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(
+            objects["https://external.example.com/api/objects/fast"], {"a": 1}
+        )
+        self.assertIsInstance(
+            objects["https://external.example.com/api/objects/slow"], FetchError
+        )
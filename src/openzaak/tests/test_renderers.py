@@ -0,0 +1,191 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import datetime
+import uuid
+from decimal import Decimal
+
+from django.contrib.gis.geos import Point
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy as _
+
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_inclusions.renderer import InclusionJSONRenderer
+from vng_api_common.constants import RolTypes
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import (
+    StatusTypeFactory,
+    ZaakTypeFactory,
+)
+from openzaak.components.documenten.tests.factories import (
+    EnkelvoudigInformatieObjectFactory,
+)
+from openzaak.components.zaken.models import Zaak
+from openzaak.components.zaken.tests.factories import (
+    RolFactory,
+    StatusFactory,
+    ZaakEigenschapFactory,
+    ZaakFactory,
+)
+from openzaak.components.zaken.tests.utils import ZAAK_READ_KWARGS, ZAAK_WRITE_KWARGS
+from openzaak.utils.expansion import ExpandJSONRenderer, ExpandLoader
+from openzaak.utils.renderers import CamelCaseORJSONRenderer
+
+from .utils import JWTAuthMixin
+
+
+class ReferenceRenderer(ExpandJSONRenderer):
+    """
+    Render without the fast paths of :class:`ExpandJSONRenderer`.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return InclusionJSONRenderer.render(
+            self, data, accepted_media_type, renderer_context
+        )
+
+    def _can_render_fast(self, accepted_media_type, renderer_context) -> bool:
+        return False
+
+    def _get_inclusions(self, serializer, serializer_data, allowed_paths) -> dict:
+        return self.loader_class(allowed_paths).inclusions_dict(serializer)
+
+
+class CamelCaseORJSONRendererTests(SimpleTestCase):
+    def assertRendersIdentically(self, data, accepted_media_type=None):
+        expected = CamelCaseJSONRenderer().render(data, accepted_media_type)
+        rendered = CamelCaseORJSONRenderer().render(data, accepted_media_type)
+
+        self.assertEqual(rendered, expected)
+
+    def test_render(self):
+        data = {
+            "url": "http://testserver/zaken/api/v1/zaken/1",
+            "zaak_identificatie": "ZAAK-2024-0000000001",
+            "nested_object": {"some_key": [{"another_key": None}], "_expand": {}},
+            "lazy_string": _("identification number"),
+            _("lazy_key"): True,
+            "uniçode": "é\u2028\u2029",
+            "numbers": [1, -2, 2**63 - 1, 0.1, 52.3731, -0.0, 1.0],
+            "tuple_value": (1, "a"),
+        }
+
+        self.assertRendersIdentically(data)
+
+    def test_render_encoded_types(self):
+        data = {
+            "date_value": datetime.date(2024, 1, 1),
+            "datetime_value": datetime.datetime(
+                2024, 1, 1, 10, tzinfo=datetime.timezone.utc
+            ),
+            "time_value": datetime.time(10, 30),
+            "duration": datetime.timedelta(days=1),
+            "decimal_value": Decimal("1.5"),
+            "uuid_value": uuid.UUID("1b2c2cc8-6b2d-4e09-8bdc-c7e3fd36d5e5"),
+        }
+
+        self.assertRendersIdentically(data)
+
+    def test_render_fallback(self):
+        for value in [1e-05, 1e16, 2**70, {1: "a"}]:
+            with self.subTest(value=value):
+                self.assertRendersIdentically({"some_value": value})
+
+    def test_render_indent(self):
+        self.assertRendersIdentically(
+            {"some_value": [1, 2]}, accepted_media_type="application/json; indent=4"
+        )
+
+    def test_render_none(self):
+        self.assertEqual(CamelCaseORJSONRenderer().render(None), b"")
+
+
+class ExpandJSONRendererTests(JWTAuthMixin, APITestCase):
+    """
+    Compare the rendered API responses with the rendering without the fast paths.
+    """
+
+    heeft_alle_autorisaties = True
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create(concept=False)
+        cls.statustype = StatusTypeFactory.create(zaaktype=cls.zaaktype)
+
+        super().setUpTestData()
+
+    def setUp(self):
+        super().setUp()
+
+        self.zaak = ZaakFactory.create(
+            zaaktype=self.zaaktype, zaakgeometrie=Point(4.887990, 52.377595)
+        )
+        ZaakFactory.create(zaaktype=self.zaaktype)
+        StatusFactory.create(zaak=self.zaak, statustype=self.statustype)
+        ZaakEigenschapFactory.create(zaak=self.zaak)
+        RolFactory.create(
+            zaak=self.zaak,
+            betrokkene_type=RolTypes.natuurlijk_persoon,
+            betrokkene="http://some.test/betrokkene",
+        )
+
+    def assertRenderedIdentically(self, response):
+        expected = ReferenceRenderer().render(
+            response.data, response.accepted_media_type, response.renderer_context
+        )
+
+        self.assertEqual(response.content, expected)
+
+    def test_read(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        cases = [
+            (reverse("zaak-list"), {}),
+            (reverse("zaak-list"), {"expand": "zaaktype,status,eigenschappen,rollen"}),
+            (reverse(self.zaak), {}),
+            (reverse(self.zaak), {"expand": "zaaktype,status.statustype"}),
+            (reverse("rol-list"), {}),
+            (reverse("enkelvoudiginformatieobject-list"), {}),
+            (reverse(eio), {"expand": "informatieobjecttype"}),
+        ]
+
+        for url, params in cases:
+            with self.subTest(url=url, params=params):
+                response = self.client.get(url, params, **ZAAK_READ_KWARGS)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertRenderedIdentically(response)
+
+    def test_create(self):
+        data = {
+            "zaaktype": f"http://testserver{reverse(self.zaaktype)}",
+            "bronorganisatie": "517439943",
+            "verantwoordelijkeOrganisatie": "517439943",
+            "startdatum": "2024-06-11",
+            "zaakgeometrie": {"type": "Point", "coordinates": [4.88799, 52.377595]},
+        }
+
+        response = self.client.post(reverse("zaak-list"), data, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertRenderedIdentically(response)
+
+    def test_error(self):
+        response = self.client.post(reverse("zaak-list"), {}, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertRenderedIdentically(response)
+
+    def test_loader_urls_cached_per_object(self):
+        loader = ExpandLoader(set())
+        other_zaak = ZaakFactory.create(zaaktype=self.zaaktype)
+
+        urls = [
+            loader._get_url(zaak, request=None)
+            for zaak in [self.zaak, other_zaak, Zaak.objects.get(pk=self.zaak.pk)]
+        ]
+
+        self.assertEqual(
+            urls, [reverse(self.zaak), reverse(other_zaak), reverse(self.zaak)]
+        )
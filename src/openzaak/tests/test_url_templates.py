@@ -0,0 +1,184 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+import time
+import uuid
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, tag
+
+from rest_framework import relations, status
+from rest_framework.request import Request
+from rest_framework.reverse import reverse as drf_reverse
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework.versioning import URLPathVersioning
+from vng_api_common.tests import reverse as get_url
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.components.zaken.api.serializers import ZaakSerializer
+from openzaak.components.zaken.models import Zaak
+from openzaak.components.zaken.tests.factories import (
+    RolFactory,
+    StatusFactory,
+    ZaakEigenschapFactory,
+    ZaakFactory,
+)
+from openzaak.components.zaken.tests.utils import ZAAK_READ_KWARGS
+from openzaak.utils.url_templates import reverse
+
+from .utils import JWTAuthMixin
+
+
+def get_request(path: str = "/zaken/api/v1/zaken", **extra) -> Request:
+    request = Request(APIRequestFactory().get(path, HTTP_HOST="openzaak.nl", **extra))
+    request.versioning_scheme = URLPathVersioning()
+    request.version = "1"
+    return request
+
+
+class ReverseTests(SimpleTestCase):
+    def assertReversesIdentically(self, viewname, kwargs, request=None, **extra):
+        expected = drf_reverse(viewname, kwargs=kwargs, request=request, **extra)
+        url = reverse(viewname, kwargs=kwargs, request=request, **extra)
+
+        self.assertEqual(url, expected)
+
+    def test_reverse(self):
+        zaak_uuid = uuid.uuid4()
+        cases = [
+            ("zaak-detail", {"uuid": zaak_uuid}),
+            ("zaak-detail", {"uuid": str(zaak_uuid)}),
+            ("zaakeigenschap-detail", {"zaak_uuid": zaak_uuid, "uuid": uuid.uuid4()}),
+            ("zaaktype-detail", {"uuid": uuid.uuid4(), "version": "1"}),
+        ]
+
+        for viewname, kwargs in cases:
+            with self.subTest(viewname=viewname, kwargs=kwargs):
+                self.assertReversesIdentically(viewname, kwargs, request=get_request())
+                self.assertReversesIdentically(
+                    viewname, {**kwargs, "version": "1"}, request=None
+                )
+
+    def test_reverse_fallback(self):
+        zaak_uuid = uuid.uuid4()
+        cases = [
+            ("zaak-detail", {"uuid": "not-a-uuid"}, get_request(), {}),
+            ("zaak-detail", {"uuid": zaak_uuid}, get_request(), {"format": "json"}),
+            (
+                "zaak-detail",
+                {"uuid": zaak_uuid},
+                get_request("/zaken/api/v1/zaken?format=json"),
+                {},
+            ),
+            ("zaak-list", {}, get_request(), {}),
+        ]
+
+        for viewname, kwargs, request, extra in cases:
+            with self.subTest(viewname=viewname, kwargs=kwargs, extra=extra):
+                self.assertReversesIdentically(viewname, kwargs, request, **extra)
+
+    def test_hyperlinked_fields_use_templates(self):
+        fields = ZaakSerializer().fields
+
+        for name in ("url", "zaaktype", "status", "rollen"):
+            with self.subTest(field=name):
+                field = fields[name]
+                field = getattr(field, "local_field", field)
+                self.assertIs(getattr(field, "child_relation", field).reverse, reverse)
+
+        # the DRF fields outside of Open Zaak are left alone
+        self.assertIs(relations.reverse, drf_reverse)
+
+    def test_base_url_cached_on_request(self):
+        request = get_request()
+
+        reverse("zaak-detail", kwargs={"uuid": uuid.uuid4()}, request=request)
+
+        with patch.object(request, "build_absolute_uri") as mock_build:
+            url = reverse("zaak-detail", kwargs={"uuid": uuid.uuid4()}, request=request)
+
+        mock_build.assert_not_called()
+        self.assertTrue(url.startswith("http://openzaak.nl/zaken/api/v1/zaken/"))
+
+
+def create_zaken(count: int) -> None:
+    zaaktype = ZaakTypeFactory.create(concept=False)
+    for _ in range(count):
+        zaak = ZaakFactory.create(zaaktype=zaaktype)
+        StatusFactory.create(zaak=zaak, statustype__zaaktype=zaaktype)
+        ZaakEigenschapFactory.create(zaak=zaak)
+        RolFactory.create(zaak=zaak)
+
+
+@contextmanager
+def patch_reverse():
+    """
+    Build the URLs with the DRF reverse instead of the templates.
+    """
+    with patch("openzaak.utils.serializer_fields.reverse", drf_reverse), patch(
+        "openzaak.utils.mixins.reverse", drf_reverse
+    ):
+        yield
+
+
+class SerializationTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        create_zaken(3)
+
+    def test_urls_unchanged(self):
+        response = self.client.get(get_url("zaak-list"), **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with patch_reverse():
+            expected = self.client.get(get_url("zaak-list"), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.json(), expected.json())
+
+
+@tag("benchmark")
+class SerializationBenchmark(JWTAuthMixin, APITestCase):
+    """
+    Report the time spent on serializing a page of zaken with and without the URL
+    templates.
+
+    Excluded from CI, run it with ``manage.py test openzaak --tag benchmark``.
+    """
+
+    heeft_alle_autorisaties = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        create_zaken(100)
+
+    def serialize(self, request) -> list:
+        zaken = Zaak.objects.prefetch_related(
+            "status_set", "rol_set", "zaakeigenschap_set"
+        )
+        return ZaakSerializer(zaken, many=True, context={"request": request}).data
+
+    def test_serialization(self):
+        response = self.client.get(get_url("zaak-list"), **ZAAK_READ_KWARGS)
+        request = response.renderer_context["request"]
+
+        def benchmark() -> float:
+            self.serialize(request)  # warm up the caches
+            start = time.perf_counter()
+            for _ in range(3):
+                self.serialize(request)
+            return time.perf_counter() - start
+
+        with patch_reverse():
+            reversed_duration = benchmark()
+        templated_duration = benchmark()
+
+        print(
+            f"\nserializing 3 x 100 zaken: {reversed_duration:.3f}s with reverse, "
+            f"{templated_duration:.3f}s with URL templates"
+        )
@@ -20,6 +20,9 @@ from rest_framework.settings import api_settings
 from vng_api_common.audittrails.models import AuditTrail
 from vng_api_common.constants import CommonResourceAction
 
+from openzaak.audittrails.deltas import resolve_snapshots
+from openzaak.audittrails.utils import delete_audittrails
+
 
 def link_to_related_objects(
     model: ModelBase, obj: Model, rel_field_name: Optional[str] = None
@@ -234,7 +237,7 @@ class AuditTrailAdminMixin:
         if basename == viewset.audit.main_resource:
             with transaction.atomic():
                 super().delete_model(request, obj)
-                AuditTrail.objects.filter(hoofd_object=data["url"]).delete()
+                delete_audittrails(data["url"])
                 return
 
         super().delete_model(request, obj)
@@ -472,3 +475,9 @@ class AuditTrailAdmin(admin.ModelAdmin):
 
     def has_add_permission(self, request: HttpRequest):
         return False
+
+    def get_object(self, request, object_id, from_field=None):
+        obj = super().get_object(request, object_id, from_field=from_field)
+        if obj is not None:
+            resolve_snapshots([obj])
+        return obj
@@ -1,16 +1,33 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
+import logging
+import time
 from contextlib import contextmanager
-from typing import Iterable, Union
+from threading import local
+from typing import Dict, Iterable, Optional, Union
+from urllib.parse import urlparse
 
 from django.conf import settings
 from django.core.cache import caches
 
+import requests
 import requests_cache
 from requests_cache import BaseCache, clear, install_cache, uninstall_cache
 from requests_cache.backends.base import KEY_FN
+from requests_cache.cache_control import DO_NOT_CACHE
 from requests_cache.cache_keys import create_key
-from requests_cache.session import CachedSession
+from requests_cache.models import CachedResponse
+from requests_cache.session import CachedSession, CacheMixin
+
+logger = logging.getLogger(__name__)
+
+# number of seconds responses that can be revalidated are kept after they expired
+STALE_RESPONSE_TIMEOUT = 24 * 60 * 60
+
+# interval in seconds to check if a request made by another process has completed
+LOCK_POLL_INTERVAL = 0.05
+
+CACHE_METRICS = ("hit", "miss", "revalidated", "waited")
 
 
 class DjangoCacheStorage(requests_cache.BaseStorage):
@@ -18,24 +35,42 @@ class DjangoCacheStorage(requests_cache.BaseStorage):
     Custom storage for requests-cache that uses the Django cache framework
     """
 
-    def __init__(self, cache_name: str, **kwargs):
+    def __init__(self, cache_name: str, stale_timeout: Optional[int] = None, **kwargs):
         super().__init__(**kwargs)
 
         self.cache = caches[cache_name]
+        self.stale_timeout = stale_timeout
 
     def __contains__(self, key) -> bool:
         return key in self.cache
 
     def __getitem__(self, key):
-        return self.cache.get(key)
+        item = self.cache.get(key)
+        if item is None:
+            raise KeyError(key)
+        return item
 
     def __setitem__(self, key, item):
         """Save an item to the cache, optionally with TTL"""
-        if getattr(item, "ttl", None):
+        if self.stale_timeout is not None and isinstance(item, CachedResponse):
+            self.cache.set(key, item, timeout=self._get_timeout(item))
+        elif getattr(item, "ttl", None):
             self.cache.set(key, item, timeout=item.ttl)
         else:
             self.cache.set(key, item)
 
+    def _get_timeout(self, response: CachedResponse) -> int:
+        """
+        Keep responses which can be revalidated after they expire.
+        """
+        if response.expires is None:
+            return self.stale_timeout
+
+        timeout = response.ttl or 0
+        if response.headers.get("ETag") or response.headers.get("Last-Modified"):
+            timeout += self.stale_timeout
+        return max(timeout, 1)
+
     def __delitem__(self, key):
         self.cache.delete(key)
 
@@ -75,9 +110,12 @@ class DjangoRequestsCache(requests_cache.BaseCache):
         match_headers: Union[Iterable[str], bool] = False,
         ignored_parameters: Iterable[str] = None,
         key_fn: KEY_FN = None,
+        stale_timeout: Optional[int] = None,
         **kwargs,
     ):
-        self.responses = DjangoCacheStorage(cache_name=cache_name)
+        self.responses = DjangoCacheStorage(
+            cache_name=cache_name, stale_timeout=stale_timeout
+        )
         self.redirects = DjangoCacheStorage(cache_name=cache_name)
         self.cache_name = cache_name
 
@@ -90,6 +128,49 @@ class DjangoRequestsCache(requests_cache.BaseCache):
         self.responses.update(other.responses)
         self.redirects.update(other.redirects)
 
+    def acquire_lock(self, key: str, timeout: int) -> bool:
+        return self.responses.cache.add(f"{key}:lock", True, timeout=timeout)
+
+    def release_lock(self, key: str) -> None:
+        self.responses.cache.delete(f"{key}:lock")
+
+    def is_locked(self, key: str) -> bool:
+        return f"{key}:lock" in self.responses.cache
+
+    def increment(self, host: str, metric: str) -> None:
+        """Increment the counter of the metric for the host"""
+        cache = self.responses.cache
+        key = f"metrics:{host}:{metric}"
+        if cache.add(key, 1, timeout=None):
+            hosts = cache.get("metrics:hosts", [])
+            if host not in hosts:
+                cache.set("metrics:hosts", hosts + [host], timeout=None)
+            return
+
+        try:
+            cache.incr(key)
+        except ValueError:
+            # the counter was reset in the meantime
+            cache.set(key, 1, timeout=None)
+
+    def get_metrics(self) -> Dict[str, Dict[str, int]]:
+        """Return the counters of the metrics per host"""
+        cache = self.responses.cache
+        metrics = {}
+        for host in cache.get("metrics:hosts", []):
+            keys = {f"metrics:{host}:{metric}": metric for metric in CACHE_METRICS}
+            values = cache.get_many(keys)
+            metrics[host] = {metric: values.get(key, 0) for key, metric in keys.items()}
+        return metrics
+
+    def reset_metrics(self) -> None:
+        cache = self.responses.cache
+        hosts = cache.get("metrics:hosts", [])
+        cache.delete_many(
+            [f"metrics:{host}:{metric}" for host in hosts for metric in CACHE_METRICS]
+            + ["metrics:hosts"]
+        )
+
     def __str__(self):
         return self.__repr__()
 
@@ -97,6 +178,129 @@ class DjangoRequestsCache(requests_cache.BaseCache):
         return f"<{self.__class__.__name__}(name={self.cache_name})>"
 
 
+def get_outgoing_requests_cache() -> DjangoRequestsCache:
+    return DjangoRequestsCache(
+        cache_name=settings.OUTGOING_REQUESTS_CACHE_NAME,
+        stale_timeout=STALE_RESPONSE_TIMEOUT,
+    )
+
+
+def get_service_ttl(url: str) -> int:
+    """
+    Return the number of seconds the responses of the service of the URL are cached.
+    """
+    from zgw_consumers.models import Service
+
+    from openzaak.config.models import ServiceCacheConfig
+
+    service = Service.get_service(url)
+    if service is None:
+        return 0
+
+    try:
+        return service.cache_config.ttl
+    except ServiceCacheConfig.DoesNotExist:
+        return 0
+
+
+class OutgoingRequestsCacheMixin(CacheMixin):
+    """
+    Cache the responses of GET requests to external APIs.
+
+    Responses are cached for the duration configured for the service, unless the
+    ``Cache-Control`` header of the response specifies otherwise. Expired responses
+    with an ``ETag`` or ``Last-Modified`` header are revalidated with a conditional
+    request.
+
+    If a response is not cached, concurrent requests for the same URL wait for the
+    first request to complete instead of all making the request. While an expired
+    response is revalidated, the expired response is used by the other requests.
+
+    The expiration can be passed to the request with ``expire_after``, otherwise it
+    is looked up for the service.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("backend", get_outgoing_requests_cache())
+        kwargs.setdefault("cache_control", True)
+        # responses are only cached if a duration is configured or they can be
+        # revalidated
+        kwargs.setdefault("expire_after", DO_NOT_CACHE)
+        super().__init__(*args, **kwargs)
+
+        self._disabled = not settings.OUTGOING_REQUESTS_CACHE_ENABLED
+        self._state = local()
+
+    def request(self, method, url, *args, expire_after=None, **kwargs):
+        # ``CacheMixin`` sends the expiration as ``Cache-Control`` request header,
+        # which should not be sent to the external API
+        self._state.expire_after = expire_after
+        try:
+            return super(CacheMixin, self).request(method, url, *args, **kwargs)
+        finally:
+            self._state.expire_after = None
+
+    def send(self, request: requests.PreparedRequest, expire_after=None, **kwargs):
+        if self._disabled or request.method not in self.allowable_methods:
+            return super().send(request, expire_after=expire_after, **kwargs)
+
+        if expire_after is None:
+            expire_after = getattr(self._state, "expire_after", None)
+        if expire_after is None:
+            expire_after = get_service_ttl(request.url)
+
+        self._state.metric = None
+        response = super().send(request, expire_after=expire_after, **kwargs)
+
+        metric = self._state.metric
+        if metric is None:
+            metric = "hit" if getattr(response, "from_cache", False) else "miss"
+        self.cache.increment(urlparse(request.url).netloc, metric)
+        return response
+
+    def _send_and_cache(self, request, actions, cached_response=None, **kwargs):
+        # a response without expiration is only cached if it can be revalidated, so
+        # there is nothing to wait for
+        if actions.expire_after == DO_NOT_CACHE and cached_response is None:
+            return super()._send_and_cache(request, actions, cached_response, **kwargs)
+
+        timeout = settings.OUTGOING_REQUESTS_CACHE_LOCK_TIMEOUT
+        if not self.cache.acquire_lock(actions.cache_key, timeout):
+            response = cached_response or self._wait_for_response(
+                actions.cache_key, timeout
+            )
+            if response is not None:
+                self._state.metric = "waited"
+                return response
+            return super()._send_and_cache(request, actions, cached_response, **kwargs)
+
+        try:
+            return super()._send_and_cache(request, actions, cached_response, **kwargs)
+        finally:
+            self.cache.release_lock(actions.cache_key)
+
+    def _wait_for_response(self, key: str, timeout: int) -> Optional[CachedResponse]:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(LOCK_POLL_INTERVAL)
+            is_locked = self.cache.is_locked(key)
+
+            response = self.cache.get_response(key)
+            if response is not None and not response.is_expired:
+                return response
+            if not is_locked:
+                break
+        return None
+
+    def _update_revalidated_response(self, actions, response, cached_response):
+        self._state.metric = "revalidated"
+        return super()._update_revalidated_response(actions, response, cached_response)
+
+
+class OutgoingRequestsSession(OutgoingRequestsCacheMixin, requests.Session):
+    pass
+
+
 @contextmanager
 def requests_cache_enabled(cache_name, backend=None, *args, **kwargs):
     """
@@ -1,5 +1,8 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+from openzaak.components.autorisaties.caching import get_cache_key
+
+
 class ListFilterByAuthorizationsMixin:
     """
     Filter list-action data by the authorizations configured.
@@ -41,6 +44,17 @@ class ListFilterByAuthorizationsMixin:
         catalogus_authorizations = self.request.jwt_auth.get_catalogus_autorisaties(
             component
         )
+        # the resolved filters only depend on the applicaties, component and scope,
+        # which allows them to be shared between requests (and clients)
+        cache_key = get_cache_key(
+            "filter-plan",
+            sorted(app.pk for app in apps),
+            component,
+            scope_needed,
+        )
         return base.filter_for_authorizations(
-            scope_needed, authorizations, catalogus_authorizations
+            scope_needed,
+            authorizations,
+            catalogus_authorizations,
+            cache_key=cache_key,
         )
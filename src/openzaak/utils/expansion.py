@@ -1,15 +1,23 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2023 Dimpact
 import logging
-from typing import Dict, Iterator, List, Optional, Tuple, Type, Union
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Type, Union
 
+from django.core.exceptions import FieldDoesNotExist
 from django.db import models
+from django.db.models import prefetch_related_objects
+from django.db.models.fields.related_descriptors import (
+    ManyToManyDescriptor,
+    ReverseManyToOneDescriptor,
+    ReverseOneToOneDescriptor,
+)
 from django.utils.module_loading import import_string
 
+from django_loose_fk.fields import FkOrURLField
 from django_loose_fk.loaders import FetchError
 from django_loose_fk.virtual_models import ProxyMixin
-from djangorestframework_camel_case.render import CamelCaseJSONRenderer
-from rest_framework.serializers import BaseSerializer, Field, Serializer
+from rest_framework.serializers import BaseSerializer, Field, ListSerializer, Serializer
 from rest_framework_inclusions.core import InclusionLoader
 from rest_framework_inclusions.renderer import (
     InclusionJSONRenderer,
@@ -17,12 +25,20 @@ from rest_framework_inclusions.renderer import (
     should_skip_inclusions,
 )
 
+from openzaak.loaders import AuthorizedRequestsLoader
+from openzaak.utils.renderers import CamelCaseORJSONRenderer
 from openzaak.utils.serializer_fields import FKOrServiceUrlField
 
 logger = logging.getLogger(__name__)
 
 EXPAND_KEY = "_expand"
 
+REVERSE_RELATION_DESCRIPTORS = (
+    ReverseManyToOneDescriptor,
+    ManyToManyDescriptor,
+    ReverseOneToOneDescriptor,
+)
+
 
 class InclusionNode:
     """
@@ -43,6 +59,7 @@ class InclusionNode:
         self.many = many
         self.parent = parent
         self._children = []
+        self._child_ids = set()
 
         if self.parent:
             self.parent.add_child(self)
@@ -52,6 +69,7 @@ class InclusionNode:
 
     def add_child(self, node: "InclusionNode"):
         self._children.append(node)
+        self._child_ids.add(node.id)
 
     def display_children(self) -> dict:
         """
@@ -73,7 +91,7 @@ class InclusionNode:
         return data
 
     def has_child(self, id) -> bool:
-        return any(child.id == id for child in self._children)
+        return id in self._child_ids
 
 
 class InclusionTree:
@@ -82,32 +100,100 @@ class InclusionTree:
     It's a little helper class to display nested inclusions
     """
 
-    _nodes = []
+    def __init__(self):
+        self._root_nodes: List[InclusionNode] = []
+        # the same object can be included in multiple places, so multiple nodes can
+        # have the same id (URL)
+        self._nodes: Dict[str, List[InclusionNode]] = defaultdict(list)
 
     def add_node(
         self, id: str, value: dict, label: str, many: bool, parent_id: str = None
     ) -> None:
         if not parent_id:
             node = InclusionNode(id, value, label, many)
-            self._nodes.append(node)
+            self._root_nodes.append(node)
+            self._nodes[id].append(node)
             return
 
         parent_nodes = [
-            n for n in self._nodes if n.id == parent_id and not n.has_child(id)
+            n for n in self._nodes.get(parent_id, []) if not n.has_child(id)
         ]
         for parent_node in parent_nodes:
             node = InclusionNode(id, value, label, many, parent=parent_node)
-            self._nodes.append(node)
+            self._nodes[id].append(node)
 
     def display_tree(self) -> dict:
         result = {}
-        root_nodes = [n for n in self._nodes if n.parent is None]
-
-        for node in root_nodes:
+        for node in self._root_nodes:
             result[node.id] = node.display_children()
         return result
 
 
+def get_prefetch_lookup(model: Type[models.Model], field: Field) -> Optional[str]:
+    """
+    Determine the lookup to prefetch the relation a serializer field reads, if any.
+    """
+    source = field.source
+    if not source or source == "*" or "." in source:
+        return None
+
+    try:
+        model_field = model._meta.get_field(source)
+    except FieldDoesNotExist:
+        # reverse relations are accessed by their accessor name
+        descriptor = getattr(model, source, None)
+        if isinstance(descriptor, REVERSE_RELATION_DESCRIPTORS):
+            return source
+        return None
+
+    if isinstance(model_field, FkOrURLField):
+        return model_field.fk_field
+    if model_field.is_relation and not model_field.auto_created:
+        return source
+    return None
+
+
+def get_polymorphic_lookups(model: Type[models.Model], serializer) -> Set[str]:
+    """
+    Determine the lookups to prefetch the related objects a polymorphic serializer
+    reads for its discriminated fields.
+
+    The serializers in the mapping of the discriminator are declared for the
+    models holding the details, which relate one-to-one to the model.
+    """
+    discriminator = getattr(serializer, "discriminator", None)
+    if discriminator is None:
+        return set()
+
+    related_models = {
+        getattr(getattr(mapped, "Meta", None), "model", None)
+        for mapped in discriminator.mapping.values()
+    }
+    return {
+        relation.get_accessor_name()
+        for relation in model._meta.related_objects
+        if relation.one_to_one and relation.related_model in related_models
+    }
+
+
+def prefetch_related_fields(
+    instances: List[models.Model], fields, serializer: Optional[Serializer] = None
+) -> None:
+    """
+    Load the relations read by the serializer fields for all instances in bulk.
+    """
+    by_model = defaultdict(list)
+    for instance in instances:
+        if isinstance(instance, models.Model) and not isinstance(instance, ProxyMixin):
+            by_model[type(instance)].append(instance)
+
+    for model, model_instances in by_model.items():
+        lookups = {get_prefetch_lookup(model, field) for field in fields} - {None}
+        lookups |= get_polymorphic_lookups(model, serializer)
+        if lookups:
+            prefetch_related_objects(model_instances, *sorted(lookups))
+
+
 class ExpandLoader(InclusionLoader):
     """
     ExpandLoader is hugely inspired by 'InclusionLoader' from 'djangorestframework-inclusions'
@@ -122,6 +208,8 @@ class ExpandLoader(InclusionLoader):
         super().__init__(*args, **kwargs)
 
         self._seen_external: Dict[str, ProxyMixin] = {}
+        self._serialized: Dict[tuple, dict] = {}
+        self._urls: Dict[tuple, str] = {}
 
     def inclusions_dict(self, serializer: Serializer) -> dict:
         """
@@ -155,32 +243,140 @@ class ExpandLoader(InclusionLoader):
         )
         for instance in instances:
             tree.add_node(
-                id=instance.get_absolute_api_url(request=request),
+                id=self._get_url(instance, request),
                 label="",
                 value={},
                 many=False,
             )
 
+        # ⚡️ load the related objects of all instances in bulk first, the inclusions
+        # are then collected from the loaded relations
+        root_serializer = (
+            serializer.child if isinstance(serializer, ListSerializer) else serializer
+        )
+        self._prefetch_inclusions(
+            (),
+            root_serializer,
+            list(instances),
+            getattr(root_serializer, "inclusion_serializers", {}),
+        )
+
         entries = self._inclusions((), serializer, serializer.instance)
 
         for obj, inclusion_serializer, parent, path, many in entries:
-            data = (
-                obj._initial_data
-                if isinstance(obj, ProxyMixin)
-                else inclusion_serializer(instance=obj, context=serializer.context).data
-            )
+            data = self._serialize(obj, inclusion_serializer, serializer.context)
             tree.add_node(
                 id=data["url"],
                 value=data,
                 label=path[-1],
                 many=many,
-                parent_id=parent.get_absolute_api_url(request=request),
+                parent_id=self._get_url(parent, request),
             )
 
         result = tree.display_tree()
 
         return result
 
+    def _get_url(self, instance: models.Model, request) -> str:
+        if instance.pk is None:
+            return instance.get_absolute_api_url(request=request)
+
+        key = (instance._meta.label, instance.pk)
+        if key not in self._urls:
+            self._urls[key] = instance.get_absolute_api_url(request=request)
+        return self._urls[key]
+
+    def _serialize(
+        self, obj: models.Model, inclusion_serializer: Type[Serializer], context: dict
+    ) -> dict:
+        """
+        Serialize every distinct object only once.
+        """
+        if isinstance(obj, ProxyMixin):
+            return obj._initial_data
+
+        key = (inclusion_serializer, obj._meta.label, obj.pk)
+        if key not in self._serialized:
+            self._serialized[key] = inclusion_serializer(
+                instance=obj, context=context
+            ).data
+        return self._serialized[key]
+
+    def _prefetch_inclusions(
+        self,
+        path: Tuple[str, ...],
+        serializer: Serializer,
+        instances: List[models.Model],
+        inclusion_serializers: Dict[str, Union[str, Type[Serializer]]],
+    ) -> None:
+        """
+        Load the requested relations of all instances at once, one path at a time.
+
+        The related objects found are processed together for the nested inclusions,
+        and the relations their inclusion serializer needs are loaded in bulk as
+        well.
+        """
+        for name, field in serializer.fields.items():
+            new_path = path + (name,)
+            if isinstance(field, BaseSerializer):
+                continue
+            if self.allowed_paths is not None and new_path not in self.allowed_paths:
+                continue
+
+            inclusion_serializer = inclusion_serializers.get(".".join(new_path))
+            if inclusion_serializer is None:
+                continue
+            if isinstance(inclusion_serializer, str):
+                inclusion_serializer = import_string(inclusion_serializer)
+
+            prefetch_related_fields(instances, [field])
+            if isinstance(field, FKOrServiceUrlField):
+                self._prefetch_external(field, instances)
+
+            related = {}
+            for instance in instances:
+                if instance is None:
+                    continue
+                for obj in self._some_related_field_inclusions(
+                    new_path, field, instance, inclusion_serializer
+                ):
+                    # the same object can be related to multiple instances, while
+                    # objects loaded by different queries are distinct instances
+                    related.setdefault(id(obj), obj)
+
+            related_objects = list(related.values())
+            nested_serializer = inclusion_serializer(instance=object)
+            prefetch_related_fields(
+                related_objects, nested_serializer.fields.values(), nested_serializer
+            )
+
+            self._prefetch_inclusions(
+                new_path, nested_serializer, related_objects, inclusion_serializers
+            )
+
+    def _prefetch_external(
+        self, field: FKOrServiceUrlField, instances: List[models.Model]
+    ) -> None:
+        """
+        Fetch the external objects the instances refer to concurrently.
+
+        The loader keeps the fetched objects for the duration of the request, so
+        resolving the objects one by one afterwards does not make any requests.
+        """
+        urls = set()
+        for instance in instances:
+            if instance is None:
+                continue
+            try:
+                value = field.get_attribute(instance)
+            except FetchError:
+                continue
+            if isinstance(value, str) and value not in self._seen_external:
+                urls.add(value)
+
+        if urls:
+            AuthorizedRequestsLoader.fetch_objects(sorted(urls))
+
     def _instance_inclusions(
         self,
         path: Tuple[str, ...],
@@ -316,7 +512,7 @@ class ExpandLoader(InclusionLoader):
         return super()._sub_serializer_inclusions(path, field, instance)
 
 
-class ExpandJSONRenderer(InclusionJSONRenderer, CamelCaseJSONRenderer):
+class ExpandJSONRenderer(InclusionJSONRenderer, CamelCaseORJSONRenderer):
     """
     Ensure that the InclusionJSONRenderer produces camelCase and properly loads loose fk
     objects
@@ -324,6 +520,15 @@ class ExpandJSONRenderer(InclusionJSONRenderer, CamelCaseJSONRenderer):
 
     loader_class = ExpandLoader
 
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        view = (renderer_context or {}).get("view")
+        if view is not None and not getattr(view, "include_allowed", lambda: True)():
+            # ⚡️ the inclusions are not rendered for this action, so don't load them
+            return CamelCaseORJSONRenderer.render(
+                self, data, accepted_media_type, renderer_context
+            )
+        return super().render(data, accepted_media_type, renderer_context)
+
     def _render_inclusions(self, data, renderer_context):
         renderer_context = renderer_context or {}
         response = renderer_context.get("response")
@@ -363,9 +568,9 @@ class ExpandJSONRenderer(InclusionJSONRenderer, CamelCaseJSONRenderer):
                 return None
 
         request = renderer_context.get("request")
-
-        inclusion_loader = self.loader_class(get_allowed_paths(request, view=view))
-        inclusions = inclusion_loader.inclusions_dict(serializer)
+        inclusions = self._get_inclusions(
+            serializer, serializer_data, get_allowed_paths(request, view=view)
+        )
 
         if isinstance(serializer_data, list):
             for record in serializer_data:
@@ -378,6 +583,17 @@ class ExpandJSONRenderer(InclusionJSONRenderer, CamelCaseJSONRenderer):
 
         return render_data
 
+    def _get_inclusions(self, serializer, serializer_data, allowed_paths) -> dict:
+        # ⚡️ nothing is expanded, so the inclusions don't have to be loaded. The
+        # loader gives the records of a list an empty expansion
+        if allowed_paths == set():
+            if isinstance(serializer_data, list):
+                return {record["url"]: {} for record in serializer_data}
+            return {}
+
+        inclusion_loader = self.loader_class(allowed_paths)
+        return inclusion_loader.inclusions_dict(serializer)
+
 
 def get_expand_options_for_serializer(
     serializer_class: Type[Serializer],
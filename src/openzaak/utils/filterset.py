@@ -2,7 +2,8 @@
 # Copyright (C) 2023 Dimpact
 import logging
 
-from django.db.models import QuerySet
+from django.conf import settings
+from django.db.models import Exists, OuterRef, QuerySet
 
 from django_filters import OrderingFilter as _OrderingFilter, constants
 from vng_api_common.filtersets import FilterSet as _FilterSet
@@ -30,13 +31,25 @@ class OrderingFilter(_OrderingFilter):
             return qs
 
         ordering = [self.get_ordering_value(param) for param in value]
-        return qs.order_by(*ordering).distinct()
+        if qs.query.distinct_fields and not settings.CMIS_ENABLED:
+            # ``DISTINCT ON`` requires the distinct fields to lead the ordering, so
+            # the rows are selected in a subquery and the outer query is ordered
+            outer = qs.all()
+            outer.query.distinct = False
+            outer.query.distinct_fields = ()
+            qs = outer.filter(pk__in=qs.values("pk"))
+        return qs.order_by(*ordering)
 
 
 class FilterGroup:
     """
     The work here is largely cherry-picked from this unmerged django-filters PR:
     https://github.com/carltongibson/django-filter/pull/1167/files
+
+    The filters of a group typically span a multi-valued relationship. Instead of
+    joining the related rows into the main query (which produces duplicates and
+    requires a ``DISTINCT``), the grouped filters are applied in a correlated
+    ``EXISTS`` subquery.
     """
 
     def __init__(self, filter_names):
@@ -73,7 +86,10 @@ class FilterGroup:
         if not data:
             return qs
 
-        return self.apply_filters(qs, data)
+        # ⚡️ the joins required by the filters only live in the subquery, so the
+        # outer query doesn't produce duplicate rows
+        subquery = self.apply_filters(qs.model._base_manager.all(), data)
+        return qs.filter(Exists(subquery.filter(pk=OuterRef("pk"))))
 
     def apply_filters(self, qs, data):
         """
@@ -1,17 +1,20 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 from django.conf import settings
+from django.utils.functional import cached_property
 
-from dictdiffer import diff
 from drc_cmis import client_builder
 from drc_cmis.connections import use_cmis_connection_pool
-from vng_api_common.audittrails.models import AuditTrail
 from vng_api_common.models import APIMixin as _APIMixin
 
+from openzaak.audittrails.archive import get_archived_audittrails
+from openzaak.audittrails.deltas import diff_snapshots, resolve_snapshots
+from openzaak.audittrails.utils import get_audittrails, parse_hoofd_object
 from openzaak.utils.decorators import convert_cmis_adapter_exceptions
 
 from .exceptions import CMISNotSupportedException
 from .expansion import ExpandJSONRenderer
+from .url_templates import reverse
 
 
 def format_dict_diff(changes):
@@ -26,17 +29,22 @@ def format_dict_diff(changes):
 
 
 class AuditTrailMixin:
-    @property
+    # ⚡️ the history template uses the audit trail several times
+    @cached_property
     def audittrail(self):
-        qs = AuditTrail.objects.filter(
-            hoofd_object__contains=self.get_absolute_api_url(version=1)
-        ).order_by("-aanmaakdatum")
-        res = []
-        for audit in qs:
-            oud = audit.oud or {}
-            nieuw = audit.nieuw or {}
+        url = self.get_absolute_api_url(version=1)
+        audittrails = list(get_audittrails(url).order_by("-aanmaakdatum"))
+        resolve_snapshots(audittrails)
+        if parsed := parse_hoofd_object(url):
+            resource, uuid = parsed
+            archived = get_archived_audittrails(uuid, resource=resource)
+            audittrails += sorted(
+                archived, key=lambda audit: audit.aanmaakdatum, reverse=True
+            )
 
-            changes = format_dict_diff(list(diff(oud, nieuw)))
+        res = []
+        for audit in audittrails:
+            changes = format_dict_diff(diff_snapshots(audit))
             res.append((audit, changes))
         return res
 
@@ -85,8 +93,11 @@ class CMISConnectionPoolMixin:
 
 class APIMixin(_APIMixin):
     def get_absolute_api_url(self, request=None, **kwargs) -> str:
-        kwargs["version"] = "1"
-        return super().get_absolute_api_url(request=request, **kwargs)
+        reverse_kwargs = {"uuid": self.uuid, **kwargs, "version": "1"}
+        # ⚡️ build the URL from a template instead of reversing it for every object
+        return reverse(
+            f"{self._meta.model_name}-detail", kwargs=reverse_kwargs, request=request
+        )
 
 
 class ExpandMixin:
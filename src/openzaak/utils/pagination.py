@@ -1,13 +1,31 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2023 Dimpact
+import binascii
+import datetime
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from collections import OrderedDict
+from typing import List, Optional, Tuple
 
 from django.conf import settings
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    FieldError,
+    ImproperlyConfigured,
+    ValidationError as DjangoValidationError,
+)
 from django.core.paginator import Paginator as DjangoPaginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.expressions import F, OrderBy
 from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
 
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination, _positive_int
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from vng_api_common.pagination import DynamicPageSizeMixin
 
 from .help_text import mark_experimental
@@ -75,3 +93,339 @@ class FuzzyPagination(DynamicPageSizeMixin, PageNumberPagination):
 
 
 OptimizedPagination = FuzzyPagination if settings.FUZZY_PAGINATION else ExactPagination
+
+
+class CMISPaginator(DjangoPaginator):
+    def _get_page(self, object_list, *args, **kwargs):
+        page = super()._get_page(object_list, *args, **kwargs)
+        # the page replaces the queryset with the list of its results when accessed
+        page.queryset = object_list
+        return page
+
+
+class CMISPagination(DynamicPageSizeMixin, PageNumberPagination):
+    """
+    Paginate CMIS querysets, which slice and count the results in the DMS.
+
+    The offset of the next page in the CMIS results is carried in the ``skipCount``
+    query parameter of the next link, so the DMS doesn't have to walk through the
+    results of all preceding pages again for every page.
+    """
+
+    django_paginator_class = CMISPaginator
+    skip_count_query_param = "skipCount"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        skip_count = self.get_skip_count(request)
+        if skip_count is not None and hasattr(queryset, "skip_to"):
+            queryset = queryset.skip_to(skip_count)
+        return super().paginate_queryset(queryset, request, view=view)
+
+    def get_skip_count(self, request) -> Optional[int]:
+        try:
+            return _positive_int(request.query_params[self.skip_count_query_param])
+        except (KeyError, ValueError):
+            return None
+
+    def get_next_link(self):
+        url = super().get_next_link()
+        if url is None:
+            return None
+
+        skip_count = getattr(self.page.queryset, "_cmis_next_skip_count", None)
+        if skip_count is None:
+            return remove_query_param(url, self.skip_count_query_param)
+        return replace_query_param(url, self.skip_count_query_param, skip_count)
+
+    def get_previous_link(self):
+        url = super().get_previous_link()
+        if url is None:
+            return None
+        return remove_query_param(url, self.skip_count_query_param)
+
+
+class CursorJSONEncoder(DjangoJSONEncoder):
+    """
+    Encode datetimes and times at full precision.
+
+    :class:`DjangoJSONEncoder` truncates them to milliseconds, so the position of
+    the cursor would fall between the items of the same millisecond.
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+def get_ordering(queryset: models.QuerySet) -> List[Tuple[str, bool]]:
+    """
+    Return the ``(field, descending)`` pairs of the effective ordering of the query.
+
+    :raises ImproperlyConfigured: for orderings that can't be used as keyset, such
+      as expressions other than fields.
+    """
+    query = queryset.query
+    if query.order_by:
+        orderings = query.order_by
+    elif query.default_ordering:
+        orderings = query.get_meta().ordering
+    else:
+        orderings = ()
+
+    result = []
+    for ordering in orderings:
+        if isinstance(ordering, str):
+            if ordering == "?":
+                raise ImproperlyConfigured("Random ordering can't be used as cursor")
+            result.append((ordering.lstrip("-"), ordering.startswith("-")))
+            continue
+
+        if isinstance(ordering, F):
+            ordering = ordering.asc()
+        if (
+            isinstance(ordering, OrderBy)
+            and isinstance(ordering.expression, F)
+            and not ordering.nulls_first
+            and not ordering.nulls_last
+        ):
+            result.append((ordering.expression.name, ordering.descending))
+            continue
+
+        raise ImproperlyConfigured(
+            f"The ordering {ordering!r} can't be used as cursor, only fields are "
+            "supported"
+        )
+
+    if not query.standard_ordering:  # ``QuerySet.reverse()``
+        result = [(name, not descending) for name, descending in result]
+    return result
+
+
+class CursorPaginationMixin:
+    """
+    Opt-in keyset (cursor) pagination on top of page number pagination.
+
+    Cursor pagination is used if the ``cursor`` query parameter is present (an empty
+    value requests the first page), or by default if ``CURSOR_PAGINATION`` is enabled
+    and no ``page`` is requested. The cursor is an opaque encoding of the ordering
+    values of the last item on the page, so every page is retrieved with an index
+    range scan instead of an ``OFFSET``, and no ``COUNT`` query is done at all.
+
+    Cursors only point forward, which is sufficient to walk through a complete
+    result set.
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = _("Invalid cursor")
+    # endpoints that are not paginated by default must never switch implicitly
+    cursor_by_default = True
+
+    def use_cursor(self, request) -> bool:
+        if self.cursor_query_param in request.query_params:
+            return True
+        return (
+            self.cursor_by_default
+            and settings.CURSOR_PAGINATION
+            and self.page_query_param not in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode = self.use_cursor(request)
+        if not self.cursor_mode:
+            return super().paginate_queryset(queryset, request, view=view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not queryset.ordered:
+            queryset = queryset.order_by("pk")
+        keyset = self.get_keyset(queryset)
+        if not queryset.query.distinct_fields:
+            if not queryset.query.standard_ordering:
+                # the keyset already has the reversed ordering
+                queryset = queryset.reverse()
+            # the tie breaker has to be part of the SQL ordering as well
+            queryset = queryset.order_by(
+                *[f"-{name}" if descending else name for name, descending in keyset]
+            )
+
+        position = self.decode_cursor(request, self.get_keyset_fields(queryset, keyset))
+        if position is not None:
+            queryset = queryset.filter(self.get_keyset_filter(keyset, position))
+
+        # fetch one extra item to determine if there's a next page
+        results = list(queryset[: page_size + 1])
+        self.page = results[:page_size]
+        self.next_position = (
+            self.get_position(self.page[-1], keyset)
+            if len(results) > page_size
+            else None
+        )
+        return self.page
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_response(data)
+
+        return Response(
+            OrderedDict([("next", self.get_next_cursor_link()), ("results", data)])
+        )
+
+    def get_keyset(self, queryset: models.QuerySet) -> List[Tuple[str, bool]]:
+        """
+        Determine the ``(field, descending)`` pairs uniquely identifying the position.
+
+        For ``DISTINCT ON`` queries the distinct fields are unique by definition,
+        otherwise the primary key is added as tie breaker.
+        """
+        distinct_fields = queryset.query.distinct_fields
+        keyset = []
+        for name, descending in get_ordering(queryset):
+            if distinct_fields and name not in distinct_fields:
+                continue
+            keyset.append((name, descending))
+
+        if not distinct_fields and not any(name == "pk" for name, _ in keyset):
+            descending = keyset[-1][1] if keyset else False
+            keyset.append(("pk", descending))
+        return keyset
+
+    @staticmethod
+    def get_keyset_filter(keyset: List[Tuple[str, bool]], position: list) -> models.Q:
+        """
+        Build the lexicographic "comes after" condition for the position.
+
+        Postgres sorts ``NULL`` values last in ascending and first in descending
+        order, which is taken into account for nullable fields.
+        """
+        condition = models.Q(pk__in=[])
+        preceding_equal = models.Q()
+        for (name, descending), value in zip(keyset, position):
+            if value is None:
+                after = models.Q(**{f"{name}__isnull": False}) if descending else None
+                equal = models.Q(**{f"{name}__isnull": True})
+            else:
+                lookup = "lt" if descending else "gt"
+                after = models.Q(**{f"{name}__{lookup}": value})
+                if not descending:
+                    after |= models.Q(**{f"{name}__isnull": True})
+                equal = models.Q(**{name: value})
+
+            if after is not None:
+                condition |= preceding_equal & after
+            preceding_equal &= equal
+        return condition
+
+    @staticmethod
+    def get_position(instance: models.Model, keyset: List[Tuple[str, bool]]) -> list:
+        position = []
+        for name, _descending in keyset:
+            *relations, field_name = name.split(LOOKUP_SEP)
+            obj = instance
+            for relation in relations:
+                obj = getattr(obj, relation) if obj is not None else None
+            if obj is None:
+                position.append(None)
+                continue
+
+            if field_name == "pk":
+                position.append(obj.pk)
+                continue
+            try:
+                attname = obj._meta.get_field(field_name).attname
+            except FieldDoesNotExist:  # annotations
+                attname = field_name
+            position.append(getattr(obj, attname))
+        return position
+
+    @staticmethod
+    def get_keyset_fields(
+        queryset: models.QuerySet, keyset: List[Tuple[str, bool]]
+    ) -> List[Optional[models.Field]]:
+        """
+        Return the model (or annotation output) fields of the keyset, if any.
+        """
+        fields = []
+        for name, _descending in keyset:
+            if name in queryset.query.annotations:
+                try:
+                    field = queryset.query.annotations[name].output_field
+                except FieldError:
+                    field = None
+                fields.append(field)
+                continue
+
+            *relations, field_name = name.split(LOOKUP_SEP)
+            model = queryset.model
+            try:
+                for relation in relations:
+                    model = model._meta.get_field(relation).related_model
+                field = (
+                    model._meta.pk
+                    if field_name == "pk"
+                    else model._meta.get_field(field_name)
+                )
+            except (AttributeError, FieldDoesNotExist):
+                field = None
+            fields.append(field if hasattr(field, "to_python") else None)
+        return fields
+
+    def decode_cursor(
+        self, request, fields: List[Optional[models.Field]]
+    ) -> Optional[list]:
+        """
+        Decode the position of the cursor, converted to the types of the keyset.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            position = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+        except (binascii.Error, UnicodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(position, list) or len(position) != len(fields):
+            raise NotFound(self.invalid_cursor_message)
+
+        try:
+            return [
+                field.to_python(value) if field is not None else value
+                for field, value in zip(fields, position)
+            ]
+        except (DjangoValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_cursor_link(self) -> Optional[str]:
+        if self.next_position is None:
+            return None
+
+        encoded = urlsafe_b64encode(
+            json.dumps(self.next_position, cls=CursorJSONEncoder).encode("ascii")
+        ).decode("ascii")
+        url = remove_query_param(
+            self.request.build_absolute_uri(), self.page_query_param
+        )
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+
+class CursorPagination(CursorPaginationMixin, OptimizedPagination):
+    pass
+
+
+class OptionalCursorPagination(
+    CursorPaginationMixin, DynamicPageSizeMixin, PageNumberPagination
+):
+    """
+    Cursor pagination for endpoints that return unpaginated lists by default.
+    """
+
+    cursor_by_default = False
+    # the endpoints remain documented as unpaginated lists
+    in_schema = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.use_cursor(request):
+            self.cursor_mode = False
+            return None
+        return super().paginate_queryset(queryset, request, view=view)
@@ -2,18 +2,21 @@
 # Copyright (C) 2019 - 2020 Dimpact
 import logging
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 from urllib.parse import urlparse
 
 from django.conf import settings
 from django.core.exceptions import (
+    FieldDoesNotExist,
     ImproperlyConfigured,
     ValidationError as DjangoValidationError,
 )
-from django.db.models import ObjectDoesNotExist
+from django.db.models import Model, ObjectDoesNotExist
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
 
+from django_loose_fk.fields import FkOrURLField
+from django_loose_fk.virtual_models import ProxyMixin
 from rest_framework import exceptions, permissions
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.request import Request
@@ -25,6 +28,49 @@ from openzaak.utils.decorators import convert_cmis_adapter_exceptions
 
 logger = logging.getLogger(__name__)
 
+PERMISSION_DATA_CACHE_ATTR = "_permission_data"
+
+
+def _get_permission_value(obj: Model, name: str, request: Request) -> Any:
+    field = obj._meta.get_field(name)
+    if not isinstance(field, FkOrURLField):
+        return getattr(obj, field.attname)
+
+    # serialize the loose FK like the API does, without loading remote objects
+    if getattr(obj, f"{field.fk_field}_id") is None:
+        return getattr(obj, field.url_field) or None
+    return getattr(obj, field.fk_field).get_absolute_api_url(request=request)
+
+
+def get_permission_data(
+    obj: Model, fields: Iterable[str], request: Request
+) -> Dict[str, Any]:
+    """
+    Read the values of the permission fields of the main object ``obj``.
+
+    ⚡️ The values are read from the model fields, rather than from the serialized
+    main object, which would resolve all its nested resources. The result is cached
+    for the rest of the request, so it reflects the main object as it was before
+    the request changed anything.
+
+    :raises FieldDoesNotExist: if one of the fields is not a model field.
+    """
+    fields = tuple(fields)
+    cache = getattr(request, PERMISSION_DATA_CACHE_ATTR, None)
+    if cache is None:
+        cache = {}
+        setattr(request, PERMISSION_DATA_CACHE_ATTR, cache)
+
+    # objects that don't come from the database (CMIS) can't be cached
+    key = (obj._meta.label, obj.pk, fields) if obj.pk is not None else None
+    if key in cache:
+        return cache[key]
+
+    data = {name: _get_permission_value(obj, name, request) for name in fields}
+    if key is not None:
+        cache[key] = data
+    return data
+
 
 class AuthRequired(permissions.BasePermission):
     """
@@ -44,6 +90,13 @@ class AuthRequired(permissions.BasePermission):
         return {field: data.get(field) for field in self.permission_fields}
 
     def format_data(self, obj, request) -> dict:
+        # remote objects only have their API representation
+        if not isinstance(obj, ProxyMixin):
+            try:
+                return get_permission_data(obj, self.permission_fields, request)
+            except FieldDoesNotExist:
+                pass
+
         main_resource = self.get_main_resource()
         serializer_class = main_resource.serializer_class
         serializer = serializer_class(obj, context={"request": request})
@@ -1,15 +1,19 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Set
 from urllib.parse import urlparse
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db import models
 from django.db.models import Case, IntegerField, Q, Value, When
 from django.http.request import validate_host
+from django.urls import get_resolver, get_script_prefix
 
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.scopes import Scope
-from vng_api_common.utils import get_resources_for_paths
+from vng_api_common.utils import get_resources_for_paths, resolve_path
 
 
 class QueryBlocked(Exception):
@@ -39,6 +43,53 @@ class BlockChangeMixin:
     delete.queryset_only = True
 
 
+def get_pks_for_paths(paths: Set[str]) -> Dict[str, int]:
+    """
+    Map the UUIDs of the (detail) paths to the primary keys of their objects.
+
+    Unlike :func:`vng_api_common.utils.get_resources_for_paths`, paths of objects
+    that don't exist are left out instead of raising an error.
+    """
+    if not paths:
+        return {}
+
+    resolver = get_resolver()
+    prefix = get_script_prefix()
+    values = set()
+    for path in paths:
+        match = resolve_path(path, resolver=resolver, script_prefix=prefix)
+        viewset_cls = match.func.cls
+        lookup_field = viewset_cls.lookup_field
+        values.add(match.kwargs[viewset_cls.lookup_url_kwarg or lookup_field])
+
+    # all paths point to the same resource, like with ``get_resources_for_paths``
+    queryset = viewset_cls().get_queryset().select_related(None)
+    return {
+        str(value): pk
+        for value, pk in queryset.filter(**{f"{lookup_field}__in": values}).values_list(
+            lookup_field, "pk"
+        )
+    }
+
+
+@dataclass
+class AuthorizationsFilterPlan:
+    """
+    Authorizations compiled into the allowed loose-fk values, grouped by the maximum
+    vertrouwelijkheidaanduiding order.
+
+    The ``None`` key is used when the confidentiality level does not apply. Plans
+    only contain primitive values so they can be stored in the Django cache.
+    """
+
+    local: Dict[Optional[int], Set[int]] = field(default_factory=dict)
+    external: Dict[Optional[int], Set[str]] = field(default_factory=dict)
+
+    def add(self, va_order: Optional[int], value, local=True) -> None:
+        target = self.local if local else self.external
+        target.setdefault(va_order, set()).add(value)
+
+
 class LooseFkAuthorizationsFilterMixin:
     auth_fields = []
     loose_fk_field = None
@@ -51,19 +102,7 @@ class LooseFkAuthorizationsFilterMixin:
             "" if not self.authorizations_lookup else f"{self.authorizations_lookup}__"
         )
 
-    def build_queryset(self, local_filters, external_filters) -> models.QuerySet:
-        if not self.vertrouwelijkheidaanduiding_use:
-            del local_filters["_va_order__lte"]
-            del external_filters["_va_order__lte"]
-
-        _local_filters = Q()
-        for k, v in local_filters.items():
-            _local_filters &= Q(**{k: v})
-
-        _external_filters = Q()
-        for k, v in external_filters.items():
-            _external_filters &= Q(**{k: v})
-
+    def build_queryset(self, filters: Q) -> models.QuerySet:
         if self.vertrouwelijkheidaanduiding_use:
             # annotate the queryset so we can map a string value to a logical number
             order_case = VertrouwelijkheidsAanduiding.get_order_expression(
@@ -71,14 +110,144 @@ class LooseFkAuthorizationsFilterMixin:
             )
             annotations = {"_va_order": order_case}
             # bring it all together now to build the resulting queryset
-            queryset = self.annotate(**annotations).filter(
-                _local_filters | _external_filters
-            )
+            queryset = self.annotate(**annotations).filter(filters)
 
         else:
-            queryset = self.filter(_local_filters | _external_filters)
+            queryset = self.filter(filters)
         return queryset
 
+    def compile_filter_plan(
+        self,
+        scope: Scope,
+        authorizations: models.QuerySet,
+        catalogus_authorizations: Optional[models.QuerySet] = None,
+    ) -> AuthorizationsFilterPlan:
+        """
+        Resolve the authorizations to the allowed loose-fk values.
+
+        Local types are resolved to their primary keys with a single query, external
+        types are kept as URLs. If a type is allowed by multiple authorizations, the
+        most permissive maximum vertrouwelijkheidaanduiding wins.
+        """
+        authorizations_local, authorizations_external = self.get_authorizations(
+            scope, authorizations
+        )
+
+        # the loose-fk objects are only needed for their PK, and are identified by the
+        # UUID at the end of the resource URL
+        paths = {
+            urlparse(getattr(auth, self.loose_fk_field)).path
+            for auth in authorizations_local
+        }
+        pks_by_uuid = get_pks_for_paths(paths)
+
+        # collect the highest allowed order per loose-fk value first, so every value
+        # ends up in exactly one group
+        local_orders: Dict[int, Optional[int]] = {}
+        external_orders: Dict[str, Optional[int]] = {}
+
+        def _register(orders: dict, value, max_vertrouwelijkheidaanduiding: str):
+            if not self.vertrouwelijkheidaanduiding_use:
+                orders[value] = None
+                return
+
+            # without maximum confidentiality level nothing is visible
+            if not max_vertrouwelijkheidaanduiding:
+                return
+
+            order = VertrouwelijkheidsAanduiding.get_choice_order(
+                max_vertrouwelijkheidaanduiding
+            )
+            orders[value] = max(order, orders.get(value, order))
+
+        for authorization in authorizations_local:
+            path = urlparse(getattr(authorization, self.loose_fk_field)).path
+            pk = pks_by_uuid.get(path.rstrip("/").rsplit("/", 1)[-1])
+            # like an unknown external URL, a type that doesn't exist (anymore)
+            # doesn't match anything
+            if pk is None:
+                continue
+            _register(local_orders, pk, authorization.max_vertrouwelijkheidaanduiding)
+
+        for authorization in authorizations_external:
+            _register(
+                external_orders,
+                getattr(authorization, self.loose_fk_field),
+                authorization.max_vertrouwelijkheidaanduiding,
+            )
+
+        for catalogus_authorization in catalogus_authorizations or []:
+            resources = getattr(
+                catalogus_authorization.catalogus, f"{self.loose_fk_field}_set"
+            ).all()
+            for instance in resources:
+                _register(
+                    local_orders,
+                    instance.pk,
+                    catalogus_authorization.max_vertrouwelijkheidaanduiding,
+                )
+
+        plan = AuthorizationsFilterPlan()
+        for pk, order in local_orders.items():
+            plan.add(order, pk)
+        for url, order in external_orders.items():
+            plan.add(order, url, local=False)
+        return plan
+
+    def get_filter_plan(
+        self,
+        scope: Scope,
+        authorizations: models.QuerySet,
+        catalogus_authorizations: Optional[models.QuerySet] = None,
+        cache_key: str = "",
+    ) -> AuthorizationsFilterPlan:
+        """
+        Return the (cached) compiled filter plan for the authorizations.
+
+        :param cache_key: a key identifying the set of authorizations, see
+          :func:`openzaak.components.autorisaties.caching.get_cache_key`. If empty,
+          the plan is compiled without caching.
+        """
+        if not cache_key:
+            return self.compile_filter_plan(
+                scope, authorizations, catalogus_authorizations
+            )
+
+        # the plan depends on the loose-fk field, which differs between the components
+        cache_key = f"{cache_key}:{self.loose_fk_field}"
+        plan = cache.get(cache_key)
+        if plan is None:
+            plan = self.compile_filter_plan(
+                scope, authorizations, catalogus_authorizations
+            )
+            cache.set(cache_key, plan, timeout=settings.AUTORISATIES_CACHE_TIMEOUT)
+        return plan
+
+    def get_plan_filters(self, plan: AuthorizationsFilterPlan) -> Q:
+        """
+        Express the filter plan as a compact predicate.
+
+        Each confidentiality level results in a single ``IN`` clause for the loose-fk
+        values, combined with a condition on the (annotated) ``_va_order``.
+        """
+        prefix = self.prefix
+        groups = [
+            (f"{prefix}_{self.loose_fk_field}__in", plan.local),
+            (f"{prefix}_{self.loose_fk_field}_url__in", plan.external),
+        ]
+
+        # an empty Q would match everything - make sure nothing matches instead
+        filters = Q(pk__in=[])
+        for lookup, values_by_order in groups:
+            for order, values in sorted(
+                values_by_order.items(), key=lambda item: item[0] or 0
+            ):
+                condition = Q(**{lookup: sorted(values)})
+                if order is not None:
+                    condition &= Q(_va_order__lte=order)
+                filters |= condition
+        return filters
+
     def get_filters(
         self, scope, authorizations, catalogus_authorizations=None, local=True
     ) -> dict:
@@ -190,19 +359,12 @@ class LooseFkAuthorizationsFilterMixin:
         scope: Scope,
         authorizations: models.QuerySet,
         catalogus_authorizations: models.QuerySet,
+        cache_key: str = "",
     ) -> models.QuerySet:
 
         # todo implement error if no loose-fk field
 
-        authorizations_local, authorizations_external = self.get_authorizations(
-            scope, authorizations
-        )
-
-        local_filters = self.get_filters(
-            scope,
-            authorizations_local,
-            catalogus_authorizations=catalogus_authorizations,
-            local=True,
+        plan = self.get_filter_plan(
+            scope, authorizations, catalogus_authorizations, cache_key=cache_key
         )
-        external_filters = self.get_filters(scope, authorizations_external, local=False)
-        return self.build_queryset(local_filters, external_filters)
+        return self.build_queryset(self.get_plan_filters(plan))
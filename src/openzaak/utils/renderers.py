@@ -1,8 +1,165 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2021 Dimpact
+import re
+from typing import Dict, Optional, Set
+
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+
+import orjson
+from djangorestframework_camel_case import util
 from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from rest_framework.serializers import BaseSerializer
 from vng_api_common.views import ERROR_CONTENT_TYPE
 
+# the camelCase keys of the serializer fields, filled when a serializer is rendered
+# for the first time
+CAMELIZED_KEYS: Dict[str, str] = {}
+_seen_serializers: Set[type] = set()
+
+JSON_TYPES = (str, int, float, bool, type(None))
+PLAIN_TYPES = {str, int, bool, type(None)}
+
 
 class ProblemJSONRenderer(CamelCaseJSONRenderer):
     media_type = ERROR_CONTENT_TYPE
+
+
+class _NotSupported(Exception):
+    """
+    The data can't be rendered identically by the fast path.
+    """
+
+
+def _camelize(key: str) -> str:
+    # the regex is looked up at runtime, since it's monkeypatched in
+    # :func:`openzaak.setup.monkeypatch_drf_camel_case`
+    return re.sub(util.camelize_re, util.underscore_to_camel, key)
+
+
+def camelize_key(key: str) -> str:
+    if key in CAMELIZED_KEYS:
+        return CAMELIZED_KEYS[key]
+    if "_" not in key:
+        return key
+    # keys that are not serializer fields (like the keys in JSON fields) are not
+    # cached, so the map can't keep growing
+    return _camelize(key)
+
+
+def add_serializer_keys(serializer: Optional[BaseSerializer]) -> None:
+    """
+    Add the keys of the fields of the serializer and its nested serializers.
+    """
+    serializer = getattr(serializer, "child", serializer)
+    if not isinstance(serializer, BaseSerializer) or not hasattr(serializer, "fields"):
+        return
+    if type(serializer) in _seen_serializers:
+        return
+    _seen_serializers.add(type(serializer))
+
+    for name, field in serializer.fields.items():
+        if "_" in name and name not in CAMELIZED_KEYS:
+            CAMELIZED_KEYS[name] = _camelize(name)
+        add_serializer_keys(field)
+
+
+def _get_serializer(data) -> Optional[BaseSerializer]:
+    serializer = getattr(data, "serializer", None)
+    if serializer is None and isinstance(data, dict):
+        serializer = getattr(data.get("results"), "serializer", None)
+    return serializer
+
+
+def _is_plain_float(value: float) -> bool:
+    """
+    Return whether orjson formats the float like ``repr``.
+    """
+    representation = float.__repr__(value)
+    return "e" not in representation and "n" not in representation
+
+
+class CamelCaseORJSONRenderer(CamelCaseJSONRenderer):
+    """
+    Render camelCase JSON with orjson.
+
+    The output is identical to the output of :class:`CamelCaseJSONRenderer`. The keys
+    are converted with a map of the keys of the serializer fields, and the data is
+    encoded with orjson. Data that orjson would encode differently (like floats in
+    exponent notation or integers beyond 64 bits) is rendered by
+    :class:`CamelCaseJSONRenderer`.
+    """
+
+    def _can_render_fast(self, accepted_media_type, renderer_context) -> bool:
+        if self.json_underscoreize.get("ignore_fields") or self.json_underscoreize.get(
+            "ignore_keys"
+        ):
+            return False
+        if self.json_underscoreize.get("no_underscore_before_number"):
+            return False
+        if not self.compact or self.ensure_ascii:
+            return False
+        return self.get_indent(accepted_media_type, renderer_context) is None
+
+    def _prepare(self, data, camelize: bool = True):
+        """
+        Convert the data into the types that orjson encodes like the ``json`` module.
+        """
+        # ⚡️ check the most common types first
+        if type(data) in PLAIN_TYPES:
+            return data
+
+        if isinstance(data, Promise):
+            data = force_str(data)
+
+        if isinstance(data, dict):
+            prepared = {}
+            for key, value in data.items():
+                if isinstance(key, Promise):
+                    key = force_str(key)
+                if not isinstance(key, str):
+                    raise _NotSupported
+                if camelize:
+                    key = camelize_key(key)
+                prepared[key] = self._prepare(value, camelize)
+            return prepared
+
+        if isinstance(data, JSON_TYPES):
+            if isinstance(data, float) and not _is_plain_float(data):
+                raise _NotSupported
+            return data
+
+        if camelize:
+            # camelize turns all other iterables into lists
+            try:
+                items = iter(data)
+            except TypeError:
+                pass
+            else:
+                return [self._prepare(item, camelize) for item in items]
+        elif isinstance(data, (list, tuple)):
+            return [self._prepare(item, camelize) for item in data]
+
+        # the values the json module passes to the encoder are not camelized
+        default = self.encoder_class().default(data)
+        return self._prepare(default, camelize=False)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if not self._can_render_fast(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        add_serializer_keys(_get_serializer(data))
+        try:
+            # ⚡️ orjson is a lot faster than the json module
+            ret = orjson.dumps(self._prepare(data))
+        except (_NotSupported, TypeError):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # escape the line and paragraph separators like the JSONRenderer
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
@@ -224,9 +224,14 @@ class AutoSchema(_AutoSchema):
         support dynamic pagination_class in view.paginator method
         """
         if hasattr(self.view, "paginator"):
-            return self.view.paginator
+            paginator = self.view.paginator
+        else:
+            paginator = super()._get_paginator()
 
-        return super()._get_paginator()
+        # opt-in pagination of unpaginated endpoints is not part of the API spec
+        if paginator is not None and not getattr(paginator, "in_schema", True):
+            return None
+        return paginator
 
     def get_expand_response(self, serializer, base_response, direction):
         """
@@ -1,12 +1,33 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+import logging
+from urllib.parse import ParseResult
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import models
+from django.http import Http404
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
-from django_loose_fk.drf import FKOrURLField, FKOrURLValidator
+from django_loose_fk.drf import (
+    FKOrURLField,
+    FKOrURLValidator,
+    Resolver,
+    URLValidator as LooseFKURLValidator,
+)
+from django_loose_fk.loaders import FetchError, FetchJsonError
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
+from rest_framework.utils.model_meta import get_field_info
+from rest_framework_nested import relations as nested_relations
 from vng_api_common.validators import URLValidator
 
+from openzaak.components.catalogi.caching import get_resource_for_path
+
+from .url_templates import reverse
+
+logger = logging.getLogger(__name__)
+
 
 class LengthValidationMixin:
     default_error_messages = {
@@ -45,12 +66,57 @@ class LengthValidationMixin:
         return value
 
 
-class LengthHyperlinkedRelatedField(
-    LengthValidationMixin, serializers.HyperlinkedRelatedField
+class TemplatedReverseMixin:
+    """
+    Build the URLs of the hyperlinked field from templates.
+
+    See :mod:`openzaak.utils.url_templates`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # ⚡️ instead of reversing the route for every object
+        self.reverse = reverse
+
+
+class HyperlinkedRelatedField(
+    TemplatedReverseMixin, serializers.HyperlinkedRelatedField
 ):
     pass
 
 
+class HyperlinkedIdentityField(
+    TemplatedReverseMixin, serializers.HyperlinkedIdentityField
+):
+    pass
+
+
+class NestedHyperlinkedRelatedField(
+    TemplatedReverseMixin, nested_relations.NestedHyperlinkedRelatedField
+):
+    pass
+
+
+class NestedHyperlinkedIdentityField(
+    TemplatedReverseMixin, nested_relations.NestedHyperlinkedIdentityField
+):
+    pass
+
+
+class LengthHyperlinkedRelatedField(LengthValidationMixin, HyperlinkedRelatedField):
+    pass
+
+
+class CachedResolver(Resolver):
+    """
+    Resolve URLs to remote or local objects, taking published catalogi objects from
+    the cache.
+    """
+
+    def resolve_local(self, parsed: ParseResult) -> models.Model:
+        return get_resource_for_path(parsed.path)
+
+
 class FKOrServiceUrlValidator(FKOrURLValidator):
     # TODO: move this to validators.py
     RESOLVED_INSTANCE_CONTEXT_KEY = "_resolved_instance"
@@ -65,20 +131,54 @@ class FKOrServiceUrlValidator(FKOrURLValidator):
             return
 
         try:
-            super().__call__(url, serializer_field)
+            resolved_instance = self.resolve_instance(url, serializer_field)
         except ValueError as exc:
             raise serializers.ValidationError(
                 _("The service for this url is unknown"), code="unknown-service"
             ) from exc
 
-        # if there are no validation errors, the parent class has added the resolver
-        # to the serializer context - we can use this to resolve the object and cache
-        # it for other validators to skip some DB queries
-        resolver = serializer_field.context["resolver"]
-        host = serializer_field.context["request"].get_host()
-        resolved_instance = resolver.resolve(host, url)
+        # cache the resolved object for other validators to skip some DB queries
         serializer_field.context[context_key] = resolved_instance
 
+    def resolve_instance(self, url: str, serializer_field) -> models.Model:
+        """
+        Validate the URL like :class:`FKOrURLValidator` and return the object.
+        """
+        url_validator = LooseFKURLValidator()
+        try:
+            url_validator(url)
+        except DjangoValidationError as exc:
+            raise serializers.ValidationError(exc.message, code=self.code)
+
+        model, field = serializer_field._get_model_and_field()
+        resolver = CachedResolver(model, field)
+        host = serializer_field.context["request"].get_host()
+        # added so that the field has access to the resolver
+        serializer_field.context["resolver"] = resolver
+
+        try:
+            return resolver.resolve(host, url)
+        except FetchError as exc:  # remote resolution fails
+            logger.info("Could not fetch %s: %r", url, exc, exc_info=exc)
+            raise serializers.ValidationError(
+                self.message.format(url=url), code="bad-url"
+            )
+        except FetchJsonError as exc:
+            logger.info(
+                "URL %s doesn't seem to point to a JSON endpoint: %r",
+                url,
+                exc,
+                exc_info=exc,
+            )
+            raise serializers.ValidationError(
+                self.message.format(url=url), code="invalid-resource"
+            )
+        except (Http404, models.ObjectDoesNotExist):  # local resolution fails
+            logger.info("Local lookup for %s didn't resolve to an object.", url)
+            raise serializers.ValidationError(
+                self.message.format(url=url), code="does_not_exist"
+            )
+
     @staticmethod
     def get_context_cache_key(field):
         field_names = [field.field_name]
@@ -111,3 +211,32 @@ class FKOrServiceUrlField(FKOrURLField):
         source = source.split("__")[0]
         model_field = model_class._meta.get_field(source)
         return model_class, model_field
+
+    def to_representation(self, value) -> str:
+        if isinstance(value, str) or value.pk is None:
+            return super().to_representation(value)
+
+        # ⚡️ build the field for local objects once, instead of for every object
+        return self.local_field.to_representation(value)
+
+    @cached_property
+    def local_field(self) -> HyperlinkedRelatedField:
+        """
+        The hyperlinked field of the FK to local objects.
+        """
+        model_class, model_field = self._get_model_and_field()
+        info = get_field_info(model_class)
+
+        extra_field_kwargs = self.parent.get_extra_kwargs().get(self.field_name, {})
+        field_class, field_kwargs = self.parent.build_field(
+            model_field.fk_field, info, model_class, 0
+        )
+        field_kwargs = self.parent.include_extra_kwargs(
+            field_kwargs, extra_field_kwargs
+        )
+        for name in ("max_length", "min_length", "allow_blank"):
+            field_kwargs.pop(name, None)
+
+        field = field_class(**field_kwargs)
+        field.parent = self.parent
+        return field
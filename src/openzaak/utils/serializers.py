@@ -2,8 +2,41 @@
 # Copyright (C) 2019 - 2020 Dimpact
 from typing import Any
 
-from rest_framework import fields as drf_fields
+from rest_framework import fields as drf_fields, serializers
 from rest_framework.serializers import Serializer
+from rest_framework_nested import serializers as nested_serializers
+
+from .serializer_fields import (
+    HyperlinkedIdentityField,
+    HyperlinkedRelatedField,
+    NestedHyperlinkedIdentityField,
+    NestedHyperlinkedRelatedField,
+)
+
+
+class TemplatedURLsMixin:
+    """
+    Build the URLs of the generated hyperlinked fields from templates.
+
+    Declared hyperlinked fields should use the fields from
+    :mod:`openzaak.utils.serializer_fields`.
+    """
+
+    serializer_related_field = HyperlinkedRelatedField
+    serializer_url_field = HyperlinkedIdentityField
+
+
+class HyperlinkedModelSerializer(
+    TemplatedURLsMixin, serializers.HyperlinkedModelSerializer
+):
+    pass
+
+
+class NestedHyperlinkedModelSerializer(
+    nested_serializers.NestedHyperlinkedModelSerializer
+):
+    serializer_related_field = NestedHyperlinkedRelatedField
+    serializer_url_field = NestedHyperlinkedIdentityField
 
 
 class ConvertNoneMixin:
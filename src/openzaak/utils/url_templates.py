@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2024 Dimpact
+"""
+Build the URLs of API resources from templates.
+
+Reversing a URL resolves the route and builds the absolute URI for every object, and
+a page of zaken holds thousands of URLs. Instead, every route is reversed once with
+placeholder UUIDs (for every version and URL conf), which gives a template of its
+path that the UUIDs of the objects are formatted into. The scheme and host are
+determined once per request.
+
+:func:`reverse` is a drop-in replacement for :func:`rest_framework.reverse.reverse`,
+which it falls back to for URLs that can't be built from a template.
+"""
+import re
+import uuid
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.urls import (
+    NoReverseMatch,
+    get_script_prefix,
+    get_urlconf,
+    reverse as django_reverse,
+)
+
+from rest_framework.reverse import reverse as drf_reverse
+from rest_framework.settings import api_settings
+from rest_framework.versioning import URLPathVersioning
+
+UUID_RE = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+
+BASE_URL_CACHE_ATTR = "_base_url"
+
+# path templates by view name, URL kwargs (and version), URL conf and script prefix.
+# ``None`` if the route can't be reversed with a template
+_templates: Dict[tuple, Optional[str]] = {}
+
+
+def _get_uuid(value) -> Optional[str]:
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, str) and UUID_RE.match(value):
+        return value
+    return None
+
+
+def _get_template(
+    viewname: str, uuid_kwargs: Tuple[str, ...], other_kwargs: Tuple[tuple, ...]
+) -> Optional[str]:
+    key = (
+        viewname,
+        uuid_kwargs,
+        other_kwargs,
+        get_urlconf() or settings.ROOT_URLCONF,
+        get_script_prefix(),
+    )
+    if key in _templates:
+        return _templates[key]
+
+    placeholders = {
+        name: str(uuid.UUID(int=index + 1)) for index, name in enumerate(uuid_kwargs)
+    }
+    try:
+        path = django_reverse(viewname, kwargs={**dict(other_kwargs), **placeholders})
+    except NoReverseMatch:
+        template = None
+    else:
+        template = path.replace("{", "{{").replace("}", "}}")
+        for name, placeholder in placeholders.items():
+            template = template.replace(placeholder, f"{{{name}}}")
+        if any(path.count(placeholder) != 1 for placeholder in placeholders.values()):
+            template = None
+
+    _templates[key] = template
+    return template
+
+
+def _get_base_url(request) -> str:
+    base_url = getattr(request, BASE_URL_CACHE_ATTR, None)
+    if base_url is None:
+        base_url = request.build_absolute_uri("/")[:-1]
+        setattr(request, BASE_URL_CACHE_ATTR, base_url)
+    return base_url
+
+
+def reverse(viewname, args=None, kwargs=None, request=None, format=None, **extra):
+    """
+    Reverse the URL like :func:`rest_framework.reverse.reverse`, from a template.
+    """
+
+    def fallback():
+        return drf_reverse(viewname, args, kwargs, request, format, **extra)
+
+    if args or extra or format is not None or not kwargs:
+        return fallback()
+
+    reverse_kwargs = kwargs
+    if request is not None:
+        if api_settings.URL_FORMAT_OVERRIDE in request.GET:
+            return fallback()
+
+        scheme = getattr(request, "versioning_scheme", None)
+        if scheme is not None:
+            if type(scheme) is not URLPathVersioning:
+                return fallback()
+            if request.version is not None:
+                reverse_kwargs = {scheme.version_param: request.version, **kwargs}
+
+    uuids = {}
+    other_kwargs = []
+    for name, value in reverse_kwargs.items():
+        if (formatted := _get_uuid(value)) is not None:
+            uuids[name] = formatted
+        elif name == api_settings.VERSION_PARAM and isinstance(value, str):
+            other_kwargs.append((name, value))
+        else:
+            # other values would need a template for every value
+            return fallback()
+
+    template = _get_template(viewname, tuple(uuids), tuple(other_kwargs))
+    if template is None:
+        return fallback()
+
+    path = template.format(**uuids)
+    if request is None:
+        return path
+    return _get_base_url(request) + path
@@ -1,18 +1,32 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+from types import SimpleNamespace
+
 from django import http
+from django.conf import settings
+from django.db.models import Q
 from django.template import TemplateDoesNotExist, loader
 from django.views.decorators.csrf import requires_csrf_token
 from django.views.defaults import ERROR_500_TEMPLATE_NAME
 
 from rest_framework import exceptions, viewsets
+from rest_framework.response import Response
 from rest_framework.views import APIView
-from vng_api_common.audittrails.viewsets import AuditTrailViewSet as _AuditTrailViewSet
+from vng_api_common.audittrails.viewsets import (
+    AuditTrailViewSet as _AuditTrailViewSet,
+    AuditTrailViewsetMixin as _AuditTrailViewsetMixin,
+)
 from vng_api_common.views import (
     ViewConfigView as _ViewConfigView,
     _test_nrc_config,
     _test_sites_config,
 )
+from vng_api_common.viewsets import CheckQueryParamsMixin as _CheckQueryParamsMixin
+
+from openzaak.audittrails.archive import get_archived_audittrails
+from openzaak.audittrails.deltas import resolve_snapshots
+from openzaak.audittrails.models import HoofdObjectReference
+from openzaak.audittrails.utils import delete_audittrails
 
 
 @requires_csrf_token
@@ -58,9 +72,99 @@ class ErrorDocumentView(APIView):
         raise self.exception_cls()
 
 
+class AuditTrailViewsetMixin(_AuditTrailViewsetMixin):
+    def _destroy_related_audittrails(self, main_object_url):
+        delete_audittrails(main_object_url)
+
+
 class AuditTrailViewSet(_AuditTrailViewSet):
+    """
+    Retrieve the audit trail of a main object, including its archived records and
+    reconstructing the snapshots that are stored as a diff.
+
+    See :mod:`openzaak.audittrails.archive` and :mod:`openzaak.audittrails.deltas`.
+    """
+
+    def get_queryset(self):
+        if not self.kwargs:  # this happens during schema generation
+            return self.queryset.all()
+
+        if settings.AUDITTRAIL_HOOFD_OBJECT_FALLBACK:
+            # records without a reference (yet) are found by the UUID in their URL
+            uuid = self.kwargs[self.main_resource_lookup_field]
+            references = HoofdObjectReference.objects.filter(uuid=uuid)
+            return self.queryset.filter(
+                Q(pk__in=references.values("audittrail_id"))
+                | Q(hoofd_object__contains=uuid)
+            )
+
+        # ⚡️ skip the lookup of vng-api-common, which searches the UUID in the URLs
+        # of the main objects
+        return super(_AuditTrailViewSet, self).get_queryset()
+
+    def get_archived_audittrails(self) -> list:
+        return get_archived_audittrails(self.kwargs[self.main_resource_lookup_field])
+
+    def list(self, request, *args, **kwargs):
+        audittrails = list(self.filter_queryset(self.get_queryset()))
+        resolve_snapshots(audittrails)
+        audittrails = self.get_archived_audittrails() + audittrails
+        if not audittrails:
+            raise http.Http404
+
+        serializer = self.get_serializer(audittrails, many=True)
+        return Response(serializer.data)
+
+    def get_object(self):
+        try:
+            audittrail = super().get_object()
+        except http.Http404:
+            lookup = str(self.kwargs[self.lookup_url_kwarg or self.lookup_field])
+            for audittrail in self.get_archived_audittrails():
+                if str(audittrail.uuid) == lookup:
+                    self.check_object_permissions(self.request, audittrail)
+                    return audittrail
+            raise
+
+        resolve_snapshots([audittrail])
+        return audittrail
+
+    @property
+    def parent_lookup_kwargs(self):
+        return {
+            self.main_resource_lookup_field: "hoofd_object_reference__uuid",
+        }
+
     def initialize_request(self, request, *args, **kwargs):
         # workaround for drf-nested-viewset injecting the URL kwarg into request.data
         return super(viewsets.GenericViewSet, self).initialize_request(
             request, *args, **kwargs
         )
+
+
+class CheckQueryParamsMixin(_CheckQueryParamsMixin):
+    """
+    Also accept the query parameters of the pagination classes.
+
+    See :class:`openzaak.utils.pagination.CursorPaginationMixin` for the (opt-in)
+    cursor and :class:`openzaak.utils.pagination.CMISPagination` for the CMIS skip
+    count.
+    """
+
+    def _check_query_params(self, request) -> None:
+        pagination_params = [
+            param
+            for param in (
+                getattr(self.paginator, "cursor_query_param", None),
+                getattr(self.paginator, "skip_count_query_param", None),
+            )
+            if param and param in request.query_params
+        ]
+        if not pagination_params:
+            return super()._check_query_params(request)
+
+        # the base implementation only looks at the query parameters
+        query_params = request.query_params.copy()
+        for param in pagination_params:
+            del query_params[param]
+        super()._check_query_params(SimpleNamespace(query_params=query_params))